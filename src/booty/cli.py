@@ -9,7 +9,7 @@ import asyncio
 import json
 import re
 import subprocess
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import click
@@ -200,8 +200,8 @@ def memory() -> None:
 def memory_status(workspace: str, as_json: bool) -> None:
     """Show memory state (enabled, record count, retention)."""
     from booty.memory.config import apply_memory_env_overrides, get_memory_config
-    from booty.memory.lookup import within_retention
-    from booty.memory.store import get_memory_state_dir, read_records
+    from booty.memory.index import get_memory_index
+    from booty.memory.store import get_memory_state_dir
 
     ws = Path(workspace).resolve()
     try:
@@ -217,11 +217,8 @@ def memory_status(workspace: str, as_json: bool) -> None:
     if not mem_config.enabled:
         click.echo("Memory disabled")
         raise SystemExit(0)
-    state_dir = get_memory_state_dir()
-    path = state_dir / "memory.jsonl"
-    records = read_records(path)
-    filtered = [r for r in records if within_retention(r, mem_config.retention_days)]
-    count = len(filtered)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=mem_config.retention_days)
+    count = get_memory_index(get_memory_state_dir()).count_since(cutoff.timestamp())
     if as_json:
         click.echo(json.dumps({"enabled": True, "records": count, "retention_days": mem_config.retention_days}))
         return
@@ -230,34 +227,86 @@ def memory_status(workspace: str, as_json: bool) -> None:
     click.echo(f"retention_days: {mem_config.retention_days}")
 
 
+@memory.command("compact")
+@click.option(
+    "--retention-days",
+    type=click.IntRange(1, 365),
+    help="Override MEMORY_COMPACT_RETENTION_DAYS",
+)
+@click.option("--archive", is_flag=True, help="Append evicted records to memory.archive.jsonl.gz")
+@click.option("--json", "as_json", is_flag=True, help="Machine-readable JSON output")
+def memory_compact(retention_days: int | None, archive: bool, as_json: bool) -> None:
+    """Drop expired and duplicate records from memory.jsonl.
+
+    The store is shared across repos, so retention defaults to
+    MEMORY_COMPACT_RETENTION_DAYS rather than one repo's retention_days.
+    """
+    from booty.memory.compaction import compact
+    from booty.memory.store import get_memory_state_dir
+
+    if retention_days is None:
+        retention_days = get_settings().MEMORY_COMPACT_RETENTION_DAYS
+    result = compact(get_memory_state_dir(), retention_days, archive=archive)
+    if as_json:
+        click.echo(json.dumps({"retention_days": retention_days, **result.to_dict()}))
+        return
+    click.echo(f"retention_days: {retention_days}")
+    click.echo(f"kept: {result.kept}")
+    click.echo(f"expired: {result.expired}")
+    click.echo(f"duplicates: {result.duplicates}")
+    click.echo(f"bytes_reclaimed: {result.bytes_reclaimed}")
+    if result.archived_to:
+        click.echo(f"archived_to: {result.archived_to}")
+
+
+@memory.command("reindex")
+def memory_reindex() -> None:
+    """Rebuild the memory index sidecar from memory.jsonl."""
+    from booty.memory.index import get_memory_index
+    from booty.memory.store import get_memory_state_dir
+
+    count = get_memory_index(get_memory_state_dir()).rebuild()
+    click.echo(f"indexed: {count}")
+
+
 @memory.command("query")
 @click.option("--pr", type=int, help="PR number to query files from")
 @click.option("--sha", type=str, help="Commit SHA (resolves to PR for paths)")
 @click.option("--repo", help="Repository owner/repo (required when cannot infer from git)")
 @click.option("--workspace", type=click.Path(exists=True, file_okay=False), default=".")
+@click.option(
+    "--from-file",
+    "from_file",
+    type=click.File("r"),
+    help="JSON list of queries (repo, pr, sha, paths, fingerprint, text); '-' reads stdin",
+)
 @click.option("--json", "as_json", is_flag=True, help="Machine-readable JSON output")
 def memory_query(
     pr: int | None,
     sha: str | None,
     repo: str | None,
     workspace: str,
+    from_file,
     as_json: bool,
 ) -> None:
-    """Query memory by PR or commit SHA."""
+    """Query memory by PR or commit SHA, or a batch of queries with --from-file."""
     from booty.memory import query as memory_query_fn
     from booty.memory.config import apply_memory_env_overrides, get_memory_config
     from booty.memory.surfacing import format_matches_for_pr
     from booty.memory.store import get_memory_state_dir
 
-    if (pr is not None and sha is not None) or (pr is None and sha is None):
+    if from_file is not None:
+        if pr is not None or sha is not None:
+            raise click.UsageError("--from-file cannot be combined with --pr or --sha")
+    elif (pr is not None and sha is not None) or (pr is None and sha is None):
         raise click.UsageError("Provide exactly one of --pr or --sha")
     ws = Path(workspace).resolve()
     repo_name = repo or _infer_repo_from_git(ws)
-    if not repo_name:
+    if not repo_name and from_file is None:
         click.echo("Use --repo owner/repo", err=True)
         raise SystemExit(1)
     token = get_settings().GITHUB_TOKEN or ""
-    if not token.strip():
+    if not token.strip() and from_file is None:
         click.echo("GITHUB_TOKEN required", err=True)
         raise SystemExit(1)
     try:
@@ -273,6 +322,9 @@ def memory_query(
     if not mem_config.enabled:
         click.echo("Memory disabled")
         raise SystemExit(0)
+    if from_file is not None:
+        _memory_query_batch(from_file, repo_name, token, mem_config, as_json)
+        return
     try:
         from github import Github
 
@@ -311,6 +363,40 @@ def memory_query(
         click.echo("(no related history)")
 
 
+def _memory_query_batch(from_file, repo_name: str | None, token: str, mem_config, as_json: bool) -> None:
+    """Run booty memory query --from-file: one result per query, PR files fetched concurrently."""
+    from booty.memory.batch import BatchQueryError, parse_queries, run_batch
+    from booty.memory.store import get_memory_state_dir
+    from booty.memory.surfacing import format_matches_for_pr
+
+    try:
+        queries = parse_queries(json.load(from_file), default_repo=repo_name)
+    except (json.JSONDecodeError, BatchQueryError) as e:
+        click.echo(f"Error: {e}", err=True)
+        raise SystemExit(1)
+    try:
+        results = run_batch(queries, mem_config, token, state_dir=get_memory_state_dir())
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        raise SystemExit(1)
+    if as_json:
+        click.echo(json.dumps(results, default=str))
+        return
+    for i, result in enumerate(results):
+        label = result["repo"]
+        if result.get("pr") is not None:
+            label += f"#{result['pr']}"
+        elif result.get("sha"):
+            label += f"@{result['sha'][:7]}"
+        if i:
+            click.echo("")
+        click.echo(f"== {label}")
+        if "error" in result:
+            click.echo(f"Error: {result['error']}")
+        else:
+            click.echo(format_matches_for_pr(result["matches"]) or "(no related history)")
+
+
 @memory.group()
 def ingest() -> None:
     """Ingest records from external sources."""
@@ -662,7 +748,7 @@ def reviewer() -> None:
 @click.option("--workspace", type=click.Path(exists=True, file_okay=False), default=".")
 @click.option("--json", "as_json", is_flag=True, help="Machine-readable JSON output")
 def reviewer_status(repo: str | None, workspace: str, as_json: bool) -> None:
-    """Show Reviewer status: enabled, 24h metrics (reviews_total, reviews_blocked, reviews_suggestions, reviewer_fail_open)."""
+    """Show Reviewer status: enabled, 24h metrics (reviews_total, reviews_blocked, reviews_suggestions, reviewer_fail_open, triage paths)."""
     from booty.reviewer.config import apply_reviewer_env_overrides, get_reviewer_config
     from booty.reviewer.metrics import get_reviewer_24h_stats
 
@@ -687,6 +773,9 @@ def reviewer_status(repo: str | None, workspace: str, as_json: bool) -> None:
         "reviews_blocked": stats["reviews_blocked"],
         "reviews_suggestions": stats["reviews_suggestions"],
         "reviewer_fail_open": stats["reviewer_fail_open"],
+        "triage_auto_approve": stats["triage_auto_approve"],
+        "triage_fast": stats["triage_fast"],
+        "triage_full": stats["triage_full"],
     }
     if as_json:
         click.echo(json.dumps(data))
@@ -695,6 +784,35 @@ def reviewer_status(repo: str | None, workspace: str, as_json: bool) -> None:
             click.echo(f"{k}: {v}")
 
 
+@cli.group()
+def llm() -> None:
+    """LLM model routing commands."""
+
+
+@llm.command("status")
+@click.option("--json", "as_json", is_flag=True, help="Machine-readable JSON output")
+def llm_status(as_json: bool) -> None:
+    """Show model routing tiers and 24h per-tier calls, success rate, latency."""
+    from booty.llm.metrics import get_routing_24h_stats
+    from booty.llm.routing import model_for_tier, routing_enabled
+
+    stats = get_routing_24h_stats()
+    data = {
+        "routing_enabled": routing_enabled(),
+        "tiers": {
+            tier: {"model": model_for_tier(tier), **stats.get(tier, {"calls": 0})}
+            for tier in ("fast", "strong")
+        },
+    }
+    if as_json:
+        click.echo(json.dumps(data))
+    else:
+        click.echo(f"routing_enabled: {data['routing_enabled']}")
+        for tier, t in data["tiers"].items():
+            for k, v in t.items():
+                click.echo(f"{tier}_{k}: {v}")
+
+
 @cli.group()
 def plan() -> None:
     """Plan generation subcommands."""
@@ -5,13 +5,14 @@ derives structured analysis from plan (goal, steps, handoff) instead of
 LLM issue interpretation. Builder is a pure execution engine.
 """
 
-import os
+from dataclasses import replace
 from pathlib import Path
 
-from booty.code_gen.refiner import refine_until_tests_pass
+from booty.code_gen.refiner import refine_until_tests_pass, retest_after_autofix
 from booty.code_gen.security import PathRestrictor
 from booty.code_gen.validator import validate_generated_code
 from booty.test_generation import detect_conventions, validate_test_imports
+from booty.test_generation.detector import is_test_file as _is_test_file
 from booty.config import Settings
 from git import Actor
 from booty.git.operations import commit_changes, format_commit_message, push_to_remote
@@ -25,23 +26,23 @@ from booty.github.pulls import (
 from booty.jobs import Job
 from booty.llm.models import CodeGenerationPlan, FileChange, IssueAnalysis
 from booty.llm.prompts import analyze_issue, generate_code_changes, generate_single_file
+from booty.llm.routing import TaskFeatures, call_with_routing, model_for_tier, select_tier
+from booty.planner.risk import classify_risk_from_paths
 from booty.planner.schema import Plan
 from booty.llm.token_budget import TokenBudget
 from booty.logging import get_logger
+from booty.repo_index import RepoIndex
 from booty.repositories import Workspace
 from booty.self_modification.safety import validate_changes_against_protected_paths
 from booty.test_runner.config import load_booty_config
+from booty.test_runner.impact import get_impact_map
+from booty.test_runner.warm import WarmTestRunner, warm_supported
 from booty.verifier.limits import limits_config_from_booty_config, format_limits_for_prompt
 from booty.test_runner.quality import run_quality_checks
 
 logger = get_logger()
 
 
-def _is_test_file(path: str) -> bool:
-    """Return True if path appears to be a test file."""
-    return path.startswith("tests/") or path.startswith("test_") or "/test_" in path
-
-
 def _generate_code_incremental(
     planner_plan: Plan,
     file_contents: dict[str, str],
@@ -50,8 +51,15 @@ def _generate_code_incremental(
     issue_body: str,
     test_conventions_text: str,
     limits_constraint: str,
+    features: TaskFeatures | None = None,
 ) -> CodeGenerationPlan:
-    """Generate code one file at a time (step-wise) to avoid max_tokens truncation."""
+    """Generate code one file at a time (step-wise) to avoid max_tokens truncation.
+
+    Each file is routed separately (features.file_bytes = that file's current size).
+    """
+    base_features = features or TaskFeatures(
+        step_count=len(planner_plan.steps), risk_level=planner_plan.risk_level
+    )
     changes: list[FileChange] = []
     test_files: list[FileChange] = []
     approach_parts: list[str] = []
@@ -85,7 +93,11 @@ def _generate_code_incremental(
             operation=operation,
             step_id=step.id,
         )
-        change = generate_single_file(
+        change = call_with_routing(
+            "builder",
+            replace(base_features, file_bytes=len(current_content or "")),
+            generate_single_file,
+            validate=lambda c: _validate_changes([c], workspace_path),
             goal=planner_plan.goal,
             task_for_file=step.acceptance,
             target_path=path,
@@ -123,6 +135,14 @@ def _generate_code_incremental(
     )
 
 
+def _validate_changes(changes: list[FileChange], workspace_path: Path) -> None:
+    """Run validate_generated_code on every non-delete change. Raises ValueError."""
+    for change in changes:
+        if change.operation == "delete":
+            continue
+        validate_generated_code(Path(change.path), change.content, workspace_path)
+
+
 def _analysis_from_plan(plan: Plan) -> IssueAnalysis:
     """Derive IssueAnalysis from Planner Plan — Builder uses plan, not raw issue."""
     files_to_modify = [s.path for s in plan.steps if s.action == "edit" and s.path]
@@ -192,27 +212,16 @@ async def process_issue_to_pr(
     try:
         logger.info("process_issue_to_pr_started", job_id=job.job_id, issue_number=job.issue_number)
 
-        # Step 1: List repo files
+        # Step 1: List repo files (one pass; also feeds convention detection and import checks)
         logger.info("listing_repo_files", workspace_path=workspace.path)
-        repo_files = []
         workspace_path = Path(workspace.path)
-        for root, dirs, files in os.walk(workspace_path):
-            # Exclude .git directory
-            if ".git" in dirs:
-                dirs.remove(".git")
-
-            # Add files relative to workspace root
-            for file in files:
-                full_path = Path(root) / file
-                relative_path = full_path.relative_to(workspace_path)
-                repo_files.append(str(relative_path))
-
-        repo_files.sort()  # Deterministic ordering
+        repo_index = RepoIndex.build(workspace_path)
+        repo_files = list(repo_index.files)  # Sorted, excludes .git, EXCLUDED_DIRS, gitignored
         logger.info("repo_files_listed", count=len(repo_files))
 
         # Step 1a: Detect test conventions
         logger.info("detecting_test_conventions", workspace_path=workspace.path)
-        conventions = detect_conventions(workspace_path)
+        conventions = detect_conventions(workspace_path, repo_index)
         logger.info(
             "test_conventions_detected",
             language=conventions.language,
@@ -304,6 +313,27 @@ async def process_issue_to_pr(
             else:
                 logger.warning("file_not_found_skipping", path=file_path)
 
+        # Step 5b: Routing features — file size, step count, risk, retry
+        if planner_plan is not None:
+            risk_level = planner_plan.risk_level
+            step_count = len(planner_plan.steps)
+        else:
+            risk_level, _ = classify_risk_from_paths(all_paths)
+            step_count = total_file_changes
+        features = TaskFeatures(
+            file_bytes=sum(len(c) for c in file_contents.values()),
+            step_count=step_count,
+            risk_level=risk_level,
+            is_retry=bool(job.verifier_error),
+        )
+        logger.info(
+            "llm_routing_features",
+            file_bytes=features.file_bytes,
+            step_count=features.step_count,
+            risk_level=features.risk_level,
+            is_retry=features.is_retry,
+        )
+
         # Step 6: Token budget check (skip trim when using incremental - one file per call)
         use_incremental = (
             planner_plan is not None
@@ -312,7 +342,10 @@ async def process_issue_to_pr(
         )
         if not use_incremental:
             logger.info("checking_token_budget")
-            budget = TokenBudget(settings.LLM_MAX_CONTEXT_TOKENS)
+            budget = TokenBudget(
+                settings.LLM_MAX_CONTEXT_TOKENS,
+                model=model_for_tier(select_tier(features)),
+            )
             base_content = f"Task: {analysis.task_description}\n\nIssue: {issue_title}\n{issue_body}"
             result = budget.check_budget(
                 "You are a code generation assistant.",
@@ -338,8 +371,26 @@ async def process_issue_to_pr(
         else:
             logger.info("token_budget_skipped", reason="incremental_generation")
 
+        # Step 6b: Load test configuration (limits for generation, tests for refinement)
+        logger.info("loading_test_configuration")
+        try:
+            config = load_booty_config(workspace_path)
+        except FileNotFoundError as e:
+            raise ValueError(
+                "Missing .booty.yml configuration. "
+                "Test-driven refinement requires a .booty.yml file in the repository root. "
+                f"Details: {str(e)}"
+            ) from e
+
+        logger.info(
+            "test_config_loaded",
+            test_command=config.test_command,
+            timeout=config.timeout,
+            max_retries=config.max_retries,
+        )
+
         # Step 7: Generate code (incremental for large plans, batch for small)
-        limits = limits_config_from_booty_config(booty_config)
+        limits = limits_config_from_booty_config(config)
         limits_constraint = format_limits_for_prompt(limits)
         if use_incremental:
             logger.info("generating_code_incremental", file_count=total_file_changes)
@@ -351,14 +402,19 @@ async def process_issue_to_pr(
                 issue_body,
                 test_conventions_text,
                 limits_constraint,
+                features,
             )
         else:
             logger.info("generating_code_changes")
-            plan = generate_code_changes(
+            plan = call_with_routing(
+                "builder",
+                features,
+                generate_code_changes,
                 analysis.task_description,
                 file_contents,
                 issue_title,
                 issue_body,
+                validate=lambda p: _validate_changes(p.changes + p.test_files, workspace_path),
                 test_conventions=test_conventions_text,
                 limits_constraint=limits_constraint,
             )
@@ -376,7 +432,7 @@ async def process_issue_to_pr(
                 if test_change.operation == "delete":
                     continue
                 is_valid, import_errors = validate_test_imports(
-                    test_change.content, conventions.language, workspace_path
+                    test_change.content, conventions.language, workspace_path, repo_index
                 )
                 if not is_valid:
                     logger.warning(
@@ -409,6 +465,19 @@ async def process_issue_to_pr(
             logger.debug("code_validated", path=change.path, operation=change.operation)
         logger.info("code_validation_complete")
 
+        # Step 8b: Test impact map for the base commit (before changes touch the tree)
+        impact = None
+        if getattr(settings, "BUILDER_TEST_IMPACT_SELECTION", True):
+            try:
+                impact = await get_impact_map(
+                    config.test_command,
+                    config.timeout,
+                    workspace_path,
+                    workspace.repo.head.commit.hexsha,
+                )
+            except Exception as e:
+                logger.warning("test_impact_map_failed", error=str(e))
+
         # Step 9: Apply changes to workspace
         logger.info("applying_changes_to_workspace", count=len(all_changes))
         modified_paths = []
@@ -443,52 +512,28 @@ async def process_issue_to_pr(
         )
 
         # Step 10: Test-driven refinement
-        logger.info("loading_test_configuration")
-        try:
-            config = load_booty_config(workspace_path)
-        except FileNotFoundError as e:
-            raise ValueError(
-                "Missing .booty.yml configuration. "
-                "Test-driven refinement requires a .booty.yml file in the repository root. "
-                f"Details: {str(e)}"
-            ) from e
-
-        logger.info(
-            "test_config_loaded",
-            test_command=config.test_command,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
-        )
-
         logger.info("starting_refinement_loop")
-        tests_passed, final_changes, error_message = await refine_until_tests_pass(
-            workspace_path,
-            config,
-            all_changes,
-            analysis.task_description,
-            issue_title,
-            issue_body,
-            test_conventions=test_conventions_text,
-        )
-
-        # Step 10b: Quality checks for all jobs (promotion gate requires it)
-        logger.info("running_quality_checks")
-        quality_result = await run_quality_checks(workspace_path)
-        logger.info(
-            "quality_checks_complete",
-            passed=quality_result.passed,
-            formatting_ok=quality_result.formatting_ok,
-            linting_ok=quality_result.linting_ok,
+        warm_runner = (
+            WarmTestRunner(workspace_path, config.test_command)
+            if getattr(settings, "BUILDER_WARM_TEST_RUNNER", False)
+            and warm_supported(config.test_command)
+            else None
         )
-        if not quality_result.passed:
-            # Append quality errors to error_message
-            quality_errors = "\n".join(quality_result.errors)
-            if error_message:
-                error_message = f"{error_message}\n\nQuality Check Failures:\n{quality_errors}"
-            else:
-                error_message = f"Quality Check Failures:\n{quality_errors}"
-            tests_passed = False
-            logger.warning("quality_checks_failed", errors_count=len(quality_result.errors))
+        try:
+            tests_passed, final_changes, error_message = await refine_until_tests_pass(
+                workspace_path,
+                config,
+                all_changes,
+                analysis.task_description,
+                issue_title,
+                issue_body,
+                test_conventions=test_conventions_text,
+                impact=impact,
+                warm_runner=warm_runner,
+            )
+        finally:
+            if warm_runner is not None:
+                await warm_runner.close()
 
         # If changes were regenerated (final_changes differ from what we had), re-apply them
         if final_changes != all_changes:
@@ -524,6 +569,38 @@ async def process_issue_to_pr(
                 deleted=len(deleted_paths),
             )
 
+        # Step 10b: Quality checks for all jobs (promotion gate requires it).
+        # Runs after final changes are on disk so auto-fixes land in the commit.
+        logger.info("running_quality_checks")
+        quality_result = await run_quality_checks(
+            workspace_path,
+            changed_paths=modified_paths,
+            fix=getattr(settings, "BUILDER_QUALITY_AUTOFIX", True),
+            whole_repo=getattr(settings, "BUILDER_QUALITY_WHOLE_REPO", False),
+        )
+        logger.info(
+            "quality_checks_complete",
+            passed=quality_result.passed,
+            formatting_ok=quality_result.formatting_ok,
+            linting_ok=quality_result.linting_ok,
+            fixed=len(quality_result.fixed_paths),
+        )
+        if quality_result.fixed_paths and tests_passed:
+            # Auto-fix rewrote files after the last test run; test what gets committed
+            retest_error = await retest_after_autofix(workspace_path, config)
+            if retest_error:
+                tests_passed = False
+                error_message = retest_error
+        if not quality_result.passed:
+            # Append quality errors to error_message
+            quality_errors = "\n".join(quality_result.errors)
+            if error_message:
+                error_message = f"{error_message}\n\nQuality Check Failures:\n{quality_errors}"
+            else:
+                error_message = f"Quality Check Failures:\n{quality_errors}"
+            tests_passed = False
+            logger.warning("quality_checks_failed", errors_count=len(quality_result.errors))
+
         # Step 11: Commit — use handoff hint when plan-driven
         logger.info("committing_changes")
         if planner_plan is not None:
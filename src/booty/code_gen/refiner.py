@@ -5,14 +5,59 @@ from pathlib import Path
 from booty.code_gen.validator import validate_generated_code
 from booty.llm.models import FileChange
 from booty.llm.prompts import regenerate_code_changes
+from booty.llm.routing import TaskFeatures, call_with_routing
 from booty.logging import get_logger
 from booty.test_runner.config import BootyConfig
-from booty.test_runner.executor import execute_tests
-from booty.test_runner.parser import extract_error_summary, extract_files_from_output
+from booty.test_runner.executor import TestResult, execute_tests
+from booty.test_runner.impact import ImpactMap, select_tests, subset_command
+from booty.test_runner.parser import (
+    extract_error_summary,
+    extract_files_from_output,
+    files_from_structured,
+    format_structured_failures,
+)
+from booty.test_runner.warm import WarmTestRunner
 
 logger = get_logger()
 
 
+async def _run_tests(
+    command: str,
+    timeout: int,
+    workspace_path: Path,
+    warm_runner: WarmTestRunner | None,
+) -> TestResult:
+    """Run tests in the warm runner when available, else a cold subprocess."""
+    if warm_runner is not None:
+        result = await warm_runner.run(command, timeout, structured=True)
+        if result is not None:
+            return result
+    return await execute_tests(command, timeout, workspace_path, structured=True)
+
+
+def _failure_summary(result: TestResult) -> str:
+    """Exact failing tests from the JUnit report; heuristics only without one."""
+    structured_failures = result.structured.failures if result.structured else []
+    if structured_failures:
+        return format_structured_failures(result.structured)
+    return result.error_summary or extract_error_summary(result.stderr, result.stdout)
+
+
+async def retest_after_autofix(workspace_path: Path, config: BootyConfig) -> str | None:
+    """Run the full suite again on files rewritten by quality auto-fix.
+
+    Returns an error summary when the suite now fails, None when it passes.
+    """
+    result = await execute_tests(
+        config.test_command, config.timeout, workspace_path, structured=True
+    )
+    if result.exit_code == 0:
+        logger.info("autofix_retest_passed")
+        return None
+    logger.warning("autofix_retest_failed", exit_code=result.exit_code, timed_out=result.timed_out)
+    return f"Tests failed after quality auto-fix.\n\nLatest error:\n{_failure_summary(result)}"
+
+
 async def refine_until_tests_pass(
     workspace_path: Path,
     config: BootyConfig,
@@ -21,6 +66,8 @@ async def refine_until_tests_pass(
     issue_title: str,
     issue_body: str,
     test_conventions: str = "",
+    impact: ImpactMap | None = None,
+    warm_runner: WarmTestRunner | None = None,
 ) -> tuple[bool, list[FileChange], str | None]:
     """Run test-refine iteration loop until tests pass or max retries exhausted.
 
@@ -30,6 +77,11 @@ async def refine_until_tests_pass(
     3. If fail on last attempt: return failure with error
     4. Otherwise: extract error, regenerate affected files, retry
 
+    With an impact map, intermediate attempts run only the test files covering
+    the changed paths. A passing subset is confirmed by one full-suite run; if
+    that fails, selection is disabled and refinement continues on the full
+    suite. The last attempt always runs the full suite.
+
     Args:
         workspace_path: Absolute path to workspace root
         config: Booty configuration with test settings
@@ -38,6 +90,8 @@ async def refine_until_tests_pass(
         issue_title: Issue title text
         issue_body: Issue body/description text
         test_conventions: Formatted test conventions string (empty if none detected)
+        impact: Test impact map for the base commit (None = always run full suite)
+        warm_runner: Warm pytest server to fork test runs from (None = cold runs)
 
     Returns:
         Tuple of (tests_passed, final_changes, error_message_or_none)
@@ -54,8 +108,24 @@ async def refine_until_tests_pass(
     for attempt in range(1, config.max_retries + 1):
         logger.info("refinement_attempt", attempt=attempt, max_retries=config.max_retries)
 
-        # Execute tests
-        result = await execute_tests(config.test_command, config.timeout, workspace_path)
+        # Execute tests (impacted subset on intermediate attempts when possible)
+        test_command = config.test_command
+        if impact is not None and attempt < config.max_retries:
+            selected = select_tests(impact, {change.path for change in current_changes})
+            if selected:
+                test_command = subset_command(config.test_command, selected, workspace_path)
+                logger.info("test_impact_selected", attempt=attempt, test_files=len(selected))
+        result = await _run_tests(test_command, config.timeout, workspace_path, warm_runner)
+
+        if result.exit_code == 0 and test_command != config.test_command:
+            # Subset passed — confirm with the full suite before declaring success
+            logger.info("test_impact_subset_passed", attempt=attempt)
+            result = await _run_tests(
+                config.test_command, config.timeout, workspace_path, warm_runner
+            )
+            if result.exit_code != 0:
+                logger.warning("test_impact_full_suite_failed", attempt=attempt)
+                impact = None
 
         # Check if tests passed
         if result.exit_code == 0:
@@ -67,7 +137,8 @@ async def refine_until_tests_pass(
             return (True, current_changes, None)
 
         # Tests failed - extract error summary
-        error_summary = extract_error_summary(result.stderr, result.stdout)
+        # Truncated output: use the summary extracted while streaming (covers the middle)
+        error_summary = _failure_summary(result)
         logger.warning(
             "tests_failed",
             attempt=attempt,
@@ -89,7 +160,11 @@ async def refine_until_tests_pass(
         logger.info("regenerating_code", attempt=attempt)
 
         # Extract failing files from test output
-        failed_files = extract_files_from_output(
+        failed_files = (
+            files_from_structured(result.structured, workspace_path)
+            if result.structured and result.structured.failures
+            else set()
+        ) or extract_files_from_output(
             result.stderr + "\n" + result.stdout,
             workspace_path,
         )
@@ -120,7 +195,15 @@ async def refine_until_tests_pass(
 
         # Call LLM to regenerate code
         logger.info("calling_llm_for_regeneration", file_count=len(file_contents))
-        regenerated_plan = regenerate_code_changes(
+        # Tests failed → refinement retry, always routed to the strong tier
+        regenerated_plan = call_with_routing(
+            "builder_refine",
+            TaskFeatures(
+                file_bytes=sum(len(c) for c in file_contents.values()),
+                step_count=len(file_contents),
+                is_retry=True,
+            ),
+            regenerate_code_changes,
             task_description,
             file_contents,
             error_summary,
@@ -33,6 +33,10 @@ class Settings(BaseSettings):
     MAX_FILES_PER_ISSUE: int = 10  # File count cap
     BUILDER_INCREMENTAL_GENERATION: bool = True  # Use step-wise generation for large plans
     BUILDER_INCREMENTAL_THRESHOLD: int = 4  # Use incremental when file count > this
+    BUILDER_TEST_IMPACT_SELECTION: bool = True  # Refinement attempts run only impacted tests
+    BUILDER_WARM_TEST_RUNNER: bool = False  # Fork refinement test runs from a pre-imported pytest server
+    BUILDER_QUALITY_AUTOFIX: bool = True  # Apply ruff fixes/formatting before the quality gate
+    BUILDER_QUALITY_WHOLE_REPO: bool = False  # Quality gate checks whole repo, not just changed files
     RESTRICTED_PATHS: str = ".github/workflows/**,.env,.env.*,**/*.env,**/secrets.*,Dockerfile,docker-compose*.yml,*lock.json,*.lock,.booty.yml"  # Comma-separated denylist patterns
 
     # Git commit attribution (Builder agent commits)
@@ -56,16 +60,31 @@ class Settings(BaseSettings):
     OBSV_COOLDOWN_HOURS: float = 6.0
     
     # Internal test endpoints
-    INTERNAL_TEST_TOKEN: str = ""  # Optional; empty = test endpoints open in development
+    INTERNAL_TEST_TOKEN: str = ""  # Optional; empty = test endpoints open in development, POST /memory/query disabled
 
     # Verifier (GitHub App) configuration
     GITHUB_APP_ID: str = ""  # Optional; empty = Verifier disabled
     GITHUB_APP_PRIVATE_KEY: str = ""  # Optional; empty = Verifier disabled
     VERIFIER_WORKER_COUNT: int = 2  # Number of verifier workers
     MAX_VERIFIER_RETRIES: int = 1  # Max verifier-triggered builder retries (prevents infinite loops)
+    CHECK_RUN_UPDATE_INTERVAL_SECONDS: float = 2.0  # Min seconds between in-progress check run edits
+
+    # Test result cache — keyed by (tree hash, test_command, install fingerprint)
+    TEST_RESULT_CACHE_ENABLED: bool = True  # Record outcomes of Builder/Verifier/main verification runs
+    TEST_RESULT_REUSE_VERIFIER: bool = False  # Verifier reuses an earlier pass on an identical tree
+    TEST_RESULT_REUSE_MAIN_VERIFY: bool = False  # Main verification reuses an earlier Verifier pass
+    TEST_SHARDS: int = 0  # >1: Verifier/main verification split pytest suites into N shards (capped at CPUs)
 
     # Security (GitHub App) configuration — uses same App as Verifier
     SECURITY_WORKER_COUNT: int = 2  # Number of security workers
+    SECURITY_AUDIT_CACHE_ENABLED: bool = True  # Reuse audit results for unchanged lockfiles
+    SECURITY_AUDIT_CACHE_TTL_HOURS: float = 24.0  # Remote advisory data is treated as fresh this long
+    SECURITY_OSV_INDEX_DIR: str = ""  # OSV export (PyPI/, npm/, Packagist/, crates.io/) for offline audits
+
+    # Memory compaction (drops expired records and dedup-window duplicates from memory.jsonl)
+    MEMORY_COMPACT_INTERVAL_HOURS: float = 24.0  # In-process compaction interval; 0 = disabled
+    MEMORY_COMPACT_RETENTION_DAYS: int = 365  # Records older than this are evicted (max retention_days)
+    MEMORY_COMPACT_ARCHIVE: bool = False  # Append evicted records to memory.archive.jsonl.gz
 
     # Reviewer (GitHub App) configuration — uses same App as Verifier
     REVIEWER_WORKER_COUNT: int = 2  # Number of reviewer workers
@@ -1,5 +1,7 @@
 """GitHub Checks API integration via GitHub App auth."""
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Any
 
 from github import Auth, GithubException, GithubIntegration
@@ -194,3 +196,141 @@ def edit_check_run(
     if output is not None:
         kwargs["output"] = output
     return check_run.edit(**kwargs)
+
+
+ANNOTATIONS_PER_REQUEST = 50  # Checks API limit per create/update request
+MAX_CHECK_ANNOTATIONS = 500  # Total streamed per check run
+FINAL_EDIT_ATTEMPTS = 3  # The completing edit is retried, then raises
+FINAL_EDIT_RETRY_DELAY = 1.0  # Seconds, doubled per retry
+
+
+def _annotation_key(annotation: dict) -> tuple:
+    return (
+        annotation.get("path", ""),
+        annotation.get("start_line", 0),
+        annotation.get("message", ""),
+    )
+
+
+class CheckRunReporter:
+    """Throttled, batched check run updates sent off the caller's critical path.
+
+    update() and add_annotations() never block: progress outputs are coalesced
+    (latest wins) and annotations are queued, then a background task sends at
+    most one edit per min_interval seconds, each carrying up to
+    ANNOTATIONS_PER_REQUEST new annotations. complete() flushes the remaining
+    annotations in chunks and sets the conclusion. API errors on progress and
+    annotation edits are logged, never raised; the completing edit is retried
+    FINAL_EDIT_ATTEMPTS times and then raises, so a check run is never left
+    in_progress silently.
+    """
+
+    def __init__(
+        self,
+        check_run: "CheckRun",
+        min_interval: float = 2.0,
+        output: dict[str, Any] | None = None,
+    ):
+        self.check_run = check_run
+        self.min_interval = min_interval
+        self._output = output or {"title": "Booty Verifier", "summary": "Running tests..."}
+        self._output_dirty = False
+        self._annotations: list[dict] = []
+        self._seen: set[tuple] = set()
+        self._wake = asyncio.Event()
+        self._closed = False
+        self._last_sent = 0.0
+        self._task: asyncio.Task | None = None
+
+    def update(self, output: dict[str, Any]) -> None:
+        """Queue an in-progress output (title + summary); replaces any unsent one."""
+        self._output = {**output}
+        self._output_dirty = True
+        self._kick()
+
+    def add_annotations(self, annotations: list[dict]) -> None:
+        """Queue annotations for streaming; duplicates and overflow are dropped."""
+        for annotation in annotations:
+            key = _annotation_key(annotation)
+            if key in self._seen or len(self._seen) >= MAX_CHECK_ANNOTATIONS:
+                continue
+            self._seen.add(key)
+            self._annotations.append(annotation)
+        self._kick()
+
+    def _kick(self) -> None:
+        if self._closed:
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._wake.set()
+
+    async def _send(self, **kwargs: Any) -> None:
+        try:
+            await asyncio.to_thread(edit_check_run, self.check_run, **kwargs)
+        except Exception as e:
+            logger.warning("check_run_update_failed", error=str(e))
+        self._last_sent = time.monotonic()
+
+    def _next_chunk(self) -> list[dict]:
+        chunk = self._annotations[:ANNOTATIONS_PER_REQUEST]
+        del self._annotations[:ANNOTATIONS_PER_REQUEST]
+        return chunk
+
+    async def _run(self) -> None:
+        while not self._closed:
+            await self._wake.wait()
+            self._wake.clear()
+            delay = self._last_sent + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._closed:
+                break
+            if not (self._output_dirty or self._annotations):
+                continue
+            output = {**self._output}
+            chunk = self._next_chunk()
+            if chunk:
+                output["annotations"] = chunk
+            self._output_dirty = False
+            await self._send(output=output)
+            if self._annotations:
+                self._wake.set()
+
+    async def close(self) -> None:
+        """Stop background updates (an in-flight edit finishes). Unsent progress is dropped."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None:
+            self._wake.set()
+            try:
+                await task
+            except Exception as e:
+                logger.warning("check_run_reporter_failed", error=str(e))
+
+    async def complete(self, conclusion: str, output: dict[str, Any]) -> None:
+        """Send the final output with all unsent annotations, 50 per request."""
+        await self.close()
+        final = {k: v for k, v in output.items() if k != "annotations"}
+        for annotation in output.get("annotations") or []:
+            key = _annotation_key(annotation)
+            if key not in self._seen and len(self._seen) < MAX_CHECK_ANNOTATIONS:
+                self._seen.add(key)
+                self._annotations.append(annotation)
+        while len(self._annotations) > ANNOTATIONS_PER_REQUEST:
+            await self._send(output={**final, "annotations": self._next_chunk()})
+        chunk = self._next_chunk()
+        kwargs = {
+            "status": "completed",
+            "conclusion": conclusion,
+            "output": {**final, "annotations": chunk} if chunk else final,
+        }
+        for attempt in range(1, FINAL_EDIT_ATTEMPTS + 1):
+            try:
+                await asyncio.to_thread(edit_check_run, self.check_run, **kwargs)
+                return
+            except Exception as e:
+                if attempt == FINAL_EDIT_ATTEMPTS:
+                    raise
+                logger.warning("check_run_complete_retry", attempt=attempt, error=str(e))
+                await asyncio.sleep(FINAL_EDIT_RETRY_DELAY * 2 ** (attempt - 1))
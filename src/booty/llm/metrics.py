@@ -0,0 +1,149 @@
+"""LLM routing metrics — per-call tier, model, latency and outcome.
+
+Uses same base state dir as Planner/Architect (get_planner_state_dir); stored
+under state_dir/llm/metrics.jsonl, one event per line. Calls append a line;
+once the file passes COMPACT_BYTES it is rewritten with the last MAX_EVENTS
+events. Used to tune routing thresholds.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+from booty.planner.store import get_planner_state_dir
+
+MAX_EVENTS = 5000
+COMPACT_BYTES = 2 * 1024 * 1024  # ~10k events; trimmed back to MAX_EVENTS
+
+_lock = threading.Lock()
+
+
+def get_llm_metrics_dir(state_dir: Path | None = None) -> Path:
+    """Return LLM metrics directory: state_dir/llm or shared base state/llm."""
+    sd = state_dir or get_planner_state_dir()
+    return sd / "llm"
+
+
+def _metrics_path(state_dir: Path | None = None) -> Path:
+    """Path to metrics.jsonl (one event per line)."""
+    return get_llm_metrics_dir(state_dir) / "metrics.jsonl"
+
+
+def _load_events(state_dir: Path | None = None) -> list[dict]:
+    """Load events from metrics.jsonl, skipping corrupt lines. Empty list if missing."""
+    return _read_events(_metrics_path(state_dir))
+
+
+def _read_events(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    events = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial line from a concurrent writer or crash
+            if isinstance(event, dict):
+                events.append(event)
+    return events
+
+
+def _compact(path: Path) -> None:
+    """Rewrite path with its last MAX_EVENTS events (atomic replace)."""
+    events = _read_events(path)[-MAX_EVENTS:]
+    fd = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=path.parent,
+        delete=False,
+        suffix=".tmp",
+    )
+    try:
+        fd.writelines(json.dumps(e, separators=(",", ":")) + "\n" for e in events)
+        fd.close()
+        os.replace(fd.name, path)
+    except Exception:
+        if os.path.exists(fd.name):
+            os.unlink(fd.name)
+        raise
+
+
+def record_llm_call(
+    agent: str,
+    tier: str,
+    model: str,
+    latency_ms: int,
+    ok: bool,
+    escalated: bool = False,
+    state_dir: Path | None = None,
+) -> None:
+    """Append one routed LLM call. The file is trimmed to the last MAX_EVENTS events when large.
+
+    Args:
+        agent: Caller (builder, builder_refine, reviewer, ...)
+        tier: fast or strong
+        model: Model name used
+        latency_ms: Wall-clock latency including output validation
+        ok: False when the call raised or its output failed validation
+        escalated: True when this call is a retry on the strong tier
+    """
+    event = {
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "agent": agent,
+        "tier": tier,
+        "model": model,
+        "latency_ms": latency_ms,
+        "ok": ok,
+    }
+    if escalated:
+        event["escalated"] = True
+    path = _metrics_path(state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (json.dumps(event, separators=(",", ":")) + "\n").encode()
+    with _lock:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)  # One O_APPEND write per event: no interleaving across processes
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+        if size > COMPACT_BYTES:
+            _compact(path)
+
+
+def get_routing_24h_stats(state_dir: Path | None = None) -> dict[str, dict]:
+    """Return per-tier stats for the last 24h.
+
+    Each tier maps to calls, ok, success_rate, avg_latency_ms, escalations
+    (strong-tier calls made because the fast tier failed).
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    stats: dict[str, dict] = {}
+    latency_sums: dict[str, int] = {}
+    for e in _load_events(state_dir):
+        ts_str = e.get("ts")
+        if not ts_str:
+            continue
+        try:
+            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+            if ts < cutoff:
+                continue
+        except (ValueError, TypeError):
+            continue
+        tier = e.get("tier") or "unknown"
+        s = stats.setdefault(tier, {"calls": 0, "ok": 0, "escalations": 0})
+        s["calls"] += 1
+        if e.get("ok"):
+            s["ok"] += 1
+        if e.get("escalated"):
+            s["escalations"] += 1
+        latency_sums[tier] = latency_sums.get(tier, 0) + int(e.get("latency_ms") or 0)
+    for tier, s in stats.items():
+        s["success_rate"] = round(s["ok"] / s["calls"], 3)
+        s["avg_latency_ms"] = latency_sums[tier] // s["calls"]
+    return stats
@@ -0,0 +1,145 @@
+"""Model routing — pick a model tier per LLM call from task features.
+
+Small, low-risk work goes to the fast tier; large, risky work and refinement
+retries go to the strong tier (MAGENTIC_ANTHROPIC_MODEL). A fast-tier call that
+raises or whose output fails validation is retried once on the strong tier.
+Every call is recorded in booty.llm.metrics.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Literal, TypeVar
+
+from magentic.chat_model.anthropic_chat_model import AnthropicChatModel
+
+from booty.llm.metrics import record_llm_call
+from booty.logging import get_logger
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+ModelTier = Literal["fast", "strong"]
+
+DEFAULT_FAST_MODEL = "claude-haiku-4-5"
+DEFAULT_STRONG_MODEL = "claude-sonnet-4-5"
+DEFAULT_FAST_MAX_FILE_BYTES = 24_000
+DEFAULT_FAST_MAX_STEPS = 3
+
+
+@dataclass
+class TaskFeatures:
+    """Features of one LLM task used for routing."""
+
+    file_bytes: int = 0  # Total size of file content sent as context
+    step_count: int = 0  # Plan steps (or file changes when no plan)
+    risk_level: str = "HIGH"  # From planner.risk (LOW/MEDIUM/HIGH); unknown → HIGH
+    is_retry: bool = False  # Refinement or verifier retry
+
+
+def routing_enabled() -> bool:
+    """LLM_ROUTING_ENABLED env (default true). When false, every call uses the strong tier."""
+    return os.environ.get("LLM_ROUTING_ENABLED", "true").lower() not in ("0", "false", "no")
+
+
+def model_for_tier(tier: ModelTier) -> str:
+    """Model name for tier. LLM_FAST_MODEL / MAGENTIC_ANTHROPIC_MODEL env override."""
+    if tier == "fast":
+        return os.environ.get("LLM_FAST_MODEL", DEFAULT_FAST_MODEL)
+    return os.environ.get("MAGENTIC_ANTHROPIC_MODEL", DEFAULT_STRONG_MODEL)
+
+
+def select_tier(features: TaskFeatures) -> ModelTier:
+    """Pick tier: fast only for LOW-risk, non-retry tasks within size and step limits."""
+    if not routing_enabled() or features.is_retry:
+        return "strong"
+    if features.risk_level != "LOW":
+        return "strong"
+    max_bytes = int(os.environ.get("LLM_FAST_MAX_FILE_BYTES", DEFAULT_FAST_MAX_FILE_BYTES))
+    max_steps = int(os.environ.get("LLM_FAST_MAX_STEPS", DEFAULT_FAST_MAX_STEPS))
+    if features.file_bytes > max_bytes or features.step_count > max_steps:
+        return "strong"
+    return "fast"
+
+
+@contextmanager
+def use_model(model: str | None) -> Iterator[None]:
+    """Route magentic prompts in this block to model. None keeps the magentic default."""
+    if not model:
+        yield
+        return
+    chat_model = AnthropicChatModel(
+        model,
+        api_key=os.environ.get("MAGENTIC_ANTHROPIC_API_KEY"),
+        max_tokens=int(os.environ.get("MAGENTIC_ANTHROPIC_MAX_TOKENS", "32768")),
+    )
+    with chat_model:
+        yield
+
+
+@contextmanager
+def routed_call(
+    agent: str,
+    tier: ModelTier,
+    model: str | None = None,
+    escalated: bool = False,
+) -> Iterator[dict]:
+    """Apply the tier's model to magentic prompts in this block and record latency/outcome.
+
+    Yields a dict; set outcome["ok"] = False inside the block to record a
+    failed call without raising (e.g. output failed validation).
+    """
+    model_name = model or model_for_tier(tier)
+    start = time.monotonic()
+    outcome = {"ok": False}
+    try:
+        with use_model(model_name if tier == "fast" or model else None):
+            outcome["ok"] = True
+            yield outcome
+    except BaseException:
+        outcome["ok"] = False
+        raise
+    finally:
+        latency_ms = int((time.monotonic() - start) * 1000)
+        try:
+            record_llm_call(agent, tier, model_name, latency_ms, outcome["ok"], escalated)
+        except Exception as e:
+            logger.warning("llm_metrics_record_failed", agent=agent, error=str(e))
+
+
+def call_with_routing(
+    agent: str,
+    features: TaskFeatures,
+    fn: Callable[..., T],
+    *args: Any,
+    validate: Callable[[T], None] | None = None,
+    **kwargs: Any,
+) -> T:
+    """Call fn on the tier chosen for features; escalate to strong on failure.
+
+    validate should raise when the output is unusable (e.g. syntax error). On
+    the fast tier a raise or failed validation escalates to the strong tier.
+    On the strong tier a failed validation is only recorded; the result is
+    returned so the caller's own validation reports the error as before.
+    """
+    tier = select_tier(features)
+    if tier == "fast":
+        try:
+            with routed_call(agent, "fast"):
+                result = fn(*args, **kwargs)
+                if validate is not None:
+                    validate(result)
+            return result
+        except Exception as e:
+            logger.warning("llm_routing_escalated", agent=agent, error=str(e))
+
+    with routed_call(agent, "strong", escalated=tier == "fast") as outcome:
+        result = fn(*args, **kwargs)
+        if validate is not None:
+            try:
+                validate(result)
+            except Exception:
+                outcome["ok"] = False
+    return result
@@ -12,13 +12,14 @@ logger = get_logger()
 class TokenBudget:
     """Manage token budgets and context window limits for LLM calls."""
 
-    def __init__(self, max_context_tokens: int):
+    def __init__(self, max_context_tokens: int, model: str | None = None):
         """Initialize token budget manager.
 
         Args:
             max_context_tokens: Maximum tokens for input context
+            model: Model to count tokens for (routed tier); default MAGENTIC_ANTHROPIC_MODEL
         """
-        self.model = os.environ.get("MAGENTIC_ANTHROPIC_MODEL", "claude-sonnet-4-5")
+        self.model = model or os.environ.get("MAGENTIC_ANTHROPIC_MODEL", "claude-sonnet-4-5")
         self.max_context_tokens = max_context_tokens
         self.max_output_tokens = int(os.environ.get("MAGENTIC_ANTHROPIC_MAX_TOKENS", "32768"))
         self.client = anthropic.Anthropic(
@@ -160,6 +160,8 @@ class SimpleRateLimiter:
 
 # Rate limiter for internal test endpoints
 internal_endpoint_limiter = SimpleRateLimiter(max_requests=5, window_seconds=60)
+# Rate limiter for POST /memory/query (each batch may make up to 200 GitHub PR lookups)
+memory_query_limiter = SimpleRateLimiter(max_requests=10, window_seconds=60)
 
 
 def get_app_version() -> str:
@@ -834,6 +836,29 @@ async def lifespan(app: FastAPI):
     architect_worker_task = asyncio.create_task(_architect_worker_loop())
     app.state.architect_worker_task = architect_worker_task
 
+    # Memory compaction — drop expired records and duplicates from memory.jsonl
+    async def _memory_compaction_loop() -> None:
+        from booty.memory.compaction import compact
+        from booty.memory.store import get_memory_state_dir
+
+        while True:
+            try:
+                await asyncio.sleep(settings.MEMORY_COMPACT_INTERVAL_HOURS * 3600)
+                result = await asyncio.to_thread(
+                    compact,
+                    get_memory_state_dir(),
+                    settings.MEMORY_COMPACT_RETENTION_DAYS,
+                    settings.MEMORY_COMPACT_ARCHIVE,
+                )
+                logger.info("memory_compacted", **result.to_dict())
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("memory_compaction_failed", error=str(e), exc_info=True)
+
+    if settings.MEMORY_COMPACT_INTERVAL_HOURS > 0:
+        app.state.memory_compaction_task = asyncio.create_task(_memory_compaction_loop())
+
     logger.info("app_started")
 
     yield
@@ -862,6 +887,16 @@ async def lifespan(app: FastAPI):
             await architect_worker_task
         except asyncio.CancelledError:
             pass
+    memory_compaction_task = getattr(app.state, "memory_compaction_task", None)
+    if memory_compaction_task:
+        memory_compaction_task.cancel()
+        try:
+            await memory_compaction_task
+        except asyncio.CancelledError:
+            pass
+    from booty.memory.writer import close_memory_writers
+
+    await asyncio.to_thread(close_memory_writers)  # Flush queued memory records
     logger.info("app_stopped")
 
 
@@ -994,3 +1029,65 @@ async def info():
             "active": active_workers,
         },
     }
+
+
+@app.post("/memory/query")
+async def memory_query(request: Request, x_internal_token: str = Header(None)):
+    """Batch memory lookup for triage.
+
+    Body: {"queries": [{"repo", "pr" | "sha" | "paths", "fingerprint", "text"}, ...],
+    "max_matches": optional}. PR file lists are fetched concurrently and all
+    queries share one memory index.
+
+    Authentication: always requires a matching X-Internal-Token header; the
+    endpoint is disabled (403) in every environment until INTERNAL_TEST_TOKEN
+    is set, since it exposes memory and spends the server's GITHUB_TOKEN.
+
+    Rate limiting: 10 requests per 60 seconds per IP.
+
+    Returns:
+        dict: {"results": [{"repo", "pr", "sha", "matches" | "error"}, ...]} in query order
+    """
+    from booty.memory.batch import parse_queries, run_batch
+    from booty.memory.config import MemoryConfig, apply_memory_env_overrides
+
+    settings = get_settings()
+
+    # Reject requests without valid client IP to prevent shared rate limit bucket
+    if not request.client or not request.client.host:
+        raise HTTPException(
+            status_code=400,
+            detail="Unable to determine client IP address"
+        )
+    if memory_query_limiter.is_rate_limited(request.client.host):
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded. Max 10 requests per 60 seconds."
+        )
+
+    if not settings.INTERNAL_TEST_TOKEN:
+        raise HTTPException(
+            status_code=403,
+            detail="Memory query endpoint disabled without INTERNAL_TEST_TOKEN",
+        )
+    if x_internal_token != settings.INTERNAL_TEST_TOKEN:
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Internal-Token")
+
+    mem_config = apply_memory_env_overrides(MemoryConfig())
+    if not mem_config.enabled:
+        raise HTTPException(status_code=503, detail="Memory disabled")
+    try:
+        body = await request.json()
+        queries = parse_queries(body)
+    except ValueError as e:  # BatchQueryError, or JSONDecodeError for a malformed body
+        raise HTTPException(status_code=400, detail=str(e))
+    max_matches = body.get("max_matches") if isinstance(body, dict) else None
+    if max_matches is not None and (
+        isinstance(max_matches, bool) or not isinstance(max_matches, int) or not 1 <= max_matches <= 20
+    ):
+        raise HTTPException(status_code=400, detail="max_matches must be an integer from 1 to 20")
+
+    results = await asyncio.to_thread(
+        run_batch, queries, mem_config, settings.GITHUB_TOKEN or "", max_matches=max_matches
+    )
+    return {"results": results}
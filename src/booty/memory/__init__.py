@@ -1,8 +1,8 @@
 """Memory module — persistent event storage for agents."""
 
-from booty.memory.api import add_record
+from booty.memory.api import add_record, submit_record
 from booty.memory.config import MemoryConfig, MemoryConfigError, get_memory_config
-from booty.memory.lookup import query
+from booty.memory.lookup import query, query_many
 from booty.memory.surfacing import surface_pr_comment
 
 __all__ = [
@@ -11,5 +11,7 @@ __all__ = [
     "MemoryConfig",
     "MemoryConfigError",
     "query",
+    "query_many",
+    "submit_record",
     "surface_pr_comment",
 ]
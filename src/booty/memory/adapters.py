@@ -6,6 +6,16 @@ from datetime import datetime, timezone
 from booty.github.issues import build_sentry_issue_title
 
 
+def sentry_error_signature(event: dict) -> str:
+    """Exception type, message and culprit of a Sentry event — the text similarity keys on."""
+    meta = event.get("metadata", {})
+    exc = (event.get("exception", {}).get("values") or [{}])[0]
+    ex_type = meta.get("type") or exc.get("type") or ""
+    message = str(meta.get("value") or exc.get("value") or "")[:300]
+    parts = [f"{ex_type}: {message}" if message else ex_type, event.get("culprit") or ""]
+    return " ".join(p for p in parts if p).strip()
+
+
 def build_incident_record(event: dict, issue_number: int, repo: str) -> dict:
     """Build incident record from Sentry event and issue number."""
     severity = event.get("level", "error")
@@ -30,6 +40,7 @@ def build_incident_record(event: dict, issue_number: int, repo: str) -> dict:
         "metadata": {
             "issue_id": event.get("issue_id", ""),
             "sentry_event": event.get("id"),
+            "error_signature": sentry_error_signature(event),
         },
         "timestamp": timestamp,
     }
@@ -1,11 +1,15 @@
-"""Memory API — add_record for agents."""
+"""Memory API — add_record / submit_record for agents."""
 
-import uuid
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from booty.memory.config import MemoryConfig
-from booty.memory.store import get_memory_state_dir, read_records, append_record
+from booty.memory.index import get_memory_index
+from booty.memory.store import get_memory_state_dir
+from booty.memory.writer import get_memory_writer, resolved
+
+DEDUP_WINDOW_HOURS = 24  # add_record rejects a repeat of a dedup key within this window
 
 
 def _build_dedup_key(record: dict) -> tuple:
@@ -25,25 +29,40 @@ def _find_duplicate(state_dir: Path, key: tuple, within_hours: int = 24) -> dict
     path = state_dir / "memory.jsonl"
     if not path.exists():
         return None
-    records = read_records(path)
+    records = get_memory_index(state_dir).by_dedup_key(key)
     now = datetime.now(timezone.utc)
     cutoff = now - timedelta(hours=within_hours)
     for rec in records:  # oldest first — return first match we're keeping
-        rec_key = _build_dedup_key(rec)
-        if rec_key == key:
-            ts = rec.get("timestamp")
-            if ts:
-                try:
-                    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    if dt >= cutoff:
-                        return rec
-                except (ValueError, TypeError):
-                    pass
-            else:
-                return rec  # no timestamp, treat as match
+        if _build_dedup_key(rec) != key:
+            continue
+        ts = rec.get("timestamp")
+        if ts:
+            try:
+                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                if dt >= cutoff:
+                    return rec
+            except (ValueError, TypeError):
+                pass
+        else:
+            return rec  # no timestamp, treat as match
     return None
 
 
+def submit_record(
+    record: dict,
+    config: MemoryConfig,
+    state_dir: Path | None = None,
+) -> Future:
+    """Queue record for the group-commit writer without waiting for the fsync.
+
+    The future resolves with the add_record result; duplicates (including records
+    still waiting to be flushed) and disabled memory resolve immediately.
+    """
+    if not config.enabled:
+        return resolved({"added": True, "id": None})
+    return get_memory_writer(state_dir or get_memory_state_dir()).submit(record)
+
+
 def add_record(
     record: dict,
     config: MemoryConfig,
@@ -53,27 +72,6 @@ def add_record(
 
     When memory disabled, returns {added: True, id: None} without persisting.
     Dedup by (type, repo, sha, fingerprint, pr_number) within 24h; exclude null/empty from key.
+    Blocks until the writer's batch containing the record is durable.
     """
-    if not config.enabled:
-        return {"added": True, "id": None}
-
-    state_dir = state_dir or get_memory_state_dir()
-    path = state_dir / "memory.jsonl"
-
-    key = _build_dedup_key(record)
-    existing = _find_duplicate(state_dir, key, within_hours=24)
-    if existing:
-        return {
-            "added": False,
-            "reason": "duplicate",
-            "existing_id": existing.get("id"),
-        }
-
-    record_id = str(uuid.uuid4())
-    record = dict(record)
-    record["id"] = record_id
-    if "timestamp" not in record or record["timestamp"] is None:
-        record["timestamp"] = datetime.now(timezone.utc).isoformat()
-
-    append_record(path, record)
-    return {"added": True, "id": record_id}
+    return submit_record(record, config, state_dir).result()
@@ -0,0 +1,143 @@
+"""Batch memory queries — triage many PRs, SHAs or path sets in one call.
+
+Shared by `booty memory query --from-file` and POST /memory/query. Each query
+is a dict with repo plus any of pr, sha, paths, fingerprint and text. Queries
+naming a PR or SHA without paths get the PR's changed files from GitHub
+concurrently (one fetch per distinct PR or SHA, BATCH_GITHUB_WORKERS at a
+time); all lookups then run through lookup.query_many against one index.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from booty.memory.lookup import query_many
+from booty.memory.pr_map import pr_for_sha
+
+if TYPE_CHECKING:
+    from booty.memory.config import MemoryConfig
+
+MAX_BATCH_QUERIES = 200
+BATCH_GITHUB_WORKERS = 8
+_QUERY_KEYS = {"repo", "pr", "sha", "paths", "fingerprint", "text"}
+
+
+class BatchQueryError(ValueError):
+    """Raised when a batch is malformed (not a list of query objects, too large, bad fields)."""
+
+
+def parse_queries(items: object, default_repo: str | None = None) -> list[dict]:
+    """Validate a batch payload: a list of query objects, or {"queries": [...]}.
+
+    Returns normalized copies with repo filled from default_repo when missing.
+    """
+    if isinstance(items, dict):
+        items = items.get("queries")
+    if not isinstance(items, list):
+        raise BatchQueryError("Expected a list of queries or an object with a 'queries' list")
+    if len(items) > MAX_BATCH_QUERIES:
+        raise BatchQueryError(f"At most {MAX_BATCH_QUERIES} queries per batch (got {len(items)})")
+    queries = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise BatchQueryError(f"Query {i}: expected an object")
+        unknown = set(item) - _QUERY_KEYS
+        if unknown:
+            raise BatchQueryError(f"Query {i}: unknown keys {sorted(unknown)}")
+        q = dict(item)
+        q["repo"] = (q.get("repo") or default_repo or "").strip()
+        if not q["repo"]:
+            raise BatchQueryError(f"Query {i}: repo required")
+        if q.get("pr") is not None and (isinstance(q["pr"], bool) or not isinstance(q["pr"], int)):
+            raise BatchQueryError(f"Query {i}: pr must be an integer")
+        for key in ("sha", "fingerprint", "text"):
+            if q.get(key) is not None and not isinstance(q[key], str):
+                raise BatchQueryError(f"Query {i}: {key} must be a string")
+        paths = q.get("paths")
+        if paths is not None and (
+            not isinstance(paths, list) or not all(isinstance(p, str) for p in paths)
+        ):
+            raise BatchQueryError(f"Query {i}: paths must be a list of strings")
+        if not any(q.get(k) for k in ("pr", "sha", "paths", "fingerprint", "text")):
+            raise BatchQueryError(f"Query {i}: one of pr, sha, paths, fingerprint or text required")
+        queries.append(q)
+    return queries
+
+
+def _pr_files(
+    token: str, repo: str, pr: int | None, sha: str | None, state_dir: Path | None
+) -> tuple[int, list[str]]:
+    """(pr_number, changed file paths) for a PR, or for the PR of a commit SHA."""
+    from github import Github
+
+    gh_repo = Github(token).get_repo(repo, lazy=True)  # One client per call; not shared across threads
+    if pr is None:
+        pr = pr_for_sha(repo, sha or "", state_dir)
+        if pr is None:
+            pulls = list(gh_repo.get_commit(sha).get_pulls())
+            if not pulls:
+                raise LookupError("No PR found for sha")
+            pr = pulls[0].number
+    return pr, [f.filename for f in gh_repo.get_pull(pr).get_files()]
+
+
+def resolve_paths(
+    queries: list[dict], token: str, state_dir: Path | None = None
+) -> list[str | None]:
+    """Fill paths (and pr) in place for queries that name a PR or SHA but no paths.
+
+    Returns one error message (or None) per query.
+    """
+    targets: dict[tuple, list[int]] = {}
+    for i, q in enumerate(queries):
+        if not q.get("paths") and (q.get("pr") is not None or q.get("sha")):
+            key = (q["repo"], q.get("pr"), None if q.get("pr") is not None else q["sha"])
+            targets.setdefault(key, []).append(i)
+    errors: list[str | None] = [None] * len(queries)
+    if not targets:
+        return errors
+    if not token.strip():
+        for indices in targets.values():
+            for i in indices:
+                errors[i] = "GITHUB_TOKEN required"
+        return errors
+
+    with ThreadPoolExecutor(max_workers=min(BATCH_GITHUB_WORKERS, len(targets))) as pool:
+        futures = {key: pool.submit(_pr_files, token, *key, state_dir) for key in targets}
+    for key, future in futures.items():
+        try:
+            pr, paths = future.result()
+        except Exception as e:
+            for i in targets[key]:
+                errors[i] = str(e) or type(e).__name__
+            continue
+        for i in targets[key]:
+            queries[i]["pr"] = pr
+            queries[i]["paths"] = paths
+    return errors
+
+
+def run_batch(
+    queries: list[dict],
+    config: "MemoryConfig | None",
+    token: str,
+    state_dir: Path | None = None,
+    max_matches: int | None = None,
+) -> list[dict]:
+    """Resolve PR files and query memory for parsed queries.
+
+    Returns one {"repo", "pr", "sha", "matches"} dict per query, in order, with
+    "error" instead of "matches" for queries whose PR files could not be fetched.
+    """
+    errors = resolve_paths(queries, token, state_dir)
+    ok = [q for q, error in zip(queries, errors) if error is None]
+    matches = iter(query_many(ok, config=config, state_dir=state_dir, max_matches=max_matches))
+    results = []
+    for q, error in zip(queries, errors):
+        result = {"repo": q["repo"], "pr": q.get("pr"), "sha": q.get("sha")}
+        if error is None:
+            result["matches"] = next(matches)
+        else:
+            result["error"] = error
+        results.append(result)
+    return results
@@ -0,0 +1,127 @@
+"""Memory compaction — drop expired records and collapse duplicates in memory.jsonl.
+
+The file is rewritten atomically while holding the same fcntl lock append_record
+uses; appenders blocked on the old file notice the replacement and reopen.
+Evicted records can be appended to a gzip archive next to memory.jsonl.
+Unparsable lines are archived with them, or left in place when not archiving.
+"""
+
+import fcntl
+import gzip
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from booty.memory.api import DEDUP_WINDOW_HOURS, _build_dedup_key
+from booty.memory.index import get_memory_index, timestamp_epoch
+from booty.memory.lookup import within_retention
+from booty.memory.pr_map import prune_pr_map
+from booty.memory.store import _is_current, _memory_jsonl_path
+
+ARCHIVE_FILENAME = "memory.archive.jsonl.gz"
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of one compaction run."""
+
+    kept: int = 0
+    expired: int = 0
+    duplicates: int = 0
+    corrupt: int = 0  # Unparsable lines (e.g. a torn write after a crash)
+    pr_map_pruned: int = 0  # sha -> PR entries older than retention
+    bytes_before: int = 0
+    bytes_after: int = 0
+    archived_to: str | None = None
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "bytes_reclaimed": self.bytes_reclaimed}
+
+
+def _is_duplicate(record: dict, kept_at: dict[tuple, float | None]) -> bool:
+    """Would add_record have rejected record given the records kept so far?"""
+    key = _build_dedup_key(record)
+    if not key:
+        return False
+    ts = timestamp_epoch(record.get("timestamp"))
+    if key in kept_at:
+        prev = kept_at[key]
+        if prev is None or ts is None or ts - prev <= DEDUP_WINDOW_HOURS * 3600:
+            return True
+    kept_at[key] = ts
+    return False
+
+
+def compact(
+    state_dir: Path,
+    retention_days: int,
+    archive: bool = False,
+) -> CompactionResult:
+    """Rewrite memory.jsonl without expired records and dedup-window duplicates."""
+    path = _memory_jsonl_path(state_dir)
+    result = CompactionResult()
+    result.pr_map_pruned = prune_pr_map(state_dir, retention_days)
+    if not path.exists():
+        return result
+
+    with open(path, "rb") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            if not _is_current(path, f.fileno()):  # Another compaction replaced it first
+                return compact(state_dir, retention_days, archive)
+            result.bytes_before = os.fstat(f.fileno()).st_size
+            kept: list[bytes] = []
+            evicted: list[bytes] = []
+            kept_at: dict[tuple, float | None] = {}
+            for raw in f:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    result.corrupt += 1
+                    (evicted if archive else kept).append(line)
+                    continue
+                if not isinstance(record, dict) or not within_retention(record, retention_days):
+                    result.expired += 1
+                    evicted.append(line)
+                elif _is_duplicate(record, kept_at):
+                    result.duplicates += 1
+                    evicted.append(line)
+                else:
+                    result.kept += 1
+                    kept.append(line)
+
+            if not evicted:
+                result.bytes_after = result.bytes_before
+                return result
+            if archive:
+                archive_path = state_dir / ARCHIVE_FILENAME
+                with gzip.open(archive_path, "ab") as gz:  # Appends a new gzip member
+                    gz.write(b"".join(line + b"\n" for line in evicted))
+                result.archived_to = str(archive_path)
+
+            fd, tmp = tempfile.mkstemp(dir=state_dir, prefix=".memory.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    for line in kept:
+                        out.write(line + b"\n")
+                    out.flush()
+                    os.fsync(out.fileno())
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            result.bytes_after = path.stat().st_size
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    get_memory_index(state_dir).rebuild()  # Now rather than on the next query
+    return result
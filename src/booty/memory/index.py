@@ -0,0 +1,420 @@
+"""Memory index — SQLite sidecar over memory.jsonl for indexed lookups.
+
+memory.jsonl stays the append-only source of truth (and the import/export
+format); memory.index.sqlite holds each line's byte offset with indexes on
+repo + timestamp, fingerprint and dedup key; normalized record paths are kept
+in record_paths and loaded into an in-memory PathTrie that scores path
+overlap; MinHash signatures of record text are kept in records.sig with their
+LSH band hashes in record_bands (see similarity.py). Matching lines are read back with pread. Every read first syncs the
+index: lines appended since the last sync are ingested from the stored byte
+offset, and a file that shrank or was replaced (compaction, restore from an
+export) is reindexed from scratch. Deleting the sidecar is always safe.
+
+Lookups return a superset of candidates; callers apply the exact retention,
+repo and fingerprint rules in Python, so results are identical to a full scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from array import array
+from datetime import datetime
+from pathlib import Path
+
+from booty.logging import get_logger
+from booty.memory import similarity
+from booty.memory.paths import PathTrie, normalize_path
+
+logger = get_logger()
+
+INDEX_FILENAME = "memory.index.sqlite"
+SCHEMA_VERSION = 5
+_PREFIX_BYTES = 4096  # Leading bytes hashed to detect a rewritten memory.jsonl
+_READ_CHUNK = 16 * 1024 * 1024
+_SIMILAR_CANDIDATES = 2000  # Newest band matches scored per query; bounds hot (generic) bands
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY,
+    id TEXT,
+    repo TEXT NOT NULL,
+    ts REAL,
+    fingerprint TEXT,
+    dedup_key TEXT,
+    pos INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    sig BLOB
+);
+CREATE INDEX IF NOT EXISTS records_repo_ts ON records(repo, ts);
+CREATE INDEX IF NOT EXISTS records_ts ON records(ts);
+CREATE INDEX IF NOT EXISTS records_fingerprint ON records(fingerprint);
+CREATE INDEX IF NOT EXISTS records_dedup_key ON records(dedup_key);
+CREATE TABLE IF NOT EXISTS record_paths (path TEXT NOT NULL, seq INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS record_bands (band INTEGER NOT NULL, seq INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS record_bands_band ON record_bands(band);
+CREATE TABLE IF NOT EXISTS repo_versions (repo TEXT PRIMARY KEY, version INTEGER NOT NULL);
+"""
+
+
+def dedup_key_text(key: tuple) -> str | None:
+    """Stable text form of an api._build_dedup_key tuple (None for an empty key)."""
+    return json.dumps(key, default=str) if key else None
+
+
+def timestamp_epoch(ts: object) -> float | None:
+    """Epoch seconds for an aware ISO timestamp; None where within_retention would reject it."""
+    if not isinstance(ts, str) or not ts:
+        return None
+    try:
+        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt.timestamp() if dt.tzinfo is not None else None
+
+
+class MemoryIndex:
+    """SQLite index for one state dir. Thread-safe; one instance per process via get_memory_index."""
+
+    def __init__(self, state_dir: Path):
+        self.jsonl_path = state_dir / "memory.jsonl"
+        self.db_path = state_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._synced_stat: tuple[int, int, int] | None = None  # (ino, size, mtime_ns)
+        self._trie: PathTrie | None = None
+        self._trie_generation = ""
+        self._trie_rowid = 0  # Last record_paths rowid loaded into the trie
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        version = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if version is not None and int(version[0]) != SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE records; DROP TABLE record_paths; DROP TABLE IF EXISTS record_bands;"
+                " DROP TABLE IF EXISTS repo_versions; DELETE FROM meta;"
+            )
+            conn.executescript(_SCHEMA)
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (str(SCHEMA_VERSION),)
+        )
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- sync -------------------------------------------------------------
+
+    def _meta(self) -> dict[str, str]:
+        return dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+
+    def _set_meta(self, **values: object) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(k, str(v)) for k, v in values.items()],
+        )
+
+    def _clear(self) -> None:
+        self._conn.execute("DELETE FROM records")
+        self._conn.execute("DELETE FROM record_paths")
+        self._conn.execute("DELETE FROM record_bands")
+        self._conn.execute("DELETE FROM repo_versions")
+        generation = int(self._meta().get("generation", 0)) + 1  # Invalidates loaded tries
+        self._set_meta(offset=0, ino=0, prefix_len=0, prefix_hash="", generation=generation)
+
+    @staticmethod
+    def _prefix_hash(f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+    def _insert(self, raw: bytes, pos: int, build_dedup_key) -> None:
+        try:
+            record = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return  # Partial or corrupt line — read_records skips these too
+        if not isinstance(record, dict):
+            return
+        fp = record.get("fingerprint")
+        repo = str(record.get("repo") or "").strip()
+        sig = similarity.signature(similarity.record_text(record))
+        cur = self._conn.execute(
+            "INSERT INTO records (id, repo, ts, fingerprint, dedup_key, pos, length, sig)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                record.get("id"),
+                repo,
+                timestamp_epoch(record.get("timestamp")),
+                fp.strip() if isinstance(fp, str) and fp.strip() else None,
+                dedup_key_text(build_dedup_key(record)),
+                pos,
+                len(raw),
+                sig.tobytes() if sig is not None else None,
+            ),
+        )
+        self._conn.execute(
+            "INSERT INTO repo_versions (repo, version) VALUES (?, 1)"
+            " ON CONFLICT(repo) DO UPDATE SET version = version + 1",
+            (repo,),
+        )
+        paths = record.get("paths") or []
+        if isinstance(paths, list):
+            # One row per occurrence: path_match_score counts duplicate paths
+            normalized = [n for n in map(normalize_path, paths) if n]
+            self._conn.executemany(
+                "INSERT INTO record_paths (path, seq) VALUES (?, ?)",
+                [(p, cur.lastrowid) for p in normalized],
+            )
+        if sig is not None:
+            self._conn.executemany(
+                "INSERT INTO record_bands (band, seq) VALUES (?, ?)",
+                [(band, cur.lastrowid) for band in similarity.band_keys(sig)],
+            )
+
+    def sync(self) -> int:
+        """Ingest lines appended to memory.jsonl since the last sync. Returns lines ingested."""
+        with self._lock:
+            return self._sync_locked()
+
+    def _sync_locked(self) -> int:
+        from booty.memory.api import _build_dedup_key
+
+        try:
+            st = os.stat(self.jsonl_path)
+            current = (st.st_ino, st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            current = None
+        if current is not None and current == self._synced_stat:
+            return 0
+
+        added = 0
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            meta = self._meta()
+            offset = int(meta.get("offset", 0))
+            if current is None:
+                if offset:
+                    self._clear()
+                self._conn.execute("COMMIT")
+                self._synced_stat = None
+                return 0
+            with open(self.jsonl_path, "rb") as f:
+                prefix_len = int(meta.get("prefix_len", 0))
+                replaced = (
+                    int(meta.get("ino", 0)) != st.st_ino
+                    or st.st_size < offset
+                    or self._prefix_hash(f, prefix_len) != meta.get("prefix_hash", "")
+                )
+                if replaced and offset:
+                    logger.info("memory_index_rebuild", path=str(self.jsonl_path))
+                if replaced:
+                    self._clear()
+                    offset = 0
+                f.seek(offset)
+                pending = b""
+                while chunk := f.read(_READ_CHUNK):
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for line in lines:
+                        if line.strip():
+                            self._insert(line, offset, _build_dedup_key)
+                            added += 1
+                        offset += len(line) + 1
+                prefix_len = min(offset, _PREFIX_BYTES)
+                self._set_meta(
+                    offset=offset,
+                    ino=st.st_ino,
+                    prefix_len=prefix_len,
+                    prefix_hash=self._prefix_hash(f, prefix_len),
+                )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        # A trailing partial line keeps the stat "dirty" so it is retried once completed
+        self._synced_stat = current if not pending else None
+        return added
+
+    def rebuild(self) -> int:
+        """Drop and re-ingest everything. Returns records indexed."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._clear()
+            self._conn.execute("COMMIT")
+            self._synced_stat = None
+            self._sync_locked()
+            return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    # -- queries ----------------------------------------------------------
+
+    def _refresh_trie(self) -> PathTrie:
+        """Load record_paths rows added since the last refresh (all of them after a clear)."""
+        generation = self._meta().get("generation", "0")
+        if self._trie is None or generation != self._trie_generation:
+            self._trie = PathTrie()
+            self._trie_generation = generation
+            self._trie_rowid = 0
+        rows = self._conn.execute(
+            "SELECT rowid, path, seq FROM record_paths WHERE rowid > ? ORDER BY rowid",
+            (self._trie_rowid,),
+        ).fetchall()
+        for rowid, path, seq in rows:
+            self._trie.add(path, seq)
+            self._trie_rowid = rowid
+        return self._trie
+
+    def _read(self, rows: list[tuple[int, int]]) -> list[dict]:
+        with open(self.jsonl_path, "rb") as f:
+            fd = f.fileno()
+            return [json.loads(os.pread(fd, length, pos)) for pos, length in rows]
+
+    def _similar(self, sig: array, repo: str | None, since_epoch: float) -> dict[int, float]:
+        """seq -> estimated similarity for records sharing an LSH band with sig (above threshold)."""
+        bands = similarity.band_keys(sig)
+        where = [
+            f"seq IN (SELECT seq FROM record_bands WHERE band IN ({','.join('?' * len(bands))}))",
+            "ts >= ?",
+        ]
+        params: list = [*bands, since_epoch]
+        if repo and repo.strip():
+            where.append("repo = ?")
+            params.append(repo.strip())
+        rows = self._conn.execute(
+            f"SELECT seq, sig FROM records WHERE {' AND '.join(where)} ORDER BY seq DESC LIMIT ?",
+            [*params, _SIMILAR_CANDIDATES],
+        ).fetchall()
+        scores = {}
+        for seq, blob in rows:
+            score = similarity.estimate(sig, similarity.from_blob(blob))
+            if score >= similarity.SIMILARITY_THRESHOLD:
+                scores[seq] = score
+        return scores
+
+    def _select(self, sql: str, params: list, match=None):
+        """Sync, then run sql (selecting seq, pos, length) and read the matching lines.
+
+        With match, match() runs in the same snapshot and returns {seq: score};
+        sql gets a JSON array of those seqs as its first parameter and results
+        carry their score (None without match). Retries once when memory.jsonl
+        is replaced mid-read.
+        """
+        for attempt in range(2):
+            with self._lock:
+                if attempt:
+                    self._synced_stat = None
+                self._sync_locked()
+                self._conn.execute("BEGIN")  # One snapshot for trie, bands and records
+                try:
+                    scores: dict = {}
+                    query_params = params
+                    if match is not None:
+                        scores = match()
+                        query_params = [json.dumps(list(scores)), *params]
+                    rows = self._conn.execute(sql, query_params).fetchall()
+                finally:
+                    self._conn.execute("COMMIT")
+                if not rows:
+                    return []
+                try:
+                    records = self._read([(pos, length) for _, pos, length in rows])
+                except (OSError, ValueError):
+                    if attempt:
+                        raise  # memory.jsonl replaced mid-read twice in a row
+                    continue
+                return [(rec, scores.get(seq)) for rec, (seq, _, _) in zip(records, rows)]
+        return []
+
+    def candidates(
+        self,
+        repo: str | None,
+        since_epoch: float,
+        paths: list[str],
+        fingerprints: list[str],
+        text: str | None = None,
+    ) -> list[tuple[dict, int, float]]:
+        """(record, path_overlap, similarity) since since_epoch (and in repo, if given), in file order.
+
+        Includes every record whose paths overlap paths (scored like
+        path_match_score), whose fingerprint is in fingerprints, or whose text
+        is at least SIMILARITY_THRESHOLD similar to text (similarity is 0.0
+        otherwise).
+        """
+        fps = sorted({fp.strip() for fp in fingerprints if fp and fp.strip()})
+        match = ["SELECT value FROM json_each(?)"]
+        params: list = []
+        if fps:
+            match.append(f"SELECT seq FROM records WHERE fingerprint IN ({','.join('?' * len(fps))})")
+            params.extend(fps)
+        where = [f"seq IN ({' UNION '.join(match)})", "ts >= ?"]
+        params.append(since_epoch)
+        if repo and repo.strip():
+            where.append("repo = ?")
+            params.append(repo.strip())
+        sql = f"SELECT seq, pos, length FROM records WHERE {' AND '.join(where)} ORDER BY seq"
+        sig = similarity.signature(text) if text else None
+
+        def scored() -> dict[int, tuple[int, float]]:
+            overlaps = self._refresh_trie().scores(paths)
+            similar = self._similar(sig, repo, since_epoch) if sig is not None else {}
+            return {
+                seq: (overlaps.get(seq, 0), similar.get(seq, 0.0))
+                for seq in overlaps.keys() | similar.keys()
+            }
+
+        return [
+            (rec, *(score or (0, 0.0))) for rec, score in self._select(sql, params, match=scored)
+        ]
+
+    def by_dedup_key(self, key: tuple) -> list[dict]:
+        """Records with the given dedup key, oldest first."""
+        text = dedup_key_text(key)
+        if text is None:
+            return []
+        rows = self._select(
+            "SELECT seq, pos, length FROM records WHERE dedup_key = ? ORDER BY seq", [text]
+        )
+        return [rec for rec, _ in rows]
+
+    def version(self, repo: str | None) -> tuple[str, int]:
+        """Changes whenever records for repo (any repo when empty) are ingested or the index is rebuilt."""
+        with self._lock:
+            self._sync_locked()
+            generation = self._meta().get("generation", "0")
+            if repo and repo.strip():
+                row = self._conn.execute(
+                    "SELECT version FROM repo_versions WHERE repo = ?", (repo.strip(),)
+                ).fetchone()
+            else:
+                row = self._conn.execute("SELECT MAX(seq) FROM records").fetchone()
+            return generation, (row[0] or 0) if row else 0
+
+    def count_since(self, since_epoch: float) -> int:
+        with self._lock:
+            self._sync_locked()
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM records WHERE ts >= ?", (since_epoch,)
+            ).fetchone()[0]
+
+
+_indexes: dict[Path, MemoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_memory_index(state_dir: Path) -> MemoryIndex:
+    """Shared index for state_dir (opened once per process)."""
+    key = Path(state_dir).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None or not index.db_path.exists():
+            index = MemoryIndex(key)
+            _indexes[key] = index
+        return index
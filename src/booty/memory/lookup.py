@@ -1,45 +1,38 @@
 """Memory lookup — deterministic query engine for related records."""
 
 import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from booty.memory.store import get_memory_state_dir, read_records
+from booty.memory.index import MemoryIndex, get_memory_index
+from booty.memory.paths import PathTrie, normalize_path  # noqa: F401 (re-export)
+from booty.memory.store import get_memory_state_dir
 
 if TYPE_CHECKING:
     from booty.memory.config import MemoryConfig
 
 SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, "unknown": 4}
-
-
-def normalize_path(p: str) -> str:
-    """Strip, replace backslash with forward slash, lstrip './'. Use PurePosixPath. Empty/invalid -> ''."""
-    if not p or not isinstance(p, str):
-        return ""
-    s = p.strip().replace("\\", "/").lstrip("./")
-    return str(PurePosixPath(s)) if s else ""
+VERIFIER_FINGERPRINT_PREFIXES = ("import:", "compile:", "test:", "install:")
+QUERY_CACHE_SIZE = 1024
+QUERY_CACHE_TTL_SECONDS = 300.0  # Bounds staleness from records aging out of retention
 
 
 def path_match_score(candidate_paths: list[str], record_paths: list[str]) -> int:
     """
     For each candidate path: check prefix/containment with each record path.
     Exact match = 2, prefix match (either direction) = 1; sum across pairs.
+    query() gets the same scores from the index's trie of all record paths.
     """
-    total = 0
-    for cand in candidate_paths:
-        cn = normalize_path(cand)
-        if not cn:
-            continue
-        for rec in record_paths:
-            rn = normalize_path(rec)
-            if not rn:
-                continue
-            if cn == rn:
-                total += 2
-            elif rn.startswith(cn + "/") or cn.startswith(rn + "/"):
-                total += 1
-    return total
+    trie = PathTrie()
+    for rec in record_paths:
+        rn = normalize_path(rec)
+        if rn:
+            trie.add(rn, 0)
+    return trie.scores(candidate_paths).get(0, 0)
 
 
 def fingerprint_matches(candidate_fp: str | None, record_fp: str | None) -> bool:
@@ -77,7 +70,7 @@ def repo_matches(record: dict, repo: str | None) -> bool:
 
 
 def sort_key(record: dict) -> tuple:
-    """(severity_rank, -timestamp_epoch, -path_overlap, id). Severity desc, recency desc, path_overlap desc, id asc."""
+    """(severity_rank, -timestamp_epoch, -path_overlap, -similarity, id). Severity desc, recency desc, path_overlap desc, similarity desc, id asc."""
     sev = (record.get("severity") or "").lower()
     severity_rank = SEVERITY_ORDER.get(sev, 4)
     ts = record.get("timestamp") or ""
@@ -87,8 +80,9 @@ def sort_key(record: dict) -> tuple:
     except (ValueError, TypeError):
         epoch = 0.0
     path_overlap = record.get("path_overlap", 0)
+    similarity = record.get("similarity", 0.0)
     rec_id = record.get("id", "")
-    return (severity_rank, -epoch, -path_overlap, rec_id)
+    return (severity_rank, -epoch, -path_overlap, -similarity, rec_id)
 
 
 def result_subset(record: dict) -> dict:
@@ -102,6 +96,42 @@ def result_subset(record: dict) -> dict:
     }
 
 
+class QueryCache:
+    """LRU of query results, each stored with the index version it was computed at."""
+
+    def __init__(self, size: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL_SECONDS):
+        self.size = size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[tuple, float, list[dict]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, version: tuple) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            cached_version, stored_at, results = entry
+            if cached_version != version or time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return [dict(r) for r in results]
+
+    def put(self, key: tuple, version: tuple, results: list[dict]) -> None:
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), [dict(r) for r in results])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_query_cache = QueryCache()
+
+
 def query(
     paths: list[str],
     repo: str,
@@ -110,38 +140,104 @@ def query(
     config: "MemoryConfig | None" = None,
     state_dir: Path | None = None,
     max_matches: int | None = None,
+    text: str | None = None,
 ) -> list[dict]:
     """
     Return related memory records from last 90 days.
-    Match by path intersection OR fingerprint (additive).
+    Match by path intersection OR fingerprint OR text similarity (additive).
+    text (title / error message) is compared with record title, summary and
+    error signature; records at least similarity.SIMILARITY_THRESHOLD alike match.
     Sorted per MEM-17; limited by max_matches or config.max_matches.
     Returns result subset (type, timestamp, summary, links, id).
+    Results are cached per (repo, paths hash, fingerprint, text) until records for the repo land.
     """
-    if not paths and not fingerprint:
+    if not paths and not fingerprint and not (text and text.strip()):
         return []
+    index = get_memory_index(state_dir or get_memory_state_dir())
+    return _query_index(index, paths, repo, fingerprint, text, *_limits(config, max_matches))
+
+
+def query_many(
+    queries: list[dict],
+    config: "MemoryConfig | None" = None,
+    state_dir: Path | None = None,
+    max_matches: int | None = None,
+) -> list[list[dict]]:
+    """
+    Run query() for each {"paths", "repo", "fingerprint", "text"} dict (missing keys
+    default to empty) against one index, synced once. Returns one result list per
+    query, in input order; identical queries are computed once.
+    """
+    index = get_memory_index(state_dir or get_memory_state_dir())
+    index.sync()
+    limits = _limits(config, max_matches)
+    computed: dict[tuple, list[dict]] = {}
+    results: list[list[dict]] = []
+    for q in queries:
+        paths = list(q.get("paths") or [])
+        args = (tuple(paths), q.get("repo") or "", q.get("fingerprint"), q.get("text"))
+        if args not in computed:
+            computed[args] = _query_index(index, paths, *args[1:], *limits)
+        results.append([dict(r) for r in computed[args]])
+    return results
 
-    state_dir = state_dir or get_memory_state_dir()
-    path = state_dir / "memory.jsonl"
-    records = read_records(path)
 
+def _limits(config: "MemoryConfig | None", max_matches: int | None) -> tuple[int, int]:
+    """(retention_days, max_n) from config, with max_matches overriding config.max_matches."""
     retention_days = config.retention_days if config else 90
     max_n = (
         max_matches
         if max_matches is not None
         else (config.max_matches if config else 3)
     )
+    return retention_days, max_n
+
+
+def _query_index(
+    index: MemoryIndex,
+    paths: list[str],
+    repo: str,
+    fingerprint: str | None,
+    text: str | None,
+    retention_days: int,
+    max_n: int,
+) -> list[dict]:
+    """query() against an already-resolved index."""
+    if not paths and not fingerprint and not (text and text.strip()):
+        return []
+    cache_key = (
+        str(index.db_path),
+        (repo or "").strip(),
+        derive_paths_hash(paths or []),
+        fingerprint or "",
+        hashlib.sha256((text or "").encode()).hexdigest()[:16],
+        retention_days,
+        max_n,
+    )
+    version = index.version(repo)
+    cached = _query_cache.get(cache_key, version)
+    if cached is not None:
+        return cached
+
+    # Indexed pre-filter (superset) with trie path overlap; the exact rules below decide membership
+    fingerprints: list[str] = []
+    if fingerprint:
+        fingerprints.append(fingerprint)
+        if paths:
+            ph = derive_paths_hash(paths)
+            fingerprints.extend(p + ph for p in VERIFIER_FINGERPRINT_PREFIXES)
+    since = datetime.now(timezone.utc) - timedelta(days=retention_days, seconds=1)
+    records = index.candidates(
+        repo, since.timestamp(), paths or [], fingerprints, text
+    )
 
     candidates: list[dict] = []
-    for r in records:
+    for r, path_overlap, similarity in records:
         if not within_retention(r, retention_days):
             continue
         if not repo_matches(r, repo):
             continue
 
-        path_overlap = 0
-        if paths:
-            path_overlap = path_match_score(paths, r.get("paths") or [])
-
         fp_match = False
         if fingerprint:
             rec_fp = r.get("fingerprint") or ""
@@ -150,15 +246,18 @@ def query(
             elif paths:
                 # verifier_cluster: derive paths_hash from candidate paths, match record fingerprint
                 ph = derive_paths_hash(paths)
-                for prefix in ("import:", "compile:", "test:", "install:"):
+                for prefix in VERIFIER_FINGERPRINT_PREFIXES:
                     if rec_fp == prefix + ph:
                         fp_match = True
                         break
 
-        if path_overlap > 0 or fp_match:
+        if path_overlap > 0 or fp_match or similarity > 0:
             r_copy = dict(r)
             r_copy["path_overlap"] = path_overlap
+            r_copy["similarity"] = similarity
             candidates.append(r_copy)
 
     candidates.sort(key=sort_key)
-    return [result_subset(r) for r in candidates[:max_n]]
+    results = [result_subset(r) for r in candidates[:max_n]]
+    _query_cache.put(cache_key, version, results)
+    return results
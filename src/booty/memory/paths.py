@@ -0,0 +1,68 @@
+"""Memory path matching — normalization and a prefix trie over record paths."""
+
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+from typing import Hashable, Iterable
+
+
+def normalize_path(p: str) -> str:
+    """Strip, replace backslash with forward slash, lstrip './'. Use PurePosixPath. Empty/invalid -> ''."""
+    if not p or not isinstance(p, str):
+        return ""
+    s = p.strip().replace("\\", "/").lstrip("./")
+    return str(PurePosixPath(s)) if s else ""
+
+
+class _Node:
+    __slots__ = ("children", "keys")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.keys: list[Hashable] = []
+
+
+class PathTrie:
+    """Normalized record paths split on "/", each node holding the keys of records ending there.
+
+    A key is added once per occurrence of the path in its record, so scores sum
+    over (candidate, record path) pairs exactly like path_match_score.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+
+    def add(self, path: str, key: Hashable) -> None:
+        """Add an already-normalized, non-empty path for key."""
+        node = self._root
+        for part in path.split("/"):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+            node = child
+        node.keys.append(key)
+
+    def scores(self, candidate_paths: Iterable[str]) -> dict[Hashable, int]:
+        """Key -> path overlap: exact match = 2, ancestor or descendant = 1, summed over pairs."""
+        out: dict[Hashable, int] = {}
+        for cand in candidate_paths:
+            cn = normalize_path(cand)
+            if not cn:
+                continue
+            parts = cn.split("/")
+            node = self._root
+            for depth, part in enumerate(parts, 1):
+                node = node.children.get(part)
+                if node is None:
+                    break
+                weight = 2 if depth == len(parts) else 1  # Exact, else record path is an ancestor
+                for key in node.keys:
+                    out[key] = out.get(key, 0) + weight
+            else:
+                stack = list(node.children.values())
+                while stack:  # Descendants
+                    below = stack.pop()
+                    for key in below.keys:
+                        out[key] = out.get(key, 0) + 1
+                    stack.extend(below.children.values())
+        return out
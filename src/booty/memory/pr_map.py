@@ -0,0 +1,66 @@
+"""Commit SHA -> PR number map, populated from pull_request webhooks.
+
+Lets Governor HOLD surfacing find the PR for a commit without a
+get_commit().get_pulls() round trip. Head SHAs are recorded on every
+pull_request event and the merge commit SHA once a PR is merged. Stored in
+pr_shas.sqlite in the memory state dir; entries older than retention are pruned
+by compaction.
+"""
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from booty.memory.store import get_memory_state_dir
+
+PR_MAP_FILENAME = "pr_shas.sqlite"
+
+
+def _connect(state_dir: Path | None) -> sqlite3.Connection:
+    state_dir = state_dir or get_memory_state_dir()
+    conn = sqlite3.connect(state_dir / PR_MAP_FILENAME, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sha_prs ("
+        " repo TEXT NOT NULL, sha TEXT NOT NULL, pr_number INTEGER NOT NULL,"
+        " updated_at REAL NOT NULL, PRIMARY KEY (repo, sha))"
+    )
+    return conn
+
+
+def record_pr_shas(
+    repo: str,
+    pr_number: int,
+    shas: list[str],
+    state_dir: Path | None = None,
+) -> None:
+    """Map each non-empty sha in repo to pr_number (latest write wins)."""
+    rows = [(repo, sha, pr_number, time.time()) for sha in shas if sha]
+    if not repo or not pr_number or not rows:
+        return
+    with closing(_connect(state_dir)) as conn, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO sha_prs (repo, sha, pr_number, updated_at) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+
+
+def pr_for_sha(repo: str, sha: str, state_dir: Path | None = None) -> int | None:
+    """PR number recorded for sha in repo, or None."""
+    if not repo or not sha:
+        return None
+    with closing(_connect(state_dir)) as conn:
+        row = conn.execute(
+            "SELECT pr_number FROM sha_prs WHERE repo = ? AND sha = ?", (repo, sha)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def prune_pr_map(state_dir: Path, older_than_days: int) -> int:
+    """Drop entries not updated within older_than_days. Returns entries removed."""
+    if not (state_dir / PR_MAP_FILENAME).exists():
+        return 0
+    cutoff = time.time() - older_than_days * 86400
+    with closing(_connect(state_dir)) as conn, conn:
+        return conn.execute("DELETE FROM sha_prs WHERE updated_at < ?", (cutoff,)).rowcount
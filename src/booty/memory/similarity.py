@@ -0,0 +1,95 @@
+"""Text similarity for memory records — MinHash signatures with LSH banding.
+
+A record's text is its title, summary and error signature (metadata
+error_signature / failure_type / reason). Text is reduced to word unigrams and
+bigrams (numbers and hex ids dropped, so "Sentry issue #12" and "#97" agree),
+and each shingle set gets a SIGNATURE_SIZE MinHash signature whose matching
+positions estimate Jaccard similarity. Signatures use one-permutation hashing
+(each shingle hashed once into one of SIGNATURE_SIZE bins, keeping the bin
+minimum) with optimal densification (an empty bin copies the first non-empty
+bin in its fixed random donor order), so building one costs one hash per
+shingle rather than one per shingle per bin. The index stores signatures as
+packed uint32 blobs and splits each into BANDS band hashes; records sharing a
+band with the query are candidates, kept when the estimate reaches
+SIMILARITY_THRESHOLD.
+"""
+
+import hashlib
+import operator
+import random
+import re
+from array import array
+
+SIGNATURE_SIZE = 48
+BANDS = 16
+ROWS = SIGNATURE_SIZE // BANDS  # P(candidate) at Jaccard 0.5 ~ 0.88, at 0.3 ~ 0.36
+SIMILARITY_THRESHOLD = 0.5
+MIN_SHINGLES = 4  # Shorter texts ("Revert abc1234") are too generic to link on
+SIGNATURE_FIELDS = ("error_signature", "failure_type", "reason")
+
+_TOKEN = re.compile(r"[a-z][a-z0-9_]+")
+_HEXLIKE = re.compile(r"[0-9a-f]{7,}")
+_rng = random.Random(0x6D656D)  # Fixed seed: stored signatures must stay comparable
+_DONORS = [_rng.sample(range(SIGNATURE_SIZE), SIGNATURE_SIZE) for _ in range(SIGNATURE_SIZE)]
+_EMPTY = 1 << 32
+
+
+def record_text(record: dict) -> str:
+    """Title, summary and error signature of record, space-joined."""
+    parts = [record.get("title"), record.get("summary")]
+    meta = record.get("metadata")
+    if isinstance(meta, dict):
+        parts.extend(meta.get(k) for k in SIGNATURE_FIELDS)
+    return " ".join(p for p in parts if isinstance(p, str) and p.strip())
+
+
+def shingles(text: str) -> set[str]:
+    """Word unigrams and bigrams of lowercased text, without numbers or hex ids."""
+    words = [w for w in _TOKEN.findall(text.lower()) if not _HEXLIKE.fullmatch(w)]
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def signature(text: str) -> array | None:
+    """MinHash signature of text, or None when it has fewer than MIN_SHINGLES shingles."""
+    grams = shingles(text or "")
+    if len(grams) < MIN_SHINGLES:
+        return None
+    bins = [_EMPTY] * SIGNATURE_SIZE
+    for g in grams:
+        h = int.from_bytes(hashlib.blake2b(g.encode(), digest_size=8).digest(), "little")
+        b, value = h % SIGNATURE_SIZE, h >> 32
+        if value < bins[b]:
+            bins[b] = value
+    sig = array("I", (0 if v == _EMPTY else v for v in bins))
+    for i, v in enumerate(bins):
+        if v == _EMPTY:
+            for d in _DONORS[i]:
+                if bins[d] != _EMPTY:
+                    sig[i] = bins[d]
+                    break
+    return sig
+
+
+def band_keys(sig: array) -> list[int]:
+    """One signed 64-bit key per band (band number folded in, so bands never collide)."""
+    raw = sig.tobytes()
+    width = ROWS * sig.itemsize
+    return [
+        int.from_bytes(
+            hashlib.blake2b(bytes([band]) + raw[band * width : (band + 1) * width], digest_size=8).digest(),
+            "little",
+            signed=True,
+        )
+        for band in range(BANDS)
+    ]
+
+
+def estimate(a: array, b: array) -> float:
+    """Estimated Jaccard similarity: fraction of matching signature positions."""
+    return sum(map(operator.eq, a, b)) / len(a)
+
+
+def from_blob(blob: bytes) -> array:
+    sig = array("I")
+    sig.frombytes(blob)
+    return sig
@@ -25,16 +25,40 @@ def _memory_jsonl_path(state_dir: Path) -> Path:
 
 def append_record(path: Path, record: dict) -> None:
     """Append record to memory.jsonl. Atomic append with fsync. Creates parent dir if missing."""
+    append_records(path, [record])
+
+
+def append_records(path: Path, records: list[dict]) -> None:
+    """Append records with one write and one fsync under the file lock.
+
+    If compaction replaced the file while we waited for the lock, reopen and retry.
+    """
+    if not records:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a") as f:
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-        try:
-            line = json.dumps(record, default=str) + "\n"
-            f.write(line)
-            f.flush()
-            os.fsync(f.fileno())
-        finally:
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    data = "".join(json.dumps(record, default=str) + "\n" for record in records)
+    while True:
+        with open(path, "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                if not _is_current(path, f.fileno()):
+                    continue
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                return
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _is_current(path: Path, fd: int) -> bool:
+    """True if fd still refers to the file at path (not replaced or unlinked)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    fst = os.fstat(fd)
+    return (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino)
 
 
 def read_records(path: Path) -> list[dict]:
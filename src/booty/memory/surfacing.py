@@ -7,8 +7,11 @@ from typing import TYPE_CHECKING
 from github import Github
 
 from booty.github.comments import post_memory_comment
+from booty.github.issues import build_sentry_issue_title
 from booty.logging import get_logger
 from booty.memory import lookup
+from booty.memory.adapters import sentry_error_signature
+from booty.memory.pr_map import pr_for_sha, record_pr_shas
 
 logger = get_logger()
 
@@ -40,7 +43,8 @@ def build_related_history_for_incident(
     """Build 'Related history' section for Observability incident issue body.
 
     Returns empty string if comment_on_incident_issue disabled or zero matches.
-    Derives paths from stack frames, culprit, metadata.
+    Derives paths from stack frames, culprit, metadata; title and error
+    signature also match similar incidents.
     """
     if not mem_config.comment_on_incident_issue:
         return ""
@@ -75,6 +79,7 @@ def build_related_history_for_incident(
         fingerprint=fingerprint,
         config=mem_config,
         state_dir=state_dir,
+        text=f"{build_sentry_issue_title(event)} {sentry_error_signature(event)}",
     )
     if not matches:
         return ""
@@ -172,20 +177,14 @@ def surface_governor_hold(
 ) -> None:
     """Surface Governor HOLD memory matches in PR comment.
 
-    Finds PR for commit, runs fingerprint lookup, merges '### Related to this hold'
-    section into existing Memory comment or creates new.
-    Skips when comment_on_pr disabled, no PR found, or zero matches.
+    Runs fingerprint lookup, finds PR for commit (sha -> PR map first, API on a miss),
+    merges '### Related to this hold' section into existing Memory comment or creates new.
+    Skips when comment_on_pr disabled, zero matches, or no PR found.
     """
     if not mem_config.comment_on_pr:
         return
 
     try:
-        gh = Github(github_token)
-        repo = gh.get_repo(repo_full_name)
-        pr_number = _find_pr_for_commit(repo, head_sha)
-        if not pr_number:
-            return
-
         matches = lookup.query(
             paths=[],
             repo=repo_full_name,
@@ -197,6 +196,15 @@ def surface_governor_hold(
         if not matches:
             return
 
+        gh = Github(github_token)
+        repo = gh.get_repo(repo_full_name, lazy=True)
+        pr_number = pr_for_sha(repo_full_name, head_sha, state_dir)
+        if not pr_number:
+            pr_number = _find_pr_for_commit(repo, head_sha)
+            if not pr_number:
+                return
+            record_pr_shas(repo_full_name, pr_number, [head_sha], state_dir)
+
         formatted = format_matches_for_pr(matches)
         repo_url = f"https://github.com/{repo_full_name}"
         issue = repo.get_issue(pr_number)
@@ -0,0 +1,176 @@
+"""Memory writer — group commit for memory.jsonl appends.
+
+Records submitted within MEMORY_WRITE_MAX_LATENCY_MS of each other (up to
+MEMORY_WRITE_MAX_BATCH) are appended with one write and one fsync by a
+background thread. Callers get a concurrent.futures.Future that resolves with
+the add_record result once the batch is durable (asyncio callers can await it
+via asyncio.wrap_future). Dedup runs at submit time against both the file and
+records still waiting to be flushed.
+"""
+
+import atexit
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from booty.logging import get_logger
+from booty.memory.store import append_records
+
+logger = get_logger()
+
+DEFAULT_MAX_LATENCY_MS = 25.0
+DEFAULT_MAX_BATCH = 256
+
+
+@dataclass
+class _Pending:
+    record: dict
+    key: tuple
+    future: Future
+
+
+def _env_number(name: str, default: float, cast=float):
+    try:
+        value = cast(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def resolved(result: dict) -> Future:
+    """An already-completed future (duplicates, memory disabled)."""
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+class MemoryWriter:
+    """Background group-commit writer for one state dir."""
+
+    def __init__(
+        self,
+        state_dir: Path,
+        max_latency_ms: float = DEFAULT_MAX_LATENCY_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self.state_dir = state_dir
+        self.path = state_dir / "memory.jsonl"
+        self.max_latency = max_latency_ms / 1000
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._queue: list[_Pending] = []
+        self._unflushed: dict[tuple, dict] = {}  # Dedup key -> record queued or being written
+        self._thread: threading.Thread | None = None
+        self.closed = False
+
+    def submit(self, record: dict) -> Future:
+        """Queue record for the next batch. Duplicates resolve immediately."""
+        from booty.memory.api import DEDUP_WINDOW_HOURS, _build_dedup_key, _find_duplicate
+
+        key = _build_dedup_key(record)
+        with self._cond:
+            if self.closed:
+                raise RuntimeError("memory writer is closed")
+            # Checked under the lock so concurrent submits of one key can't both pass
+            existing = self._unflushed.get(key) if key else None
+            if existing is None:
+                existing = _find_duplicate(self.state_dir, key, within_hours=DEDUP_WINDOW_HOURS)
+            if existing:
+                return resolved(
+                    {"added": False, "reason": "duplicate", "existing_id": existing.get("id")}
+                )
+
+            record = dict(record)
+            record["id"] = str(uuid.uuid4())
+            if "timestamp" not in record or record["timestamp"] is None:
+                record["timestamp"] = datetime.now(timezone.utc).isoformat()
+            pending = _Pending(record, key, Future())
+            if key:
+                self._unflushed[key] = record
+            self._queue.append(pending)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="memory-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return pending.future
+
+    def _next_batch(self) -> list[_Pending] | None:
+        with self._cond:
+            while not self._queue and not self.closed:
+                self._cond.wait()
+            if not self._queue:
+                return None  # Closed and drained
+            deadline = time.monotonic() + self.max_latency
+            while len(self._queue) < self.max_batch and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._queue[: self.max_batch]
+            del self._queue[: self.max_batch]
+            return batch
+
+    def _run(self) -> None:
+        while (batch := self._next_batch()) is not None:
+            try:
+                append_records(self.path, [p.record for p in batch])
+                error = None
+            except Exception as e:
+                error = e
+                logger.warning("memory_write_failed", records=len(batch), error=str(e))
+            with self._cond:
+                for p in batch:
+                    if p.key and self._unflushed.get(p.key) is p.record:
+                        del self._unflushed[p.key]
+            for p in batch:
+                if error is None:
+                    p.future.set_result({"added": True, "id": p.record["id"]})
+                else:
+                    p.future.set_exception(error)
+
+    def close(self) -> None:
+        """Flush everything queued and stop the thread."""
+        with self._cond:
+            self.closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+
+_writers: dict[Path, MemoryWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_memory_writer(state_dir: Path) -> MemoryWriter:
+    """Shared writer for state_dir (MEMORY_WRITE_MAX_LATENCY_MS / MEMORY_WRITE_MAX_BATCH)."""
+    key = Path(state_dir).resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer.closed:
+            writer = MemoryWriter(
+                key,
+                max_latency_ms=_env_number("MEMORY_WRITE_MAX_LATENCY_MS", DEFAULT_MAX_LATENCY_MS),
+                max_batch=_env_number("MEMORY_WRITE_MAX_BATCH", DEFAULT_MAX_BATCH, int),
+            )
+            _writers[key] = writer
+        return writer
+
+
+def close_memory_writers() -> None:
+    """Flush and stop all writers (app shutdown, interpreter exit)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_memory_writers)
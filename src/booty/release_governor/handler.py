@@ -230,7 +230,7 @@ def apply_governor_decision(
         if surface_hold_fn:
             surface_hold_fn()
         if booty_config:
-            from booty.memory import add_record, get_memory_config
+            from booty.memory import get_memory_config, submit_record
             from booty.memory.adapters import build_governor_hold_record
             from booty.memory.config import apply_memory_env_overrides
 
@@ -240,13 +240,13 @@ def apply_governor_decision(
             if mem_config and mem_config.enabled:
                 try:
                     record = build_governor_hold_record(decision, repo_full_name)
-                    add_record(record, mem_config)
+                    submit_record(record, mem_config)
                 except Exception:
                     from booty.logging import get_logger
                     get_logger().warning(
                         "memory_ingestion_failed",
                         type="governor_hold",
-                        error="add_record failed",
+                        error="submit_record failed",
                     )
 
     if delivery_id:
@@ -23,6 +23,14 @@ from booty.test_runner.config import (
     load_booty_config,
 )
 from booty.test_runner.executor import execute_tests
+from booty.test_runner.result_cache import (
+    CachedTestResult,
+    find_reusable_pass,
+    head_tree_sha,
+    install_fingerprint,
+    record_test_result_best_effort,
+)
+from booty.test_runner.sharding import max_shards, run_sharded
 from booty.verifier.workspace import prepare_verification_workspace
 
 logger = get_logger()
@@ -202,39 +210,85 @@ async def process_main_verification_job(job: MainVerificationJob) -> None:
             ws_path = Path(workspace.path)
             config_from_workspace = load_booty_config(ws_path)
 
-            setup = getattr(config_from_workspace, "setup_command", None)
-            install = getattr(config_from_workspace, "install_command", None)
-            if setup:
-                r = subprocess.run(
-                    setup, shell=True, cwd=ws_path, capture_output=True, text=True, timeout=300
+            # Identical tree already passed (Verifier/main verification) → skip setup, install, tests
+            tree_sha = ""
+            fingerprint = install_fingerprint(config_from_workspace)
+            if settings.TEST_RESULT_CACHE_ENABLED:
+                try:
+                    tree_sha = head_tree_sha(workspace.repo)
+                except Exception as e:
+                    logger.warning("main_verify_tree_sha_failed", error=str(e))
+            reused = (
+                find_reusable_pass(tree_sha, config_from_workspace.test_command, fingerprint)
+                if tree_sha and settings.TEST_RESULT_REUSE_MAIN_VERIFY
+                else None
+            )
+            if reused is not None:
+                logger.info(
+                    "main_verify_test_result_reused",
+                    repo=job.repo_full_name,
+                    head_sha=job.head_sha[:7],
+                    tree_sha=tree_sha[:7],
+                    source=reused.source,
+                    run_url=reused.run_url,
                 )
-                if r.returncode != 0:
-                    _apply_verification_failed(job.repo_full_name, job.head_sha, hold_docs_url)
-                    record_delivery_id(state_dir, job.repo_full_name, job.head_sha, job.delivery_id)
-                    return
-            if install:
-                r = subprocess.run(
-                    install, shell=True, cwd=ws_path, capture_output=True, text=True, timeout=600
+                verification_passed = True
+            else:
+                setup = getattr(config_from_workspace, "setup_command", None)
+                install = getattr(config_from_workspace, "install_command", None)
+                if setup:
+                    r = subprocess.run(
+                        setup, shell=True, cwd=ws_path, capture_output=True, text=True, timeout=300
+                    )
+                    if r.returncode != 0:
+                        _apply_verification_failed(job.repo_full_name, job.head_sha, hold_docs_url)
+                        record_delivery_id(state_dir, job.repo_full_name, job.head_sha, job.delivery_id)
+                        return
+                if install:
+                    r = subprocess.run(
+                        install, shell=True, cwd=ws_path, capture_output=True, text=True, timeout=600
+                    )
+                    if r.returncode != 0:
+                        _apply_verification_failed(job.repo_full_name, job.head_sha, hold_docs_url)
+                        record_delivery_id(state_dir, job.repo_full_name, job.head_sha, job.delivery_id)
+                        return
+
+                timeout_sec = (
+                    getattr(config_from_workspace, "timeout_seconds", None)
+                    or getattr(config_from_workspace, "timeout", 600)
                 )
-                if r.returncode != 0:
+                result = None
+                if settings.TEST_SHARDS > 1:
+                    result = await run_sharded(
+                        config_from_workspace.test_command,
+                        timeout_sec,
+                        ws_path,
+                        max_shards(settings.TEST_SHARDS),
+                        job.repo_full_name,
+                    )
+                if result is None:
+                    result = await execute_tests(
+                        config_from_workspace.test_command, timeout_sec, ws_path
+                    )
+
+                if result.exit_code != 0:
                     _apply_verification_failed(job.repo_full_name, job.head_sha, hold_docs_url)
                     record_delivery_id(state_dir, job.repo_full_name, job.head_sha, job.delivery_id)
                     return
 
-            timeout_sec = (
-                getattr(config_from_workspace, "timeout_seconds", None)
-                or getattr(config_from_workspace, "timeout", 600)
-            )
-            result = await execute_tests(
-                config_from_workspace.test_command, timeout_sec, ws_path
-            )
-
-            if result.exit_code != 0:
-                _apply_verification_failed(job.repo_full_name, job.head_sha, hold_docs_url)
-                record_delivery_id(state_dir, job.repo_full_name, job.head_sha, job.delivery_id)
-                return
-
-            verification_passed = True
+                if tree_sha:
+                    record_test_result_best_effort(
+                        CachedTestResult(
+                            tree_sha=tree_sha,
+                            test_command=config_from_workspace.test_command,
+                            install_fingerprint=fingerprint,
+                            passed=True,
+                            exit_code=result.exit_code,
+                            source="main_verify",
+                            head_sha=job.head_sha,
+                        )
+                    )
+                verification_passed = True
 
     except Exception as e:
         logger.exception("main_verify_workspace_error", repo=job.repo_full_name, error=str(e))
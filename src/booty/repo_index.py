@@ -0,0 +1,172 @@
+"""Single-pass workspace index — file list, extension counts and parsed manifests.
+
+In a git checkout the file list comes from `git ls-files` (tracked files plus
+untracked ones not excluded by .gitignore), since ignore rules never apply to
+tracked files. Elsewhere it is one os.scandir walk that skips anything matched
+by a .gitignore (nested .gitignore files apply to their own subtree). Either
+way EXCLUDED_DIRS are skipped. Lockfile
+discovery, convention detection, import validation and the Builder's file
+listing all query the same index instead of walking the tree themselves.
+"""
+
+from __future__ import annotations
+
+import configparser
+import fnmatch
+import json
+import os
+import subprocess
+import tomllib
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pathspec
+
+from booty.logging import get_logger
+
+logger = get_logger()
+
+# Directories never indexed (dependencies, build output, VCS metadata)
+EXCLUDED_DIRS = {".git", "node_modules", "venv", "__pycache__", "dist", "build", "target"}
+
+_GLOB_CHARS = set("*?[")
+
+
+def _load_gitignore(directory: str) -> pathspec.PathSpec | None:
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
+    return spec if spec.patterns else None
+
+
+def _ignored(specs: list[tuple[str, pathspec.PathSpec]], rel: str, is_dir: bool) -> bool:
+    for prefix, spec in specs:
+        sub = rel[len(prefix):]
+        if spec.match_file(sub + "/" if is_dir else sub):
+            return True
+    return False
+
+
+def _git_files(root: Path) -> list[str] | None:
+    """Tracked and non-ignored untracked files under a git checkout root, or None."""
+    if not (root / ".git").exists():
+        return None
+    try:
+        proc = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    files = set()
+    for raw in proc.stdout.split(b"\0"):
+        rel = raw.decode("utf-8", errors="surrogateescape")
+        if not rel or EXCLUDED_DIRS.intersection(rel.split("/")[:-1]):
+            continue
+        if os.path.isfile(root / rel):  # Drops deleted files and submodule directories
+            files.add(rel)
+    return sorted(files)
+
+
+def _walk_files(root: Path) -> list[str]:
+    """Walk root once with os.scandir, applying .gitignore files to their subtrees."""
+    files: list[str] = []
+    stack: list[tuple[str, str, list[tuple[str, pathspec.PathSpec]]]] = [("", str(root), [])]
+    while stack:
+        rel_dir, abs_dir, specs = stack.pop()
+        try:
+            with os.scandir(abs_dir) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        if any(e.name == ".gitignore" for e in entries):
+            local = _load_gitignore(abs_dir)
+            if local is not None:
+                specs = [*specs, (rel_dir, local)]
+        for entry in entries:
+            rel = rel_dir + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDED_DIRS and not _ignored(specs, rel, True):
+                        stack.append((rel + "/", entry.path, specs))
+                elif entry.is_file() and not _ignored(specs, rel, False):
+                    files.append(rel)
+            except OSError:
+                continue
+    files.sort()
+    return files
+
+
+def parse_manifest(path: Path) -> dict:
+    """Parse a TOML, JSON or INI/CFG manifest into a dict ({} for other types)."""
+    if path.suffix == ".toml":
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    if path.suffix == ".json":
+        with open(path) as f:
+            return json.load(f)
+    if path.suffix in {".cfg", ".ini"}:
+        parser = configparser.ConfigParser()
+        parser.read(path)
+        return {section: dict(parser[section]) for section in parser.sections()}
+    return {}
+
+
+@dataclass
+class RepoIndex:
+    """Files of one workspace as sorted POSIX paths relative to root."""
+
+    root: Path
+    files: list[str]
+    extension_counts: Counter[str]
+    _by_name: dict[str, list[str]] = field(default_factory=dict, repr=False)
+    _manifests: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, root: str | Path) -> RepoIndex:
+        """List root's files once: git ls-files in a checkout, else an os.scandir walk."""
+        root = Path(root)
+        files = _git_files(root)
+        if files is None:
+            files = _walk_files(root)
+
+        by_name: dict[str, list[str]] = {}
+        extension_counts: Counter[str] = Counter()
+        for rel in files:
+            name = rel.rsplit("/", 1)[-1]
+            by_name.setdefault(name, []).append(rel)
+            extension_counts[os.path.splitext(name)[1].lower()] += 1
+        logger.debug("repo_index_built", root=str(root), files=len(files))
+        return cls(root=root, files=files, extension_counts=extension_counts, _by_name=by_name)
+
+    def __contains__(self, rel: str) -> bool:
+        name = rel.rsplit("/", 1)[-1]
+        return rel in self._by_name.get(name, ())
+
+    def named(self, pattern: str) -> list[str]:
+        """Relative paths whose basename matches pattern (fnmatch), in path order."""
+        if not _GLOB_CHARS & set(pattern):
+            return list(self._by_name.get(pattern, ()))
+        names = [n for n in self._by_name if fnmatch.fnmatchcase(n, pattern)]
+        return sorted(rel for n in names for rel in self._by_name[n])
+
+    def manifest(self, rel: str) -> Any:
+        """Parsed manifest at rel (parsed once), or None when absent or unparsable."""
+        if rel not in self._manifests:
+            parsed = None
+            if rel in self:
+                try:
+                    parsed = parse_manifest(self.root / rel)
+                except Exception as e:
+                    logger.warning("manifest_parse_error", file=rel, error=str(e))
+            self._manifests[rel] = parsed
+        return self._manifests[rel]
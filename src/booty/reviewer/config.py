@@ -17,7 +17,7 @@ class ReviewerConfigError(Exception):
 
 
 class ReviewerConfig(BaseModel):
-    """Reviewer config block — enabled, block_on.
+    """Reviewer config block — enabled, block_on, pre-filter thresholds.
 
     Unknown keys fail (model_config extra='forbid').
     block_on values map in Phase 39 (e.g. overengineering, poor_tests).
@@ -30,6 +30,12 @@ class ReviewerConfig(BaseModel):
         default_factory=list,
         description="Block-on categories (e.g. overengineering, poor_tests, duplication)",
     )
+    prefilter: bool = Field(
+        default=True,
+        description="Auto-approve docs/lockfile-only diffs and send small diffs to the fast model",
+    )
+    fast_max_changed_lines: int = Field(default=40, ge=0)
+    fast_max_files: int = Field(default=3, ge=0)
 
 
 def get_reviewer_config(booty_config: object) -> ReviewerConfig | None:
@@ -1,7 +1,9 @@
 """Review engine — run_review, format_reviewer_comment, block_on mapping, decision logic."""
 
+import os
 from typing import Literal
 
+from booty.llm.routing import model_for_tier, routed_call
 from booty.reviewer.prompts import _review_diff_impl
 from booty.reviewer.schema import (
     CATEGORY_ORDER,
@@ -24,6 +26,7 @@ def run_review(
     diff: str,
     pr_meta: dict,
     block_on: list[str],
+    model: str | None = None,
 ) -> ReviewResult:
     """Run LLM review on diff; apply block_on mapping and decision logic.
 
@@ -31,6 +34,8 @@ def run_review(
         diff: Unified diff (full patch)
         pr_meta: {title, body, base_sha, head_sha, file_list}
         block_on: Config keys that can block (overengineering, poor_tests, etc.)
+        model: Anthropic model override (e.g. fast_review_model()); None uses
+            the magentic default (MAGENTIC_ANTHROPIC_MODEL)
 
     Returns:
         ReviewResult with decision, categories, blocking_categories
@@ -50,16 +55,33 @@ def run_review(
     head_sha = pr_meta.get("head_sha", "") or ""
     file_list = pr_meta.get("file_list", "") or ""
 
-    out = _review_diff_impl(
-        diff_truncated=diff_truncated,
-        pr_title=pr_title,
-        pr_body=pr_body,
-        file_list=file_list,
-        base_sha=base_sha,
-        head_sha=head_sha,
-    )
+    with routed_call("reviewer", "fast" if model else "strong", model=model):
+        out = _review_diff_impl(
+            diff_truncated=diff_truncated,
+            pr_title=pr_title,
+            pr_body=pr_body,
+            file_list=file_list,
+            base_sha=base_sha,
+            head_sha=head_sha,
+        )
+
+    return apply_block_on(out.categories or [], block_on)
+
+
+def fast_review_model() -> str:
+    """Model for small diffs routed by the pre-filter. REVIEWER_FAST_MODEL env, else the fast routing tier."""
+    return os.environ.get("REVIEWER_FAST_MODEL") or model_for_tier("fast")
 
-    categories = out.categories or []
+
+def apply_block_on(
+    categories: list[CategoryResult],
+    block_on: list[str],
+) -> ReviewResult:
+    """Apply block_on mapping and decision logic to category results.
+
+    Shared by run_review and incremental/reused reviews so the decision always
+    reflects the current block_on config.
+    """
     blocking_category_names = {
         BLOCK_ON_TO_CATEGORY.get(k, k)
         for k in (block_on or [])
@@ -95,6 +117,55 @@ def run_review(
     )
 
 
+_GRADE_RANK = {"PASS": 0, "WARN": 1, "FAIL": 2}
+
+
+def merge_review_results(
+    prior: ReviewResult,
+    incremental: ReviewResult,
+    changed_paths: set[str],
+    block_on: list[str],
+) -> ReviewResult:
+    """Merge an interdiff review with prior findings for files it did not touch.
+
+    Prior findings that reference a changed path are superseded by the
+    incremental review; findings without paths always survive. A prior
+    WARN/FAIL grade is lowered only when the incremental review graded that
+    category and every prior finding in it was superseded (its files were in
+    scope); otherwise the merged grade is the worse of the two.
+    """
+    prior_by_name = {c.category: c for c in prior.categories}
+    new_by_name = {c.category: c for c in incremental.categories}
+
+    merged: list[CategoryResult] = []
+    for name in list(CATEGORY_ORDER) + [
+        n for n in {**prior_by_name, **new_by_name} if n not in CATEGORY_ORDER
+    ]:
+        old = prior_by_name.get(name)
+        new = new_by_name.get(name)
+        if old is None and new is None:
+            continue
+        kept = [
+            f
+            for f in (old.findings if old else [])
+            if not f.paths or not any(p in changed_paths for p in f.paths)
+        ]
+        regraded = new is not None and old is not None and bool(old.findings) and not kept
+        grade = new.grade if new else "PASS"
+        if old and not regraded and _GRADE_RANK[old.grade] > _GRADE_RANK[grade]:
+            grade = old.grade
+        merged.append(
+            CategoryResult(
+                category=name,
+                grade=grade,
+                findings=(new.findings if new else []) + kept,
+                confidence=(new or old).confidence,
+            )
+        )
+
+    return apply_block_on(merged, block_on)
+
+
 def _compute_non_blocked_decision(categories: list[CategoryResult]) -> Literal["APPROVED", "APPROVED_WITH_SUGGESTIONS"]:
     """Any WARN or FAIL → APPROVED_WITH_SUGGESTIONS; else APPROVED."""
     for c in categories:
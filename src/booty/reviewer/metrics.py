@@ -1,4 +1,5 @@
-"""Reviewer metrics — reviews_total, reviews_blocked, reviews_suggestions, reviewer_fail_open (REV-09, REV-15).
+"""Reviewer metrics — reviews_total, reviews_blocked, reviews_suggestions, reviewer_fail_open (REV-09, REV-15),
+and pre-filter triage decisions (auto_approve / fast / full).
 
 Uses same base state dir as Planner/Architect (get_planner_state_dir) for consistent
 ~/.booty/state layout; PLANNER_STATE_DIR env applies. Stored under state_dir/reviewer/.
@@ -21,6 +22,8 @@ FAIL_OPEN_BUCKETS = frozenset({
     "unexpected_exception",
 })
 
+TRIAGE_PATHS = frozenset({"auto_approve", "fast", "full"})
+
 
 def get_reviewer_metrics_dir(state_dir: Path | None = None) -> Path:
     """Return reviewer metrics directory: state_dir/reviewer or shared base state/reviewer."""
@@ -73,6 +76,7 @@ def _append_event(
     state_dir: Path | None = None,
     *,
     bucket: str | None = None,
+    reason: str | None = None,
 ) -> None:
     """Append event with current UTC timestamp."""
     ts = datetime.now(timezone.utc).isoformat()
@@ -80,6 +84,8 @@ def _append_event(
     event: dict = {"ts": ts, "type": event_type}
     if bucket is not None:
         event["bucket"] = bucket
+    if reason is not None:
+        event["reason"] = reason
     events.append(event)
     _save_events(events, state_dir)
 
@@ -113,11 +119,27 @@ def increment_reviewer_fail_open(
     _append_event("fail_open", state_dir, bucket=bucket)
 
 
+def record_triage_decision(
+    path: str,
+    reason: str,
+    state_dir: Path | None = None,
+) -> None:
+    """Record pre-filter decision for a reviewed diff.
+
+    Args:
+        path: auto_approve, fast, or full
+        reason: Rule that chose the path (e.g. docs_only, small_diff, large_diff)
+    """
+    bucket = path if path in TRIAGE_PATHS else "full"
+    _append_event("triage", state_dir, bucket=bucket, reason=reason)
+
+
 def get_reviewer_24h_stats(state_dir: Path | None = None) -> dict[str, int]:
     """Return counts for events within last 24h. Rolling window from now."""
     cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
     events = _load_events(state_dir)
     reviews_total = reviews_blocked = reviews_suggestions = reviewer_fail_open = 0
+    triage: dict[str, int] = {p: 0 for p in TRIAGE_PATHS}
     for e in events:
         ts_str = e.get("ts")
         if not ts_str:
@@ -139,9 +161,14 @@ def get_reviewer_24h_stats(state_dir: Path | None = None) -> dict[str, int]:
             reviews_suggestions += 1
         elif t == "fail_open":
             reviewer_fail_open += 1
+        elif t == "triage" and e.get("bucket") in triage:
+            triage[e["bucket"]] += 1
     return {
         "reviews_total": reviews_total,
         "reviews_blocked": reviews_blocked,
         "reviews_suggestions": reviews_suggestions,
         "reviewer_fail_open": reviewer_fail_open,
+        "triage_auto_approve": triage["auto_approve"],
+        "triage_fast": triage["fast"],
+        "triage_full": triage["full"],
     }
@@ -17,14 +17,34 @@ from booty.github.checks import (
     get_verifier_repo,
 )
 from booty.logging import get_logger
-from booty.reviewer.config import apply_reviewer_env_overrides, get_reviewer_config
-from booty.reviewer.engine import format_reviewer_comment, run_review
+from booty.reviewer.config import (
+    ReviewerConfig,
+    apply_reviewer_env_overrides,
+    get_reviewer_config,
+)
+from booty.reviewer.engine import (
+    apply_block_on,
+    fast_review_model,
+    format_reviewer_comment,
+    merge_review_results,
+    run_review,
+)
 from booty.reviewer.job import ReviewerJob
 from booty.reviewer.metrics import (
     increment_reviewer_fail_open,
     increment_reviews_blocked,
     increment_reviews_suggestions,
     increment_reviews_total,
+    record_triage_decision,
+)
+from booty.reviewer.schema import ReviewResult
+from booty.reviewer.store import find_review_for_tree, get_last_review, save_review
+from booty.reviewer.triage import (
+    DiffFile,
+    TriageDecision,
+    auto_approved_result,
+    classify_diff,
+    count_changed_lines,
 )
 from booty.test_runner.config import load_booty_config_from_content
 
@@ -46,6 +66,165 @@ def _classify_fail_open_exception(exc: BaseException) -> str:
     return "unexpected_exception"
 
 
+def _collect_diff(compare) -> tuple[str, str, list[DiffFile]]:
+    """Return (diff, file_list, files) from a GitHub compare."""
+    diff_parts: list[str] = []
+    file_entries: list[str] = []
+    files: list[DiffFile] = []
+    for f in compare.files:
+        filename = getattr(f, "filename", "") or ""
+        patch = getattr(f, "patch", None)
+        if patch:
+            diff_parts.append(patch)
+        file_type = "test" if filename.startswith("tests/") else "src"
+        file_entries.append(f"{filename} ({file_type})")
+        files.append(
+            DiffFile(
+                path=filename,
+                status=getattr(f, "status", "") or "",
+                changed_lines=count_changed_lines(patch),
+            )
+        )
+    return "\n".join(diff_parts), "\n".join(file_entries), files
+
+
+def _head_tree_sha(repo, head_sha: str) -> str | None:
+    """Return the git tree SHA of head_sha, or None when unavailable."""
+    try:
+        sha = repo.get_commit(head_sha).commit.tree.sha
+    except GithubException:
+        return None
+    return sha if isinstance(sha, str) else None
+
+
+async def _triaged_review(
+    diff: str,
+    files: list[DiffFile],
+    pr_meta: dict,
+    config: ReviewerConfig,
+) -> ReviewResult:
+    """Run the pre-filter, then auto-approve or call run_review with the chosen model."""
+    if not config.prefilter:
+        decision = TriageDecision("full", "prefilter_disabled")
+    else:
+        decision = classify_diff(
+            files,
+            config.block_on,
+            config.fast_max_changed_lines,
+            config.fast_max_files,
+        )
+    record_triage_decision(decision.path, decision.reason)
+    get_logger().info(
+        "reviewer_triage",
+        head_sha=(pr_meta.get("head_sha") or "")[:7],
+        path=decision.path,
+        reason=decision.reason,
+        files=len(files),
+    )
+    if decision.path == "auto_approve":
+        return auto_approved_result()
+    model = fast_review_model() if decision.path == "fast" else None
+    return await asyncio.to_thread(
+        run_review,
+        diff,
+        pr_meta,
+        config.block_on,
+        model,
+    )
+
+
+async def _review_head(
+    repo,
+    job: ReviewerJob,
+    base_sha: str,
+    pr_title: str,
+    pr_body: str,
+    config: ReviewerConfig,
+) -> tuple[ReviewResult, str]:
+    """Review job.head_sha, reusing or extending the PR's prior review when possible.
+
+    Returns (result, mode) where mode is "reused" (identical tree already
+    reviewed), "incremental" (only the interdiff since the last reviewed head
+    was reviewed) or "full".
+    """
+    block_on = config.block_on
+    tree_sha = _head_tree_sha(repo, job.head_sha)
+    if tree_sha:
+        same_tree = find_review_for_tree(
+            job.owner, job.repo_name, job.pr_number, tree_sha
+        )
+        if same_tree is not None:
+            result = apply_block_on(same_tree.result.categories, block_on)
+            _save_review_best_effort(job, tree_sha, result)
+            return result, "reused"
+
+    prior = get_last_review(job.owner, job.repo_name, job.pr_number)
+    if prior is not None and prior.head_sha != job.head_sha:
+        try:
+            interdiff = repo.compare(prior.head_sha, job.head_sha)
+        except GithubException as e:
+            # Prior head unreachable (force-push + gc) — fall back to a full review
+            get_logger().info(
+                "reviewer_interdiff_unavailable",
+                prior_head=prior.head_sha[:7],
+                status=getattr(e, "status", None),
+            )
+            interdiff = None
+        # Only "ahead" means prior head is an ancestor; diverged/behind → force-push, full review
+        if getattr(interdiff, "status", None) == "ahead":
+            diff, file_list, files = _collect_diff(interdiff)
+            if not files:
+                result = apply_block_on(prior.result.categories, block_on)
+            else:
+                partial = await _triaged_review(
+                    diff,
+                    files,
+                    {
+                        "title": pr_title,
+                        "body": pr_body,
+                        "base_sha": prior.head_sha,
+                        "head_sha": job.head_sha,
+                        "file_list": file_list,
+                    },
+                    config,
+                )
+                result = merge_review_results(
+                    prior.result, partial, {f.path for f in files}, block_on
+                )
+            _save_review_best_effort(job, tree_sha, result)
+            return result, "incremental"
+
+    compare = repo.compare(base_sha, job.head_sha)
+    diff, file_list, files = _collect_diff(compare)
+    pr_meta = {
+        "title": pr_title,
+        "body": pr_body,
+        "base_sha": base_sha,
+        "head_sha": job.head_sha,
+        "file_list": file_list,
+    }
+    result = await _triaged_review(diff, files, pr_meta, config)
+    _save_review_best_effort(job, tree_sha, result)
+    return result, "full"
+
+
+def _save_review_best_effort(
+    job: ReviewerJob, tree_sha: str | None, result: ReviewResult
+) -> None:
+    """Persist reviewed revision; failures only lose the incremental shortcut."""
+    try:
+        save_review(
+            job.owner, job.repo_name, job.pr_number, job.head_sha, tree_sha, result
+        )
+    except Exception as e:
+        get_logger().warning(
+            "reviewer_state_save_failed",
+            repo=f"{job.owner}/{job.repo_name}",
+            pr=job.pr_number,
+            error=str(e),
+        )
+
+
 async def process_reviewer_job(job: ReviewerJob, settings: Settings) -> None:
     """Process Reviewer job — Phase 38 stub: check lifecycle only. Phase 39 adds LLM."""
 
@@ -108,38 +287,16 @@ async def process_reviewer_job(job: ReviewerJob, settings: Settings) -> None:
         )
         return
 
-    # Phase 39: fetch diff, run LLM review
+    # Phase 39: fetch diff, run LLM review (interdiff only when a prior review exists)
     pr_payload = job.payload.get("pull_request", {})
     base_ref = pr_payload.get("base", {})
     base_sha = base_ref.get("sha", "") or job.head_sha
 
     try:
-        compare = repo.compare(base_sha, job.head_sha)
-        diff_parts: list[str] = []
-        file_entries: list[str] = []
-        for f in compare.files:
-            if getattr(f, "patch", None):
-                diff_parts.append(f.patch)
-            file_type = "test" if (getattr(f, "filename", "") or "").startswith("tests/") else "src"
-            file_entries.append(f"{getattr(f, 'filename', '')} ({file_type})")
-        diff = "\n".join(diff_parts)
-        file_list = "\n".join(file_entries) if file_entries else ""
-
         pr_title = pr_payload.get("title", "") or ""
         pr_body = (pr_payload.get("body") or "") or ""
-        pr_meta = {
-            "title": pr_title,
-            "body": pr_body,
-            "base_sha": base_sha,
-            "head_sha": job.head_sha,
-            "file_list": file_list,
-        }
-
-        result = await asyncio.to_thread(
-            run_review,
-            diff,
-            pr_meta,
-            config.block_on,
+        result, review_mode = await _review_head(
+            repo, job, base_sha, pr_title, pr_body, config
         )
     except Exception as exc:
         bucket = _classify_fail_open_exception(exc)
@@ -175,6 +332,8 @@ async def process_reviewer_job(job: ReviewerJob, settings: Settings) -> None:
         title = "Reviewer blocked"
 
     summary = "See PR comment for details."
+    if review_mode == "reused":
+        summary = "Tree unchanged since a previous review; reused its findings."
     if result.blocking_categories:
         summary = f"Blocking: {', '.join(result.blocking_categories)}"
 
@@ -208,6 +367,7 @@ async def process_reviewer_job(job: ReviewerJob, settings: Settings) -> None:
         pr=job.pr_number,
         sha=job.head_sha[:7] if job.head_sha else "",
         outcome=result.decision,
+        review_mode=review_mode,
         blocked_categories=result.blocking_categories or [],
         suggestion_count=suggestion_count,
     )
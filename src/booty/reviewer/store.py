@@ -0,0 +1,146 @@
+"""Reviewer PR state — last reviewed head/tree SHA and ReviewResult per PR.
+
+Stored under state_dir/reviewer/prs/owner/repo/{pr_number}.json using the same
+base state dir as Planner/Architect (get_planner_state_dir).
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from booty.planner.store import get_planner_state_dir
+from booty.reviewer.schema import ReviewResult
+
+REVIEW_HISTORY_MAX = 10
+
+
+@dataclass
+class ReviewedRevision:
+    """One completed review: head SHA, its tree SHA, and the result."""
+
+    head_sha: str
+    tree_sha: str | None
+    result: ReviewResult
+    reviewed_at: str
+
+
+def _pr_state_path(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    state_dir: Path | None = None,
+) -> Path:
+    """Return path: state_dir/reviewer/prs/owner/repo/{pr_number}.json."""
+    sd = state_dir or get_planner_state_dir()
+    return sd / "reviewer" / "prs" / owner / repo / f"{pr_number}.json"
+
+
+def load_review_history(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    state_dir: Path | None = None,
+) -> list[ReviewedRevision]:
+    """Load reviewed revisions for a PR, oldest first. Empty list if missing or invalid."""
+    path = _pr_state_path(owner, repo, pr_number, state_dir)
+    if not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text())
+        return [
+            ReviewedRevision(
+                head_sha=r["head_sha"],
+                tree_sha=r.get("tree_sha"),
+                result=ReviewResult.model_validate(r["result"]),
+                reviewed_at=r.get("reviewed_at", ""),
+            )
+            for r in data.get("reviews") or []
+        ]
+    except (json.JSONDecodeError, KeyError, TypeError, ValidationError):
+        return []
+
+
+def get_last_review(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    state_dir: Path | None = None,
+) -> ReviewedRevision | None:
+    """Return the most recent reviewed revision for a PR, or None."""
+    history = load_review_history(owner, repo, pr_number, state_dir)
+    return history[-1] if history else None
+
+
+def find_review_for_tree(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    tree_sha: str,
+    state_dir: Path | None = None,
+) -> ReviewedRevision | None:
+    """Return the latest review of an identical tree (e.g. after a no-op rebase), or None."""
+    for rev in reversed(load_review_history(owner, repo, pr_number, state_dir)):
+        if rev.tree_sha and rev.tree_sha == tree_sha:
+            return rev
+    return None
+
+
+def save_review(
+    owner: str,
+    repo: str,
+    pr_number: int,
+    head_sha: str,
+    tree_sha: str | None,
+    result: ReviewResult,
+    state_dir: Path | None = None,
+) -> Path:
+    """Append reviewed revision atomically. Keeps the last REVIEW_HISTORY_MAX entries."""
+    history = [
+        r
+        for r in load_review_history(owner, repo, pr_number, state_dir)
+        if r.head_sha != head_sha
+    ]
+    history.append(
+        ReviewedRevision(
+            head_sha=head_sha,
+            tree_sha=tree_sha,
+            result=result,
+            reviewed_at=datetime.now(timezone.utc).isoformat(),
+        )
+    )
+    history = history[-REVIEW_HISTORY_MAX:]
+    data = {
+        "reviews": [
+            {
+                "head_sha": r.head_sha,
+                "tree_sha": r.tree_sha,
+                "result": r.result.model_dump(),
+                "reviewed_at": r.reviewed_at,
+            }
+            for r in history
+        ]
+    }
+    path = _pr_state_path(owner, repo, pr_number, state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=path.parent,
+        delete=False,
+        suffix=".tmp",
+    )
+    try:
+        json.dump(data, fd, indent=0, separators=(",", ":"))
+        fd.flush()
+        os.fsync(fd.fileno())
+        fd.close()
+        os.replace(fd.name, path)
+    except Exception:
+        if os.path.exists(fd.name):
+            os.unlink(fd.name)
+        raise
+    return path
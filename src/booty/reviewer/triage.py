@@ -0,0 +1,163 @@
+"""Deterministic pre-filter ahead of run_review — auto-approve, fast model, or full review.
+
+Classifies a PR (or interdiff) from file types, diff size and block_on so that
+docs-only, lockfile-only and tiny changes skip or downsize the LLM review.
+"""
+
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import PurePosixPath
+from typing import Literal
+
+from booty.reviewer.schema import ReviewResult
+from booty.test_generation.detector import is_test_file
+
+TriagePath = Literal["auto_approve", "fast", "full"]
+
+DOC_SUFFIXES = frozenset({".md", ".rst", ".adoc"})
+DOC_NAMES = frozenset({
+    "LICENSE",
+    "LICENSE.txt",
+    "CHANGELOG",
+    "CHANGELOG.txt",
+    "AUTHORS",
+    "AUTHORS.txt",
+    "NOTICE",
+    "NOTICE.txt",
+    "README",
+    "README.txt",
+})
+DOC_DIRS = ("docs/", "doc/")
+# Under DOC_DIRS these also count as docs (plain-text pages, images); code there never does
+DOC_DIR_SUFFIXES = DOC_SUFFIXES | {".txt", ".png", ".jpg", ".jpeg", ".gif", ".svg"}
+# Dependency / build inputs that look like docs by suffix or location; never docs-only
+MANIFEST_PATTERNS = (
+    "requirements*.txt",
+    "requirements*.in",
+    "constraints*.txt",
+    "CMakeLists.txt",
+    "*.cmake",
+    "conf.py",
+    "setup.py",
+    "setup.cfg",
+    "pyproject.toml",
+    "package.json",
+    "Makefile",
+)
+LOCKFILE_NAMES = frozenset({
+    "uv.lock",
+    "poetry.lock",
+    "Pipfile.lock",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "Cargo.lock",
+    "composer.lock",
+    "Gemfile.lock",
+    "go.sum",
+})
+
+
+@dataclass
+class DiffFile:
+    """One changed file from a compare: path, GitHub status, +/- line count (None if no patch)."""
+
+    path: str
+    status: str
+    changed_lines: int | None
+
+
+@dataclass
+class TriageDecision:
+    """Review path chosen for a diff and the rule that chose it."""
+
+    path: TriagePath
+    reason: str
+
+
+def count_changed_lines(patch: str | None) -> int | None:
+    """Count added/removed lines in a unified diff hunk. None when no patch (binary/too large)."""
+    if not patch:
+        return None
+    return sum(
+        1
+        for line in patch.splitlines()
+        if line[:1] in ("+", "-") and not line.startswith(("+++", "---"))
+    )
+
+
+def is_manifest_path(path: str) -> bool:
+    """True for dependency manifests and build files (requirements*.txt, CMakeLists.txt, ...)."""
+    name = PurePosixPath(path).name
+    return any(fnmatch(name, pattern) for pattern in MANIFEST_PATTERNS)
+
+
+def is_doc_path(path: str) -> bool:
+    """True for documentation files, excluding manifests.
+
+    Docs by suffix or well-known name anywhere, plus text and images under a
+    docs dir. Code under docs/ (conf.py, hooks, scripts) is never a doc.
+    """
+    if is_manifest_path(path):
+        return False
+    p = PurePosixPath(path)
+    suffix = p.suffix.lower()
+    return (
+        suffix in DOC_SUFFIXES
+        or p.name in DOC_NAMES
+        or (path.startswith(DOC_DIRS) and suffix in DOC_DIR_SUFFIXES)
+    )
+
+
+def is_lockfile_path(path: str) -> bool:
+    """True for dependency lockfiles."""
+    return PurePosixPath(path).name in LOCKFILE_NAMES
+
+
+def classify_diff(
+    files: list[DiffFile],
+    block_on: list[str],
+    fast_max_changed_lines: int,
+    fast_max_files: int,
+) -> TriageDecision:
+    """Pick the review path for a diff.
+
+    - Only docs and/or lockfiles → auto_approve.
+    - Small diff (all patches present, within file and line limits) → fast,
+      unless a configured block_on category is likely to need the full model:
+      poor_tests with source changes and no test changes, or
+      overengineering/architectural_regression with newly added source files.
+    - Everything else → full.
+    """
+    if not files:
+        return TriageDecision("auto_approve", "empty_diff")
+
+    code_files = [f for f in files if not (is_doc_path(f.path) or is_lockfile_path(f.path))]
+    if not code_files:
+        if all(is_doc_path(f.path) for f in files):
+            return TriageDecision("auto_approve", "docs_only")
+        if all(is_lockfile_path(f.path) for f in files):
+            return TriageDecision("auto_approve", "lockfile_only")
+        return TriageDecision("auto_approve", "docs_and_lockfiles")
+
+    if any(f.changed_lines is None for f in code_files):
+        return TriageDecision("full", "patch_unavailable")
+    total_lines = sum(f.changed_lines or 0 for f in code_files)
+    if len(code_files) > fast_max_files or total_lines > fast_max_changed_lines:
+        return TriageDecision("full", "large_diff")
+
+    block = set(block_on or [])
+    source_files = [f for f in code_files if not is_test_file(f.path)]
+    if "poor_tests" in block and source_files and len(source_files) == len(code_files):
+        return TriageDecision("full", "block_on_poor_tests")
+    if block & {"overengineering", "architectural_regression"} and any(
+        f.status == "added" for f in source_files
+    ):
+        return TriageDecision("full", "block_on_new_files")
+    return TriageDecision("fast", "small_diff")
+
+
+def auto_approved_result() -> ReviewResult:
+    """ReviewResult for auto-approved diffs — no categories, decision APPROVED."""
+    return ReviewResult(decision="APPROVED")
@@ -17,7 +17,7 @@ from booty.github.comments import post_builder_blocked_comment, post_self_modifi
 from booty.github.repo_config import load_booty_config_for_repo
 from booty.jobs import Job
 from booty.logging import get_logger
-from booty.memory import add_record, get_memory_config
+from booty.memory import get_memory_config, submit_record
 from booty.memory.adapters import build_deploy_failure_record
 from booty.memory.config import apply_memory_env_overrides
 from booty.planner.jobs import PlannerJob, planner_enqueue, planner_is_duplicate, planner_mark_processed
@@ -42,6 +42,7 @@ from booty.test_runner.config import (
     apply_release_governor_env_overrides,
     load_booty_config_from_content,
 )
+from booty.memory.pr_map import record_pr_shas
 from booty.memory.surfacing import surface_governor_hold
 from booty.reviewer import ReviewerJob
 from booty.security import SecurityJob
@@ -331,6 +332,17 @@ async def _route_pull_request(
         )
         return {"status": "ignored", "reason": "normalize_failed"}
 
+    # sha -> PR map for memory surfacing (head on every event, merge commit once merged)
+    try:
+        pr_payload = payload.get("pull_request", {})
+        record_pr_shas(
+            internal.full_name,
+            internal.pr_number,
+            [internal.head_sha, pr_payload.get("merge_commit_sha") if pr_payload.get("merged") else ""],
+        )
+    except Exception as e:
+        logger.warning("pr_map_update_failed", pr_number=internal.pr_number, error=str(e))
+
     if internal.action not in ("opened", "synchronize", "reopened"):
         _log_event_skip(
             agent=None,
@@ -575,7 +587,7 @@ async def _route_workflow_run(
                     record = build_deploy_failure_record(
                         head_sha, run_url, conclusion, failure_type, repo_full_name
                     )
-                    add_record(record, mem_config)
+                    submit_record(record, mem_config)
                 except Exception as e:
                     logger.warning(
                         "memory_ingestion_failed",
@@ -0,0 +1,346 @@
+"""Offline advisory index — match lockfile versions against an OSV export on disk.
+
+The export directory holds one subdirectory per OSV ecosystem (PyPI, npm,
+Packagist, crates.io) with either the extracted advisory JSON files or the
+ecosystem's all.zip as downloaded from the OSV bucket. Lockfiles are parsed
+in-process; files the parser can't pin (pyproject.toml, pnpm-lock.yaml) fall
+back to the ecosystem's audit tool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import tomllib
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from packaging.version import InvalidVersion, Version
+
+from booty.logging import get_logger
+
+logger = get_logger()
+
+OSV_ECOSYSTEMS = {"python": "PyPI", "node": "npm", "php": "Packagist", "rust": "crates.io"}
+
+_SEVERITY_MAP = {
+    "critical": "critical",
+    "high": "high",
+    "moderate": "medium",
+    "medium": "medium",
+    "low": "low",
+}
+_REQUIREMENT_PIN = re.compile(
+    r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?\s*===?\s*([^\s;#,]+)"
+)
+_YARN_ENTRY = re.compile(r'^"?((?:@[^/@"]+/)?[^@"\s]+)@')
+_YARN_VERSION = re.compile(r'^\s+version:?\s+"?([^"\s]+)"?')
+
+
+@dataclass(frozen=True)
+class Advisory:
+    """One OSV advisory entry for one package."""
+
+    id: str
+    cve_id: str
+    severity: str
+    versions: frozenset[str]
+    ranges: tuple[tuple[tuple[str, str], ...], ...]  # Per range: ((event, version), ...)
+
+
+def normalize_name(ecosystem: str, name: str) -> str:
+    if ecosystem == "python":
+        return re.sub(r"[-_.]+", "-", name).lower()
+    if ecosystem == "php":
+        return name.lower()
+    return name
+
+
+# -- lockfile parsing ---------------------------------------------------------
+
+
+def parse_lockfile(ecosystem: str, path: Path) -> list[tuple[str, str]] | None:
+    """(package, version) pairs pinned by path, or None when it can't be pinned offline."""
+    name = path.name
+    try:
+        if ecosystem == "python":
+            if name in ("poetry.lock", "uv.lock"):
+                data = tomllib.loads(path.read_text(encoding="utf-8"))
+                return [
+                    (p["name"], str(p["version"]))
+                    for p in data.get("package", [])
+                    if p.get("name") and p.get("version")
+                ]
+            if name == "Pipfile.lock":
+                data = json.loads(path.read_text(encoding="utf-8"))
+                return [
+                    (pkg, str(spec["version"]).lstrip("="))
+                    for section in ("default", "develop")
+                    for pkg, spec in (data.get(section) or {}).items()
+                    if isinstance(spec, dict) and spec.get("version")
+                ]
+            if name.startswith("requirements") and name.endswith(".txt"):
+                return _parse_requirements(path)
+            return None
+        if ecosystem == "node":
+            if name == "package-lock.json":
+                return _parse_package_lock(json.loads(path.read_text(encoding="utf-8")))
+            if name == "yarn.lock":
+                return _parse_yarn_lock(path.read_text(encoding="utf-8"))
+            return None
+        if ecosystem == "php" and name == "composer.lock":
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return [
+                (p["name"], str(p["version"]).lstrip("v"))
+                for section in ("packages", "packages-dev")
+                for p in data.get(section) or []
+                if p.get("name") and p.get("version")
+            ]
+        if ecosystem == "rust" and name == "Cargo.lock":
+            data = tomllib.loads(path.read_text(encoding="utf-8"))
+            return [
+                (p["name"], str(p["version"]))
+                for p in data.get("package", [])
+                if p.get("name") and p.get("version")
+            ]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.warning("lockfile_parse_failed", path=str(path), error=str(e))
+    return None
+
+
+def _parse_requirements(path: Path) -> list[tuple[str, str]] | None:
+    pins: list[tuple[str, str]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        m = _REQUIREMENT_PIN.match(stripped)
+        if m is None:
+            return None  # Unpinned or includes (-r, -e, URLs): needs the real resolver
+        pins.append((m.group(1), m.group(2)))
+    return pins
+
+
+def _parse_package_lock(data: dict) -> list[tuple[str, str]]:
+    pins: list[tuple[str, str]] = []
+    for key, meta in (data.get("packages") or {}).items():
+        if not key or not isinstance(meta, dict) or meta.get("link"):
+            continue
+        name = meta.get("name") or key.rsplit("node_modules/", 1)[-1]
+        if meta.get("version"):
+            pins.append((name, str(meta["version"])))
+    if pins:
+        return pins
+
+    def walk(deps: dict) -> None:  # lockfileVersion 1
+        for name, meta in deps.items():
+            if isinstance(meta, dict) and meta.get("version"):
+                pins.append((name, str(meta["version"])))
+                walk(meta.get("dependencies") or {})
+
+    walk(data.get("dependencies") or {})
+    return pins
+
+
+def _parse_yarn_lock(text: str) -> list[tuple[str, str]]:
+    pins: list[tuple[str, str]] = []
+    current: str | None = None
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        if not line[0].isspace():
+            m = _YARN_ENTRY.match(line)
+            current = m.group(1) if m else None
+            continue
+        if current is not None:
+            m = _YARN_VERSION.match(line)
+            if m:
+                pins.append((current, m.group(1)))
+                current = None
+    return pins
+
+
+# -- version comparison -------------------------------------------------------
+
+
+def _version_key(ecosystem: str, version: str):
+    if ecosystem == "python":
+        try:
+            return (0, Version(version))
+        except InvalidVersion:
+            pass
+    # SemVer-ish: numeric core, pre-releases sort before the release
+    core, _, pre = version.lstrip("v").partition("-")
+    core = core.split("+", 1)[0]
+    nums = tuple(int(p) if p.isdigit() else 0 for p in core.split("."))
+    nums = nums + (0,) * (4 - len(nums))
+    pre_parts = [(0, int(p), "") if p.isdigit() else (1, 0, p) for p in pre.split(".")]
+    pre_key = (1,) if not pre else (0, *pre_parts)
+    return (1, nums, pre_key)
+
+
+def _compare_keys(ecosystem: str, a: str, b: str) -> int:
+    ka, kb = _version_key(ecosystem, a), _version_key(ecosystem, b)
+    if ka[0] != kb[0]:  # One side isn't PEP 440; compare both loosely
+        ka, kb = _version_key("", a), _version_key("", b)
+    return (ka > kb) - (ka < kb)
+
+
+def is_affected(ecosystem: str, version: str, advisory: Advisory) -> bool:
+    """OSV range evaluation: walk events in version order, toggling affected."""
+    if version in advisory.versions:
+        return True
+    for events in advisory.ranges:
+        affected = False
+        ordered = sorted(
+            events,
+            key=lambda e: (0,) if e[1] == "0" else (1, _version_key(ecosystem, e[1])),
+        )
+        for kind, bound in ordered:
+            if kind == "introduced":
+                if bound == "0" or _compare_keys(ecosystem, version, bound) >= 0:
+                    affected = True
+            elif kind == "fixed":
+                if _compare_keys(ecosystem, version, bound) >= 0:
+                    affected = False
+            elif kind == "last_affected":
+                if _compare_keys(ecosystem, version, bound) > 0:
+                    affected = False
+        if affected:
+            return True
+    return False
+
+
+# -- index --------------------------------------------------------------------
+
+
+def _iter_osv_documents(directory: Path) -> Iterator[dict]:
+    for path in sorted(directory.iterdir()):
+        try:
+            if path.suffix == ".json":
+                yield json.loads(path.read_bytes())
+            elif path.suffix == ".zip":
+                with zipfile.ZipFile(path) as zf:
+                    for member in zf.namelist():
+                        if member.endswith(".json"):
+                            yield json.loads(zf.read(member))
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            logger.warning("osv_document_unreadable", path=str(path), error=str(e))
+
+
+def _advisory_from(doc: dict, affected: dict) -> Advisory:
+    aliases = [a for a in doc.get("aliases") or [] if str(a).startswith("CVE-")]
+    raw_sev = str(
+        (doc.get("database_specific") or {}).get("severity")
+        or (affected.get("database_specific") or {}).get("severity")
+        or ""
+    ).lower()
+    ranges = tuple(
+        tuple((k, str(v)) for event in r.get("events") or [] for k, v in event.items())
+        for r in affected.get("ranges") or []
+        if r.get("type") in ("ECOSYSTEM", "SEMVER")
+    )
+    return Advisory(
+        id=str(doc.get("id", "")),
+        cve_id=aliases[0] if aliases else str(doc.get("id", "")),
+        # No GHSA severity: conservative high, as with pip-audit results
+        severity=_SEVERITY_MAP.get(raw_sev, "high"),
+        versions=frozenset(str(v) for v in affected.get("versions") or []),
+        ranges=ranges,
+    )
+
+
+def export_fingerprint(root: Path) -> str:
+    """Advisory DB version: changes whenever a file in the export is added, replaced or touched."""
+    h = hashlib.sha256()
+    for osv_name in sorted(OSV_ECOSYSTEMS.values()):
+        directory = root / osv_name
+        if not directory.is_dir():
+            continue
+        for path in sorted(directory.iterdir()):
+            st = path.stat()
+            h.update(f"{osv_name}/{path.name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()[:16]
+
+
+class AdvisoryIndex:
+    """Package -> advisories per ecosystem, loaded lazily from an OSV export."""
+
+    def __init__(self, root: Path, version: str | None = None):
+        self.root = Path(root)
+        self._by_ecosystem: dict[str, dict[str, list[Advisory]]] = {}
+        self._lock = threading.Lock()
+        self.version = version or export_fingerprint(self.root)
+
+    def has_ecosystem(self, ecosystem: str) -> bool:
+        osv_name = OSV_ECOSYSTEMS.get(ecosystem)
+        return osv_name is not None and (self.root / osv_name).is_dir()
+
+    def _packages(self, ecosystem: str) -> dict[str, list[Advisory]]:
+        with self._lock:
+            loaded = self._by_ecosystem.get(ecosystem)
+            if loaded is not None:
+                return loaded
+            osv_name = OSV_ECOSYSTEMS[ecosystem]
+            packages: dict[str, list[Advisory]] = {}
+            for doc in _iter_osv_documents(self.root / osv_name):
+                if doc.get("withdrawn"):
+                    continue
+                for affected in doc.get("affected") or []:
+                    pkg = affected.get("package") or {}
+                    if pkg.get("ecosystem") != osv_name or not pkg.get("name"):
+                        continue
+                    key = normalize_name(ecosystem, pkg["name"])
+                    packages.setdefault(key, []).append(_advisory_from(doc, affected))
+            logger.info("osv_index_loaded", ecosystem=osv_name, packages=len(packages))
+            self._by_ecosystem[ecosystem] = packages
+            return packages
+
+    def audit(self, ecosystem: str, path: Path) -> list[dict] | None:
+        """Findings for path, or None when it can't be audited offline."""
+        if not self.has_ecosystem(ecosystem):
+            return None
+        pins = parse_lockfile(ecosystem, path)
+        if pins is None:
+            return None
+        packages = self._packages(ecosystem)
+        findings: list[dict] = []
+        seen: set[tuple[str, str]] = set()
+        for name, version in pins:
+            for adv in packages.get(normalize_name(ecosystem, name), ()):
+                if (name, adv.id) in seen or not is_affected(ecosystem, version, adv):
+                    continue
+                seen.add((name, adv.id))
+                findings.append(
+                    {
+                        "ecosystem": ecosystem,
+                        "path": str(path),
+                        "package": name,
+                        "severity": adv.severity,
+                        "cve_id": adv.cve_id,
+                    }
+                )
+        return findings
+
+
+_indexes: dict[str, AdvisoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_advisory_index(root: str | Path) -> AdvisoryIndex | None:
+    """Shared index for root; rebuilt when the export changes. None if root is missing."""
+    root = Path(root)
+    if not root.is_dir():
+        logger.warning("osv_index_missing", path=str(root))
+        return None
+    with _indexes_lock:
+        version = export_fingerprint(root)
+        index = _indexes.get(str(root))
+        if index is None or index.version != version:
+            index = AdvisoryIndex(root, version)
+            _indexes[str(root)] = index
+        return index
@@ -4,15 +4,23 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from booty.logging import get_logger
+from booty.release_governor.store import get_state_dir
+from booty.repo_index import RepoIndex
+from booty.security.advisories import AdvisoryIndex, get_advisory_index
+
 if TYPE_CHECKING:
     from booty.test_runner.config import SecurityConfig
 
@@ -33,6 +41,10 @@ LOCKFILE_PATTERNS: dict[str, list[str]] = {
     "rust": ["**/Cargo.lock"],
 }
 
+logger = get_logger()
+
+AUDIT_CACHE_VERSION = 1  # Bump when finding format or tool invocation changes
+
 # Lockfile basename -> is true lockfile (vs manifest)
 PYTHON_LOCKFILES = {"poetry.lock", "Pipfile.lock", "uv.lock"}
 
@@ -59,25 +71,29 @@ class AuditResult:
     worst_severity: str | None  # "critical" | "high" | "medium" | "low" | None
 
 
-def discover_lockfiles(workspace_path: Path) -> list[tuple[str, Path]]:
+def discover_lockfiles(
+    workspace_path: Path, index: RepoIndex | None = None
+) -> list[tuple[str, Path]]:
     """Discover lockfiles and manifests in workspace.
 
     Returns [(ecosystem, path), ...] for each found file.
     Deduplicates by content hash (identical files count as one).
-    Sorted by (ecosystem, path) for deterministic order.
+    Sorted by (ecosystem, path) for deterministic order. Uses index (built
+    here when omitted), so gitignored and EXCLUDED_DIRS paths are skipped.
     """
     workspace = Path(workspace_path).resolve()
     if not workspace.exists() or not workspace.is_dir():
         return []
+    if index is None:
+        index = RepoIndex.build(workspace)
 
     seen_hashes: set[str] = set()
     results: list[tuple[str, Path]] = []
 
     for ecosystem, patterns in LOCKFILE_PATTERNS.items():
         for pattern in patterns:
-            for path in workspace.rglob(pattern.replace("**/", "")):
-                if not path.is_file():
-                    continue
+            for rel in index.named(pattern.replace("**/", "")):
+                path = workspace / rel
                 try:
                     content = path.read_bytes()
                 except OSError:
@@ -435,20 +451,128 @@ def _run_cargo_audit(
     return findings, errors, summary
 
 
+def audit_cache_key(
+    ecosystem: str,
+    tool: str,
+    content_hash: str,
+    advisory_version: str,
+    fail_severity: str,
+) -> str:
+    """Cache key for one lockfile audit: (ecosystem, content hash, advisory DB version)."""
+    raw = json.dumps(
+        [AUDIT_CACHE_VERSION, ecosystem, tool, content_hash, advisory_version, fail_severity]
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+_REQUIREMENT_INCLUDE = re.compile(
+    r"^(?:-[rc]\s*|--(?:requirement|constraint)(?:\s*=\s*|\s+))(\S+)"
+)
+
+
+def lockfile_content_hash(path: Path) -> str | None:
+    """Hash of what auditing path reads: its bytes plus, for requirements files,
+    every file pulled in through -r/-c includes (recursively).
+
+    None when an include is a URL (its content is unknown without fetching).
+    Raises OSError when path itself cannot be read.
+    """
+    data = path.read_bytes()
+    h = hashlib.sha256(data)
+    if not (path.name.startswith("requirements") and path.suffix == ".txt"):
+        return h.hexdigest()
+    seen = {path.resolve()}
+    pending = [(path, data)]
+    while pending:
+        current, content = pending.pop()
+        for line in content.decode("utf-8", errors="replace").splitlines():
+            m = _REQUIREMENT_INCLUDE.match(line.strip())
+            if m is None:
+                continue
+            if "://" in m.group(1):
+                return None
+            included = (current.parent / m.group(1)).resolve()
+            if included in seen:
+                continue
+            seen.add(included)
+            try:
+                included_data = included.read_bytes()
+            except OSError:
+                included_data = b""  # pip-audit reports the missing file itself
+            else:
+                pending.append((included, included_data))
+            rel = os.path.relpath(included, path.parent.resolve())
+            h.update(b"\0" + rel.encode() + b"\0" + included_data)
+    return h.hexdigest()
+
+
+def _audit_cache_path(key: str) -> Path:
+    return get_state_dir() / "audit_cache" / f"{key}.json"
+
+
+def load_cached_audit(key: str, path: Path) -> tuple[list[dict], str] | None:
+    """Cached (findings, summary) with finding paths pointed at path, or None."""
+    try:
+        data = json.loads(_audit_cache_path(key).read_text())
+    except (OSError, ValueError):
+        return None
+    findings = [{**f, "path": str(path)} for f in data.get("findings", [])]
+    return findings, str(data.get("summary", "passed"))
+
+
+def save_cached_audit(key: str, findings: list[dict], summary: str) -> None:
+    """Persist an audit result. Findings are stored without workspace paths."""
+    target = _audit_cache_path(key)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "findings": [{k: v for k, v in f.items() if k != "path"} for f in findings],
+        "summary": summary,
+    }
+    tmp = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, target)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        logger.warning("audit_cache_write_failed", error=str(e))
+
+
+def _tool_for(ecosystem: str, path: Path) -> str:
+    if ecosystem == "node":
+        return TOOL_BY_ECOSYSTEM["node"].get(path.name, "npm")
+    return next(iter(TOOL_BY_ECOSYSTEM.get(ecosystem, {"*": ecosystem}).values()))
+
+
 def run_dependency_audit(
     workspace_path: str | Path,
     config: SecurityConfig | None,
+    cache: bool = False,
+    cache_ttl_hours: float = 24.0,
+    osv_index_dir: str | Path | None = None,
+    index: RepoIndex | None = None,
 ) -> AuditResult:
     """Run dependency audit across all detected lockfiles.
 
     Runs audits in parallel. Fails only when severity >= fail_severity.
+
+    With cache, results are reused per (ecosystem, lockfile content hash
+    including -r/-c includes, advisory DB version). The version is the OSV export fingerprint for
+    offline audits and a cache_ttl_hours time bucket for the remote tools.
+    With osv_index_dir, lockfiles the advisory index can parse are audited
+    in-process without network access; the rest still use the tools.
+    Results carrying errors (tool missing, timeout) are never cached.
+    index is the workspace RepoIndex to discover lockfiles from, if prebuilt.
     """
     fail_severity = (
         config.fail_severity if config is not None else "high"
     )
     workspace = Path(workspace_path).resolve()
 
-    lockfiles = discover_lockfiles(workspace)
+    lockfiles = discover_lockfiles(workspace, index)
+    advisories: AdvisoryIndex | None = (
+        get_advisory_index(osv_index_dir) if osv_index_dir else None
+    )
+    remote_version = f"ttl:{int(time.time() // max(cache_ttl_hours * 3600, 1))}"
 
     all_findings: list[dict] = []
     all_errors: list[str] = []
@@ -458,6 +582,44 @@ def run_dependency_audit(
     severity_order = ("critical", "high", "medium", "low")
 
     def audit_one(item: tuple[str, Path]) -> tuple[str, list[dict], list[str], str]:
+        ecosystem, path = item
+        if not cache and advisories is None:
+            return run_tool(item)
+        tool = _tool_for(ecosystem, path)
+        try:
+            content_hash = lockfile_content_hash(path)
+        except OSError:
+            return run_tool(item)
+        if content_hash is None:
+            return run_tool(item)
+        offline = advisories is not None and advisories.has_ecosystem(ecosystem)
+        osv_key = (
+            audit_cache_key(ecosystem, "osv", content_hash, advisories.version, fail_severity)
+            if offline and advisories is not None
+            else None
+        )
+        tool_key = audit_cache_key(ecosystem, tool, content_hash, remote_version, fail_severity)
+        if cache:
+            for key in (osv_key, tool_key):
+                hit = load_cached_audit(key, path) if key else None
+                if hit is not None:
+                    logger.info("dependency_audit_cache_hit", ecosystem=ecosystem, path=str(path))
+                    return ecosystem, hit[0], [], hit[1]
+
+        if offline and advisories is not None and osv_key is not None:
+            f = advisories.audit(ecosystem, path)
+            if f is not None:
+                s = f"{len(f)} vulnerable (offline)" if f else "passed"
+                if cache:
+                    save_cached_audit(osv_key, f, s)
+                return ecosystem, f, [], s
+
+        ecosystem, f, e, s = run_tool(item)
+        if cache and not e:
+            save_cached_audit(tool_key, f, s)
+        return ecosystem, f, e, s
+
+    def run_tool(item: tuple[str, Path]) -> tuple[str, list[dict], list[str], str]:
         ecosystem, path = item
         if ecosystem == "python":
             f, e, s = _run_python_audit(path, fail_severity)
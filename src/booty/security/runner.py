@@ -22,8 +22,16 @@ from booty.security.permission_drift import (
     get_changed_paths,
     sensitive_paths_touched,
 )
-from booty.security.scanner import build_annotations, run_secret_scan
-from booty.memory import add_record, get_memory_config
+from booty.security.scan_state import (
+    SecretScanState,
+    load_scan_state,
+    merge_findings,
+    plan_secret_scan,
+    rules_fingerprint,
+    save_scan_state,
+)
+from booty.security.scanner import ScanResult, build_annotations, run_secret_scan
+from booty.memory import get_memory_config, submit_record
 from booty.memory.adapters import build_security_block_record
 from booty.memory.config import apply_memory_env_overrides
 from booty.test_runner.config import (
@@ -58,7 +66,7 @@ def _ingest_security_record(
             mem_config = apply_memory_env_overrides(mem_config)
         if mem_config and mem_config.enabled:
             record = build_security_block_record(job, trigger, title, summary, paths)
-            add_record(record, mem_config)
+            submit_record(record, mem_config)
     except Exception as e:
         logger.warning(
             "memory_ingestion_failed",
@@ -98,6 +106,60 @@ def build_audit_summary(audit_result: AuditResult) -> str:
     return "\n".join(lines) if lines else "Dependency audit failed"
 
 
+async def _scan_secrets_incrementally(
+    job: SecurityJob,
+    workspace_path: str,
+    base_sha: str,
+    security_config: SecurityConfig | None,
+) -> ScanResult:
+    """Scan only commits added since the last scanned head; merge with its findings.
+
+    State is only persisted for successful scans. Errors loading or saving
+    state degrade to a full scan rather than failing the check.
+    """
+    fingerprint = rules_fingerprint(workspace_path, security_config)
+    previous = load_scan_state(job.owner, job.repo_name, job.pr_number)
+    plan = await asyncio.to_thread(
+        plan_secret_scan, workspace_path, previous, base_sha, job.head_sha, fingerprint
+    )
+    if plan.reuse and plan.previous is not None:
+        logger.info("secret_scan_reused", job_id=job.job_id, head_sha=job.head_sha)
+        return ScanResult(findings=list(plan.previous.findings), scan_ok=True)
+
+    logger.info(
+        "secret_scan_started",
+        job_id=job.job_id,
+        incremental=plan.incremental,
+        scan_base=plan.scan_base,
+    )
+    result = await asyncio.to_thread(
+        run_secret_scan,
+        workspace_path,
+        plan.scan_base,
+        job.head_sha,
+        security_config,
+    )
+    if not result.scan_ok:
+        return result
+    if plan.previous is not None:
+        result.findings = merge_findings(plan.previous.findings, result.findings)
+    try:
+        save_scan_state(
+            job.owner,
+            job.repo_name,
+            job.pr_number,
+            SecretScanState(
+                head_sha=job.head_sha,
+                base_sha=base_sha,
+                rules_fingerprint=fingerprint,
+                findings=result.findings,
+            ),
+        )
+    except OSError as e:
+        logger.warning("secret_scan_state_save_failed", job_id=job.job_id, error=str(e))
+    return result
+
+
 async def process_security_job(job: SecurityJob, settings: Settings) -> None:
     """Process a security job: create check, load config, complete.
 
@@ -193,12 +255,8 @@ async def process_security_job(job: SecurityJob, settings: Settings) -> None:
             # If base_sha is None/empty, use head_sha as base to produce empty diff
             # (no changed files to scan). This gracefully handles initial commits.
             scan_base = base_sha if base_sha else job.head_sha
-            result = await asyncio.to_thread(
-                run_secret_scan,
-                workspace.path,
-                scan_base,
-                job.head_sha,
-                security_config,
+            result = await _scan_secrets_incrementally(
+                job, workspace.path, scan_base, security_config
             )
 
             if not result.scan_ok:
@@ -251,6 +309,9 @@ async def process_security_job(job: SecurityJob, settings: Settings) -> None:
                     run_dependency_audit,
                     workspace.path,
                     security_config,
+                    cache=settings.SECURITY_AUDIT_CACHE_ENABLED,
+                    cache_ttl_hours=settings.SECURITY_AUDIT_CACHE_TTL_HOURS,
+                    osv_index_dir=settings.SECURITY_OSV_INDEX_DIR or None,
                 )
             except Exception as e:
                 logger.exception("dependency_audit_failed", job_id=job.job_id, error=str(e))
@@ -0,0 +1,148 @@
+"""Incremental secret scan state — last scanned head and its findings per PR."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from booty.logging import get_logger
+from booty.release_governor.store import get_state_dir
+from booty.security.secrets import GITLEAKS_CONFIG_NAMES
+
+if TYPE_CHECKING:
+    from booty.test_runner.config import SecurityConfig
+
+logger = get_logger()
+
+
+@dataclass
+class SecretScanState:
+    """Findings of base_sha..head_sha under one rule set (rules_fingerprint)."""
+
+    head_sha: str
+    base_sha: str
+    rules_fingerprint: str
+    findings: list[dict] = field(default_factory=list)
+    scanned_at: str = ""
+
+
+@dataclass
+class ScanPlan:
+    """What to diff for this push. previous is set when the scan is incremental."""
+
+    scan_base: str
+    previous: SecretScanState | None = None
+    reuse: bool = False  # Head already scanned under the same rules; skip the scan
+
+    @property
+    def incremental(self) -> bool:
+        return self.previous is not None
+
+
+def _state_path(owner: str, repo_name: str, pr_number: int) -> Path:
+    return get_state_dir() / "secret_scans" / f"{owner}__{repo_name}__{pr_number}.json"
+
+
+def load_scan_state(owner: str, repo_name: str, pr_number: int) -> SecretScanState | None:
+    """Last persisted scan for the PR, or None when absent or unreadable."""
+    path = _state_path(owner, repo_name, pr_number)
+    try:
+        data = json.loads(path.read_text())
+        return SecretScanState(**data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("secret_scan_state_unreadable", path=str(path), error=str(e))
+        return None
+
+
+def save_scan_state(owner: str, repo_name: str, pr_number: int, state: SecretScanState) -> None:
+    """Persist scan state with an atomic write."""
+    path = _state_path(owner, repo_name, pr_number)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not state.scanned_at:
+        state.scanned_at = datetime.now(timezone.utc).isoformat()
+    fd = tempfile.NamedTemporaryFile(mode="w", dir=path.parent, delete=False, suffix=".tmp")
+    try:
+        json.dump(asdict(state), fd, indent=0, separators=(",", ":"))
+        fd.flush()
+        os.fsync(fd.fileno())
+        fd.close()
+        os.replace(fd.name, path)
+    except Exception:
+        if os.path.exists(fd.name):
+            os.unlink(fd.name)
+        raise
+
+
+def rules_fingerprint(workspace_path: str | Path, config: SecurityConfig | None) -> str:
+    """Hash of everything that changes which lines count as findings."""
+    h = hashlib.sha256()
+    if config is not None:
+        h.update(config.secret_scanner.encode())
+        h.update(json.dumps(sorted(config.secret_scan_exclude)).encode())
+    for name in GITLEAKS_CONFIG_NAMES:
+        path = Path(workspace_path) / name
+        if path.is_file():
+            h.update(name.encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _is_ancestor(workspace_path: str | Path, old_sha: str, new_sha: str) -> bool:
+    """True when old_sha is in new_sha's history (False if unknown, e.g. force-pushed away)."""
+    try:
+        proc = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", old_sha, new_sha],
+            cwd=workspace_path,
+            capture_output=True,
+            timeout=20,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return proc.returncode == 0
+
+
+def plan_secret_scan(
+    workspace_path: str | Path,
+    previous: SecretScanState | None,
+    base_sha: str,
+    head_sha: str,
+    fingerprint: str,
+) -> ScanPlan:
+    """Scan only previous.head..head when the PR was extended, else base..head.
+
+    Falls back to a full scan when there is no state, the base moved (a merge
+    from the base branch would otherwise pull its changes into the diff), the
+    rules changed, or the old head is no longer an ancestor (force-push).
+    """
+    if previous is None or previous.base_sha != base_sha:
+        return ScanPlan(scan_base=base_sha)
+    if previous.rules_fingerprint != fingerprint:
+        return ScanPlan(scan_base=base_sha)
+    if previous.head_sha == head_sha:
+        return ScanPlan(scan_base=head_sha, previous=previous, reuse=True)
+    if not _is_ancestor(workspace_path, previous.head_sha, head_sha):
+        logger.info("secret_scan_full_rescan", reason="history_rewritten", old_head=previous.head_sha)
+        return ScanPlan(scan_base=base_sha)
+    return ScanPlan(scan_base=previous.head_sha, previous=previous)
+
+
+def merge_findings(previous: list[dict], new: list[dict]) -> list[dict]:
+    """Previous findings stay (the secret is still in PR history); duplicates are dropped."""
+    merged: list[dict] = []
+    seen: set[tuple] = set()
+    for f in [*previous, *new]:
+        key = (f.get("path"), f.get("start_line"), f.get("rule_id"), f.get("secret"))
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(f)
+    return merged
@@ -1,17 +1,33 @@
-"""Secret scanning via gitleaks or trufflehog."""
+"""Secret scanning — native rule scan, gitleaks when installed."""
 
 from __future__ import annotations
 
 import json
 import shutil
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pathspec
+
+from booty.logging import get_logger
+from booty.security.secrets import (
+    DEFAULT_RULES,
+    SecretRuleSet,
+    diff_adds_lines,
+    load_gitleaks_rules,
+    scan_git_diff,
+)
+
 if TYPE_CHECKING:
     from booty.test_runner.config import SecurityConfig
 
+logger = get_logger()
+
+DIFF_SPOOL_BYTES = 4 * 1024 * 1024  # Diff copy kept for gitleaks; beyond this it lives on disk
+
 
 @dataclass
 class ScanResult:
@@ -22,6 +38,60 @@ class ScanResult:
     error_message: str | None = None
 
 
+def _find_scanner(*names: str) -> str | None:
+    """Resolve binary: try PATH first, then common install locations.
+
+    Use full path so subprocess works when PATH doesn't include /usr/local/bin
+    (e.g. systemd).
+    """
+    for name in names:
+        p = shutil.which(name)
+        if p:
+            return str(Path(p).resolve())
+    # Fallback: common locations when PATH lacks /usr/local/bin
+    for name in names:
+        for prefix in ("/usr/local/bin", "/usr/bin"):
+            cand = Path(prefix) / name
+            if cand.is_file():
+                return str(cand.resolve())
+    return None
+
+
+def _parse_gitleaks_report(stdout: bytes) -> list[dict]:
+    findings: list[dict] = []
+    if not stdout:
+        return findings
+    try:
+        raw = json.loads(stdout.decode("utf-8"))
+    except json.JSONDecodeError:
+        return findings
+    # gitleaks json: can be {"findings": [...]} or list
+    if isinstance(raw, dict) and "findings" in raw:
+        items = raw["findings"]
+    elif isinstance(raw, list):
+        items = raw
+    else:
+        items = []
+
+    for f in items:
+        if isinstance(f, dict):
+            path = f.get("File") or f.get("file") or f.get("path") or ""
+            start = f.get("StartLine") or f.get("Line") or f.get("line") or 1
+            end = f.get("EndLine") or f.get("end_line") or start
+            rule_id = f.get("RuleID") or f.get("rule_id") or "unknown"
+            secret = f.get("Secret") or f.get("secret") or ""
+            findings.append(
+                {
+                    "path": str(path),
+                    "start_line": int(start) if start else 1,
+                    "end_line": int(end) if end else 1,
+                    "rule_id": str(rule_id),
+                    "secret": secret[:20] + "..." if len(secret) > 20 else secret,
+                }
+            )
+    return findings
+
+
 def run_secret_scan(
     workspace_path: str,
     base_sha: str,
@@ -30,38 +100,20 @@ def run_secret_scan(
 ) -> ScanResult:
     """Run secret scan on git diff base..head.
 
-    Uses gitleaks preferred; trufflehog fallback if gitleaks missing.
-    Returns ScanResult with findings or error.
+    The diff is streamed hunk by hunk through the native scanner (added lines
+    only; call from a worker thread). gitleaks, when installed and not
+    overridden by secret_scanner="native", then rescans the diff whenever it
+    adds lines outside secret_scan_exclude: its rule set is far larger than
+    the native one, so the native keyword pre-filter cannot stand in for it.
+    Without gitleaks the native findings are the result. secret_scan_exclude
+    applies to both. trufflehog has no stdin flow, so it maps to the
+    same path. Returns ScanResult with findings or error.
     """
     scanner_bin = "gitleaks"
+    exclude_patterns: list[str] = []
     if config is not None:
         scanner_bin = config.secret_scanner
-
-    # Resolve binary: try PATH first, then common install locations. Use full path
-    # so subprocess works when PATH doesn't include /usr/local/bin (e.g. systemd).
-    def _find_scanner(*names: str) -> str | None:
-        for name in names:
-            p = shutil.which(name)
-            if p:
-                return str(Path(p).resolve())
-        # Fallback: common locations when PATH lacks /usr/local/bin
-        for name in names:
-            for prefix in ("/usr/local/bin", "/usr/bin"):
-                cand = Path(prefix) / name
-                if cand.is_file():
-                    return str(cand.resolve())
-        return None
-
-    if scanner_bin == "gitleaks":
-        scanner_path = _find_scanner("gitleaks", "trufflehog")
-    else:
-        scanner_path = _find_scanner("trufflehog", "gitleaks")
-    if scanner_path is None:
-        return ScanResult(
-            findings=[],
-            scan_ok=False,
-            error_message="Secret scanner not found (gitleaks or trufflehog)",
-        )
+        exclude_patterns = config.secret_scan_exclude
 
     workspace = Path(workspace_path)
     if not workspace.exists():
@@ -71,50 +123,61 @@ def run_secret_scan(
             error_message=f"Workspace not found: {workspace_path}",
         )
 
+    scanner_path = None if scanner_bin == "native" else _find_scanner("gitleaks")
+    exclude = (
+        pathspec.PathSpec.from_lines("gitignore", exclude_patterns) if exclude_patterns else None
+    )
+    rules = SecretRuleSet([*DEFAULT_RULES, *load_gitleaks_rules(workspace)])
+
     try:
-        # git diff base..head
-        diff_proc = subprocess.Popen(
-            ["git", "diff", f"{base_sha}..{head_sha}", "--", "."],
-            cwd=workspace_path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=False,
-        )
-        diff_out, diff_err = diff_proc.communicate(timeout=20)
-        if diff_proc.returncode != 0 and diff_proc.returncode is not None:
-            return ScanResult(
-                findings=[],
-                scan_ok=False,
-                error_message=f"git diff failed: {diff_err.decode(errors='replace')}",
+        with tempfile.SpooledTemporaryFile(
+            max_size=DIFF_SPOOL_BYTES, prefix="booty-secret-diff-"
+        ) as diff_copy:
+            try:
+                native = scan_git_diff(
+                    workspace,
+                    base_sha,
+                    head_sha,
+                    rules,
+                    exclude=exclude,
+                    tee=diff_copy if scanner_path is not None else None,
+                )
+            except subprocess.CalledProcessError as e:
+                return ScanResult(
+                    findings=[],
+                    scan_ok=False,
+                    error_message=f"git diff failed: {(e.stderr or b'').decode(errors='replace')}",
+                )
+
+            logger.info(
+                "secret_scan_native_complete",
+                diff_bytes=native.diff_bytes,
+                keyword_hit=native.keyword_hit,
+                findings=len(native.findings),
+                external=scanner_path is not None,
             )
-
-        # Empty diff: no changed content
-        if not diff_out.strip():
-            return ScanResult(findings=[], scan_ok=True)
-
-        # Run gitleaks stdin (trufflehog not implemented for stdin flow)
-        if scanner_bin == "trufflehog":
-            return ScanResult(
-                findings=[],
-                scan_ok=False,
-                error_message="trufflehog diff scan not implemented; use gitleaks",
+            # Nothing added outside excluded paths: nothing for gitleaks to find
+            if scanner_path is None or not diff_adds_lines(
+                workspace, base_sha, head_sha, exclude
+            ):
+                return ScanResult(findings=native.findings, scan_ok=True)
+
+            # gitleaks stdin --report-format=json --report-path=-
+            diff_copy.seek(0)
+            gitleaks_proc = subprocess.run(
+                [
+                    scanner_path,
+                    "stdin",
+                    "--no-banner",
+                    "--report-format=json",
+                    "--report-path=-",
+                ],
+                stdin=diff_copy,
+                capture_output=True,
+                timeout=35,
+                cwd=workspace_path,
             )
 
-        # gitleaks stdin --report-format=json --report-path=-
-        gitleaks_proc = subprocess.run(
-            [
-                scanner_path,
-                "stdin",
-                "--no-banner",
-                "--report-format=json",
-                "--report-path=-",
-            ],
-            input=diff_out,
-            capture_output=True,
-            timeout=35,
-            cwd=workspace_path,
-        )
-
         # Exit 0 = no findings, 1 = findings, 2 = error
         if gitleaks_proc.returncode == 2:
             err = gitleaks_proc.stderr.decode(errors="replace").strip()
@@ -124,37 +187,9 @@ def run_secret_scan(
                 error_message=f"gitleaks failed: {err or 'unknown error'}",
             )
 
-        findings: list[dict] = []
-        if gitleaks_proc.stdout:
-            try:
-                raw = json.loads(gitleaks_proc.stdout.decode("utf-8"))
-                # gitleaks json: can be {"findings": [...]} or list
-                if isinstance(raw, dict) and "findings" in raw:
-                    items = raw["findings"]
-                elif isinstance(raw, list):
-                    items = raw
-                else:
-                    items = []
-
-                for f in items:
-                    if isinstance(f, dict):
-                        path = f.get("File") or f.get("file") or f.get("path") or ""
-                        start = f.get("StartLine") or f.get("Line") or f.get("line") or 1
-                        end = f.get("EndLine") or f.get("end_line") or start
-                        rule_id = f.get("RuleID") or f.get("rule_id") or "unknown"
-                        secret = f.get("Secret") or f.get("secret") or ""
-                        findings.append(
-                            {
-                                "path": str(path),
-                                "start_line": int(start) if start else 1,
-                                "end_line": int(end) if end else 1,
-                                "rule_id": str(rule_id),
-                                "secret": secret[:20] + "..." if len(secret) > 20 else secret,
-                            }
-                        )
-            except json.JSONDecodeError:
-                pass
-
+        findings = _parse_gitleaks_report(gitleaks_proc.stdout)
+        if exclude is not None:
+            findings = [f for f in findings if not exclude.match_file(f["path"])]
         return ScanResult(findings=findings, scan_ok=True)
 
     except subprocess.TimeoutExpired:
@@ -0,0 +1,403 @@
+"""Native secret scanner — gitleaks-style rules over added diff lines, no external binary.
+
+Rules carry gitleaks-style keywords. A hunk whose added lines contain no keyword
+is skipped without running any regex; lines that survive are matched against a
+single combined alternation of every rule, and only lines it hits are checked
+rule by rule (so a specific rule wins over generic-api-key on the same span).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import subprocess
+import threading
+import tomllib
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+import pathspec
+
+from booty.logging import get_logger
+
+logger = get_logger()
+
+GITLEAKS_CONFIG_NAMES = (".gitleaks.toml", "gitleaks.toml")
+SECRET_DISPLAY_CHARS = 20
+
+_HUNK_HEADER = re.compile(rb"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+
+@dataclass
+class SecretRule:
+    """One detection rule. group selects the secret from the match (0 = whole match)."""
+
+    id: str
+    regex: str
+    keywords: tuple[str, ...]
+    entropy: float = 0.0
+    group: int = 1
+    require_digit: bool = False  # Skips identifier-looking values (generic rules)
+
+
+# Subset of the gitleaks default rule set covering the common provider tokens
+DEFAULT_RULES: tuple[SecretRule, ...] = (
+    SecretRule(
+        "aws-access-token",
+        r"\b((?:A3T[A-Z0-9]|AKIA|ASIA|ABIA|ACCA)[A-Z0-9]{16})\b",
+        ("a3t", "akia", "asia", "abia", "acca"),
+        entropy=3.0,
+    ),
+    SecretRule("github-pat", r"\b(ghp_[0-9a-zA-Z]{36})\b", ("ghp_",)),
+    SecretRule("github-fine-grained-pat", r"\b(github_pat_\w{82})\b", ("github_pat_",)),
+    SecretRule("github-oauth", r"\b(gho_[0-9a-zA-Z]{36})\b", ("gho_",)),
+    SecretRule("github-app-token", r"\b((?:ghu|ghs)_[0-9a-zA-Z]{36})\b", ("ghu_", "ghs_")),
+    SecretRule("github-refresh-token", r"\b(ghr_[0-9a-zA-Z]{36})\b", ("ghr_",)),
+    SecretRule("gitlab-pat", r"\b(glpat-[\w-]{20})\b", ("glpat-",)),
+    SecretRule(
+        "slack-bot-token", r"\b(xoxb-[0-9]{10,13}-[0-9]{10,13}[a-zA-Z0-9-]*)", ("xoxb",)
+    ),
+    SecretRule(
+        "slack-user-token",
+        r"\b(xox[pe](?:-[0-9]{10,13}){3}-[a-zA-Z0-9-]{28,34})",
+        ("xoxp-", "xoxe-"),
+    ),
+    SecretRule(
+        "slack-webhook-url",
+        r"((?:https?://)?hooks\.slack\.com/(?:services|workflows)/[A-Za-z0-9+/]{43,46})",
+        ("hooks.slack.com",),
+    ),
+    SecretRule(
+        "stripe-access-token",
+        r"\b((?:sk|rk)_(?:test|live|prod)_[a-zA-Z0-9]{10,99})\b",
+        ("sk_test", "sk_live", "sk_prod", "rk_test", "rk_live", "rk_prod"),
+    ),
+    SecretRule(
+        "private-key",
+        r"(?i)(-----BEGIN[ A-Z0-9_-]{0,100}PRIVATE KEY(?: BLOCK)?-----)",
+        ("-----begin",),
+    ),
+    SecretRule("gcp-api-key", r"\b(AIza[\w-]{35})\b", ("aiza",)),
+    SecretRule(
+        "openai-api-key",
+        r"\b(sk-(?:(?:proj|svcacct|admin)-[\w-]{58,74}|[a-zA-Z0-9]{20})T3BlbkFJ[\w-]{20,74})\b",
+        ("t3blbkfj",),
+    ),
+    SecretRule("anthropic-api-key", r"\b(sk-ant-api03-[\w-]{93}AA)\b", ("sk-ant-api03",)),
+    SecretRule("npm-access-token", r"(?i)\b(npm_[a-z0-9]{36})\b", ("npm_",)),
+    SecretRule("pypi-upload-token", r"(pypi-AgEIcHlwaS5vcmc[\w-]{50,1000})", ("pypi-ageichlwas5vcmc",)),
+    SecretRule("sendgrid-api-token", r"\b(SG\.[\w.=-]{66})\b", ("sg.",)),
+    SecretRule(
+        "jwt",
+        r"\b(eyJ[\w-]{17,}\.eyJ[\w/\\-]{17,}\.[\w/\\-]{10,}={0,2})",
+        ("eyj",),
+        entropy=3.0,
+    ),
+    SecretRule(
+        "generic-api-key",
+        r"(?i)(?:access|auth|api|credential|creds|key|passw(?:or)?d|secret|token)"
+        r"[\w.-]{0,20}[\s'\"]{0,3}(?:=|>|:{1,3}=|\|\||:|=>|\?=|,)[`'\"\s=]{0,5}"
+        r"([\w.=-]{10,150}|[a-z0-9][a-z0-9+/]{11,}={0,3})(?:[`'\"\s;]|\\[nr]|$)",
+        ("access", "api", "auth", "key", "credential", "creds", "passwd", "password", "secret", "token"),
+        entropy=3.5,
+        require_digit=True,
+    ),
+)
+
+
+def shannon_entropy(value: str) -> float:
+    """Shannon entropy in bits per character."""
+    if not value:
+        return 0.0
+    n = len(value)
+    return -sum(c / n * math.log2(c / n) for c in Counter(value).values())
+
+
+def _scoped(pattern: str) -> str:
+    """Turn a leading global flag group, e.g. (?i)x, into a scoped one: (?i:x)."""
+    m = _LEADING_FLAGS.match(pattern)
+    if m is None:
+        return pattern
+    return f"(?{m.group(1)}:{pattern[m.end():]})"
+
+
+def load_gitleaks_rules(workspace_path: Path) -> list[SecretRule]:
+    """Rules from the workspace's gitleaks config. Rules Python's re can't compile are skipped."""
+    for name in GITLEAKS_CONFIG_NAMES:
+        path = workspace_path / name
+        if path.is_file():
+            break
+    else:
+        return []
+    try:
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
+        logger.warning("gitleaks_config_unreadable", path=str(path), error=str(e))
+        return []
+
+    rules: list[SecretRule] = []
+    for raw in data.get("rules") or []:
+        if not isinstance(raw, dict) or not raw.get("regex"):
+            continue
+        rule = SecretRule(
+            id=str(raw.get("id") or "custom"),
+            regex=str(raw["regex"]),
+            keywords=tuple(str(k).lower() for k in raw.get("keywords") or ()),
+            entropy=float(raw.get("entropy") or 0.0),
+            group=int(raw.get("secretGroup") or 0),
+        )
+        try:
+            re.compile(_scoped(rule.regex))
+        except re.error as e:
+            logger.warning("gitleaks_rule_skipped", rule_id=rule.id, error=str(e))
+            continue
+        rules.append(rule)
+    return rules
+
+
+@dataclass
+class _CompiledRule:
+    rule: SecretRule
+    pattern: re.Pattern[str]
+
+
+class SecretRuleSet:
+    """Rules compiled into a keyword pre-filter and one combined regex."""
+
+    def __init__(self, rules: Iterable[SecretRule] = DEFAULT_RULES):
+        self.rules = [_CompiledRule(r, re.compile(_scoped(r.regex))) for r in rules]
+        # Rules without keywords can't be pre-filtered; they force a regex pass
+        self._always = [c for c in self.rules if not c.rule.keywords]
+        keywords = sorted({k for c in self.rules for k in c.rule.keywords}, key=len, reverse=True)
+        self._keywords = (
+            re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+            if keywords
+            else None
+        )
+        self._combined = re.compile(
+            "|".join(f"(?:{_scoped(c.rule.regex)})" for c in self.rules)
+        )
+
+    def has_keyword(self, text: str) -> bool:
+        """True when any rule could match text (the external scanner pre-filter)."""
+        if self._always:
+            return True
+        return self._keywords is not None and self._keywords.search(text) is not None
+
+    def scan_line(self, line: str) -> list[tuple[str, str]]:
+        """(rule_id, secret) pairs on one line; overlapping spans keep the earlier rule."""
+        if not self._combined.search(line):
+            return []
+        lowered = line.lower()
+        hits: list[tuple[str, str]] = []
+        taken: list[tuple[int, int]] = []
+        for c in self.rules:
+            if c.rule.keywords and not any(k in lowered for k in c.rule.keywords):
+                continue
+            for m in c.pattern.finditer(line):
+                group = c.rule.group if c.rule.group <= (c.pattern.groups or 0) else 0
+                secret = m.group(group) or ""
+                start, end = m.span(group)
+                if not secret or any(start < e and s < end for s, e in taken):
+                    continue
+                if c.rule.entropy and shannon_entropy(secret) < c.rule.entropy:
+                    continue
+                if c.rule.require_digit and not any(ch.isdigit() for ch in secret):
+                    continue
+                taken.append((start, end))
+                hits.append((c.rule.id, secret))
+        return hits
+
+
+@dataclass
+class DiffHunk:
+    """Added lines of one hunk: (new-file line number, text)."""
+
+    path: str
+    lines: list[tuple[int, str]] = field(default_factory=list)
+
+
+def iter_added_hunks(stream: Iterable[bytes]) -> Iterator[DiffHunk]:
+    """Parse `git diff` output line by line, yielding each hunk's added lines.
+
+    Hunk bodies are delimited by the line counts in their @@ header, so an
+    added line that itself starts with "++ " is content, not a file header.
+    """
+    path: str | None = None
+    hunk: DiffHunk | None = None
+    line_no = 0
+    old_left = new_left = 0  # Body lines still expected in the current hunk
+    for raw in stream:
+        if old_left > 0 or new_left > 0:
+            if raw.startswith(b"+"):
+                if hunk is not None:
+                    text = raw[1:].rstrip(b"\r\n").decode("utf-8", errors="replace")
+                    hunk.lines.append((line_no, text))
+                line_no += 1
+                new_left -= 1
+                continue
+            if raw.startswith(b"-"):
+                old_left -= 1
+                continue
+            if raw.startswith(b" ") or raw in (b"\n", b"\r\n"):
+                line_no += 1
+                old_left -= 1
+                new_left -= 1
+                continue
+            if raw.startswith(b"\\"):  # "\ No newline at end of file"
+                continue
+            old_left = new_left = 0  # Body shorter than its header claimed
+        elif raw.startswith(b"\\"):
+            continue
+        if hunk is not None and hunk.lines:
+            yield hunk
+        hunk = None
+        if raw.startswith(b"+++ "):
+            target = raw[4:].rstrip(b"\r\n").decode("utf-8", errors="replace")
+            if target.startswith('"'):
+                target = target.strip('"')
+            path = target[2:] if target.startswith("b/") else None  # /dev/null: deletion
+        elif raw.startswith(b"@@"):
+            m = _HUNK_HEADER.match(raw)
+            if m:
+                old_left = int(m.group(1)) if m.group(1) is not None else 1
+                line_no = int(m.group(2))
+                new_left = int(m.group(3)) if m.group(3) is not None else 1
+                hunk = DiffHunk(path) if path is not None else None
+        elif raw.startswith(b"diff --git"):
+            path = None
+    if hunk is not None and hunk.lines:
+        yield hunk
+
+
+@dataclass
+class NativeScan:
+    """Findings of a native scan. keyword_hit=False means no rule keyword was added."""
+
+    findings: list[dict]
+    keyword_hit: bool
+    diff_bytes: int = 0
+
+
+def scan_hunks(
+    hunks: Iterable[DiffHunk],
+    rules: SecretRuleSet,
+    exclude: pathspec.PathSpec | None = None,
+) -> NativeScan:
+    """Scan added lines hunk by hunk; hunks without a keyword are skipped outright."""
+    findings: list[dict] = []
+    keyword_hit = False
+    for hunk in hunks:
+        if exclude is not None and exclude.match_file(hunk.path):
+            continue
+        if not rules.has_keyword("\n".join(text for _, text in hunk.lines)):
+            continue
+        keyword_hit = True
+        for line_no, text in hunk.lines:
+            for rule_id, secret in rules.scan_line(text):
+                findings.append(
+                    {
+                        "path": hunk.path,
+                        "start_line": line_no,
+                        "end_line": line_no,
+                        "rule_id": rule_id,
+                        "secret": secret[:SECRET_DISPLAY_CHARS] + "..."
+                        if len(secret) > SECRET_DISPLAY_CHARS
+                        else secret,
+                    }
+                )
+    return NativeScan(findings=findings, keyword_hit=keyword_hit)
+
+
+def diff_adds_lines(
+    workspace_path: Path,
+    base_sha: str,
+    head_sha: str,
+    exclude: pathspec.PathSpec | None = None,
+    timeout: float = 20,
+) -> bool:
+    """True when `git diff base..head` adds text lines to a path outside exclude.
+
+    Read from `git diff --numstat`, independently of the hunk parser. Errors
+    count as True so callers fall back to scanning.
+    """
+    cmd = ["git", "diff", "--numstat", "-z", "--no-renames", f"{base_sha}..{head_sha}", "--", "."]
+    try:
+        proc = subprocess.Popen(
+            cmd, cwd=workspace_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        stdout, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        return True
+    except OSError:
+        return True
+    if proc.returncode != 0:
+        return True
+    for record in stdout.split(b"\0"):
+        added, _, rest = record.partition(b"\t")
+        path = rest.partition(b"\t")[2].decode("utf-8", errors="replace")
+        if not path or added in (b"0", b"-"):  # "-": binary, no text lines for a scanner
+            continue
+        if exclude is None or not exclude.match_file(path):
+            return True
+    return False
+
+
+def scan_git_diff(
+    workspace_path: Path,
+    base_sha: str,
+    head_sha: str,
+    rules: SecretRuleSet,
+    exclude: pathspec.PathSpec | None = None,
+    tee: IO[bytes] | None = None,
+    timeout: float = 20,
+) -> NativeScan:
+    """Stream `git diff base..head` through scan_hunks without buffering the diff.
+
+    tee, when given, receives the raw diff bytes (for handing to an external
+    scanner afterwards). Raises subprocess.CalledProcessError when git fails
+    and subprocess.TimeoutExpired when the diff outlives timeout.
+    """
+    cmd = ["git", "diff", "--no-color", "--no-ext-diff", f"{base_sha}..{head_sha}", "--", "."]
+    proc = subprocess.Popen(
+        cmd, cwd=workspace_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    size = 0
+
+    def _lines() -> Iterator[bytes]:
+        nonlocal size
+        assert proc.stdout is not None
+        for raw in proc.stdout:
+            size += len(raw)
+            if tee is not None:
+                tee.write(raw)
+            yield raw
+
+    try:
+        result = scan_hunks(iter_added_hunks(_lines()), rules, exclude)
+        stderr = proc.stderr.read() if proc.stderr is not None else b""
+        proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+    result.diff_bytes = size
+    return result
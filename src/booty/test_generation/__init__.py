@@ -6,16 +6,18 @@ This module provides:
 
 Public API:
 - detect_conventions: Analyze repository to infer test conventions
+- is_test_file: Whether a repo path looks like a test file
 - validate_test_imports: Validate generated test imports against project dependencies
 - DetectedConventions: Model for detected test conventions
 """
 
-from booty.test_generation.detector import detect_conventions
+from booty.test_generation.detector import detect_conventions, is_test_file
 from booty.test_generation.models import DetectedConventions
 from booty.test_generation.validator import validate_test_imports
 
 __all__ = [
     "detect_conventions",
+    "is_test_file",
     "validate_test_imports",
     "DetectedConventions",
 ]
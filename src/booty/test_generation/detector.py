@@ -6,13 +6,11 @@ This module analyzes repository structure to detect test conventions:
 - Test directory and file naming patterns (from existing tests)
 """
 
-import configparser
-import json
-import tomllib
 from collections import Counter
 from pathlib import Path
 
 from booty.logging import get_logger
+from booty.repo_index import EXCLUDED_DIRS, RepoIndex, parse_manifest  # noqa: F401 (re-export)
 from booty.test_generation.models import DetectedConventions
 
 logger = get_logger()
@@ -46,11 +44,17 @@ TEST_PATTERNS = {
 # Common test directory names
 TEST_DIRECTORIES = ["tests", "test", "__tests__", "spec"]
 
-# Directories to exclude from scanning
-EXCLUDED_DIRS = {".git", "node_modules", "venv", "__pycache__", "dist", "build", "target"}
 
+def is_test_file(path: str) -> bool:
+    """Return True if path appears to be a test file."""
+    return (
+        path.startswith(("tests/", "test_"))
+        or "/tests/" in path
+        or "/test_" in path
+        or path.endswith("_test.py")
+    )
 
-def detect_conventions(workspace_path: Path) -> DetectedConventions:
+def detect_conventions(workspace_path: Path, index: RepoIndex | None = None) -> DetectedConventions:
     """Detect test conventions from repository structure.
 
     Analyzes repository to infer:
@@ -60,22 +64,25 @@ def detect_conventions(workspace_path: Path) -> DetectedConventions:
 
     Args:
         workspace_path: Path to repository root
+        index: Prebuilt index of workspace_path; built here when omitted
 
     Returns:
         DetectedConventions with inferred settings
     """
     logger.info("detecting_test_conventions", workspace=str(workspace_path))
+    if index is None:
+        index = RepoIndex.build(workspace_path)
 
     # Step 1: Language detection
-    language = detect_primary_language(workspace_path)
+    language = detect_primary_language(workspace_path, index)
     logger.debug("detected_language", language=language)
 
     # Step 2: Config file inspection
-    config, config_path = find_and_parse_config(workspace_path, language)
+    config, config_path = find_and_parse_config(workspace_path, language, index)
     logger.debug("found_config", config_file=str(config_path) if config_path else None)
 
     # Step 3: Test file discovery
-    test_files = find_existing_tests(workspace_path, language)
+    test_files = find_existing_tests(workspace_path, language, index)
     logger.debug("found_tests", count=len(test_files))
 
     # Step 4: Framework detection
@@ -110,28 +117,24 @@ def detect_conventions(workspace_path: Path) -> DetectedConventions:
     )
 
 
-def detect_primary_language(workspace_path: Path) -> str:
+def detect_primary_language(workspace_path: Path, index: RepoIndex | None = None) -> str:
     """Detect primary language by counting source file extensions.
 
-    Excludes .git, node_modules, venv, __pycache__, dist, build, target.
+    Excludes .git, node_modules, venv, __pycache__, dist, build, target and
+    gitignored files.
 
     Args:
         workspace_path: Path to repository root
+        index: Prebuilt index of workspace_path; built here when omitted
 
     Returns:
         Most common language, or "unknown" if no recognized files
     """
-    extension_counts = Counter()
-
-    for file_path in workspace_path.rglob("*"):
-        # Skip excluded directories
-        if any(part in EXCLUDED_DIRS for part in file_path.parts):
-            continue
-
-        if file_path.is_file():
-            ext = file_path.suffix.lower()
-            if ext in LANGUAGE_EXTENSIONS:
-                extension_counts[ext] += 1
+    if index is None:
+        index = RepoIndex.build(workspace_path)
+    extension_counts = Counter(
+        {ext: n for ext, n in index.extension_counts.items() if ext in LANGUAGE_EXTENSIONS}
+    )
 
     if not extension_counts:
         logger.warning("no_recognized_files", workspace=str(workspace_path))
@@ -142,7 +145,9 @@ def detect_primary_language(workspace_path: Path) -> str:
     return LANGUAGE_EXTENSIONS[most_common_ext]
 
 
-def find_and_parse_config(workspace_path: Path, language: str) -> tuple[dict | None, Path | None]:
+def find_and_parse_config(
+    workspace_path: Path, language: str, index: RepoIndex | None = None
+) -> tuple[dict | None, Path | None]:
     """Find and parse language-specific config file.
 
     Checks:
@@ -155,6 +160,7 @@ def find_and_parse_config(workspace_path: Path, language: str) -> tuple[dict | N
     Args:
         workspace_path: Path to repository root
         language: Detected language
+        index: Prebuilt index of workspace_path; manifests are parsed once per index
 
     Returns:
         Tuple of (parsed_config, config_path) or (None, None) if not found
@@ -170,6 +176,11 @@ def find_and_parse_config(workspace_path: Path, language: str) -> tuple[dict | N
 
     for config_name in config_paths.get(language, []):
         config_path = workspace_path / config_name
+        if index is not None:
+            parsed = index.manifest(config_name)
+            if parsed is not None:
+                return parsed, config_path
+            continue
         if config_path.exists():
             try:
                 parsed = parse_config_file(config_path)
@@ -190,21 +201,12 @@ def parse_config_file(config_path: Path) -> dict:
     Returns:
         Parsed configuration as dict
     """
-    if config_path.suffix == ".toml":
-        with open(config_path, "rb") as f:
-            return tomllib.load(f)
-    elif config_path.suffix == ".json":
-        with open(config_path) as f:
-            return json.load(f)
-    elif config_path.suffix in {".cfg", ".ini"}:
-        parser = configparser.ConfigParser()
-        parser.read(config_path)
-        return {section: dict(parser[section]) for section in parser.sections()}
-    else:
-        return {}
+    return parse_manifest(config_path)
 
 
-def find_existing_tests(workspace_path: Path, language: str) -> list[Path]:
+def find_existing_tests(
+    workspace_path: Path, language: str, index: RepoIndex | None = None
+) -> list[Path]:
     """Find existing test files in the repository.
 
     Searches for test files matching language-specific patterns.
@@ -213,20 +215,19 @@ def find_existing_tests(workspace_path: Path, language: str) -> list[Path]:
     Args:
         workspace_path: Path to repository root
         language: Detected language
+        index: Prebuilt index of workspace_path; built here when omitted
 
     Returns:
         List of test file paths (max 10)
     """
+    if index is None:
+        index = RepoIndex.build(workspace_path)
     test_files = []
     patterns = TEST_PATTERNS.get(language, [])
 
     for pattern in patterns:
-        for test_file in workspace_path.rglob(pattern):
-            # Skip excluded directories
-            if any(part in EXCLUDED_DIRS for part in test_file.parts):
-                continue
-
-            test_files.append(test_file)
+        for rel in index.named(pattern):
+            test_files.append(workspace_path / rel)
             if len(test_files) >= 10:
                 break
 
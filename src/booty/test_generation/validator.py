@@ -13,6 +13,7 @@ import sys
 from pathlib import Path
 
 from booty.logging import get_logger
+from booty.repo_index import RepoIndex
 
 logger = get_logger()
 
@@ -33,6 +34,7 @@ def validate_test_imports(
     test_file_content: str,
     language: str,
     workspace_path: Path,
+    index: RepoIndex | None = None,
 ) -> tuple[bool, list[str]]:
     """Validate that test imports don't hallucinate non-existent packages.
 
@@ -45,6 +47,7 @@ def validate_test_imports(
         test_file_content: Content of generated test file
         language: Programming language ("python", "javascript", etc.)
         workspace_path: Path to repository root
+        index: Prebuilt index of workspace_path; built here when omitted
 
     Returns:
         Tuple of (is_valid, error_messages)
@@ -52,7 +55,7 @@ def validate_test_imports(
         - (False, [errors]) if invalid imports found
     """
     if language == "python":
-        errors = validate_python_imports(test_file_content, workspace_path)
+        errors = validate_python_imports(test_file_content, workspace_path, index)
         return (len(errors) == 0, errors)
     else:
         # Non-Python languages: validation deferred per RESEARCH.md open question #5
@@ -60,7 +63,9 @@ def validate_test_imports(
         return (True, [])
 
 
-def validate_python_imports(test_content: str, workspace_path: Path) -> list[str]:
+def validate_python_imports(
+    test_content: str, workspace_path: Path, index: RepoIndex | None = None
+) -> list[str]:
     """Validate Python imports against project structure and installed packages.
 
     Checks:
@@ -71,6 +76,7 @@ def validate_python_imports(test_content: str, workspace_path: Path) -> list[str
     Args:
         test_content: Python test file content
         workspace_path: Path to repository root
+        index: Prebuilt index of workspace_path; built here when omitted
 
     Returns:
         List of error messages (empty if all imports valid)
@@ -88,9 +94,11 @@ def validate_python_imports(test_content: str, workspace_path: Path) -> list[str
     logger.debug("extracted_imports", imports=imports)
 
     # Get validation sources
+    if index is None:
+        index = RepoIndex.build(workspace_path)
     stdlib_modules = get_stdlib_modules()
-    project_modules = get_project_modules(workspace_path)
-    dependencies = get_project_dependencies(workspace_path)
+    project_modules = get_project_modules(workspace_path, index)
+    dependencies = get_project_dependencies(workspace_path, index)
 
     logger.debug(
         "validation_sources",
@@ -163,7 +171,10 @@ def get_stdlib_modules() -> set[str]:
     return set(sys.stdlib_module_names)
 
 
-def get_project_modules(workspace_path: Path) -> set[str]:
+_NON_MODULE_DIRS = {"tests", "test", "docs", "dist", "build"}
+
+
+def get_project_modules(workspace_path: Path, index: RepoIndex | None = None) -> set[str]:
     """Get set of project's own module names from src/ and root directories.
 
     Scans for:
@@ -172,12 +183,27 @@ def get_project_modules(workspace_path: Path) -> set[str]:
 
     Args:
         workspace_path: Path to repository root
+        index: Prebuilt index of workspace_path; directories are listed when omitted
 
     Returns:
         Set of project module names
     """
     modules = set()
 
+    if index is not None:
+        for rel in index.files:
+            parts = rel.split("/")
+            for depth in (0, 1) if parts[0] == "src" else (0,):
+                item = parts[depth:]
+                name = item[0]
+                if name.startswith(".") or name in _NON_MODULE_DIRS:
+                    continue
+                if len(item) == 1 and name.endswith(".py"):
+                    modules.add(name[:-3])
+                elif len(item) == 2 and item[1] == "__init__.py":
+                    modules.add(name)
+        return modules
+
     # Check common source directories
     for src_dir in ["src", "."]:
         src_path = workspace_path / src_dir
@@ -186,7 +212,7 @@ def get_project_modules(workspace_path: Path) -> set[str]:
 
         for item in src_path.iterdir():
             # Skip hidden files and common non-module directories
-            if item.name.startswith(".") or item.name in {"tests", "test", "docs", "dist", "build"}:
+            if item.name.startswith(".") or item.name in _NON_MODULE_DIRS:
                 continue
 
             if item.is_dir() and (item / "__init__.py").exists():
@@ -197,7 +223,7 @@ def get_project_modules(workspace_path: Path) -> set[str]:
     return modules
 
 
-def get_project_dependencies(workspace_path: Path) -> set[str]:
+def get_project_dependencies(workspace_path: Path, index: RepoIndex | None = None) -> set[str]:
     """Extract declared dependencies from pyproject.toml or requirements.txt.
 
     Parses:
@@ -206,6 +232,7 @@ def get_project_dependencies(workspace_path: Path) -> set[str]:
 
     Args:
         workspace_path: Path to repository root
+        index: Prebuilt index of workspace_path; pyproject.toml is parsed once per index
 
     Returns:
         Set of package names (normalized)
@@ -214,12 +241,17 @@ def get_project_dependencies(workspace_path: Path) -> set[str]:
 
     # Try pyproject.toml
     pyproject = workspace_path / "pyproject.toml"
-    if pyproject.exists():
+    if index is not None:
+        deps.update(pyproject_deps_from(index.manifest("pyproject.toml") or {}))
+    elif pyproject.exists():
         deps.update(parse_pyproject_deps(pyproject))
 
     # Try requirements.txt
     requirements = workspace_path / "requirements.txt"
-    if requirements.exists():
+    has_requirements = (
+        "requirements.txt" in index if index is not None else requirements.exists()
+    )
+    if has_requirements:
         deps.update(parse_requirements_txt(requirements))
 
     # Normalize all dependency names and add known aliases
@@ -245,29 +277,38 @@ def parse_pyproject_deps(pyproject_path: Path) -> set[str]:
     """
     import tomllib
 
-    deps = set()
-
     try:
         with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
-
-        # Extract from [project.dependencies]
-        if "project" in data and "dependencies" in data["project"]:
-            for dep in data["project"]["dependencies"]:
-                pkg_name = extract_package_name(dep)
-                if pkg_name:
-                    deps.add(pkg_name)
-
-        # Extract from [project.optional-dependencies]
-        if "project" in data and "optional-dependencies" in data["project"]:
-            for group in data["project"]["optional-dependencies"].values():
-                for dep in group:
-                    pkg_name = extract_package_name(dep)
-                    if pkg_name:
-                        deps.add(pkg_name)
-
+            return pyproject_deps_from(tomllib.load(f))
     except Exception as e:
         logger.warning("pyproject_parse_error", error=str(e))
+        return set()
+
+
+def pyproject_deps_from(data: dict) -> set[str]:
+    """Package names from parsed pyproject.toml [project] dependency tables.
+
+    Args:
+        data: Parsed pyproject.toml
+
+    Returns:
+        Set of package names
+    """
+    deps = set()
+    project = data.get("project") or {}
+
+    # Extract from [project.dependencies]
+    for dep in project.get("dependencies") or []:
+        pkg_name = extract_package_name(dep)
+        if pkg_name:
+            deps.add(pkg_name)
+
+    # Extract from [project.optional-dependencies]
+    for group in (project.get("optional-dependencies") or {}).values():
+        for dep in group:
+            pkg_name = extract_package_name(dep)
+            if pkg_name:
+                deps.add(pkg_name)
 
     return deps
 
@@ -0,0 +1,32 @@
+"""Dependency manifests — what decides a workspace's installed environment.
+
+Shared by the warm test runner (restart when dependencies change) and the
+Verifier's import-resolution cache (keyed per environment).
+"""
+
+import hashlib
+from pathlib import Path
+
+DEPENDENCY_FILES = (
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "Pipfile",
+    "Pipfile.lock",
+    "poetry.lock",
+    "uv.lock",
+    "pdm.lock",
+)
+
+
+def dependency_fingerprint(workspace_path: Path) -> str:
+    """Hash of dependency manifests and lockfiles at the workspace root."""
+    h = hashlib.sha256()
+    names = list(DEPENDENCY_FILES) + sorted(
+        p.name for p in workspace_path.glob("requirements*.txt")
+    )
+    for name in names:
+        path = workspace_path / name
+        if path.is_file():
+            h.update(name.encode() + b"\0" + path.read_bytes() + b"\0")
+    return h.hexdigest()
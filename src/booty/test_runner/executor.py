@@ -1,13 +1,38 @@
-"""Test execution with subprocess and timeout handling."""
+"""Test execution with subprocess and timeout handling.
+
+Output is streamed rather than buffered whole: each stream is spooled to a
+temp file past SPOOL_THRESHOLD bytes, a ring buffer keeps the tail, and a
+FailureLineExtractor collects error lines and pytest progress as lines arrive.
+"""
 
 import asyncio
+import os
+import shutil
+import signal
+import tempfile
+import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
 from booty.logging import get_logger
+from booty.test_runner.parser import (
+    FailureLineExtractor,
+    StructuredResults,
+    parse_junit_xml,
+    with_junit_xml,
+)
 
 logger = get_logger()
 
+SPOOL_THRESHOLD = 4 * 1024 * 1024  # Per stream; beyond this output lives on disk
+MAX_RESULT_BYTES = 1024 * 1024  # Per stream returned in TestResult (head + tail)
+TAIL_LINES = 2000
+TAIL_LINE_MAX_CHARS = 1000
+PROGRESS_INTERVAL_SECONDS = 10.0
+_READ_CHUNK = 64 * 1024
+
 
 @dataclass
 class TestResult:
@@ -17,12 +42,150 @@ class TestResult:
     stdout: str
     stderr: str
     timed_out: bool = False
+    output_truncated: bool = False  # stdout/stderr hold head + tail only
+    error_summary: str = ""  # Streamed failure summary; set when output was truncated
+    structured: StructuredResults | None = None  # JUnit XML results when requested + available
+
+
+class _StreamCapture:
+    """Capture one output stream with bounded memory."""
+
+    def __init__(self, extractor: FailureLineExtractor):
+        self._spool = tempfile.SpooledTemporaryFile(
+            max_size=SPOOL_THRESHOLD, prefix="booty-test-output-"
+        )
+        self._tail: deque[str] = deque(maxlen=TAIL_LINES)
+        self._partial = b""
+        self._extractor = extractor
+        self.size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self._spool.write(chunk)
+        self.size += len(chunk)
+        *complete, self._partial = (self._partial + chunk).split(b"\n")
+        for raw in complete:
+            self._add_line(raw)
+
+    def finish(self) -> None:
+        if self._partial:
+            self._add_line(self._partial)
+            self._partial = b""
+
+    def _add_line(self, raw: bytes) -> None:
+        line = raw.decode("utf-8", errors="replace")
+        self._extractor.feed(line)
+        self._tail.append(line[:TAIL_LINE_MAX_CHARS])
+
+    def text(self) -> tuple[str, bool]:
+        """Return (output, truncated). Full output when within MAX_RESULT_BYTES."""
+        self._spool.seek(0)
+        if self.size <= MAX_RESULT_BYTES:
+            return self._spool.read().decode("utf-8", errors="replace"), False
+        head = self._spool.read(MAX_RESULT_BYTES // 2).decode("utf-8", errors="replace")
+        tail = "\n".join(self._tail)[-(MAX_RESULT_BYTES // 2) :]
+        omitted = self.size - MAX_RESULT_BYTES
+        return f"{head}\n\n...[{omitted} bytes omitted]...\n\n{tail}", True
+
+    def close(self) -> None:
+        self._spool.close()
+
+
+def _build_result(
+    out: _StreamCapture,
+    err: _StreamCapture,
+    extractor: FailureLineExtractor,
+    exit_code: int,
+    timed_out: bool,
+    timeout: int,
+    xml_path: Path | None,
+) -> TestResult:
+    """Assemble a TestResult from finished captures (shared with the warm runner)."""
+    stdout, out_truncated = out.text()
+    stderr, err_truncated = err.text()
+    truncated = out_truncated or err_truncated
+
+    logger.info(
+        "test_execution_complete",
+        exit_code=exit_code,
+        stdout_len=out.size,
+        stderr_len=err.size,
+        timed_out=timed_out,
+        tests_run=extractor.tests_run,
+        failures=extractor.failures,
+    )
+
+    if timed_out:
+        timeout_msg = f"Test execution exceeded timeout of {timeout} seconds"
+        stderr = f"{stderr}\n{timeout_msg}" if stderr else timeout_msg
+
+    return TestResult(
+        exit_code=-1 if timed_out else exit_code,
+        stdout=stdout,
+        stderr=stderr,
+        timed_out=timed_out,
+        output_truncated=truncated,
+        error_summary=extractor.summary() if truncated else "",
+        structured=parse_junit_xml(xml_path) if xml_path is not None else None,
+    )
+
+
+def result_from_files(
+    stdout_path: Path,
+    stderr_path: Path,
+    exit_code: int,
+    timed_out: bool = False,
+    timeout: int = 0,
+    xml_path: Path | None = None,
+) -> TestResult:
+    """Build a TestResult from output files with the same bounds as execute_tests."""
+    extractor = FailureLineExtractor()
+    out = _StreamCapture(extractor)
+    err = _StreamCapture(extractor)
+    try:
+        for capture, path in ((out, stdout_path), (err, stderr_path)):
+            if path.exists():
+                with path.open("rb") as f:
+                    for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+                        capture.feed(chunk)
+            capture.finish()
+        return _build_result(out, err, extractor, exit_code, timed_out, timeout, xml_path)
+    finally:
+        out.close()
+        err.close()
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    capture: _StreamCapture,
+    report: Callable[[], None],
+) -> None:
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        capture.feed(chunk)
+        report()
+    capture.finish()
+
+
+def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    """Kill the shell and everything it spawned (test runners fork workers)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
 
 
 async def execute_tests(
     command: str,
     timeout: int,
     workspace_path: Path,
+    env: dict[str, str] | None = None,
+    on_progress: Callable[[int, int], None] | None = None,
+    structured: bool = False,
 ) -> TestResult:
     """Execute test command with timeout.
 
@@ -30,54 +193,92 @@ async def execute_tests(
         command: Shell command to execute
         timeout: Timeout in seconds
         workspace_path: Working directory for command execution
+        env: Extra environment variables, merged over the current environment
+        on_progress: Called with (tests_run, failures) at most every
+            PROGRESS_INTERVAL_SECONDS while pytest progress changes
+        structured: Inject a JUnit XML report into known test commands (pytest)
+            and parse it into TestResult.structured
 
     Returns:
-        TestResult with exit code and output
+        TestResult with exit code and output. On timeout the output captured
+        so far is kept and the timeout message is appended to stderr.
 
     Note:
-        Never raises - captures all failures in TestResult
+        Never raises - captures all failures in TestResult. Cancellation kills
+        the process group and propagates.
     """
+    report_dir: str | None = None
+    xml_path: Path | None = None
+    if structured:
+        report_dir = tempfile.mkdtemp(prefix="booty-junit-")
+        xml_path = Path(report_dir) / "results.xml"
+        command = with_junit_xml(command, xml_path) or command
+
     logger.info("executing_tests", command=command, timeout=timeout)
 
+    extractor = FailureLineExtractor()
+    out = _StreamCapture(extractor)
+    err = _StreamCapture(extractor)
+    last_report = {"at": time.monotonic(), "counts": (0, 0)}
+
+    def report() -> None:
+        if on_progress is None:
+            return
+        now = time.monotonic()
+        counts = (extractor.tests_run, extractor.failures)
+        if now - last_report["at"] < PROGRESS_INTERVAL_SECONDS or counts == last_report["counts"]:
+            return
+        last_report["at"], last_report["counts"] = now, counts
+        try:
+            on_progress(*counts)
+        except Exception as e:
+            logger.warning("test_progress_callback_failed", error=str(e))
+
     try:
         proc = await asyncio.create_subprocess_shell(
             command,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             cwd=str(workspace_path),
+            env={**os.environ, **env} if env else None,
+            start_new_session=True,
+        )
+        pumps = asyncio.gather(
+            _pump(proc.stdout, out, report),
+            _pump(proc.stderr, err, report),
         )
 
         try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                proc.communicate(),
-                timeout=timeout,
-            )
-
-            logger.info(
-                "test_execution_complete",
-                exit_code=proc.returncode,
-                stdout_len=len(stdout_bytes),
-                stderr_len=len(stderr_bytes),
-            )
-
-            return TestResult(
-                exit_code=proc.returncode if proc.returncode is not None else -1,
-                stdout=stdout_bytes.decode("utf-8", errors="replace"),
-                stderr=stderr_bytes.decode("utf-8", errors="replace"),
-                timed_out=False,
-            )
-
+            await asyncio.wait_for(asyncio.shield(pumps), timeout=timeout)
+            await proc.wait()
+            timed_out = False
         except asyncio.TimeoutError:
             logger.warning("test_timeout_killing_process", timeout=timeout)
-            proc.kill()
+            _kill_process_group(proc)
             await proc.wait()  # Prevent zombie
+            try:
+                await asyncio.wait_for(pumps, timeout=5)
+            except asyncio.TimeoutError:
+                pass  # Orphaned grandchild still holds a pipe; keep what we have
+            out.finish()
+            err.finish()
+            timed_out = True
+        except asyncio.CancelledError:
+            # Caller gave up (e.g. a failed sibling Verifier phase); don't leak the suite
+            _kill_process_group(proc)
+            pumps.add_done_callback(lambda f: f.cancelled() or f.exception())
+            pumps.cancel()
+            raise
 
-            return TestResult(
-                exit_code=-1,
-                stdout="",
-                stderr=f"Test execution exceeded timeout of {timeout} seconds",
-                timed_out=True,
-            )
+        return _build_result(
+            out,
+            err,
+            extractor,
+            -1 if proc.returncode is None else proc.returncode,
+            timed_out,
+            timeout,
+            xml_path,
+        )
 
     except Exception as e:
         logger.error("test_execution_error", error=str(e), exc_info=True)
@@ -87,3 +288,8 @@ async def execute_tests(
             stderr=f"Test execution failed: {str(e)}",
             timed_out=False,
         )
+    finally:
+        out.close()
+        err.close()
+        if report_dir is not None:
+            shutil.rmtree(report_dir, ignore_errors=True)
@@ -0,0 +1,244 @@
+"""Test impact selection — map source files to the tests that cover them.
+
+Built once per base commit from a pytest-cov run with per-test contexts
+(--cov-context=test) and cached under state_dir/test_impact/. Refinement
+attempts then run only the test files affected by changed files; anything the
+map cannot vouch for (non-Python files, conftest.py, uncovered modules) falls
+back to the full suite.
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import sqlite3
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+from booty.logging import get_logger
+from booty.planner.store import get_planner_state_dir
+from booty.test_runner.executor import execute_tests
+from booty.test_runner.parser import is_pytest_command, pytest_index
+
+logger = get_logger()
+
+# pytest options whose value is a separate token (value may look like a path)
+_PYTEST_VALUE_OPTIONS = frozenset({
+    "-c",
+    "-k",
+    "-m",
+    "-o",
+    "-p",
+    "--rootdir",
+    "--confcutdir",
+    "--basetemp",
+    "--ignore",
+    "--deselect",
+    "--junitxml",
+})
+
+
+@dataclass
+class ImpactMap:
+    """Source file -> covering test files, for one base commit and test command."""
+
+    base_sha: str
+    file_to_tests: dict[str, list[str]] = field(default_factory=dict)
+
+
+def supports_impact_selection(test_command: str) -> bool:
+    """True when test_command is a single pytest invocation we can extend with args."""
+    return is_pytest_command(test_command)
+
+
+def _is_test_path(path: str) -> bool:
+    name = PurePosixPath(path).name
+    return name.startswith("test_") or name.endswith("_test.py")
+
+
+def _impact_cache_path(base_sha: str, test_command: str, state_dir: Path | None = None) -> Path:
+    """Return path: state_dir/test_impact/{base_sha}-{command_hash}.json."""
+    sd = state_dir or get_planner_state_dir()
+    cmd_hash = hashlib.sha256(test_command.encode()).hexdigest()[:12]
+    return sd / "test_impact" / f"{base_sha}-{cmd_hash}.json"
+
+
+def load_impact_map(
+    base_sha: str, test_command: str, state_dir: Path | None = None
+) -> ImpactMap | None:
+    """Load cached map for base_sha + test_command. None if missing or invalid."""
+    path = _impact_cache_path(base_sha, test_command, state_dir)
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text())
+        return ImpactMap(base_sha=data["base_sha"], file_to_tests=data["file_to_tests"])
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+
+
+def save_impact_map(
+    impact: ImpactMap, test_command: str, state_dir: Path | None = None
+) -> Path:
+    """Persist map atomically. Creates parent dirs."""
+    path = _impact_cache_path(impact.base_sha, test_command, state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=path.parent,
+        delete=False,
+        suffix=".tmp",
+    )
+    try:
+        json.dump(
+            {"base_sha": impact.base_sha, "file_to_tests": impact.file_to_tests},
+            fd,
+            indent=0,
+            separators=(",", ":"),
+        )
+        fd.flush()
+        os.fsync(fd.fileno())
+        fd.close()
+        os.replace(fd.name, path)
+    except Exception:
+        if os.path.exists(fd.name):
+            os.unlink(fd.name)
+        raise
+    return path
+
+
+def read_coverage_contexts(coverage_file: Path, workspace_path: Path) -> dict[str, list[str]]:
+    """Read a coverage.py SQLite data file into {source path: [test files]}.
+
+    Contexts come from pytest-cov --cov-context=test ("tests/test_x.py::test_y|run").
+    Lines covered only at import time (empty context) are ignored.
+    """
+    root = workspace_path.resolve()
+    mapping: dict[str, set[str]] = {}
+    conn = sqlite3.connect(str(coverage_file))
+    try:
+        rows = conn.execute(
+            "SELECT file.path, context.context FROM line_bits "
+            "JOIN file ON file.id = line_bits.file_id "
+            "JOIN context ON context.id = line_bits.context_id"
+        ).fetchall()
+    finally:
+        conn.close()
+    for file_path, context in rows:
+        if not context or "::" not in context:
+            continue
+        try:
+            rel = Path(file_path).resolve().relative_to(root).as_posix()
+        except ValueError:
+            continue
+        test_file = context.split("::", 1)[0]
+        mapping.setdefault(rel, set()).add(test_file)
+    return {k: sorted(v) for k, v in mapping.items()}
+
+
+async def build_impact_map(
+    test_command: str,
+    timeout: int,
+    workspace_path: Path,
+    base_sha: str,
+) -> ImpactMap | None:
+    """Run test_command under pytest-cov with per-test contexts and build the map.
+
+    Must run before Builder changes are applied (workspace at base_sha). Returns
+    None when coverage data is unavailable (e.g. pytest-cov not installed).
+    """
+    with tempfile.TemporaryDirectory(prefix="booty-impact-") as tmp:
+        coverage_file = Path(tmp) / ".coverage"
+        command = (
+            f"{test_command} -p pytest_cov --cov=. --cov-context=test "
+            "--cov-report= -q -p no:cacheprovider"
+        )
+        result = await execute_tests(
+            command,
+            timeout,
+            workspace_path,
+            env={"COVERAGE_FILE": str(coverage_file)},
+        )
+        if not coverage_file.exists():
+            logger.info(
+                "test_impact_map_unavailable",
+                exit_code=result.exit_code,
+                timed_out=result.timed_out,
+            )
+            return None
+        try:
+            file_to_tests = read_coverage_contexts(coverage_file, workspace_path)
+        except sqlite3.Error as e:
+            logger.warning("test_impact_coverage_read_failed", error=str(e))
+            return None
+    logger.info("test_impact_map_built", base_sha=base_sha[:7], files=len(file_to_tests))
+    return ImpactMap(base_sha=base_sha, file_to_tests=file_to_tests)
+
+
+async def get_impact_map(
+    test_command: str,
+    timeout: int,
+    workspace_path: Path,
+    base_sha: str,
+    state_dir: Path | None = None,
+) -> ImpactMap | None:
+    """Return cached map for base_sha, building and caching it on miss."""
+    if not supports_impact_selection(test_command):
+        return None
+    cached = load_impact_map(base_sha, test_command, state_dir)
+    if cached is not None:
+        logger.info("test_impact_map_cache_hit", base_sha=base_sha[:7])
+        return cached
+    impact = await build_impact_map(test_command, timeout, workspace_path, base_sha)
+    if impact is not None and impact.file_to_tests:
+        try:
+            save_impact_map(impact, test_command, state_dir)
+        except OSError as e:
+            logger.warning("test_impact_map_save_failed", error=str(e))
+    return impact
+
+
+def select_tests(impact: ImpactMap, changed_paths: set[str]) -> list[str] | None:
+    """Test files affected by changed_paths, or None when the full suite is required.
+
+    Changed test files are selected directly. Any other changed file must be a
+    Python module present in the map; conftest.py, non-Python files, and
+    modules no test covered force the full suite.
+    """
+    selected: set[str] = set()
+    for path in changed_paths:
+        p = PurePosixPath(path)
+        if p.suffix != ".py" or p.name == "conftest.py":
+            return None
+        if _is_test_path(path):
+            selected.add(path)
+            continue
+        tests = impact.file_to_tests.get(path)
+        if not tests:
+            return None
+        selected.update(tests)
+    return sorted(selected) or None
+
+
+def subset_command(test_command: str, targets: list[str], workspace_path: Path) -> str:
+    """Rewrite a pytest command to run only targets (test files or node IDs).
+
+    Positional path arguments (e.g. `tests/`) are dropped so the selection is
+    not widened back to the whole suite; options are kept.
+    """
+    tokens = shlex.split(test_command)
+    idx = pytest_index(tokens)
+    kept = tokens[: idx + 1]
+    prev = ""
+    for tok in tokens[idx + 1 :]:
+        is_path_arg = (
+            not tok.startswith("-")
+            and prev not in _PYTEST_VALUE_OPTIONS
+            and (workspace_path / tok.split("::", 1)[0]).exists()
+        )
+        if not is_path_arg:
+            kept.append(tok)
+        prev = tok
+    existing = [t for t in targets if (workspace_path / t.split("::", 1)[0]).exists()]
+    return shlex.join(kept + existing)
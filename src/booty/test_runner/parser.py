@@ -1,83 +1,119 @@
 """Parse test output to extract relevant error context."""
 
-from pathlib import Path
+import re
+import shlex
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
 
 
-def extract_error_summary(stderr: str, stdout: str, max_lines: int = 100) -> str:
-    """Extract concise error summary from test output.
-
-    Prioritizes:
-    1. Assertion errors with context
-    2. Traceback information
-    3. Test failure summaries
+# pytest -q progress line: "tests/test_x.py ..F.s   [ 40%]" (file prefix optional)
+_PROGRESS_RE = re.compile(r"^(?:\S+\s+)?([.FEsxX]+)\s+\[\s*\d+%\]$")
+# pytest -v result line: "tests/test_x.py::test_y PASSED   [ 40%]"
+_VERBOSE_RE = re.compile(r"::\S+\s+(PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)\b")
 
-    Removes:
-    - Verbose logging
-    - Repeated stack frames
-    - Test discovery output
 
-    Args:
-        stderr: Test stderr output
-        stdout: Test stdout output
-        max_lines: Maximum lines to include
+class FailureLineExtractor:
+    """Incremental form of extract_error_summary that also counts pytest progress.
 
-    Returns:
-        Filtered error summary suitable for LLM context
+    Lines are fed one at a time as output streams in; memory is bounded by
+    max_lines kept error lines.
     """
-    lines = []
 
-    # Combine stderr and stdout
-    combined = stderr + "\n" + stdout
+    def __init__(self, max_lines: int = 100):
+        self.max_lines = max_lines
+        self.lines: list[str] = []
+        self.dropped = 0
+        self.tests_run = 0
+        self.failures = 0
+        self._in_traceback = False
+
+    def feed(self, line: str) -> None:
+        """Consume one output line (without trailing newline)."""
+        self._count_progress(line)
+        if self._is_error_line(line):
+            if len(self.lines) < self.max_lines:
+                self.lines.append(line)
+            else:
+                self.dropped += 1
 
-    # Split into lines
-    output_lines = combined.split("\n")
+    def summary(self) -> str:
+        """Kept error lines, with a truncation note when max_lines was exceeded."""
+        lines = list(self.lines)
+        if self.dropped:
+            lines.append(f"\n... (truncated {self.dropped} lines)")
+        return "\n".join(lines)
+
+    def _count_progress(self, line: str) -> None:
+        stripped = line.strip()
+        m = _VERBOSE_RE.search(stripped)
+        if m:
+            self.tests_run += 1
+            if m.group(1) in ("FAILED", "ERROR"):
+                self.failures += 1
+            return
+        m = _PROGRESS_RE.match(stripped)
+        if m:
+            marks = m.group(1)
+            self.tests_run += len(marks)
+            self.failures += marks.count("F") + marks.count("E")
 
-    # Simple heuristic: keep lines that look like errors
-    in_traceback = False
-    for line in output_lines:
+    def _is_error_line(self, line: str) -> bool:
         stripped = line.strip()
 
         # Start of traceback
         if stripped.startswith("Traceback (most recent call last):"):
-            in_traceback = True
-            lines.append(line)
-            continue
+            self._in_traceback = True
+            return True
 
         # Traceback frame
-        if in_traceback and (
+        if self._in_traceback and (
             stripped.startswith('File "') or stripped.startswith("  ")
         ):
-            lines.append(line)
-            continue
+            return True
 
         # Error line (ends traceback)
-        if in_traceback and stripped and not stripped.startswith(" "):
-            lines.append(line)
-            in_traceback = False
-            continue
+        if self._in_traceback and stripped and not stripped.startswith(" "):
+            self._in_traceback = False
+            return True
 
         # Assertion errors
         if "AssertionError" in line or "assert" in line.lower():
-            lines.append(line)
-            continue
+            return True
 
         # Test failure summaries (pytest format)
         if stripped.startswith("FAILED ") or stripped.startswith("ERROR "):
-            lines.append(line)
-            continue
+            return True
 
         # Summary lines
-        if " failed" in line.lower() or " error" in line.lower():
-            lines.append(line)
-            continue
+        return " failed" in line.lower() or " error" in line.lower()
 
-    # Limit to max_lines
-    if len(lines) > max_lines:
-        lines = lines[:max_lines] + [
-            f"\n... (truncated {len(lines) - max_lines} lines)"
-        ]
 
-    return "\n".join(lines)
+def extract_error_summary(stderr: str, stdout: str, max_lines: int = 100) -> str:
+    """Extract concise error summary from test output.
+
+    Prioritizes:
+    1. Assertion errors with context
+    2. Traceback information
+    3. Test failure summaries
+
+    Removes:
+    - Verbose logging
+    - Repeated stack frames
+    - Test discovery output
+
+    Args:
+        stderr: Test stderr output
+        stdout: Test stdout output
+        max_lines: Maximum lines to include
+
+    Returns:
+        Filtered error summary suitable for LLM context
+    """
+    extractor = FailureLineExtractor(max_lines)
+    for line in (stderr + "\n" + stdout).split("\n"):
+        extractor.feed(line)
+    return extractor.summary()
 
 
 def extract_files_from_output(
@@ -120,3 +156,162 @@ def extract_files_from_output(
                 continue
 
     return involved_files
+
+
+# --- Structured results (JUnit XML) ---------------------------------------
+
+# Traceback location in pytest long repr: "src/app.py:12: AssertionError"
+_LOCATION_RE = re.compile(r"^(\S+\.py):(\d+): ", re.MULTILINE)
+
+
+@dataclass
+class TestCaseResult:
+    """One test case from a structured report."""
+
+    nodeid: str  # tests/test_x.py::TestA::test_b
+    outcome: str  # passed, failed, error, skipped
+    duration: float = 0.0
+    message: str = ""
+    details: str = ""  # Failure text (traceback / long repr)
+    locations: list[tuple[str, int]] = field(default_factory=list)  # (path, line)
+
+
+@dataclass
+class StructuredResults:
+    """Parsed structured test report."""
+
+    cases: list[TestCaseResult] = field(default_factory=list)
+
+    @property
+    def failures(self) -> list[TestCaseResult]:
+        return [c for c in self.cases if c.outcome in ("failed", "error")]
+
+    def durations(self) -> dict[str, float]:
+        """nodeid → seconds."""
+        return {c.nodeid: c.duration for c in self.cases}
+
+
+def pytest_index(tokens: list[str]) -> int | None:
+    """Index of the pytest executable (or `-m pytest`) token, else None."""
+    for i, tok in enumerate(tokens):
+        if PurePosixPath(tok).name in ("pytest", "py.test"):
+            return i
+        if tok == "pytest" and i > 0 and tokens[i - 1] == "-m":
+            return i
+    return None
+
+
+def is_pytest_command(test_command: str) -> bool:
+    """True when test_command is a single pytest invocation we can extend with args."""
+    if any(op in test_command for op in ("&&", "||", ";", "|")):
+        return False
+    try:
+        tokens = shlex.split(test_command)
+    except ValueError:
+        return False
+    return pytest_index(tokens) is not None
+
+
+def with_junit_xml(test_command: str, xml_path: Path) -> str | None:
+    """Return test_command writing a JUnit XML report to xml_path, or None if unsupported.
+
+    Only pytest commands are rewritten (--junitxml is built in). xunit1 keeps
+    the file/line attributes on each testcase. Commands that already write a
+    report are left alone.
+    """
+    if not is_pytest_command(test_command) or "--junitxml" in test_command:
+        return None
+    return f"{test_command} --junitxml={shlex.quote(str(xml_path))} -o junit_family=xunit1"
+
+
+def _nodeid(case: ET.Element) -> str:
+    """Rebuild the pytest nodeid from file/classname/name (xunit1 attributes)."""
+    name = case.get("name", "")
+    classname = case.get("classname", "")
+    file_attr = case.get("file")
+    parts = classname.split(".") if classname else []
+    if file_attr:
+        module_depth = len(PurePosixPath(file_attr).with_suffix("").parts)
+        return "::".join([file_attr, *parts[module_depth:], name])
+    return f"{classname}::{name}" if classname else name
+
+
+def parse_junit_xml(xml_path: Path) -> StructuredResults | None:
+    """Parse a JUnit XML report incrementally (iterparse; elements freed as read).
+
+    Returns None when the report is missing or unreadable.
+    """
+    if not xml_path.exists():
+        return None
+    results = StructuredResults()
+    try:
+        for _, elem in ET.iterparse(str(xml_path), events=("end",)):
+            if elem.tag != "testcase":
+                continue
+            outcome, message, details = "passed", "", ""
+            for child in elem:
+                if child.tag in ("failure", "error", "skipped"):
+                    outcome = {"failure": "failed"}.get(child.tag, child.tag)
+                    message = child.get("message", "")
+                    details = child.text or ""
+                    break
+            try:
+                duration = float(elem.get("time") or 0.0)
+            except ValueError:
+                duration = 0.0
+            results.cases.append(
+                TestCaseResult(
+                    nodeid=_nodeid(elem),
+                    outcome=outcome,
+                    duration=duration,
+                    message=message,
+                    details=details,
+                    locations=[
+                        (m.group(1), int(m.group(2))) for m in _LOCATION_RE.finditer(details)
+                    ],
+                )
+            )
+            elem.clear()
+    except ET.ParseError:
+        return None
+    return results
+
+
+def format_structured_failures(results: StructuredResults, max_lines: int = 100) -> str:
+    """Failing tests with message and source locations, for LLM context."""
+    lines: list[str] = []
+    for case in results.failures:
+        lines.append(f"{case.outcome.upper()} {case.nodeid} ({case.duration:.2f}s)")
+        # pytest marks the explanatory lines of a failure with "E   "
+        explanation = [ln for ln in case.details.splitlines() if ln.startswith("E ")][:10]
+        if explanation:
+            lines.extend(f"  {line}" for line in explanation)
+        elif case.message:
+            lines.extend(f"  {line}" for line in case.message.splitlines()[:5])
+        for path, lineno in case.locations:
+            lines.append(f"  at {path}:{lineno}")
+    if len(lines) > max_lines:
+        lines = lines[:max_lines] + [f"\n... (truncated {len(lines) - max_lines} lines)"]
+    return "\n".join(lines)
+
+
+def files_from_structured(results: StructuredResults, workspace_path: Path) -> set[str]:
+    """Workspace source files (not tests) at failure locations.
+
+    Same scope rules as extract_files_from_output.
+    """
+    involved: set[str] = set()
+    root = workspace_path.resolve()
+    for case in results.failures:
+        for path, _ in case.locations:
+            p = Path(path)
+            if p.is_absolute():
+                try:
+                    p = p.resolve().relative_to(root)
+                except ValueError:
+                    continue
+            if not (root / p).exists():
+                continue
+            if not any(part.startswith("test") for part in p.parts):
+                involved.add(str(p))
+    return involved
@@ -1,13 +1,25 @@
-"""Quality gate runner for code formatting and linting checks."""
+"""Quality gate runner for code formatting and linting checks.
+
+By default only the given changed files are checked; format and lint run
+concurrently. An optional auto-fix pass applies `ruff check --fix` and
+`ruff format` to the changed files first so fixable issues never fail the
+job. Auto-fix never touches other files, even for whole-repo checks, so every
+rewrite is reported in fixed_paths and lands in the caller's commit.
+"""
 
 import asyncio
-from dataclasses import dataclass
+import functools
+import hashlib
+import shutil
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from booty.logging import get_logger
 
 logger = get_logger()
 
+RUFF_SUFFIXES = (".py", ".pyi", ".ipynb")
+
 
 @dataclass
 class QualityCheckResult:
@@ -17,39 +29,113 @@ class QualityCheckResult:
     formatting_ok: bool
     linting_ok: bool
     errors: list[str]
+    fixed_paths: list[str] = field(default_factory=list)  # Rewritten by the auto-fix pass
+
+
+@functools.cache
+def find_ruff() -> str | None:
+    """Path of the ruff binary, located once per process. None if not installed."""
+    path = shutil.which("ruff")
+    if path:
+        logger.info("ruff_available", path=path)
+    return path
+
+
+def quality_targets(
+    workspace_path: Path, changed_paths: list[str] | None, whole_repo: bool = False
+) -> list[str]:
+    """Paths to pass to ruff: ["."] for whole-repo runs, else existing changed Python files."""
+    if whole_repo or changed_paths is None:
+        return ["."]
+    return sorted(
+        {
+            p
+            for p in changed_paths
+            if p.endswith(RUFF_SUFFIXES) and (workspace_path / p).is_file()
+        }
+    )
 
 
-async def run_quality_checks(workspace_path: Path) -> QualityCheckResult:
+async def _run_ruff(ruff: str, args: list[str], workspace_path: Path) -> tuple[int, str]:
+    """Run ruff with args in workspace_path. Returns (returncode, stdout + stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        ruff,
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(workspace_path),
+    )
+    stdout_bytes, stderr_bytes = await proc.communicate()
+    stdout_text = stdout_bytes.decode("utf-8", errors="replace")
+    stderr_text = stderr_bytes.decode("utf-8", errors="replace")
+    return proc.returncode, f"{stdout_text}\n{stderr_text}"
+
+
+def _digests(workspace_path: Path, targets: list[str]) -> dict[str, str]:
+    return {
+        t: hashlib.sha256((workspace_path / t).read_bytes()).hexdigest()
+        for t in targets
+        if (workspace_path / t).is_file()
+    }
+
+
+async def _auto_fix(ruff: str, targets: list[str], workspace_path: Path) -> list[str]:
+    """Apply lint fixes then formatting (ruff's recommended order). Returns rewritten files."""
+    before = _digests(workspace_path, targets)
+    try:
+        await _run_ruff(ruff, ["check", "--fix", "--exit-zero", *targets], workspace_path)
+        await _run_ruff(ruff, ["format", *targets], workspace_path)
+    except Exception as e:
+        logger.warning("quality_autofix_failed", error=str(e))
+        return []
+    after = _digests(workspace_path, targets)
+    fixed = sorted(t for t, digest in after.items() if before.get(t) != digest)
+    if fixed:
+        logger.info("quality_autofix_applied", files=len(fixed))
+    return fixed
+
+
+async def _check(
+    ruff: str, args: list[str], label: str, workspace_path: Path
+) -> tuple[bool, str | None]:
+    """Run one check. Returns (ok, error message or None)."""
+    logger.info(f"running_{label}_check", workspace=str(workspace_path))
+    try:
+        returncode, output = await _run_ruff(ruff, args, workspace_path)
+    except Exception as e:
+        logger.error(f"{label}_check_error", error=str(e), exc_info=True)
+        return False, f"{label.capitalize()} check execution failed: {str(e)}"
+    if returncode != 0:
+        logger.warning(f"{label}_check_failed", returncode=returncode)
+        name = "Formatting" if label == "format" else "Linting"
+        return False, f"{name} check failed:\n{output}"
+    logger.info(f"{label}_check_passed")
+    return True, None
+
+
+async def run_quality_checks(
+    workspace_path: Path,
+    changed_paths: list[str] | None = None,
+    fix: bool = False,
+    whole_repo: bool = False,
+) -> QualityCheckResult:
     """Execute ruff format and lint checks.
 
+    Args:
+        workspace_path: Repository root
+        changed_paths: Repo-relative paths to check; None checks the whole repo
+        fix: Apply `ruff check --fix` and `ruff format` to changed_paths before checking
+        whole_repo: Check the whole repository even when changed_paths is given
+
     Returns:
         QualityCheckResult with combined results from formatting and linting.
         If ruff is not installed, gracefully skips checks and returns success.
     """
-    logger.info("checking_ruff_availability")
-
-    # Check if ruff is available
-    try:
-        proc = await asyncio.create_subprocess_shell(
-            "which ruff",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout_bytes, _ = await proc.communicate()
-
-        if proc.returncode != 0:
+    ruff = find_ruff()
+    targets = quality_targets(workspace_path, changed_paths, whole_repo)
+    if ruff is None or not targets:
+        if ruff is None:
             logger.warning("ruff_not_installed_skipping_quality_checks")
-            return QualityCheckResult(
-                passed=True,
-                formatting_ok=True,
-                linting_ok=True,
-                errors=[],
-            )
-
-        logger.info("ruff_available", path=stdout_bytes.decode("utf-8").strip())
-
-    except Exception as e:
-        logger.error("ruff_availability_check_failed", error=str(e))
         return QualityCheckResult(
             passed=True,
             formatting_ok=True,
@@ -57,66 +143,16 @@ async def run_quality_checks(workspace_path: Path) -> QualityCheckResult:
             errors=[],
         )
 
-    errors = []
-    formatting_ok = True
-    linting_ok = True
-
-    # Run ruff format --check
-    logger.info("running_format_check", workspace=str(workspace_path))
-    try:
-        proc = await asyncio.create_subprocess_shell(
-            "ruff format --check .",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=str(workspace_path),
-        )
-
-        stdout_bytes, stderr_bytes = await proc.communicate()
-
-        if proc.returncode != 0:
-            formatting_ok = False
-            stdout_text = stdout_bytes.decode("utf-8", errors="replace")
-            stderr_text = stderr_bytes.decode("utf-8", errors="replace")
-            error_msg = f"Formatting check failed:\n{stdout_text}\n{stderr_text}"
-            errors.append(error_msg)
-            logger.warning("format_check_failed", returncode=proc.returncode)
-        else:
-            logger.info("format_check_passed")
-
-    except Exception as e:
-        formatting_ok = False
-        error_msg = f"Format check execution failed: {str(e)}"
-        errors.append(error_msg)
-        logger.error("format_check_error", error=str(e), exc_info=True)
-
-    # Run ruff check
-    logger.info("running_lint_check", workspace=str(workspace_path))
-    try:
-        proc = await asyncio.create_subprocess_shell(
-            "ruff check .",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=str(workspace_path),
-        )
-
-        stdout_bytes, stderr_bytes = await proc.communicate()
-
-        if proc.returncode != 0:
-            linting_ok = False
-            stdout_text = stdout_bytes.decode("utf-8", errors="replace")
-            stderr_text = stderr_bytes.decode("utf-8", errors="replace")
-            error_msg = f"Linting check failed:\n{stdout_text}\n{stderr_text}"
-            errors.append(error_msg)
-            logger.warning("lint_check_failed", returncode=proc.returncode)
-        else:
-            logger.info("lint_check_passed")
-
-    except Exception as e:
-        linting_ok = False
-        error_msg = f"Lint check execution failed: {str(e)}"
-        errors.append(error_msg)
-        logger.error("lint_check_error", error=str(e), exc_info=True)
+    fix_targets = (
+        quality_targets(workspace_path, changed_paths) if changed_paths is not None else []
+    )
+    fixed_paths = await _auto_fix(ruff, fix_targets, workspace_path) if fix and fix_targets else []
 
+    (formatting_ok, format_error), (linting_ok, lint_error) = await asyncio.gather(
+        _check(ruff, ["format", "--check", *targets], "format", workspace_path),
+        _check(ruff, ["check", *targets], "lint", workspace_path),
+    )
+    errors = [e for e in (format_error, lint_error) if e]
     passed = formatting_ok and linting_ok
 
     logger.info(
@@ -125,6 +161,8 @@ async def run_quality_checks(workspace_path: Path) -> QualityCheckResult:
         formatting_ok=formatting_ok,
         linting_ok=linting_ok,
         error_count=len(errors),
+        targets=len(targets),
+        fixed=len(fixed_paths),
     )
 
     return QualityCheckResult(
@@ -132,4 +170,5 @@ async def run_quality_checks(workspace_path: Path) -> QualityCheckResult:
         formatting_ok=formatting_ok,
         linting_ok=linting_ok,
         errors=errors,
+        fixed_paths=fixed_paths,
     )
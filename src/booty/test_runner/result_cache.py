@@ -0,0 +1,148 @@
+"""Test result store keyed by (git tree hash, test_command, install fingerprint).
+
+Verifier and main-branch verification often test the same tree. Each records
+its outcome here; a later run on an identical tree may reuse an earlier pass
+instead of re-running the suite. Stored under state_dir/test_results/.
+
+Only passes from runs that executed setup/install themselves
+(INSTALLED_SOURCES) are reusable.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import git
+
+from booty.logging import get_logger
+from booty.planner.store import get_planner_state_dir
+
+logger = get_logger()
+
+INSTALLED_SOURCES = ("verifier", "main_verify")  # Sources that ran setup/install before testing
+
+
+@dataclass
+class CachedTestResult:
+    """One recorded test run on a tree."""
+
+    tree_sha: str
+    test_command: str
+    install_fingerprint: str
+    passed: bool
+    exit_code: int
+    source: str  # verifier, main_verify
+    head_sha: str = ""
+    run_url: str = ""  # Check run (or PR) holding the original output
+    recorded_at: str = ""
+
+    def describe(self) -> str:
+        """One-line origin of this result for check output and logs."""
+        where = f" ({self.run_url})" if self.run_url else ""
+        return f"{self.source} run on {self.head_sha[:7] or self.tree_sha[:7]}{where}"
+
+
+def install_fingerprint(config: object) -> str:
+    """Hash of what shapes the test environment beyond the tree itself.
+
+    Dependency files are part of the tree hash; this covers setup/install
+    commands and the interpreter version running them.
+    """
+    parts = [
+        getattr(config, "setup_command", None) or "",
+        getattr(config, "install_command", None) or "",
+        f"{sys.version_info.major}.{sys.version_info.minor}",
+    ]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+
+
+def head_tree_sha(repo: git.Repo) -> str:
+    """Tree hash of HEAD (clean checkouts: Verifier, main verification). Empty if unavailable."""
+    sha = repo.head.commit.tree.hexsha
+    return sha if isinstance(sha, str) else ""
+
+
+def _cache_key(tree_sha: str, test_command: str, fingerprint: str) -> str:
+    raw = "\0".join((tree_sha, test_command, fingerprint))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _result_path(key: str, state_dir: Path | None = None) -> Path:
+    """Return path: state_dir/test_results/{key[:2]}/{key}.json."""
+    sd = state_dir or get_planner_state_dir()
+    return sd / "test_results" / key[:2] / f"{key}.json"
+
+
+def lookup_test_result(
+    tree_sha: str,
+    test_command: str,
+    fingerprint: str,
+    state_dir: Path | None = None,
+) -> CachedTestResult | None:
+    """Return recorded result for this tree/command/fingerprint, or None."""
+    path = _result_path(_cache_key(tree_sha, test_command, fingerprint), state_dir)
+    if not path.exists():
+        return None
+    try:
+        return CachedTestResult(**json.loads(path.read_text()))
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+def find_reusable_pass(
+    tree_sha: str,
+    test_command: str,
+    fingerprint: str,
+    state_dir: Path | None = None,
+    sources: tuple[str, ...] = INSTALLED_SOURCES,
+) -> CachedTestResult | None:
+    """Recorded passing result for this key from one of sources, or None.
+
+    Failures are never reused.
+    """
+    cached = lookup_test_result(tree_sha, test_command, fingerprint, state_dir)
+    if cached is None or not cached.passed or cached.source not in sources:
+        return None
+    return cached
+
+
+def record_test_result(
+    result: CachedTestResult,
+    state_dir: Path | None = None,
+) -> Path:
+    """Persist result atomically, replacing any earlier record for the same key."""
+    if not result.recorded_at:
+        result.recorded_at = datetime.now(timezone.utc).isoformat()
+    key = _cache_key(result.tree_sha, result.test_command, result.install_fingerprint)
+    path = _result_path(key, state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=path.parent,
+        delete=False,
+        suffix=".tmp",
+    )
+    try:
+        json.dump(asdict(result), fd, indent=0, separators=(",", ":"))
+        fd.flush()
+        os.fsync(fd.fileno())
+        fd.close()
+        os.replace(fd.name, path)
+    except Exception:
+        if os.path.exists(fd.name):
+            os.unlink(fd.name)
+        raise
+    return path
+
+
+def record_test_result_best_effort(result: CachedTestResult) -> None:
+    """record_test_result that logs instead of raising (callers are mid-job)."""
+    try:
+        record_test_result(result)
+    except Exception as e:
+        logger.warning("test_result_cache_record_failed", source=result.source, error=str(e))
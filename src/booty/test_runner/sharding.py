@@ -0,0 +1,263 @@
+"""Parallel test sharding — split a pytest suite across concurrent subprocesses.
+
+Test IDs are collected with --collect-only, grouped by file and balanced into
+shards by historical per-test durations (state_dir/test_durations/), run
+concurrently and merged back into one TestResult. Shards name test files, not
+node IDs, so each shard's `sh -c` command stays well under the kernel's
+per-argument limit. Non-pytest commands run serially (caller fallback).
+"""
+
+import asyncio
+import hashlib
+import heapq
+import json
+import os
+import re
+import shlex
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+from booty.logging import get_logger
+from booty.planner.store import get_planner_state_dir
+from booty.test_runner.executor import TestResult, execute_tests
+from booty.test_runner.impact import subset_command
+from booty.test_runner.parser import StructuredResults, is_pytest_command
+
+logger = get_logger()
+
+DEFAULT_TEST_DURATION = 1.0  # Seconds assumed for tests with no history
+MIN_TESTS_PER_SHARD = 2
+MAX_SHARD_COMMAND_BYTES = 100_000  # Linux caps one argv string (the sh -c script) at 128 KiB
+
+
+def max_shards(requested: int) -> int:
+    """Shard limit: requested count capped at the CPU count."""
+    return max(1, min(requested, os.cpu_count() or 1))
+
+
+def _durations_path(repo_key: str, state_dir: Path | None = None) -> Path:
+    """Return path: state_dir/test_durations/{repo_hash}.json."""
+    sd = state_dir or get_planner_state_dir()
+    digest = hashlib.sha256(repo_key.encode()).hexdigest()[:16]
+    return sd / "test_durations" / f"{digest}.json"
+
+
+def load_durations(repo_key: str, state_dir: Path | None = None) -> dict[str, float]:
+    """Historical nodeid → seconds for repo_key. Empty if missing or invalid."""
+    path = _durations_path(repo_key, state_dir)
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+        return {str(k): float(v) for k, v in (data.get("durations") or {}).items()}
+    except (json.JSONDecodeError, TypeError, ValueError, AttributeError):
+        return {}
+
+
+def save_durations(
+    repo_key: str, durations: dict[str, float], state_dir: Path | None = None
+) -> None:
+    """Merge durations into the stored history (latest run wins) atomically."""
+    merged = load_durations(repo_key, state_dir)
+    merged.update(durations)
+    path = _durations_path(repo_key, state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=path.parent,
+        delete=False,
+        suffix=".tmp",
+    )
+    try:
+        json.dump({"repo": repo_key, "durations": merged}, fd, indent=0, separators=(",", ":"))
+        fd.flush()
+        os.fsync(fd.fileno())
+        fd.close()
+        os.replace(fd.name, path)
+    except Exception:
+        if os.path.exists(fd.name):
+            os.unlink(fd.name)
+        raise
+
+
+def plan_shards(
+    test_ids: list[str], durations: dict[str, float], shard_count: int
+) -> list[list[str]]:
+    """Split test_ids into at most shard_count shards of similar total duration.
+
+    Longest-processing-time first: tests sorted by expected duration are each
+    assigned to the currently lightest shard. Tests without history get the
+    median known duration. Empty shards are dropped.
+    """
+    default = statistics.median(durations.values()) if durations else DEFAULT_TEST_DURATION
+    expected = {tid: durations.get(tid, default) for tid in test_ids}
+    heap = [(0.0, i) for i in range(max(1, shard_count))]
+    shards: list[list[str]] = [[] for _ in heap]
+    for tid in sorted(test_ids, key=lambda t: (-expected[t], t)):
+        total, i = heapq.heappop(heap)
+        shards[i].append(tid)
+        heapq.heappush(heap, (total + expected[tid], i))
+    return [sorted(s) for s in shards if s]
+
+
+def plan_file_shards(
+    test_ids: list[str], durations: dict[str, float], shard_count: int
+) -> list[list[str]]:
+    """Split the files of test_ids into at most shard_count shards of similar duration.
+
+    A file's expected duration is the sum of its tests' (median known duration
+    for tests without history).
+    """
+    default = statistics.median(durations.values()) if durations else DEFAULT_TEST_DURATION
+    file_durations: dict[str, float] = {}
+    for tid in test_ids:
+        path = tid.split("::", 1)[0]
+        file_durations[path] = file_durations.get(path, 0.0) + durations.get(tid, default)
+    return plan_shards(list(file_durations), file_durations, shard_count)
+
+
+def _verbosity_flag(test_command: str, target: int = -1) -> str:
+    """Flag that brings the command's -q/-v verbosity to target.
+
+    --collect-only lists one node ID per line only at verbosity -1.
+    """
+    level = 0
+    for tok in shlex.split(test_command):
+        if re.fullmatch(r"-q+", tok):
+            level -= len(tok) - 1
+        elif re.fullmatch(r"-v+", tok):
+            level += len(tok) - 1
+        elif tok == "--quiet":
+            level -= 1
+        elif tok == "--verbose":
+            level += 1
+    diff = target - level
+    if diff < 0:
+        return "-" + "q" * -diff
+    if diff > 0:
+        return "-" + "v" * diff
+    return ""
+
+
+async def collect_test_ids(
+    test_command: str, timeout: int, workspace_path: Path
+) -> list[str] | None:
+    """Collect pytest node IDs for test_command. None if collection fails."""
+    flag = _verbosity_flag(test_command)
+    result = await execute_tests(
+        f"{test_command} --collect-only {flag} -p no:cacheprovider", timeout, workspace_path
+    )
+    if result.exit_code != 0 or result.output_truncated:
+        logger.info("test_collection_failed", exit_code=result.exit_code)
+        return None
+    return [
+        line.strip()
+        for line in result.stdout.splitlines()
+        if "::" in line and not line.startswith(" ")
+    ]
+
+
+def merge_results(results: list[TestResult]) -> TestResult:
+    """Merge shard results: fails if any shard failed; outputs concatenated per shard."""
+    n = len(results)
+    exit_code = next((r.exit_code for r in results if r.exit_code != 0), 0)
+    structured = None
+    if any(r.structured is not None for r in results):
+        structured = StructuredResults(
+            cases=[c for r in results if r.structured for c in r.structured.cases]
+        )
+    return TestResult(
+        exit_code=exit_code,
+        stdout="\n".join(f"=== shard {i}/{n} ===\n{r.stdout}" for i, r in enumerate(results, 1)),
+        stderr="\n".join(
+            f"=== shard {i}/{n} ===\n{r.stderr}" for i, r in enumerate(results, 1) if r.stderr
+        ),
+        timed_out=any(r.timed_out for r in results),
+        output_truncated=any(r.output_truncated for r in results),
+        error_summary="\n".join(r.error_summary for r in results if r.error_summary),
+        structured=structured,
+    )
+
+
+async def run_sharded(
+    test_command: str,
+    timeout: int,
+    workspace_path: Path,
+    shard_count: int,
+    repo_key: str,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> TestResult | None:
+    """Run test_command split into concurrent shards and merge the results.
+
+    Returns None when sharding does not apply (not pytest, collection failed,
+    too few tests) so the caller runs the command serially. Each shard gets
+    BOOTY_TEST_SHARD / BOOTY_TEST_SHARD_COUNT in its environment.
+    """
+    if shard_count < 2 or not is_pytest_command(test_command):
+        return None
+    test_ids = await collect_test_ids(test_command, timeout, workspace_path)
+    if not test_ids:
+        return None
+    if not all((workspace_path / t.split("::", 1)[0]).exists() for t in test_ids):
+        # Node IDs relative to a different rootdir; targeted shards would run nothing
+        logger.info("test_shards_skipped", reason="nodeids_outside_workspace")
+        return None
+    shard_count = min(shard_count, len(test_ids) // MIN_TESTS_PER_SHARD)
+    if shard_count < 2:
+        return None
+
+    durations = load_durations(repo_key)
+    shards = plan_file_shards(test_ids, durations, shard_count)
+    if len(shards) < 2:
+        return None
+    base = f"{test_command} -p no:cacheprovider"
+    commands = [subset_command(base, shard, workspace_path) for shard in shards]
+    if max(len(c.encode()) for c in commands) > MAX_SHARD_COMMAND_BYTES:
+        logger.info("test_shards_skipped", reason="command_too_long")
+        return None
+    logger.info(
+        "test_shards_planned",
+        shards=len(shards),
+        tests=len(test_ids),
+        known_durations=sum(1 for t in test_ids if t in durations),
+    )
+
+    progress = [(0, 0)] * len(shards)
+
+    def shard_progress(i: int) -> Callable[[int, int], None]:
+        def report(tests_run: int, failures: int) -> None:
+            progress[i] = (tests_run, failures)
+            if on_progress is not None:
+                on_progress(sum(p[0] for p in progress), sum(p[1] for p in progress))
+
+        return report
+
+    results = await asyncio.gather(
+        *(
+            execute_tests(
+                command,
+                timeout,
+                workspace_path,
+                env={"BOOTY_TEST_SHARD": str(i), "BOOTY_TEST_SHARD_COUNT": str(len(shards))},
+                on_progress=shard_progress(i),
+                structured=True,
+            )
+            for i, command in enumerate(commands)
+        )
+    )
+    merged = merge_results(list(results))
+
+    if merged.structured is not None and merged.structured.cases:
+        try:
+            save_durations(repo_key, merged.structured.durations())
+        except OSError as e:
+            logger.warning("test_durations_save_failed", error=str(e))
+    logger.info(
+        "test_shards_complete",
+        shards=len(shards),
+        exit_codes=[r.exit_code for r in results],
+    )
+    return merged
+
@@ -0,0 +1,239 @@
+"""Warm test runner — fork pre-imported pytest workers instead of cold starts.
+
+A warm_server.py process per workspace imports pytest and the project's
+third-party dependencies once, then forks a clean child per test run. The
+server restarts when dependency files change. Any warm-runner failure returns
+None so callers fall back to execute_tests.
+"""
+
+import ast
+import asyncio
+import json
+import os
+import shlex
+import shutil
+import signal
+import sys
+import tempfile
+from pathlib import Path
+
+from booty.logging import get_logger
+from booty.test_runner.dependencies import dependency_fingerprint
+from booty.test_runner.executor import TestResult, result_from_files
+from booty.test_runner.parser import is_pytest_command, pytest_index
+
+logger = get_logger()
+
+WARM_START_TIMEOUT = 120  # Seconds to import dependencies before giving up
+MAX_PRELOAD_MODULES = 200
+_SKIP_DIRS = frozenset({
+    ".git",
+    ".venv",
+    "venv",
+    "env",
+    "node_modules",
+    "__pycache__",
+    "build",
+    "dist",
+    ".tox",
+    ".nox",
+})
+_SERVER_SCRIPT = Path(__file__).with_name("warm_server.py")
+
+
+def warm_supported(test_command: str) -> bool:
+    """True for single pytest commands on platforms with fork()."""
+    return hasattr(os, "fork") and sys.platform != "win32" and is_pytest_command(test_command)
+
+
+def _local_top_level_names(workspace_path: Path) -> set[str]:
+    names: set[str] = set()
+    for root in (workspace_path, workspace_path / "src"):
+        if not root.is_dir():
+            continue
+        for entry in root.iterdir():
+            if entry.is_dir() or entry.suffix == ".py":
+                names.add(entry.stem if entry.suffix == ".py" else entry.name)
+    return names
+
+
+def third_party_modules(workspace_path: Path) -> list[str]:
+    """Top-level modules imported by workspace code that are neither stdlib nor local.
+
+    These are safe to pre-import in the warm server; project modules are not,
+    since each refinement attempt changes them.
+    """
+    local = _local_top_level_names(workspace_path)
+    stdlib = set(sys.stdlib_module_names) | {"__future__"}
+    found: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(workspace_path):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS and not d.startswith(".")]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            try:
+                tree = ast.parse(Path(dirpath, filename).read_bytes())
+            except (SyntaxError, ValueError, OSError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    found.update(alias.name.split(".")[0] for alias in node.names)
+                elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                    found.add(node.module.split(".")[0])
+    return sorted(found - stdlib - local)[:MAX_PRELOAD_MODULES]
+
+
+def resolve_interpreter(test_command: str) -> str:
+    """Python interpreter the test command would run under."""
+    tokens = shlex.split(test_command)
+    idx = pytest_index(tokens)
+    if idx is not None and idx >= 2 and tokens[idx - 1] == "-m":
+        return shutil.which(tokens[idx - 2]) or tokens[idx - 2]
+    if idx is not None:
+        script = shutil.which(tokens[idx])
+        if script:
+            try:
+                first = Path(script).read_bytes()[:256].split(b"\n", 1)[0].decode()
+            except (OSError, UnicodeDecodeError):
+                first = ""
+            if first.startswith("#!"):
+                shebang = shlex.split(first[2:].strip())
+                if shebang and Path(shebang[0]).name == "env":
+                    interpreter = shutil.which(shebang[-1]) or shebang[-1]
+                else:
+                    interpreter = shebang[0] if shebang else ""
+                if "python" in Path(interpreter).name:
+                    return interpreter
+    return sys.executable
+
+
+class WarmTestRunner:
+    """Per-workspace warm pytest server; forks one clean child per run."""
+
+    def __init__(self, workspace_path: Path, test_command: str):
+        self.workspace_path = workspace_path
+        self.test_command = test_command
+        self._proc: asyncio.subprocess.Process | None = None
+        self._tmp: str | None = None
+        self._fingerprint = ""
+        self._runs = 0
+
+    @property
+    def _sock_path(self) -> str:
+        return os.path.join(self._tmp or "", "warm.sock")
+
+    async def start(self) -> bool:
+        """Start the server and wait for its dependency imports. False on failure."""
+        self._tmp = tempfile.mkdtemp(prefix="booty-warm-")
+        self._fingerprint = dependency_fingerprint(self.workspace_path)
+        modules = third_party_modules(self.workspace_path)
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                resolve_interpreter(self.test_command),
+                str(_SERVER_SCRIPT),
+                self._sock_path,
+                str(self.workspace_path),
+                json.dumps(modules),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=str(self.workspace_path),
+                start_new_session=True,
+            )
+            async with asyncio.timeout(WARM_START_TIMEOUT):
+                while True:
+                    line = await self._proc.stdout.readline()
+                    if not line:
+                        raise RuntimeError("warm server exited during startup")
+                    if line.strip() == b"ready":
+                        break
+        except Exception as e:
+            logger.warning("warm_runner_start_failed", error=str(e))
+            await self.close()
+            return False
+        logger.info("warm_runner_started", preloaded=len(modules))
+        return True
+
+    async def _ensure_started(self) -> bool:
+        alive = self._proc is not None and self._proc.returncode is None
+        if alive and dependency_fingerprint(self.workspace_path) == self._fingerprint:
+            return True
+        if alive:
+            logger.info("warm_runner_invalidated", reason="dependency_files_changed")
+        await self.close()
+        return await self.start()
+
+    async def run(
+        self, command: str, timeout: int, structured: bool = False
+    ) -> TestResult | None:
+        """Run a pytest command in a forked warm child. None when the warm path fails."""
+        if not warm_supported(command) or not await self._ensure_started():
+            return None
+        tokens = shlex.split(command)
+        idx = pytest_index(tokens)
+        args = tokens[idx + 1 :]
+        self._runs += 1
+        run_dir = Path(self._tmp) / f"run-{self._runs}"
+        run_dir.mkdir()
+        xml_path = None
+        if structured and "--junitxml" not in command:
+            xml_path = run_dir / "results.xml"
+            args += [f"--junitxml={xml_path}", "-o", "junit_family=xunit1"]
+        request = {
+            "args": args,
+            "stdout": str(run_dir / "stdout"),
+            "stderr": str(run_dir / "stderr"),
+            "env": {},
+            "cwd_on_path": idx > 0 and tokens[idx - 1] == "-m",
+        }
+        logger.info("executing_tests_warm", command=command, timeout=timeout)
+        try:
+            reader, writer = await asyncio.open_unix_connection(self._sock_path)
+        except OSError as e:
+            logger.warning("warm_runner_connect_failed", error=str(e))
+            await self.close()
+            return None
+        try:
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            pid = json.loads(await reader.readline())["pid"]
+            timed_out = False
+            try:
+                reply = await asyncio.wait_for(reader.readline(), timeout=timeout)
+                exit_code = int(json.loads(reply)["exit_code"])
+            except asyncio.TimeoutError:
+                timed_out = True
+                exit_code = -1
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except OSError:
+                    pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("warm_runner_run_failed", error=str(e))
+            await self.close()
+            return None
+        finally:
+            writer.close()
+        try:
+            return result_from_files(
+                Path(request["stdout"]),
+                Path(request["stderr"]),
+                exit_code,
+                timed_out=timed_out,
+                timeout=timeout,
+                xml_path=xml_path,
+            )
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+    async def close(self) -> None:
+        """Stop the server and remove its socket directory."""
+        if self._proc is not None and self._proc.returncode is None:
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+            except OSError:
+                self._proc.kill()
+            await self._proc.wait()
+        self._proc = None
+        if self._tmp is not None:
+            shutil.rmtree(self._tmp, ignore_errors=True)
+            self._tmp = None
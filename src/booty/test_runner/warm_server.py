@@ -0,0 +1,108 @@
+"""Warm pytest server — runs inside the workspace's interpreter (stdlib only).
+
+Started by booty.test_runner.warm as `python warm_server.py SOCKET WORKSPACE
+MODULES_JSON`. Pre-imports pytest and the given third-party modules once,
+prints "ready", then serves newline-delimited JSON requests on a Unix socket:
+
+    {"args": [...], "stdout": path, "stderr": path, "env": {...}, "cwd_on_path": bool}
+
+Each request forks a child (new session) that runs pytest.main(args) with
+stdout/stderr redirected to the given files. The server replies
+{"pid": child_pid} immediately and {"exit_code": n} when the child exits.
+"""
+
+import importlib
+import json
+import os
+import socket
+import sys
+import traceback
+
+
+def _preload(modules: list[str]) -> list[str]:
+    loaded = []
+    for name in ["pytest", *modules]:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except BaseException:  # noqa: BLE001 — a broken dependency must not stop the server
+            pass
+    return loaded
+
+
+def _run_child(request: dict) -> None:
+    """In the forked child: redirect output, run pytest, exit with its code."""
+    code = 70
+    try:
+        os.setsid()
+        for fd, key in ((1, "stdout"), (2, "stderr")):
+            target = os.open(request[key], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.dup2(target, fd)
+            os.close(target)
+        os.environ.update(request.get("env") or {})
+        if request.get("cwd_on_path"):
+            sys.path.insert(0, os.getcwd())  # `python -m pytest` semantics
+        import pytest
+
+        code = int(pytest.main(list(request["args"])))
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def _serve(sock_path: str) -> None:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    server.listen(1)
+    print("ready", flush=True)
+    while True:
+        conn, _ = server.accept()
+        try:
+            _handle(server, conn)
+        except (OSError, ValueError):
+            pass  # Client gave up (timeout) or sent garbage; serve the next one
+        finally:
+            conn.close()
+
+
+def _handle(server: socket.socket, conn: socket.socket) -> None:
+    stream = conn.makefile("rwb")
+    line = stream.readline()
+    if not line:
+        return
+    request = json.loads(line)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        server.close()
+        _run_child(request)
+    try:
+        stream.write(json.dumps({"pid": pid}).encode() + b"\n")
+        stream.flush()
+    finally:
+        _, status = os.waitpid(pid, 0)
+    stream.write(json.dumps({"exit_code": os.waitstatus_to_exitcode(status)}).encode() + b"\n")
+    stream.flush()
+
+
+def main() -> None:
+    sock_path, workspace, modules_json = sys.argv[1:4]
+    # Running as a script puts this package dir first on sys.path; its sibling
+    # modules (config, parser, ...) must not shadow the project's
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") != script_dir]
+    os.chdir(workspace)
+    _preload(json.loads(modules_json))
+    _serve(sock_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,26 @@
 """Import and compile validation for Verifier — detect hallucinated imports and syntax errors."""
 
+import ast
 import asyncio
+import hashlib
 import json
+import multiprocessing
+import os
 import platform
-import py_compile
 import re
 import sys
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
+from booty.logging import get_logger
+from booty.planner.store import get_planner_state_dir
+from booty.test_runner.dependencies import dependency_fingerprint
+
+logger = get_logger()
+
 
 def _workspace_python(workspace_path: Path) -> str:
     """Return Python executable to use for import validation.
@@ -24,8 +37,80 @@ def _workspace_python(workspace_path: Path) -> str:
     return sys.executable
 
 
-def compile_sweep(file_paths: list[Path | str], workspace_root: Path) -> list[dict]:
-    """Compile each .py file; return annotation dicts for syntax errors.
+COMPILE_CACHE_MAX_ENTRIES = 10_000
+PARALLEL_COMPILE_MIN_FILES = 8  # Below this a worker thread beats process-pool overhead
+MAX_COMPILE_WORKERS = 4
+
+# blob SHA → (line, message) for syntax errors, None for files that compile
+_compile_cache: OrderedDict[str, tuple[int, str] | None] = OrderedDict()
+_compile_pool: ProcessPoolExecutor | None = None
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Git blob SHA-1 of file contents (same as `git hash-object`)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _syntax_check(source: bytes, filename: str) -> tuple[int, str] | None:
+    """Compile source in memory (no .pyc written). Returns (line, message) on error."""
+    try:
+        compile(source, filename, "exec", dont_inherit=True)
+    except SyntaxError as e:
+        return e.lineno or 0, e.msg or str(e)
+    except ValueError as e:  # e.g. source contains null bytes
+        return 0, str(e)
+    return None
+
+
+def _syntax_check_many(items: list[tuple[bytes, str]]) -> list[tuple[int, str] | None]:
+    return [_syntax_check(source, filename) for source, filename in items]
+
+
+def _get_compile_pool() -> ProcessPoolExecutor:
+    global _compile_pool
+    if _compile_pool is None:
+        _compile_pool = ProcessPoolExecutor(
+            max_workers=min(MAX_COMPILE_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _compile_pool
+
+
+async def _check_sources(items: list[tuple[bytes, str]]) -> list[tuple[int, str] | None]:
+    """Syntax-check sources off the event loop; large batches go to a process pool."""
+    if len(items) < PARALLEL_COMPILE_MIN_FILES:
+        return await asyncio.to_thread(_syntax_check_many, items)
+    loop = asyncio.get_running_loop()
+    try:
+        pool = _get_compile_pool()
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(pool, _syntax_check, src, name) for src, name in items)
+            )
+        )
+    except (OSError, BrokenProcessPool):
+        global _compile_pool
+        _compile_pool = None
+        return await asyncio.to_thread(_syntax_check_many, items)
+
+
+def _read_sources(file_paths: list[Path | str], workspace_root: Path) -> list[tuple[Path, bytes]]:
+    sources = []
+    for path in file_paths:
+        p = Path(path) if not isinstance(path, Path) else path
+        p = p if p.is_absolute() else workspace_root / p
+        if not p.exists() or p.suffix != ".py":
+            continue
+        sources.append((p, p.read_bytes()))
+    return sources
+
+
+async def compile_sweep(file_paths: list[Path | str], workspace_root: Path) -> list[dict]:
+    """Syntax-check each .py file; return annotation dicts for syntax errors.
+
+    Sources are compiled in memory (no bytecode written to the workspace) in a
+    process pool, and results are memoized by git blob SHA so files unchanged
+    since an earlier sweep are not re-checked.
 
     Args:
         file_paths: Paths to Python files (may be absolute or relative to workspace)
@@ -34,125 +119,271 @@ def compile_sweep(file_paths: list[Path | str], workspace_root: Path) -> list[di
     Returns:
         List of annotation dicts: path, start_line, end_line, annotation_level, title, message
     """
+    sources = await asyncio.to_thread(_read_sources, file_paths, workspace_root)
+    shas = [git_blob_sha(data) for _, data in sources]
+    pending = {
+        sha: (data, str(p))
+        for (p, data), sha in zip(sources, shas)
+        if sha not in _compile_cache
+    }
+    if pending:
+        results = await _check_sources(list(pending.values()))
+        for sha, result in zip(pending, results):
+            _compile_cache[sha] = result
+            if len(_compile_cache) > COMPILE_CACHE_MAX_ENTRIES:
+                _compile_cache.popitem(last=False)
+
     annotations: list[dict] = []
-    for path in file_paths:
-        p = Path(path) if not isinstance(path, Path) else path
-        p = p if p.is_absolute() else workspace_root / p
-        if not p.exists() or p.suffix != ".py":
+    for (p, _), sha in zip(sources, shas):
+        if sha in _compile_cache:
+            _compile_cache.move_to_end(sha)
+        error = _compile_cache.get(sha)
+        if error is None:
             continue
+        line, msg = error
         try:
-            py_compile.compile(str(p), doraise=True)
-        except py_compile.PyCompileError as e:
-            se = getattr(e, "exc_value", e)
-            line = getattr(se, "lineno", None) or 0
-            msg = getattr(se, "msg", None) or str(e)
-            try:
-                rel = p.relative_to(workspace_root)
-            except ValueError:
-                rel = p
-            path_str = str(rel).replace("\\", "/")
-            annotations.append({
-                "path": path_str,
-                "start_line": line,
-                "end_line": line,
-                "annotation_level": "failure",
-                "title": "Syntax error",
-                "message": msg,
-            })
+            rel = p.relative_to(workspace_root)
+        except ValueError:
+            rel = p
+        path_str = str(rel).replace("\\", "/")
+        annotations.append({
+            "path": path_str,
+            "start_line": line,
+            "end_line": line,
+            "annotation_level": "failure",
+            "title": "Syntax error",
+            "message": msg,
+        })
     return annotations
 
 
+def environment_fingerprint(
+    workspace_path: Path,
+    python_exe: str,
+    repo: str = "",
+    install_command: str | None = None,
+) -> str:
+    """Hash of what decides third-party import resolution.
+
+    Covers the repo, its install_command, root dependency files and the
+    interpreter. A workspace .venv is identified by its pyvenv.cfg (base
+    interpreter and version) rather than its path, which differs per
+    verification workspace.
+    """
+    h = hashlib.sha256(dependency_fingerprint(workspace_path).encode())
+    h.update(f"\0{repo}\0{install_command or ''}\0".encode())
+    cfg = Path(python_exe).parent.parent / "pyvenv.cfg"
+    if python_exe != sys.executable and cfg.is_file():
+        h.update(cfg.read_bytes())
+    else:
+        h.update(f"{python_exe}\0{sys.version}".encode())
+    return h.hexdigest()[:32]
+
+
+def _resolution_cache_path(fingerprint: str, state_dir: Path | None = None) -> Path:
+    """Return path: state_dir/import_resolution/{fingerprint}.json."""
+    sd = state_dir or get_planner_state_dir()
+    return sd / "import_resolution" / f"{fingerprint}.json"
+
+
+def load_import_resolutions(fingerprint: str, state_dir: Path | None = None) -> dict[str, bool]:
+    """Cached module name → resolvable for this environment. Empty if missing or invalid."""
+    path = _resolution_cache_path(fingerprint, state_dir)
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+        return {str(k): bool(v) for k, v in (data.get("modules") or {}).items()}
+    except (json.JSONDecodeError, AttributeError, OSError):
+        return {}
+
+
+def save_import_resolutions(
+    fingerprint: str, resolutions: dict[str, bool], state_dir: Path | None = None
+) -> None:
+    """Merge resolutions into the cached map for this environment atomically."""
+    merged = load_import_resolutions(fingerprint, state_dir)
+    merged.update(resolutions)
+    path = _resolution_cache_path(fingerprint, state_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=path.parent,
+        delete=False,
+        suffix=".tmp",
+    )
+    try:
+        json.dump({"modules": merged}, fd, indent=0, separators=(",", ":"))
+        fd.flush()
+        os.fsync(fd.fileno())
+        fd.close()
+        os.replace(fd.name, path)
+    except Exception:
+        if os.path.exists(fd.name):
+            os.unlink(fd.name)
+        raise
+
+
+def collect_imports(
+    file_paths: list[Path], workspace_path: Path
+) -> tuple[list[tuple[str, int, str]], list[dict]]:
+    """Parse files for absolute imports.
+
+    Returns:
+        (imports, errors): imports are (path, line, top-level module) in file
+        order; errors are raw error dicts (path, line, msg) for unparsable files
+    """
+    found: list[tuple[str, int, str]] = []
+    errors: list[dict] = []
+    for fp in file_paths:
+        arg = str(fp)
+        p = workspace_path / arg if not Path(arg).is_absolute() else Path(arg)
+        if not p.exists():
+            continue
+        try:
+            tree = ast.parse(p.read_bytes())  # Bytes: honours PEP 263 encoding declarations
+        except SyntaxError as e:
+            errors.append({"path": arg, "line": e.lineno or 0, "msg": str(e)})
+            continue
+        except ValueError as e:  # e.g. undecodable source or null bytes
+            errors.append({"path": arg, "line": 0, "msg": str(e)})
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    found.append((arg, node.lineno, alias.name.split(".")[0]))
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                found.append((arg, node.lineno, node.module.split(".")[0]))
+    return found, errors
+
+
+def _module_names_in(root: Path) -> set[str]:
+    """Top-level module names a sys.path entry at root provides (dirs count as namespace packages)."""
+    if not root.is_dir():
+        return set()
+    return {
+        entry.stem if entry.suffix == ".py" else entry.name
+        for entry in root.iterdir()
+        if entry.is_dir() or entry.suffix == ".py"
+    }
+
+
+_RESOLVE_SCRIPT = """import importlib.util, json, sys
+stdlib = set(getattr(sys, "stdlib_module_names", ())) | {"__future__"}
+sys.path.insert(0, sys.argv[1])
+result = {}
+for name in sys.argv[2:]:
+    if name in stdlib:
+        result[name] = True
+        continue
+    try:
+        result[name] = importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        result[name] = False
+print(json.dumps(result))
+"""
+
+
 async def validate_imports(
     file_paths: list[Path],
     workspace_path: Path,
     timeout: int = 60,
+    repo: str = "",
+    install_command: str | None = None,
 ) -> list[dict]:
-    """Validate imports resolve in workspace subprocess.
+    """Validate imports resolve in the workspace environment.
 
-    Runs Python in workspace env; parses AST, tries importlib.import_module for each
-    root module. Skipped: inside TYPE_CHECKING blocks.
+    Files are parsed in-process; every distinct top-level module is resolved
+    in one workspace-Python subprocess, against that interpreter's stdlib
+    names and then importlib.util.find_spec (modules are located, never
+    executed). Names that resolve outside the workspace are cached per
+    environment fingerprint (repo, install_command, dependency files,
+    interpreter), so repeat stdlib and third-party imports need no subprocess
+    at all. Unresolved names are never cached: a missing module may be a
+    transient install failure. Workspace-local names are always resolved
+    fresh. Relative imports are not checked.
 
     Args:
         file_paths: Paths to .py files (relative to workspace)
         workspace_path: Workspace root
         timeout: Subprocess timeout in seconds
+        repo: owner/name, part of the cache key
+        install_command: The repo's install_command, part of the cache key
 
     Returns:
-        List of annotation dicts for ModuleNotFoundError
+        List of annotation dicts for unresolvable modules
     """
     if not file_paths:
         return []
 
     paths_str = [str(p) for p in file_paths]
-    inner = f'''import ast, importlib, json, sys
-from pathlib import Path
-sys.path.insert(0, {repr(str(workspace_path))})
-workspace = Path({repr(str(workspace_path))})
-errors = []
-for arg in sys.argv[1:]:
-    p = workspace / arg if not Path(arg).is_absolute() else Path(arg)
-    if not p.exists():
-        continue
-    try:
-        tree = ast.parse(p.read_text())
-    except SyntaxError as e:
-        errors.append({{"path": arg, "line": e.lineno or 0, "msg": str(e)}})
-        continue
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                mod = alias.name.split(".")[0]
-                try:
-                    importlib.import_module(mod)
-                except ModuleNotFoundError as e:
-                    errors.append({{"path": arg, "line": node.lineno, "msg": str(e)}})
-        elif isinstance(node, ast.ImportFrom) and node.module:
-            mod = node.module.split(".")[0]
-            try:
-                importlib.import_module(mod)
-            except ModuleNotFoundError as e:
-                errors.append({{"path": arg, "line": node.lineno, "msg": str(e)}})
-print(json.dumps(errors))
-'''
+    found, errors = await asyncio.to_thread(collect_imports, file_paths, workspace_path)
 
     python_exe = _workspace_python(workspace_path)
-    proc = await asyncio.create_subprocess_exec(
-        python_exe,
-        "-c",
-        inner,
-        "--",
-        *paths_str,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        cwd=str(workspace_path),
-    )
-    try:
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-    except asyncio.TimeoutError:
-        return [{
-            "path": paths_str[0] if paths_str else "",
-            "start_line": 1,
-            "end_line": 1,
-            "annotation_level": "failure",
-            "title": "Import validation timeout",
-            "message": f"Subprocess exceeded {timeout}s",
-        }]
+    fingerprint = environment_fingerprint(workspace_path, python_exe, repo, install_command)
+    # Workspace names are never cached; root-level ones resolve via sys.path[0]
+    root_names = _module_names_in(workspace_path)
+    local = root_names | _module_names_in(workspace_path / "src")
+    cached = load_import_resolutions(fingerprint)
+    resolved = {k: True for k, v in cached.items() if v and k not in local}
+    resolved.update({name: True for name in root_names})
+    pending = sorted({mod for _, _, mod in found if mod not in resolved})
 
-    raw = stdout.decode("utf-8", errors="replace").strip()
-    if not raw:
-        return []
-    try:
-        errors = json.loads(raw)
-    except json.JSONDecodeError:
-        return [{
-            "path": paths_str[0] if paths_str else "",
-            "start_line": 1,
-            "end_line": 1,
-            "annotation_level": "failure",
-            "title": "Import validation error",
-            "message": raw[:200],
-        }]
+    if pending:
+        proc = await asyncio.create_subprocess_exec(
+            python_exe,
+            "-c",
+            _RESOLVE_SCRIPT,
+            str(workspace_path),
+            *pending,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(workspace_path),
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return [{
+                "path": paths_str[0] if paths_str else "",
+                "start_line": 1,
+                "end_line": 1,
+                "annotation_level": "failure",
+                "title": "Import validation timeout",
+                "message": f"Subprocess exceeded {timeout}s",
+            }]
 
+        raw = stdout.decode("utf-8", errors="replace").strip()
+        try:
+            fresh = {str(k): bool(v) for k, v in json.loads(raw).items()}
+        except (json.JSONDecodeError, AttributeError):
+            return [{
+                "path": paths_str[0] if paths_str else "",
+                "start_line": 1,
+                "end_line": 1,
+                "annotation_level": "failure",
+                "title": "Import validation error",
+                "message": raw[:200],
+            }]
+        resolved.update(fresh)
+        third_party = {k: True for k, v in fresh.items() if v and k not in local}
+        if third_party:
+            try:
+                save_import_resolutions(fingerprint, third_party)
+            except OSError as e:
+                logger.warning("import_resolution_cache_save_failed", error=str(e))
+
+    logger.info(
+        "imports_validated",
+        modules=len({mod for _, _, mod in found}),
+        resolved_in_subprocess=len(pending),
+    )
+    errors += [
+        {"path": path, "line": line, "msg": f"No module named '{mod}'"}
+        for path, line, mod in found
+        if not resolved.get(mod, False)
+    ]
     return [
         {
             "path": e.get("path", ""),
@@ -0,0 +1,146 @@
+"""Verifier stage DAG — run independent phases concurrently, fail fast, time each phase."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from booty.logging import get_logger
+
+logger = get_logger()
+
+
+@dataclass
+class StageOutcome:
+    """Result of one stage. ok=False marks a verification failure (not an error)."""
+
+    ok: bool
+    value: Any = None
+
+
+@dataclass
+class Stage:
+    """One pipeline phase.
+
+    run receives the outcomes of finished stages. Dependencies naming stages
+    absent from the pipeline are treated as satisfied. When a fail_fast stage
+    fails, all other running stages are cancelled; other failures only stop
+    their dependents.
+    """
+
+    name: str
+    run: Callable[[dict[str, StageOutcome]], Awaitable[StageOutcome]]
+    after: tuple[str, ...] = ()
+    fail_fast: bool = True
+
+
+@dataclass
+class PipelineResult:
+    """Outcomes and wall-clock timings of a pipeline run."""
+
+    outcomes: dict[str, StageOutcome] = field(default_factory=dict)
+    statuses: dict[str, str] = field(default_factory=dict)  # ok, failed, cancelled, skipped
+    timings: dict[str, float] = field(default_factory=dict)
+    order: list[str] = field(default_factory=list)
+    total_seconds: float = 0.0
+    cancelled: bool = False  # Stopped by cancel_event
+
+    def failed(self, name: str) -> bool:
+        outcome = self.outcomes.get(name)
+        return outcome is not None and not outcome.ok
+
+    def format_timings(self) -> str:
+        """Markdown table of per-phase status and duration for check run output."""
+        lines = ["### Phase timings", "", "| Phase | Status | Time |", "| --- | --- | --- |"]
+        for name in self.order:
+            status = self.statuses.get(name, "skipped")
+            seconds = self.timings.get(name)
+            shown = f"{seconds:.1f}s" if seconds is not None else "—"
+            lines.append(f"| {name} | {status} | {shown} |")
+        lines.append(f"| **total** | | {self.total_seconds:.1f}s |")
+        return "\n".join(lines)
+
+
+async def run_stages(
+    stages: list[Stage], cancel_event: asyncio.Event | None = None
+) -> PipelineResult:
+    """Run stages as soon as their dependencies succeed.
+
+    Stops early when a fail_fast stage fails or cancel_event is set; stages
+    left running are cancelled and stages never started are reported skipped.
+    A stage raising an exception cancels the rest and the exception propagates.
+    """
+    names = {s.name for s in stages}
+    result = PipelineResult(order=[s.name for s in stages])
+    pending = {s.name: s for s in stages}
+    running: dict[asyncio.Task, Stage] = {}
+    started: dict[str, float] = {}
+    pipeline_start = time.monotonic()
+    stop = False
+
+    cancel_waiter: asyncio.Task | None = None
+    if cancel_event is not None:
+        cancel_waiter = asyncio.create_task(cancel_event.wait())
+
+    def ready(stage: Stage) -> bool:
+        deps = [d for d in stage.after if d in names]
+        return all(result.statuses.get(d) == "ok" for d in deps)
+
+    def blocked(stage: Stage) -> bool:
+        return any(result.statuses.get(d) in ("failed", "cancelled", "skipped") for d in stage.after)
+
+    try:
+        while True:
+            if not stop:
+                for name, stage in list(pending.items()):
+                    if blocked(stage):
+                        result.statuses[name] = "skipped"
+                        del pending[name]
+                    elif ready(stage):
+                        started[name] = time.monotonic()
+                        running[asyncio.create_task(stage.run(result.outcomes))] = stage
+                        del pending[name]
+            if not running:
+                break
+            waiting = set(running) | ({cancel_waiter} if cancel_waiter else set())
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if cancel_waiter is not None and cancel_waiter in done:
+                result.cancelled = True
+                stop = True
+                cancel_waiter = None
+            for task in done:
+                stage = running.pop(task, None)
+                if stage is None:
+                    continue
+                result.timings[stage.name] = time.monotonic() - started[stage.name]
+                outcome = task.result()  # Re-raises stage errors
+                result.outcomes[stage.name] = outcome
+                result.statuses[stage.name] = "ok" if outcome.ok else "failed"
+                logger.info(
+                    "verifier_stage_complete",
+                    stage=stage.name,
+                    ok=outcome.ok,
+                    seconds=round(result.timings[stage.name], 2),
+                )
+                if not outcome.ok and stage.fail_fast:
+                    stop = True
+            if stop:
+                for task, stage in running.items():
+                    task.cancel()
+                    result.timings[stage.name] = time.monotonic() - started[stage.name]
+                    result.statuses[stage.name] = "cancelled"
+                await asyncio.gather(*running, return_exceptions=True)
+                running.clear()
+                break
+    except BaseException:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        raise
+    finally:
+        if cancel_waiter is not None:
+            cancel_waiter.cancel()
+        for name in pending:
+            result.statuses.setdefault(name, "skipped")
+        result.total_seconds = time.monotonic() - pipeline_start
+    return result
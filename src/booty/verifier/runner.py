@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,6 +11,8 @@ from pydantic import ValidationError
 
 from booty.config import Settings, verifier_enabled
 from booty.github.checks import (
+    MAX_CHECK_ANNOTATIONS,
+    CheckRunReporter,
     create_check_run,
     edit_check_run,
     get_verifier_repo,
@@ -25,7 +28,16 @@ from booty.test_runner.config import (
     load_booty_config,
     load_booty_config_from_content,
 )
-from booty.test_runner.executor import execute_tests
+from booty.test_runner.executor import TestResult, execute_tests
+from booty.test_runner.parser import format_structured_failures
+from booty.test_runner.result_cache import (
+    CachedTestResult,
+    find_reusable_pass,
+    head_tree_sha,
+    install_fingerprint,
+    record_test_result_best_effort,
+)
+from booty.test_runner.sharding import max_shards, run_sharded
 
 from booty.verifier.imports import (
     compile_sweep,
@@ -34,7 +46,7 @@ from booty.verifier.imports import (
     validate_imports,
 )
 from booty.verifier.job import VerifierJob
-from booty.memory import add_record, get_memory_config
+from booty.memory import get_memory_config, submit_record
 from booty.memory.adapters import build_verifier_cluster_record
 from booty.memory.config import apply_memory_env_overrides
 from booty.reviewer.config import (
@@ -52,11 +64,13 @@ from booty.verifier.promotion_gates import (
     is_plan_originated_pr,
 )
 from booty.verifier.limits import (
+    DiffStats,
     check_diff_limits,
     format_limit_failures,
     get_pr_diff_stats,
     limits_config_from_booty_config,
 )
+from booty.verifier.pipeline import Stage, StageOutcome, run_stages
 from booty.verifier.workspace import prepare_verification_workspace
 
 if TYPE_CHECKING:
@@ -88,6 +102,13 @@ def _check_cancel(job: VerifierJob, check_run: "CheckRun | None") -> bool:
     return True
 
 
+def _with_timings(output: dict, timings: str) -> dict:
+    """Check run output with the phase timings table leading its text."""
+    text = output.get("text", "")
+    combined = f"{timings}\n\n{text}" if text else timings
+    return {**output, "text": combined[:CHECK_OUTPUT_MAX]}
+
+
 def _ingest_verifier_record(
     job: VerifierJob,
     failure_type: str,
@@ -103,7 +124,7 @@ def _ingest_verifier_record(
             mem_config = apply_memory_env_overrides(mem_config)
         if mem_config and mem_config.enabled:
             record = build_verifier_cluster_record(job, failure_type, paths, summary)
-            add_record(record, mem_config)
+            submit_record(record, mem_config)
     except Exception as e:
         logger.warning(
             "memory_ingestion_failed",
@@ -261,6 +282,7 @@ async def process_verifier_job(
     logger.info("check_created", job_id=job.job_id, status="queued")
 
     # Agent PRs: schema validation and diff limits before clone (fail fast)
+    diff_stats: DiffStats | None = None
     if job.is_agent_pr:
         repo = get_verifier_repo(
             job.owner, job.repo_name, job.installation_id, settings
@@ -292,8 +314,8 @@ async def process_verifier_job(
                 return
 
             limits = limits_config_from_booty_config(config)
-            stats = get_pr_diff_stats(repo, job.pr_number)
-            failures = check_diff_limits(stats, limits)
+            diff_stats = get_pr_diff_stats(repo, job.pr_number)
+            failures = check_diff_limits(diff_stats, limits)
             if failures:
                 output_text = format_limit_failures(failures)
                 if repo is not None:
@@ -360,7 +382,6 @@ async def process_verifier_job(
                 job.owner, job.repo_name, job.installation_id, settings
             )
 
-            # Phase 10: setup → install → import/compile sweep → tests
             if isinstance(config, BootyConfigV1):
                 if job.is_agent_pr and getattr(config, "install_command", None) in (
                     None,
@@ -386,153 +407,277 @@ async def process_verifier_job(
                     logger.info("check_failed_config", job_id=job.job_id)
                     return
 
-                if config.setup_command:
-                    setup_result = await execute_tests(
-                        config.setup_command, config.timeout, workspace_path
+            # Phase 10: stage DAG. setup → install → tests; the diff fetch, compile
+            # sweep and import validation run alongside and cancel the rest on failure.
+            # Progress and annotations go through the reporter, off the critical path.
+            has_install = bool(getattr(config, "install_command", None) or "")
+            reporter = CheckRunReporter(
+                check_run, min_interval=settings.CHECK_RUN_UPDATE_INTERVAL_SECONDS
+            )
+
+            async def run_setup(_: dict[str, StageOutcome]) -> StageOutcome:
+                setup_result = await execute_tests(
+                    config.setup_command, config.timeout, workspace_path
+                )
+                return StageOutcome(setup_result.exit_code == 0, setup_result)
+
+            async def run_install(_: dict[str, StageOutcome]) -> StageOutcome:
+                install_result = await execute_tests(
+                    config.install_command, config.timeout, workspace_path
+                )
+                return StageOutcome(install_result.exit_code == 0, install_result)
+
+            async def run_diff(_: dict[str, StageOutcome]) -> StageOutcome:
+                stats = diff_stats
+                if stats is None and repo is not None:
+                    stats = await asyncio.to_thread(get_pr_diff_stats, repo, job.pr_number)
+                py_files = (
+                    [f.filename for f in stats.files if f.filename.endswith(".py")]
+                    if stats is not None
+                    else []
+                )
+                return StageOutcome(True, py_files)
+
+            async def run_compile(done: dict[str, StageOutcome]) -> StageOutcome:
+                file_paths = [Path(f) for f in done["diff"].value]
+                compile_errors = await compile_sweep(file_paths, workspace_path)
+                reporter.add_annotations(compile_errors)
+                return StageOutcome(not compile_errors, compile_errors)
+
+            async def run_imports(done: dict[str, StageOutcome]) -> StageOutcome:
+                file_paths = [Path(f) for f in done["diff"].value]
+                # Skip import validation for test files — they use dev deps (pytest, etc.)
+                # which may not be in Booty's environment when using sys.executable
+                src_paths = [p for p in file_paths if "tests" not in p.parts and not p.name.startswith("test_")]
+                import_errors = (
+                    await validate_imports(
+                        src_paths,
+                        workspace_path,
+                        repo=f"{job.owner}/{job.repo_name}",
+                        install_command=getattr(config, "install_command", None),
+                    )
+                    if has_install and src_paths
+                    else []
+                )
+                reporter.add_annotations(import_errors)
+                return StageOutcome(not import_errors, import_errors)
+
+            async def run_tests(_: dict[str, StageOutcome]) -> StageOutcome:
+                tree_sha = ""
+                fingerprint = install_fingerprint(config)
+                reused: CachedTestResult | None = None
+                if settings.TEST_RESULT_CACHE_ENABLED:
+                    try:
+                        tree_sha = head_tree_sha(workspace.repo)
+                    except Exception as e:
+                        logger.warning("verifier_tree_sha_failed", job_id=job.job_id, error=str(e))
+                    if tree_sha and settings.TEST_RESULT_REUSE_VERIFIER:
+                        reused = find_reusable_pass(tree_sha, config.test_command, fingerprint)
+
+                if reused is not None:
+                    logger.info(
+                        "verifier_test_result_reused",
+                        job_id=job.job_id,
+                        tree_sha=tree_sha[:7],
+                        source=reused.source,
+                        run_url=reused.run_url,
                     )
-                    if setup_result.exit_code != 0:
-                        setup_annotations = parse_setup_stderr(
-                            setup_result.stderr or "", workspace_path
+                    result = TestResult(exit_code=0, stdout="", stderr="")
+                else:
+                    def publish_progress(tests_run: int, failures: int) -> None:
+                        reporter.update(
+                            {
+                                "title": "Booty Verifier",
+                                "summary": (
+                                    f"Running tests... {tests_run} run, {failures} failed so far"
+                                ),
+                            }
+                        )
+
+                    result = None
+                    if settings.TEST_SHARDS > 1:
+                        result = await run_sharded(
+                            config.test_command,
+                            config.timeout,
+                            workspace_path,
+                            max_shards(settings.TEST_SHARDS),
+                            f"{job.owner}/{job.repo_name}",
+                            on_progress=publish_progress,
                         )
-                        ann, truncated = prepare_check_annotations(
-                            setup_annotations, 50
+                    if result is None:
+                        result = await execute_tests(
+                            config.test_command,
+                            config.timeout,
+                            workspace_path,
+                            on_progress=publish_progress,
+                            structured=True,
                         )
-                        summary = setup_result.stderr[:500] or "setup_command failed."
-                        if truncated:
-                            summary += " Too many errors — showing first 50."
-                        paths = [a.get("path", "") for a in (setup_annotations or []) if a.get("path")]
-                        if repo is not None:
-                            _ingest_verifier_record(
-                                job, "compile", paths, summary, config, repo
+                    if tree_sha:
+                        run_url = getattr(check_run, "html_url", "")
+                        record_test_result_best_effort(
+                            CachedTestResult(
+                                tree_sha=tree_sha,
+                                test_command=config.test_command,
+                                install_fingerprint=fingerprint,
+                                passed=result.exit_code == 0 and not result.timed_out,
+                                exit_code=result.exit_code,
+                                source="verifier",
+                                head_sha=job.head_sha,
+                                run_url=run_url if isinstance(run_url, str) else "",
                             )
-                        edit_check_run(
-                            check_run,
-                            status="completed",
-                            conclusion="failure",
-                            output={
-                                "title": "Verifier failed — Compile errors",
-                                "summary": summary,
-                                "annotations": ann,
-                            },
                         )
-                        if _check_cancel(job, check_run):
-                            return
-                        logger.info("check_failed_setup", job_id=job.job_id)
-                        return
+                return StageOutcome(
+                    result.exit_code == 0 and not result.timed_out,
+                    (result, reused, tree_sha),
+                )
+
+            stages = [
+                Stage("diff", run_diff),
+                Stage("compile", run_compile, after=("diff",)),
+            ]
+            if isinstance(config, BootyConfigV1) and config.setup_command:
+                stages.append(Stage("setup", run_setup))
+            if isinstance(config, BootyConfigV1) and config.install_command:
+                stages.append(Stage("install", run_install, after=("setup",)))
+            stages += [
+                Stage("imports", run_imports, after=("diff", "install")),
+                # Test failures don't cancel the static checks: their findings take precedence
+                Stage("tests", run_tests, after=("setup", "install"), fail_fast=False),
+            ]
+            try:
+                pipeline = await run_stages(
+                    stages, cancel_event=getattr(job, "cancel_event", None)
+                )
+            except BaseException:
+                await reporter.close()
+                raise
+            if getattr(job, "cancel_event", None) and job.cancel_event.is_set():
+                await reporter.close()
+                _check_cancel(job, check_run)
+                return
+            timings = pipeline.format_timings()
+            logger.info(
+                "verifier_pipeline_complete",
+                job_id=job.job_id,
+                seconds=round(pipeline.total_seconds, 2),
+                statuses=pipeline.statuses,
+            )
 
+            if pipeline.failed("setup"):
+                setup_result = pipeline.outcomes["setup"].value
+                setup_annotations = parse_setup_stderr(
+                    setup_result.stderr or "", workspace_path
+                )
+                ann, truncated = prepare_check_annotations(
+                    setup_annotations, MAX_CHECK_ANNOTATIONS
+                )
+                summary = setup_result.stderr[:500] or "setup_command failed."
+                if truncated:
+                    summary += f" Too many errors — showing first {MAX_CHECK_ANNOTATIONS}."
+                paths = [a.get("path", "") for a in (setup_annotations or []) if a.get("path")]
+                if repo is not None:
+                    _ingest_verifier_record(
+                        job, "compile", paths, summary, config, repo
+                    )
+                await reporter.complete(
+                    "failure",
+                    _with_timings(
+                        {
+                            "title": "Verifier failed — Compile errors",
+                            "summary": summary,
+                            "annotations": ann,
+                        },
+                        timings,
+                    ),
+                )
                 if _check_cancel(job, check_run):
                     return
+                logger.info("check_failed_setup", job_id=job.job_id)
+                return
 
-                if config.install_command:
-                    install_result = await execute_tests(
-                        config.install_command, config.timeout, workspace_path
+            if pipeline.failed("install"):
+                install_result = pipeline.outcomes["install"].value
+                err = install_result.stderr or ""
+                out = install_result.stdout or ""
+                if not err.strip():
+                    err = out or "install_command failed"
+                else:
+                    err = err.strip()
+                summary = err[:500]
+                if repo is not None:
+                    _ingest_verifier_record(
+                        job, "install", [], summary, config, repo
                     )
-                    if install_result.exit_code != 0:
-                        err = install_result.stderr or ""
-                        out = install_result.stdout or ""
-                        if not err.strip():
-                            err = out or "install_command failed"
-                        else:
-                            err = err.strip()
-                        summary = err[:500]
-                        if repo is not None:
-                            _ingest_verifier_record(
-                                job, "install", [], summary, config, repo
-                            )
-                        edit_check_run(
-                            check_run,
-                            status="completed",
-                            conclusion="failure",
-                            output={
-                                "title": "Verifier failed — Install failed",
-                                "summary": summary,
-                            },
-                        )
-                        if _check_cancel(job, check_run):
-                            return
-                        logger.info("check_failed_install", job_id=job.job_id)
-                        return
-
+                await reporter.complete(
+                    "failure",
+                    _with_timings(
+                        {
+                            "title": "Verifier failed — Install failed",
+                            "summary": summary,
+                        },
+                        timings,
+                    ),
+                )
                 if _check_cancel(job, check_run):
                     return
+                logger.info("check_failed_install", job_id=job.job_id)
+                return
 
-            # Import/compile sweep: get changed .py files
-            py_files: list[str] = []
-            repo = get_verifier_repo(
-                job.owner, job.repo_name, job.installation_id, settings
+            compile_errors = pipeline.outcomes["compile"].value if pipeline.failed("compile") else []
+            import_errors = pipeline.outcomes["imports"].value if pipeline.failed("imports") else []
+            all_annotations = compile_errors + import_errors
+            annotations, truncated = prepare_check_annotations(
+                all_annotations, MAX_CHECK_ANNOTATIONS
             )
-            if repo is not None:
-                stats = get_pr_diff_stats(repo, job.pr_number)
-                py_files = [
-                    f.filename for f in stats.files if f.filename.endswith(".py")
-                ]
-
-            if py_files:
-                file_paths = [Path(f) for f in py_files]
-                compile_errors = compile_sweep(file_paths, workspace_path)
-                # Skip import validation for test files — they use dev deps (pytest, etc.)
-                # which may not be in Booty's environment when using sys.executable
-                src_paths = [p for p in file_paths if "tests" not in p.parts and not p.name.startswith("test_")]
-                has_install = bool(getattr(config, "install_command", None) or "")
-                import_errors = (
-                    await validate_imports(src_paths, workspace_path)
-                    if has_install and src_paths
-                    else []
-                )
-                all_annotations = compile_errors + import_errors
-                annotations, truncated = prepare_check_annotations(
-                    all_annotations, 50
+            if annotations:
+                has_compile = bool(compile_errors)
+                has_import = bool(import_errors)
+                if has_compile and has_import:
+                    title = "Verifier failed — Multiple failure classes"
+                elif has_compile:
+                    title = "Verifier failed — Compile errors"
+                else:
+                    title = "Verifier failed — Import errors"
+                n_import, n_compile = len(import_errors), len(compile_errors)
+                summary = (
+                    f"{n_import} import errors, {n_compile} compile errors. "
+                    "Tests not run."
                 )
-                if annotations:
-                    has_compile = bool(compile_errors)
-                    has_import = bool(import_errors)
-                    if has_compile and has_import:
-                        title = "Verifier failed — Multiple failure classes"
-                    elif has_compile:
-                        title = "Verifier failed — Compile errors"
-                    else:
-                        title = "Verifier failed — Import errors"
-                    n_import, n_compile = len(import_errors), len(compile_errors)
-                    summary = (
-                        f"{n_import} import errors, {n_compile} compile errors. "
-                        "Tests not run."
-                    )
-                    if truncated:
-                        summary += " Too many errors — showing first 50."
-                    if repo is not None:
-                        if has_import:
-                            import_paths = [a.get("path", "") for a in import_errors if a.get("path")]
-                            _ingest_verifier_record(
-                                job, "import", import_paths, summary, config, repo
-                            )
-                        if has_compile:
-                            compile_paths = [a.get("path", "") for a in compile_errors if a.get("path")]
-                            _ingest_verifier_record(
-                                job, "compile", compile_paths, summary, config, repo
-                            )
-                    edit_check_run(
-                        check_run,
-                        status="completed",
-                        conclusion="failure",
-                        output={
+                if truncated:
+                    summary += f" Too many errors — showing first {MAX_CHECK_ANNOTATIONS}."
+                if repo is not None:
+                    if has_import:
+                        import_paths = [a.get("path", "") for a in import_errors if a.get("path")]
+                        _ingest_verifier_record(
+                            job, "import", import_paths, summary, config, repo
+                        )
+                    if has_compile:
+                        compile_paths = [a.get("path", "") for a in compile_errors if a.get("path")]
+                        _ingest_verifier_record(
+                            job, "compile", compile_paths, summary, config, repo
+                        )
+                await reporter.complete(
+                    "failure",
+                    _with_timings(
+                        {
                             "title": title,
                             "summary": summary,
                             "annotations": annotations,
                         },
-                    )
-                    if _check_cancel(job, check_run):
-                        return
-                    logger.info("check_failed_import_compile", job_id=job.job_id)
+                        timings,
+                    ),
+                )
+                if _check_cancel(job, check_run):
                     return
-
-            if _check_cancel(job, check_run):
+                logger.info("check_failed_import_compile", job_id=job.job_id)
                 return
 
-            result = await execute_tests(
-                config.test_command, config.timeout, workspace_path
-            )
-
-            tests_passed = result.exit_code == 0 and not result.timed_out
+            if "tests" not in pipeline.outcomes:
+                await reporter.close()
+                raise RuntimeError(f"Verifier pipeline stopped early: {pipeline.statuses}")
+            py_files = pipeline.outcomes["diff"].value
+            result, reused, tree_sha = pipeline.outcomes["tests"].value
+            tests_passed = pipeline.outcomes["tests"].ok
 
             # Agent PRs: 0 tests collected counts as failure
             # pytest exit code 5 = no tests collected
@@ -561,6 +706,11 @@ async def process_verifier_job(
                 )
                 if not tests_passed and not no_tests_collected and result.stderr:
                     output_summary += f". {result.stderr[:200]}"
+                if reused is not None:
+                    output_summary += (
+                        f". Reused result for identical tree {tree_sha[:7]} "
+                        f"from {reused.describe()}"
+                    )
                 # Include full stdout+stderr in text for failure diagnosis (GitHub truncates at 65535)
                 output_text = ""
                 if not tests_passed:
@@ -568,6 +718,15 @@ async def process_verifier_job(
                         f"=== stdout ===\n{result.stdout or ''}\n"
                         f"=== stderr ===\n{result.stderr or ''}"
                     )
+                    # Lead with exact failing tests (JUnit report), else the streamed
+                    # failure lines when output was cut to head + tail
+                    failures = (
+                        format_structured_failures(result.structured)
+                        if result.structured and result.structured.failures
+                        else result.error_summary
+                    )
+                    if failures:
+                        combined = f"=== failures ===\n{failures}\n{combined}"
                     output_text = combined[:CHECK_OUTPUT_MAX]
                     if len(combined) > CHECK_OUTPUT_MAX:
                         output_text += "\n\n...[truncated]"
@@ -580,12 +739,7 @@ async def process_verifier_job(
             output_dict: dict[str, str] = {"title": "Booty Verifier", "summary": output_summary}
             if output_text:
                 output_dict["text"] = output_text
-            edit_check_run(
-                check_run,
-                status="completed",
-                conclusion=conclusion,
-                output=output_dict,
-            )
+            await reporter.complete(conclusion, _with_timings(output_dict, timings))
             if _check_cancel(job, check_run):
                 return
             logger.info(
@@ -17,7 +17,7 @@ from booty.router import route_github_event
 from booty.github.issues import create_sentry_issue_with_retry
 from booty.github.repo_config import load_booty_config_for_repo, repo_from_url
 from booty.memory.surfacing import build_related_history_for_incident, surface_pr_comment
-from booty.memory import add_record, get_memory_config
+from booty.memory import get_memory_config, submit_record
 from booty.memory.adapters import build_incident_record, build_revert_record
 from booty.memory.config import apply_memory_env_overrides
 from booty.logging import get_logger
@@ -237,7 +237,7 @@ async def github_webhook(request: Request, background_tasks: BackgroundTasks):
                         record = build_revert_record(
                             repo_full_name, sha, reverted_sha, source="push"
                         )
-                        add_record(record, mem_config)
+                        submit_record(record, mem_config)
                 except Exception as e:
                     logger.warning(
                         "memory_ingestion_failed",
@@ -448,7 +448,7 @@ async def sentry_webhook(request: Request):
             try:
                 repo = repo_from_url(settings.TARGET_REPO_URL)
                 record = build_incident_record(event, issue_number, repo)
-                add_record(record, mem_config)
+                submit_record(record, mem_config)
             except Exception as e:
                 logger.warning(
                     "memory_ingestion_failed",
@@ -2,6 +2,8 @@
 
 import os
 
+import pytest
+
 # Settings requires WEBHOOK_SECRET, TARGET_REPO_URL, GITHUB_TOKEN.
 # Set defaults so tests run in clean clones (CI, main verification) without .env.
 for key, default in (
@@ -11,3 +13,9 @@ for key, default in (
 ):
     if key not in os.environ or not str(os.environ.get(key, "")).strip():
         os.environ[key] = default
+
+
+@pytest.fixture(autouse=True)
+def _isolated_planner_state_dir(tmp_path_factory, monkeypatch):
+    """Keep state written as a side effect (LLM/reviewer metrics, caches) out of ~/.booty."""
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path_factory.mktemp("state")))
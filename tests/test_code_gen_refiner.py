@@ -0,0 +1,46 @@
+"""Tests for the Builder's test-refinement helpers."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from booty.code_gen.refiner import refine_until_tests_pass, retest_after_autofix
+from booty.llm.models import CodeGenerationPlan, FileChange
+from booty.test_runner.config import BootyConfig
+
+
+@pytest.mark.asyncio
+async def test_retest_after_autofix_reports_failures(tmp_path):
+    (tmp_path / "test_fixed.py").write_text("def test_ok():\n    pass\n")
+    config = BootyConfig(test_command=f"{sys.executable} -m pytest -p no:cacheprovider", timeout=60)
+    assert await retest_after_autofix(tmp_path, config) is None
+
+    (tmp_path / "test_fixed.py").write_text("def test_broken():\n    assert False\n")
+    error = await retest_after_autofix(tmp_path, config)
+    assert error.startswith("Tests failed after quality auto-fix.")
+    assert "test_broken" in error
+
+
+@pytest.mark.asyncio
+async def test_refine_regenerates_failing_code_then_passes(tmp_path):
+    (tmp_path / "calc.py").write_text("def value():\n    return 1\n")
+    (tmp_path / "test_calc.py").write_text(
+        "from calc import value\n\ndef test_value():\n    assert value() == 2\n"
+    )
+    config = BootyConfig(
+        test_command=f"{sys.executable} -m pytest -p no:cacheprovider", timeout=60, max_retries=2
+    )
+    fixed = FileChange(path="calc.py", content="def value():\n    return 2\n", operation="modify", explanation="x")
+    plan = CodeGenerationPlan(changes=[fixed], approach="fix", testing_notes="")
+    original = FileChange(path="calc.py", content="def value():\n    return 1\n", operation="modify", explanation="x")
+
+    with patch("booty.code_gen.refiner.call_with_routing", return_value=plan) as llm:
+        passed, changes, error = await refine_until_tests_pass(
+            tmp_path, config, [original], "make value 2", "title", "body"
+        )
+
+    assert (passed, error) == (True, None)
+    assert changes == [fixed]
+    assert "calc.py" in llm.call_args.args[5]  # failing files handed to the LLM
+    assert (tmp_path / "calc.py").read_text() == fixed.content
@@ -20,8 +20,9 @@ def test_is_test_file():
     assert _is_test_file("src/foo.py") is False
 
 
-def test_generate_code_incremental_calls_generate_single_file_per_step(tmp_path):
+def test_generate_code_incremental_calls_generate_single_file_per_step(tmp_path, monkeypatch):
     """_generate_code_incremental calls generate_single_file once per add/edit step."""
+    monkeypatch.setenv("LLM_ROUTING_ENABLED", "false")  # Strong tier only: no escalation retries
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "existing.py").write_text("print('old')\n")
 
@@ -76,6 +77,53 @@ def test_generate_code_incremental_calls_generate_single_file_per_step(tmp_path)
     assert (tmp_path / "src" / "existing.py").read_text() == "print('updated')\n"
 
 
+def test_generate_code_incremental_escalates_invalid_fast_tier_output(tmp_path, monkeypatch):
+    """On the fast tier, a file that fails validation is regenerated once on the strong tier."""
+    monkeypatch.delenv("LLM_ROUTING_ENABLED", raising=False)
+    (tmp_path / "src").mkdir()
+    plan = Plan(
+        goal="Add feature X",
+        risk_level="LOW",
+        steps=[
+            Step(id="P1", action="add", path="src/new_module.py", acceptance="New module created"),
+            Step(id="P2", action="add", path="src/other.py", acceptance="Other module created"),
+        ],
+        handoff_to_builder=HandoffToBuilder(
+            branch_name_hint="feat-x",
+            commit_message_hint="feat: add X",
+            pr_title="Add X",
+            pr_body_outline="Summary",
+        ),
+    )
+    calls: list[str] = []
+
+    def mock_generate_single_file(*, target_path, operation, **kwargs):
+        calls.append(target_path)
+        # First attempt at new_module.py is not valid Python; every other attempt is
+        first_try = calls.count(target_path) == 1
+        content = "new content" if first_try and target_path.endswith("new_module.py") else "X = 1\n"
+        return FileChange(path=target_path, content=content, operation=operation, explanation="done")
+
+    with patch("booty.code_gen.generator.generate_single_file", side_effect=mock_generate_single_file), patch(
+        "booty.llm.routing.use_model"
+    ) as mock_use:
+        mock_use.return_value.__enter__ = lambda self: None
+        mock_use.return_value.__exit__ = lambda self, *exc: False
+        result = _generate_code_incremental(
+            plan,
+            {},
+            tmp_path,
+            issue_title="Add X",
+            issue_body="Body",
+            test_conventions_text="",
+            limits_constraint="- Max 250 LOC per file",
+        )
+
+    assert calls == ["src/new_module.py", "src/new_module.py", "src/other.py"]
+    assert (tmp_path / "src" / "new_module.py").read_text() == "X = 1\n"
+    assert [c.path for c in result.changes] == ["src/new_module.py", "src/other.py"]
+
+
 def test_generate_code_incremental_classifies_test_files(tmp_path):
     """Test files go to test_files, source files to changes."""
     (tmp_path / "src").mkdir()
@@ -1,10 +1,16 @@
 """Tests for GitHub Checks API helpers."""
 
+import asyncio
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from booty.github.checks import create_reviewer_check_run, reviewer_check_success
+from booty.github.checks import (
+    CheckRunReporter,
+    create_reviewer_check_run,
+    reviewer_check_success,
+)
 
 
 def test_create_reviewer_check_run_returns_none_when_app_disabled() -> None:
@@ -113,3 +119,97 @@ def test_reviewer_check_success_exception() -> None:
 
     result = reviewer_check_success(mock_repo, "abc123")
     assert result is False
+
+
+def _annotations(n: int, path: str = "a.py") -> list[dict]:
+    return [
+        {
+            "path": path,
+            "start_line": i,
+            "end_line": i,
+            "annotation_level": "failure",
+            "title": "Syntax error",
+            "message": f"error {i}",
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reporter_coalesces_progress_updates() -> None:
+    """Bursts of update() within the interval produce one edit with the latest output."""
+    check_run = MagicMock()
+    reporter = CheckRunReporter(check_run, min_interval=0.2)
+    for i in range(20):
+        reporter.update({"title": "Booty Verifier", "summary": f"{i} run"})
+    await asyncio.sleep(0.1)
+    await reporter.complete("success", {"title": "Booty Verifier", "summary": "done"})
+
+    summaries = [c.kwargs["output"]["summary"] for c in check_run.edit.call_args_list]
+    assert summaries[0] in ("0 run", "19 run")
+    assert summaries[-1] == "done"
+    assert len(summaries) <= 3
+    assert check_run.edit.call_args.kwargs["conclusion"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_reporter_streams_annotations_in_chunks_of_50() -> None:
+    """Annotations go out 50 per request as found; complete() sends the rest, deduplicated."""
+    check_run = MagicMock()
+    reporter = CheckRunReporter(check_run, min_interval=0.0)
+    reporter.add_annotations(_annotations(120))
+    await asyncio.sleep(0.2)
+    streamed = [len(c.kwargs["output"].get("annotations", [])) for c in check_run.edit.call_args_list]
+    assert streamed == [50, 50, 20]
+
+    final = {"title": "failed", "summary": "s", "annotations": _annotations(130)}
+    await reporter.complete("failure", final)
+
+    last = check_run.edit.call_args.kwargs
+    assert last["status"] == "completed"
+    assert [a["start_line"] for a in last["output"]["annotations"]] == list(range(121, 131))
+    total = sum(len(c.kwargs["output"].get("annotations", [])) for c in check_run.edit.call_args_list)
+    assert total == 130
+
+
+@pytest.mark.asyncio
+async def test_reporter_does_not_block_on_slow_api() -> None:
+    """A slow edit runs in a worker thread; update() returns immediately."""
+    check_run = MagicMock()
+    check_run.edit.side_effect = lambda **kwargs: time.sleep(0.3)
+    reporter = CheckRunReporter(check_run, min_interval=0.0)
+
+    start = time.monotonic()
+    reporter.update({"title": "t", "summary": "1"})
+    await asyncio.sleep(0.05)
+    reporter.update({"title": "t", "summary": "2"})
+    assert time.monotonic() - start < 0.2
+    await reporter.close()
+
+
+@pytest.mark.asyncio
+async def test_reporter_logs_progress_errors_and_retries_completion(monkeypatch) -> None:
+    """Progress failures are swallowed; the completing edit is retried."""
+    monkeypatch.setattr("booty.github.checks.FINAL_EDIT_RETRY_DELAY", 0.0)
+    check_run = MagicMock()
+    check_run.edit.side_effect = [RuntimeError("502"), RuntimeError("502"), None]
+    reporter = CheckRunReporter(check_run, min_interval=0.0)
+    reporter.add_annotations(_annotations(3))
+    await asyncio.sleep(0.05)
+    await reporter.complete("failure", {"title": "t", "summary": "s"})
+
+    assert check_run.edit.call_count == 3
+    assert check_run.edit.call_args.kwargs["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_reporter_raises_when_completion_keeps_failing(monkeypatch) -> None:
+    """A check run that cannot be completed is reported, not left in_progress silently."""
+    monkeypatch.setattr("booty.github.checks.FINAL_EDIT_RETRY_DELAY", 0.0)
+    check_run = MagicMock()
+    check_run.edit.side_effect = RuntimeError("502")
+    reporter = CheckRunReporter(check_run, min_interval=0.0)
+
+    with pytest.raises(RuntimeError):
+        await reporter.complete("success", {"title": "t", "summary": "s"})
+    assert check_run.edit.call_count == 3
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-from booty.main import app, internal_endpoint_limiter
+from booty.main import app, internal_endpoint_limiter, memory_query_limiter
 
 
 @pytest.fixture
@@ -18,8 +18,10 @@ def client():
 def reset_rate_limiter():
     """Reset rate limiter before each test."""
     internal_endpoint_limiter.requests.clear()
+    memory_query_limiter.requests.clear()
     yield
     internal_endpoint_limiter.requests.clear()
+    memory_query_limiter.requests.clear()
 
 
 @pytest.fixture
@@ -167,3 +169,62 @@ def test_rate_limiter_cleanup():
     # Cleanup should remove old entries
     limiter.cleanup_old_entries()
     assert len(limiter.requests) == 0
+
+
+def test_memory_query_endpoint_requires_token_when_configured(client, mock_settings):
+    """POST /memory/query requires X-Internal-Token when INTERNAL_TEST_TOKEN is set."""
+    mock_settings.INTERNAL_TEST_TOKEN = "secret-token-123"
+    with patch("booty.main.get_settings", return_value=mock_settings):
+        response = client.post("/memory/query", json={"queries": []})
+        assert response.status_code == 401
+
+
+@pytest.mark.parametrize("environment", ["production", "development"])
+def test_memory_query_endpoint_disabled_without_token(client, mock_settings, environment):
+    """POST /memory/query is disabled in every environment without INTERNAL_TEST_TOKEN."""
+    mock_settings.SENTRY_ENVIRONMENT = environment
+    with patch("booty.main.get_settings", return_value=mock_settings):
+        response = client.post("/memory/query", json={"queries": []})
+        assert response.status_code == 403
+
+
+def test_memory_query_endpoint_rate_limited(client, mock_settings):
+    """POST /memory/query allows 10 requests per minute per IP."""
+    mock_settings.INTERNAL_TEST_TOKEN = "secret-token-123"
+    with patch("booty.main.get_settings", return_value=mock_settings):
+        for _ in range(10):
+            response = client.post("/memory/query", json={"queries": []})
+            assert response.status_code == 401
+        response = client.post("/memory/query", json={"queries": []})
+        assert response.status_code == 429
+
+
+def test_memory_query_endpoint_returns_results(client, mock_settings, monkeypatch, tmp_path):
+    """POST /memory/query returns one result per query, in order."""
+    from datetime import datetime, timezone
+
+    from booty.memory.store import append_record
+
+    monkeypatch.setenv("MEMORY_STATE_DIR", str(tmp_path))
+    append_record(
+        tmp_path / "memory.jsonl",
+        {"type": "incident", "timestamp": datetime.now(timezone.utc).isoformat(),
+         "summary": "DB timeout", "links": [], "id": "r1", "repo": "o/r", "paths": ["src/foo.py"]},
+    )
+    mock_settings.GITHUB_TOKEN = ""
+    mock_settings.INTERNAL_TEST_TOKEN = "secret-token-123"
+    headers = {"X-Internal-Token": "secret-token-123"}
+    with patch("booty.main.get_settings", return_value=mock_settings):
+        response = client.post(
+            "/memory/query",
+            json={"queries": [{"repo": "o/r", "paths": ["src/foo.py"]}, {"repo": "o/r", "pr": 3}]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [m["id"] for m in results[0]["matches"]] == ["r1"]
+        assert results[1]["error"] == "GITHUB_TOKEN required"
+
+        response = client.post("/memory/query", json={"queries": [{"paths": ["x"]}]}, headers=headers)
+        assert response.status_code == 400
+        assert "repo required" in response.json()["detail"]
@@ -0,0 +1,83 @@
+"""Tests for LLM model routing — tier selection, escalation, metrics."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from booty.llm.metrics import get_routing_24h_stats
+from booty.llm.routing import TaskFeatures, call_with_routing, select_tier
+
+
+@pytest.fixture(autouse=True)
+def _state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    monkeypatch.delenv("LLM_ROUTING_ENABLED", raising=False)
+
+
+def test_select_tier_small_low_risk_is_fast() -> None:
+    """LOW risk, small files, few steps → fast."""
+    assert select_tier(TaskFeatures(file_bytes=1000, step_count=2, risk_level="LOW")) == "fast"
+
+
+@pytest.mark.parametrize(
+    "features",
+    [
+        TaskFeatures(file_bytes=1000, step_count=2, risk_level="MEDIUM"),
+        TaskFeatures(file_bytes=10_000_000, step_count=2, risk_level="LOW"),
+        TaskFeatures(file_bytes=1000, step_count=9, risk_level="LOW"),
+        TaskFeatures(file_bytes=1000, step_count=2, risk_level="LOW", is_retry=True),
+    ],
+)
+def test_select_tier_strong_cases(features: TaskFeatures) -> None:
+    """Risky, large, many-step, or retry tasks → strong."""
+    assert select_tier(features) == "strong"
+
+
+def test_select_tier_disabled_env(monkeypatch) -> None:
+    """LLM_ROUTING_ENABLED=false → always strong."""
+    monkeypatch.setenv("LLM_ROUTING_ENABLED", "false")
+    assert select_tier(TaskFeatures(risk_level="LOW")) == "strong"
+
+
+def test_call_with_routing_escalates_on_validation_failure() -> None:
+    """Fast-tier output failing validation is regenerated on the strong tier."""
+    fn = MagicMock(side_effect=["bad", "good"])
+
+    def validate(out: str) -> None:
+        if out == "bad":
+            raise ValueError("syntax error")
+
+    with patch("booty.llm.routing.use_model") as mock_use:
+        mock_use.return_value.__enter__ = MagicMock()
+        mock_use.return_value.__exit__ = MagicMock(return_value=False)
+        out = call_with_routing("builder", TaskFeatures(risk_level="LOW"), fn, validate=validate)
+
+    assert out == "good"
+    assert fn.call_count == 2
+    stats = get_routing_24h_stats()
+    assert stats["fast"]["calls"] == 1
+    assert stats["fast"]["success_rate"] == 0.0
+    assert stats["strong"]["escalations"] == 1
+    assert stats["strong"]["ok"] == 1
+
+
+def test_call_with_routing_strong_validation_failure_returns_result() -> None:
+    """Strong tier records failed validation but returns result for caller to handle."""
+    fn = MagicMock(return_value="bad")
+
+    def validate(out: str) -> None:
+        raise ValueError("syntax error")
+
+    out = call_with_routing("builder", TaskFeatures(risk_level="HIGH"), fn, validate=validate)
+
+    assert out == "bad"
+    assert fn.call_count == 1
+    assert get_routing_24h_stats()["strong"]["ok"] == 0
+
+
+def test_call_with_routing_strong_exception_propagates() -> None:
+    """Exceptions on the strong tier propagate and are recorded as failures."""
+    fn = MagicMock(side_effect=RuntimeError("boom"))
+    with pytest.raises(RuntimeError):
+        call_with_routing("builder", TaskFeatures(is_retry=True), fn)
+    assert get_routing_24h_stats()["strong"]["calls"] == 1
@@ -214,6 +214,7 @@ async def test_process_main_verification_job_verification_passed_applies_governo
                                         "booty.release_governor.main_verify.get_settings"
                                     ) as mock_settings:
                                         mock_settings.return_value.GITHUB_TOKEN = "tok"
+                                        mock_settings.return_value.TEST_SHARDS = 0
                                         with patch(
                                             "booty.release_governor.main_verify.get_state_dir"
                                         ) as mock_state_dir:
@@ -285,6 +286,7 @@ async def test_process_main_verification_job_verification_failed_posts_hold():
                                     "booty.release_governor.main_verify.get_settings"
                                 ) as mock_settings:
                                     mock_settings.return_value.GITHUB_TOKEN = "tok"
+                                    mock_settings.return_value.TEST_SHARDS = 0
                                     with patch(
                                         "booty.release_governor.main_verify.get_state_dir"
                                     ) as mock_state_dir:
@@ -297,3 +299,77 @@ async def test_process_main_verification_job_verification_failed_posts_hold():
     mock_post_hold.assert_called_once()
     call_args = mock_post_hold.call_args[0]
     assert call_args[2].reason == "verification_failed"
+
+
+@pytest.mark.asyncio
+async def test_process_main_verification_job_reuses_cached_pass(tmp_path, monkeypatch):
+    """Identical tree with a recorded pass skips tests and applies Governor."""
+    from booty.test_runner.result_cache import (
+        CachedTestResult,
+        install_fingerprint,
+        record_test_result,
+    )
+
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    job = MainVerificationJob(
+        repo_full_name="owner/repo",
+        head_sha="abc123",
+        repo_url="https://github.com/owner/repo",
+        delivery_id="del-1",
+    )
+    mock_booty_config = MagicMock()
+    mock_booty_config.release_governor = ReleaseGovernorConfig(
+        enabled=True,
+        deploy_workflow_name="deploy.yml",
+        verification_workflow_name="",
+        max_deploys_per_hour=6,
+    )
+    mock_booty_config.setup_command = None
+    mock_booty_config.install_command = "pip install -e ."
+    mock_booty_config.test_command = "pytest"
+    record_test_result(
+        CachedTestResult(
+            tree_sha="tree1",
+            test_command="pytest",
+            install_fingerprint=install_fingerprint(mock_booty_config),
+            passed=True,
+            exit_code=0,
+            source="verifier",
+            head_sha="prhead",
+        )
+    )
+
+    mock_workspace = MagicMock()
+    mock_workspace.path = str(tmp_path)
+    mock_workspace.repo.head.commit.tree.hexsha = "tree1"
+    mock_workspace.__aenter__ = AsyncMock(return_value=mock_workspace)
+    mock_workspace.__aexit__ = AsyncMock(return_value=None)
+
+    from booty.release_governor.decision import Decision
+
+    mv = "booty.release_governor.main_verify"
+    with (
+        patch(f"{mv}.has_delivery_id", return_value=False),
+        patch(f"{mv}.load_booty_config_for_repo", return_value=mock_booty_config),
+        patch(f"{mv}.prepare_verification_workspace", return_value=mock_workspace),
+        patch(f"{mv}.load_booty_config", return_value=mock_booty_config),
+        patch(f"{mv}.execute_tests", new_callable=AsyncMock) as mock_exec,
+        patch(f"{mv}.subprocess.run") as mock_run,
+        patch(
+            f"{mv}.simulate_decision_for_cli",
+            return_value=(Decision("ALLOW", "ok", "LOW", "abc123"), []),
+        ),
+        patch(f"{mv}.apply_governor_decision") as mock_apply,
+        patch(f"{mv}.Github"),
+        patch(f"{mv}.get_settings") as mock_settings,
+        patch(f"{mv}.get_state_dir", return_value=tmp_path),
+    ):
+        mock_settings.return_value.GITHUB_TOKEN = "tok"
+        mock_settings.return_value.TEST_SHARDS = 0
+        mock_settings.return_value.TEST_RESULT_CACHE_ENABLED = True
+        mock_settings.return_value.TEST_RESULT_REUSE_MAIN_VERIFY = True
+        await process_main_verification_job(job)
+
+    mock_exec.assert_not_called()
+    mock_run.assert_not_called()
+    mock_apply.assert_called_once()
@@ -0,0 +1,109 @@
+"""Tests for batch memory queries — payload validation, concurrent PR file resolution, run_batch."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from booty.memory.batch import MAX_BATCH_QUERIES, BatchQueryError, parse_queries, run_batch
+from booty.memory.pr_map import record_pr_shas
+from booty.memory.store import append_record
+
+
+def _mock_github(files_by_pr: dict[int, list[str]], commit_prs: dict[str, int] | None = None):
+    gh_repo = MagicMock()
+
+    def get_pull(number):
+        pull = MagicMock()
+        pull.get_files.return_value = [MagicMock(filename=f) for f in files_by_pr[number]]
+        return pull
+
+    def get_commit(sha):
+        commit = MagicMock()
+        pr = (commit_prs or {}).get(sha)
+        commit.get_pulls.return_value = [MagicMock(number=pr)] if pr else []
+        return commit
+
+    gh_repo.get_pull.side_effect = get_pull
+    gh_repo.get_commit.side_effect = get_commit
+    gh = MagicMock()
+    gh.get_repo.return_value = gh_repo
+    return gh, gh_repo
+
+
+def _seed(tmp_path):
+    now = datetime.now(timezone.utc).isoformat()
+    for rid, p in [("r1", "src/foo.py"), ("r2", "src/bar.py")]:
+        append_record(
+            tmp_path / "memory.jsonl",
+            {"type": "incident", "timestamp": now, "summary": rid, "links": [], "id": rid,
+             "repo": "o/r", "paths": [p]},
+        )
+
+
+def test_parse_queries_accepts_list_or_object_and_fills_repo():
+    assert parse_queries([{"pr": 1}], default_repo="o/r") == [{"pr": 1, "repo": "o/r"}]
+    assert parse_queries({"queries": [{"repo": "a/b", "paths": ["x.py"]}]})[0]["repo"] == "a/b"
+
+
+@pytest.mark.parametrize(
+    "payload, message",
+    [
+        ({"nope": []}, "list of queries"),
+        ([1], "expected an object"),
+        ([{"repo": "o/r", "branch": "main"}], "unknown keys"),
+        ([{"pr": 1}], "repo required"),
+        ([{"repo": "o/r", "pr": "1"}], "pr must be an integer"),
+        ([{"repo": "o/r", "paths": "src/foo.py"}], "paths must be a list"),
+        ([{"repo": "o/r"}], "one of pr, sha"),
+        ([{"repo": "o/r", "pr": 1}] * (MAX_BATCH_QUERIES + 1), "At most"),
+    ],
+)
+def test_parse_queries_rejects_invalid(payload, message):
+    with pytest.raises(BatchQueryError, match=message):
+        parse_queries(payload)
+
+
+@patch("github.Github")
+def test_run_batch_fetches_each_pr_once(mock_github, tmp_path):
+    _seed(tmp_path)
+    gh, gh_repo = _mock_github({1: ["src/foo.py"], 2: ["src/bar.py"]}, commit_prs={"abc1234": 2})
+    mock_github.return_value = gh
+    record_pr_shas("o/r", 1, ["def5678"], state_dir=tmp_path)
+    queries = parse_queries([
+        {"repo": "o/r", "pr": 1},
+        {"repo": "o/r", "pr": 1},
+        {"repo": "o/r", "sha": "abc1234"},
+        {"repo": "o/r", "sha": "def5678"},
+        {"repo": "o/r", "paths": ["src/bar.py"]},
+    ])
+
+    results = run_batch(queries, None, "token", state_dir=tmp_path)
+
+    assert [r["pr"] for r in results] == [1, 1, 2, 1, None]
+    assert [[m["id"] for m in r["matches"]] for r in results] == [["r1"], ["r1"], ["r2"], ["r1"], ["r2"]]
+    assert sorted(c.args[0] for c in gh_repo.get_pull.call_args_list) == [1, 1, 2]
+    gh_repo.get_commit.assert_called_once_with("abc1234")  # def5678 comes from the PR map
+
+
+@patch("github.Github")
+def test_run_batch_reports_per_query_errors(mock_github, tmp_path):
+    _seed(tmp_path)
+    gh, _ = _mock_github({1: ["src/foo.py"]})
+    mock_github.return_value = gh
+    queries = parse_queries([{"repo": "o/r", "sha": "0000000"}, {"repo": "o/r", "pr": 1}])
+
+    results = run_batch(queries, None, "token", state_dir=tmp_path)
+
+    assert results[0] == {"repo": "o/r", "pr": None, "sha": "0000000", "error": "No PR found for sha"}
+    assert [m["id"] for m in results[1]["matches"]] == ["r1"]
+
+
+def test_run_batch_without_token_only_fails_github_queries(tmp_path):
+    _seed(tmp_path)
+    queries = parse_queries([{"repo": "o/r", "pr": 1}, {"repo": "o/r", "paths": ["src/foo.py"]}])
+
+    results = run_batch(queries, None, "", state_dir=tmp_path)
+
+    assert results[0]["error"] == "GITHUB_TOKEN required"
+    assert [m["id"] for m in results[1]["matches"]] == ["r1"]
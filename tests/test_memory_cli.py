@@ -1,4 +1,4 @@
-"""Tests for memory CLI — booty memory status, booty memory query."""
+"""Tests for memory CLI — booty memory status, booty memory query, booty memory compact."""
 
 import json
 from datetime import datetime, timedelta, timezone
@@ -198,3 +198,85 @@ def test_memory_query_json_output(mock_github, monkeypatch, tmp_path):
     assert result.exit_code == 0
     data = json.loads(result.output)
     assert isinstance(data, list)
+
+
+def test_memory_query_from_file_json(monkeypatch, tmp_path):
+    """query --from-file runs every query in the file and prints one result each."""
+    monkeypatch.setenv("MEMORY_STATE_DIR", str(tmp_path))
+    config_dir = tmp_path / "ws"
+    config_dir.mkdir()
+    (config_dir / ".booty.yml").write_text(
+        "schema_version: 1\ntest_command: pytest\nmemory:\n  enabled: true\n"
+    )
+    append_record(
+        tmp_path / "memory.jsonl",
+        {
+            "type": "incident",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "summary": "DB timeout",
+            "links": [],
+            "id": "r1",
+            "repo": "o/r",
+            "paths": ["src/foo.py"],
+        },
+    )
+    batch = tmp_path / "batch.json"
+    batch.write_text(json.dumps([{"paths": ["src/foo.py"]}, {"paths": ["docs/x.md"]}]))
+
+    runner = CliRunner()
+    with patch("booty.cli.get_settings") as mock_settings:
+        mock_settings.return_value = MagicMock(GITHUB_TOKEN="")
+        result = runner.invoke(
+            cli,
+            ["memory", "query", "--from-file", str(batch), "--repo", "o/r",
+             "--workspace", str(config_dir), "--json"],
+            obj={},
+        )
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert [[m["id"] for m in r["matches"]] for r in data] == [["r1"], []]
+
+
+def test_memory_query_from_file_rejects_pr():
+    """--from-file cannot be combined with --pr."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["memory", "query", "--from-file", "-", "--pr", "1", "--repo", "o/r"], input="[]", obj={}
+    )
+    assert result.exit_code != 0
+    assert "--from-file" in result.output
+
+
+def test_memory_compact_json_output(monkeypatch, tmp_path):
+    """compact --json reports counts and bytes reclaimed."""
+    monkeypatch.setenv("MEMORY_STATE_DIR", str(tmp_path))
+    path = tmp_path / "memory.jsonl"
+    now = datetime.now(timezone.utc)
+    append_record(path, {"id": "old", "timestamp": (now - timedelta(days=100)).isoformat(), "repo": "o/r"})
+    append_record(path, {"id": "new", "timestamp": now.isoformat(), "repo": "o/r"})
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["memory", "compact", "--retention-days", "30", "--json"], obj={})
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert (data["retention_days"], data["kept"], data["expired"]) == (30, 1, 1)
+    assert data["bytes_reclaimed"] > 0
+    assert [r["id"] for r in read_records(path)] == ["new"]
+
+
+def test_memory_compact_defaults_to_server_retention(monkeypatch, tmp_path):
+    """Without --retention-days, a workspace's shorter retention_days does not evict other repos' records."""
+    monkeypatch.setenv("MEMORY_STATE_DIR", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".booty.yml").write_text(
+        "schema_version: 1\ntest_command: pytest\nmemory:\n  retention_days: 30\n"
+    )
+    path = tmp_path / "memory.jsonl"
+    old = datetime.now(timezone.utc) - timedelta(days=100)
+    append_record(path, {"id": "other-repo", "timestamp": old.isoformat(), "repo": "o/other"})
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["memory", "compact", "--json"], obj={})
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert (data["retention_days"], data["kept"], data["expired"]) == (365, 1, 0)
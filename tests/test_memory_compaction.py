@@ -0,0 +1,86 @@
+"""Tests for memory compaction — retention, dedup collapse, atomic rewrite, archive."""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+from booty.memory.compaction import ARCHIVE_FILENAME, compact
+from booty.memory.lookup import query
+from booty.memory.store import append_record, read_records
+
+
+def _rec(rec_id: str, hours_ago: float, **extra) -> dict:
+    ts = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return {
+        "id": rec_id,
+        "type": "incident",
+        "timestamp": ts.isoformat(),
+        "repo": "o/r",
+        "paths": ["src/a.py"],
+        **extra,
+    }
+
+
+def test_compact_drops_expired_and_duplicates(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("old", hours_ago=24 * 40, sha="s0"))
+    append_record(path, _rec("first", hours_ago=30, sha="s1"))
+    append_record(path, _rec("dup", hours_ago=29, sha="s1"))  # Within 24h of "first"
+    append_record(path, _rec("later", hours_ago=2, sha="s1"))  # Outside the window: kept
+    append_record(path, _rec("other", hours_ago=1, sha="s2"))
+    with open(path, "a") as f:
+        f.write('{"id": "torn"')
+    assert query(["src"], "o/r", state_dir=tmp_path, max_matches=10)  # Builds the index
+
+    result = compact(tmp_path, retention_days=30)
+
+    assert (result.kept, result.expired, result.duplicates, result.corrupt) == (3, 1, 1, 1)
+    assert result.bytes_reclaimed == result.bytes_before - path.stat().st_size > 0
+    assert [r["id"] for r in read_records(path)] == ["first", "later", "other"]
+    assert result.archived_to is None
+    assert '{"id": "torn"' in path.read_text().splitlines()  # Kept in place, not dropped
+    ids = {r["id"] for r in query(["src"], "o/r", state_dir=tmp_path, max_matches=10)}
+    assert ids == {"first", "later", "other"}
+
+    append_record(path, _rec("new", hours_ago=0, sha="s3"))
+    assert "new" in {r["id"] for r in query(["src"], "o/r", state_dir=tmp_path, max_matches=10)}
+
+
+def test_compact_archives_evicted_records(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("old", hours_ago=24 * 40))
+    append_record(path, _rec("keep", hours_ago=1))
+    compact(tmp_path, retention_days=30, archive=True)
+    append_record(path, _rec("older", hours_ago=24 * 50))
+    result = compact(tmp_path, retention_days=30, archive=True)
+
+    assert result.archived_to == str(tmp_path / ARCHIVE_FILENAME)
+    with gzip.open(tmp_path / ARCHIVE_FILENAME, "rt") as f:
+        assert [json.loads(line)["id"] for line in f] == ["old", "older"]
+
+
+def test_compact_archives_corrupt_lines(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("keep", hours_ago=1))
+    with open(path, "a") as f:
+        f.write('{"id": "torn"\n')
+
+    result = compact(tmp_path, retention_days=30, archive=True)
+
+    assert (result.kept, result.corrupt) == (1, 1)
+    assert [r["id"] for r in read_records(path)] == ["keep"]
+    assert '{"id": "torn"' not in path.read_text()
+    with gzip.open(tmp_path / ARCHIVE_FILENAME, "rt") as f:
+        assert f.read().splitlines() == ['{"id": "torn"']
+
+
+def test_compact_noop_leaves_file_untouched(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("keep", hours_ago=1))
+    ino = path.stat().st_ino
+
+    result = compact(tmp_path, retention_days=30)
+
+    assert (result.kept, result.bytes_reclaimed) == (1, 0)
+    assert path.stat().st_ino == ino
+    assert compact(tmp_path / "missing", retention_days=30).kept == 0
@@ -0,0 +1,159 @@
+"""Tests for the memory index — sync with memory.jsonl, rebuilds, parity with a full scan."""
+
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+from booty.memory.api import _build_dedup_key, _find_duplicate
+from booty.memory.index import INDEX_FILENAME, get_memory_index
+from booty.memory.lookup import (
+    derive_paths_hash,
+    fingerprint_matches,
+    normalize_path,
+    query,
+    repo_matches,
+    result_subset,
+    sort_key,
+    within_retention,
+)
+from booty.memory.store import append_record, read_records
+
+
+def _rec(rec_id: str, days_ago: float = 1, **extra) -> dict:
+    ts = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return {
+        "type": "incident",
+        "timestamp": ts.isoformat(),
+        "summary": rec_id,
+        "links": [],
+        "id": rec_id,
+        "repo": "owner/repo",
+        **extra,
+    }
+
+
+def _pairwise_score(candidate_paths, record_paths):
+    """The original nested-loop path_match_score."""
+    total = 0
+    for cn in map(normalize_path, candidate_paths):
+        for rn in map(normalize_path, record_paths):
+            if not cn or not rn:
+                continue
+            if cn == rn:
+                total += 2
+            elif rn.startswith(cn + "/") or cn.startswith(rn + "/"):
+                total += 1
+    return total
+
+
+def _full_scan(records, paths, repo, fingerprint=None, max_n=3):
+    """Reference implementation: the pre-index linear scan."""
+    out = []
+    for r in records:
+        if not within_retention(r, 90) or not repo_matches(r, repo):
+            continue
+        overlap = _pairwise_score(paths, r.get("paths") or []) if paths else 0
+        fp_match = False
+        if fingerprint:
+            rec_fp = r.get("fingerprint") or ""
+            fp_match = fingerprint_matches(fingerprint, rec_fp) or bool(
+                paths
+                and rec_fp
+                in {p + derive_paths_hash(paths) for p in ("import:", "compile:", "test:", "install:")}
+            )
+        if overlap > 0 or fp_match:
+            out.append({**r, "path_overlap": overlap})
+    out.sort(key=sort_key)
+    return [result_subset(r) for r in out[:max_n]]
+
+
+def test_index_catches_up_with_external_appends(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("a", paths=["src/a.py"]))
+    assert [r["id"] for r in query(["src"], "owner/repo", state_dir=tmp_path)] == ["a"]
+
+    append_record(path, _rec("b", days_ago=0.5, paths=["src/b.py"]))
+    assert [r["id"] for r in query(["src"], "owner/repo", state_dir=tmp_path)] == ["b", "a"]
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+def test_partial_last_line_is_picked_up_once_completed(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("a", paths=["x.py"]))
+    with open(path, "a") as f:
+        f.write('{"id": "b", "paths": ["x.py"]')
+    index = get_memory_index(tmp_path)
+    assert index.sync() == 1
+
+    with open(path, "a") as f:
+        f.write("}\n")
+    assert index.sync() == 1  # Corrupt once joined, but the offset still advances
+    append_record(path, _rec("c", paths=["x.py"]))
+    ids = [r["id"] for r in query(["x.py"], "owner/repo", state_dir=tmp_path, max_matches=5)]
+    assert sorted(ids) == ["a", "c"]
+
+
+def test_rewritten_file_is_reindexed(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    for i in range(3):
+        append_record(path, _rec(f"old{i}", paths=["src/a.py"]))
+    assert len(query(["src/a.py"], "owner/repo", state_dir=tmp_path, max_matches=5)) == 3
+
+    tmp = tmp_path / "memory.jsonl.new"
+    append_record(tmp, _rec("new", paths=["src/a.py"]))
+    os.replace(tmp, path)
+    assert [r["id"] for r in query(["src/a.py"], "owner/repo", state_dir=tmp_path)] == ["new"]
+
+    path.unlink()
+    assert query(["src/a.py"], "owner/repo", state_dir=tmp_path) == []
+
+
+def test_dedup_uses_index(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    rec = _rec("a", days_ago=0, sha="abc", pr_number=4)
+    append_record(path, rec)
+    append_record(path, _rec("b", days_ago=0, sha="abc", pr_number=5))
+
+    assert _find_duplicate(tmp_path, _build_dedup_key(rec))["id"] == "a"
+    assert _find_duplicate(tmp_path, _build_dedup_key({**rec, "pr_number": "4"})) is None
+
+
+def test_results_match_full_scan(tmp_path):
+    rng = random.Random(7)
+    path = tmp_path / "memory.jsonl"
+    dirs = ["src", "src/app", "src/app/core", "tests", "docs", "lib"]
+    ph = derive_paths_hash(["src/app/x.py", "tests/t.py"])
+    for i in range(400):
+        paths = [
+            f"{rng.choice(dirs)}/{rng.choice(['x.py', 'y.py', 'z'])}"
+            for _ in range(rng.randint(0, 3))
+        ]
+        if rng.random() < 0.2:
+            paths.append("./" + rng.choice(dirs))
+        if paths and rng.random() < 0.1:
+            paths.append(paths[0])  # Duplicates count once per occurrence
+        rec = _rec(
+            f"r{i:03d}",
+            days_ago=rng.uniform(0, 120),
+            repo=rng.choice(["owner/repo", " owner/repo ", "other/repo"]),
+            paths=paths,
+            severity=rng.choice(["critical", "high", "low", None]),
+            fingerprint=rng.choice([None, "fp:1", "fp:2", f"test:{ph}"]),
+        )
+        if rng.random() < 0.05:
+            rec["timestamp"] = "2026-01-01T00:00:00"  # Naive: never within retention
+        append_record(path, rec)
+    records = read_records(path)
+
+    cases = [
+        (["src/app"], "owner/repo", None),
+        (["src/app/x.py", "tests/t.py"], "owner/repo", "fp:1"),
+        (["docs/z"], "", None),
+        ([], "other/repo", "fp:2"),
+        (["lib"], "owner/repo", "nope"),
+        (["src", "src/app/core/x.py", "src"], "owner/repo", None),
+    ]
+    for paths, repo, fp in cases:
+        expected = _full_scan(records, paths, repo, fp, max_n=50)
+        got = query(paths, repo, fingerprint=fp, state_dir=tmp_path, max_matches=50)
+        assert got == expected, (paths, repo, fp)
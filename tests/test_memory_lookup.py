@@ -12,6 +12,7 @@ from booty.memory.lookup import (
     normalize_path,
     path_match_score,
     query,
+    query_many,
 )
 from booty.memory.store import append_record, read_records
 
@@ -224,3 +225,34 @@ def test_query_max_matches_limit(monkeypatch, tmp_path):
         ["src/foo.py"], "owner/repo", state_dir=tmp_path, max_matches=2
     )
     assert len(result) == 2
+
+
+def test_query_many_matches_query_per_item(tmp_path):
+    """query_many returns query()'s results for each item, in input order."""
+    path = tmp_path / "memory.jsonl"
+    now = datetime.now(timezone.utc).isoformat()
+    for rid, repo, p, fp in [
+        ("r1", "owner/repo", "src/foo.py", "fp-a"),
+        ("r2", "owner/repo", "src/bar.py", "fp-b"),
+        ("r3", "other/repo", "src/foo.py", ""),
+    ]:
+        append_record(
+            path,
+            {"type": "incident", "timestamp": now, "summary": rid, "links": [], "id": rid,
+             "repo": repo, "paths": [p], "fingerprint": fp},
+        )
+    queries = [
+        {"repo": "owner/repo", "paths": ["src/foo.py"]},
+        {"repo": "owner/repo", "fingerprint": "fp-b"},
+        {"repo": "other/repo", "paths": ["src/foo.py"]},
+        {"repo": "owner/repo"},
+        {"repo": "owner/repo", "paths": ["src/foo.py"]},
+    ]
+
+    results = query_many(queries, state_dir=tmp_path)
+
+    assert [[r["id"] for r in rs] for rs in results] == [["r1"], ["r2"], ["r3"], [], ["r1"]]
+    for q, rs in zip(queries, results):
+        assert rs == query(q.get("paths") or [], q["repo"], fingerprint=q.get("fingerprint"), state_dir=tmp_path)
+    results[0][0]["id"] = "mutated"
+    assert results[4][0]["id"] == "r1"
@@ -0,0 +1,29 @@
+"""Tests for memory path trie scoring."""
+
+from booty.memory.lookup import path_match_score
+from booty.memory.paths import PathTrie
+
+
+def test_trie_scores_exact_ancestor_and_descendant():
+    trie = PathTrie()
+    trie.add("src/app/core.py", "exact")
+    trie.add("src", "ancestor")
+    trie.add("src/app/core.py/x", "descendant")
+    trie.add("src/application.py", "sibling")
+
+    assert trie.scores(["./src/app/core.py"]) == {"exact": 2, "ancestor": 1, "descendant": 1}
+    assert trie.scores(["", "docs"]) == {}
+
+
+def test_trie_sums_over_pairs_with_duplicates():
+    trie = PathTrie()
+    for path in ("src/a.py", "src/a.py", "src/b.py"):
+        trie.add(path, 1)
+
+    assert trie.scores(["src", "src/a.py"]) == {1: 3 + 4}
+
+
+def test_path_match_score_matches_pairwise_definition():
+    assert path_match_score(["src/foo"], ["src/foo", "src/foo/new.py", "src/food"]) == 3
+    assert path_match_score(["src\\foo\\bar.py"], [" ./src/foo", ""]) == 1
+    assert path_match_score([], ["src"]) == 0
@@ -0,0 +1,80 @@
+"""Tests for the sha -> PR map and cached surfacing lookups."""
+
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from booty.memory.index import MemoryIndex
+from booty.memory.lookup import query
+from booty.memory.pr_map import pr_for_sha, prune_pr_map, record_pr_shas
+from booty.memory.store import append_record
+from booty.memory.surfacing import surface_governor_hold
+
+
+def _rec(rec_id: str, repo: str = "o/r", **extra) -> dict:
+    return {
+        "id": rec_id,
+        "type": "governor_hold",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "summary": rec_id,
+        "links": [],
+        "repo": repo,
+        **extra,
+    }
+
+
+def test_record_lookup_and_prune(tmp_path):
+    record_pr_shas("o/r", 7, ["head1", "", "merge1"], state_dir=tmp_path)
+    record_pr_shas("o/r", 8, ["head1"], state_dir=tmp_path)  # Latest write wins
+
+    assert pr_for_sha("o/r", "head1", tmp_path) == 8
+    assert pr_for_sha("o/r", "merge1", tmp_path) == 7
+    assert pr_for_sha("x/y", "head1", tmp_path) is None
+
+    future = time.time() + 2 * 86400
+    with patch("booty.memory.pr_map.time.time", return_value=future):
+        assert prune_pr_map(tmp_path, older_than_days=1) == 2
+    assert pr_for_sha("o/r", "head1", tmp_path) is None
+
+
+def test_query_results_cached_until_repo_records_land(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("a", fingerprint="cooldown"))
+
+    original = MemoryIndex.candidates
+    cands = MagicMock(side_effect=lambda self, *args: original(self, *args))
+    with patch.object(MemoryIndex, "candidates", lambda self, *args: cands(self, *args)):
+        first = query([], "o/r", fingerprint="cooldown", state_dir=tmp_path)
+        assert query([], "o/r", fingerprint="cooldown", state_dir=tmp_path) == first
+        assert cands.call_count == 1
+
+        append_record(path, _rec("other", repo="x/y", fingerprint="cooldown"))
+        query([], "o/r", fingerprint="cooldown", state_dir=tmp_path)
+        assert cands.call_count == 1  # Other repo: still cached
+
+        append_record(path, _rec("b", fingerprint="cooldown"))
+        ids = [r["id"] for r in query([], "o/r", fingerprint="cooldown", state_dir=tmp_path)]
+        assert cands.call_count == 2
+    assert sorted(ids) == ["a", "b"]
+
+
+@patch("booty.memory.surfacing.post_memory_comment")
+@patch("booty.memory.surfacing.Github")
+def test_governor_hold_uses_pr_map(mock_github, mock_post, tmp_path):
+    append_record(tmp_path / "memory.jsonl", _rec("h1", fingerprint="cooldown"))
+    record_pr_shas("o/r", 12, ["abc123"], state_dir=tmp_path)
+    gh_repo = MagicMock()
+    gh_repo.get_issue.return_value.get_comments.return_value = []
+    mock_github.return_value.get_repo.return_value = gh_repo
+    config = MagicMock(comment_on_pr=True, retention_days=90, max_matches=3)
+
+    surface_governor_hold("token", "o/r", "abc123", "cooldown", config, state_dir=tmp_path)
+
+    gh_repo.get_commit.assert_not_called()
+    assert mock_post.call_args[0][2] == 12
+
+    # Unknown sha: falls back to the API and remembers the answer
+    gh_repo.get_commit.return_value.get_pulls.return_value = [MagicMock(number=13)]
+    surface_governor_hold("token", "o/r", "def456", "cooldown", config, state_dir=tmp_path)
+    assert mock_post.call_args[0][2] == 13
+    assert pr_for_sha("o/r", "def456", tmp_path) == 13
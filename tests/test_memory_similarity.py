@@ -0,0 +1,95 @@
+"""Tests for MinHash text similarity and its use in lookup.query."""
+
+from datetime import datetime, timezone
+
+from booty.memory import similarity
+from booty.memory.adapters import build_incident_record
+from booty.memory.lookup import query
+from booty.memory.store import append_record
+
+
+def _rec(rid: str, title: str, **extra) -> dict:
+    rec = {
+        "id": rid,
+        "type": "incident",
+        "repo": "o/r",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "title": title,
+        "summary": extra.pop("summary", ""),
+        "paths": [],
+        "fingerprint": rid,
+    }
+    rec.update(extra)
+    return rec
+
+
+def test_signature_is_stable_and_ignores_ids():
+    a = similarity.signature("KeyError: 'user_id' in handlers.checkout — Sentry issue #12")
+    b = similarity.signature("KeyError: 'user_id' in handlers.checkout — Sentry issue #9731")
+    assert a is not None
+    assert a == b
+    assert len(similarity.band_keys(a)) == similarity.BANDS
+
+
+def test_short_text_has_no_signature():
+    assert similarity.signature("Revert abc1234") is None
+    assert similarity.signature("") is None
+
+
+def test_estimate_tracks_overlap():
+    base = similarity.signature("timeout connecting to payments database during checkout flow")
+    near = similarity.signature("timeout connecting to payments database during checkout")
+    far = similarity.signature("css grid layout broken on mobile safari landing page")
+    assert similarity.estimate(base, near) >= similarity.SIMILARITY_THRESHOLD
+    assert similarity.estimate(base, far) < similarity.SIMILARITY_THRESHOLD
+
+
+def test_record_text_includes_error_signature():
+    event = {
+        "level": "error",
+        "metadata": {"type": "KeyError", "value": "'user_id'", "filename": "app/views.py"},
+        "culprit": "handlers.checkout",
+    }
+    text = similarity.record_text(build_incident_record(event, 7, "o/r"))
+    assert "KeyError: 'user_id'" in text
+    assert "handlers.checkout" in text
+
+
+def test_query_matches_similar_text_without_path_or_fingerprint(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    append_record(path, _rec("same", "[error] KeyError — app/views.py", metadata={
+        "error_signature": "KeyError: 'user_id' handlers.checkout",
+    }))
+    append_record(path, _rec("other", "[error] ValueError — lib/parse.py", metadata={
+        "error_signature": "ValueError: invalid literal for int() parsers.csv_row",
+    }))
+
+    results = query(
+        [],
+        "o/r",
+        text="[error] KeyError — web/views.py KeyError: 'user_id' handlers.checkout",
+        state_dir=tmp_path,
+    )
+
+    assert [r["id"] for r in results] == ["same"]
+
+
+def test_similarity_breaks_ties_after_path_overlap(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    ts = datetime.now(timezone.utc).isoformat()
+    text = "database connection pool exhausted while serving checkout requests"
+    append_record(path, _rec("b-near", text[:-9], timestamp=ts, paths=["src/db.py"]))
+    append_record(path, _rec("a-unrelated", "render template missing variable", timestamp=ts, paths=["src/db.py"]))
+
+    results = query(["src/db.py"], "o/r", text=text, state_dir=tmp_path)
+
+    assert [r["id"] for r in results] == ["b-near", "a-unrelated"]
+
+
+def test_similarity_respects_repo(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    text = "timeout connecting to payments database during checkout flow"
+    append_record(path, _rec("elsewhere", text, repo="o/other"))
+
+    assert query([], "o/r", text=text, state_dir=tmp_path) == []
+    assert [r["id"] for r in query([], "o/other", text=text, state_dir=tmp_path)] == ["elsewhere"]
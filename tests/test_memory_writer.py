@@ -0,0 +1,79 @@
+"""Tests for the group-commit memory writer."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from booty.memory import MemoryConfig, submit_record
+from booty.memory.store import append_records, read_records
+from booty.memory.writer import MemoryWriter
+
+
+def test_concurrent_submits_share_one_fsync(tmp_path):
+    writer = MemoryWriter(tmp_path, max_latency_ms=100)
+    futures = []
+    lock = threading.Lock()
+
+    def submit(i: int) -> None:
+        future = writer.submit({"type": "incident", "repo": "o/r", "sha": f"s{i}"})
+        with lock:
+            futures.append(future)
+
+    with patch("booty.memory.writer.append_records", wraps=append_records) as append:
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        results = [f.result(timeout=5) for f in futures]
+    writer.close()
+
+    assert append.call_count == 1
+    assert all(r["added"] for r in results)
+    assert {r["id"] for r in results} == {r["id"] for r in read_records(tmp_path / "memory.jsonl")}
+
+
+def test_dedup_sees_unflushed_records(tmp_path):
+    writer = MemoryWriter(tmp_path, max_latency_ms=200)
+    first = writer.submit({"type": "incident", "repo": "o/r", "sha": "abc"})
+    second = writer.submit({"type": "incident", "repo": "o/r", "sha": "abc"})
+
+    assert not first.done()  # Still waiting for the batch
+    assert second.result(timeout=0) == {
+        "added": False,
+        "reason": "duplicate",
+        "existing_id": first.result(timeout=5)["id"],
+    }
+    third = writer.submit({"type": "incident", "repo": "o/r", "sha": "abc"})
+    assert third.result(timeout=0)["existing_id"] == first.result()["id"]  # Now from disk
+    writer.close()
+    assert len(read_records(tmp_path / "memory.jsonl")) == 1
+
+
+def test_close_flushes_and_failed_write_propagates(tmp_path):
+    writer = MemoryWriter(tmp_path, max_latency_ms=10_000)
+    future = writer.submit({"type": "incident", "repo": "o/r"})
+    writer.close()
+    assert future.result(timeout=0)["added"] is True
+    with pytest.raises(RuntimeError):
+        writer.submit({"type": "incident"})
+
+    writer = MemoryWriter(tmp_path, max_latency_ms=1)
+    with patch("booty.memory.writer.append_records", side_effect=OSError("disk full")):
+        failed = writer.submit({"type": "incident", "repo": "o/r", "sha": "x"})
+        with pytest.raises(OSError):
+            failed.result(timeout=5)
+    retry = writer.submit({"type": "incident", "repo": "o/r", "sha": "x"})  # Key released
+    assert retry.result(timeout=5)["added"] is True
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_record_is_awaitable(tmp_path):
+    future = submit_record({"type": "incident", "repo": "o/r"}, MemoryConfig(), state_dir=tmp_path)
+    result = await asyncio.wrap_future(future)
+    assert result["added"] is True
+    disabled = submit_record({"type": "incident"}, MemoryConfig(enabled=False), state_dir=tmp_path)
+    assert disabled.result(timeout=0) == {"added": True, "id": None}
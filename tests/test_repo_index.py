@@ -0,0 +1,112 @@
+"""Tests for the single-pass workspace index and its consumers."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from booty.repo_index import RepoIndex
+from booty.security.audit import discover_lockfiles
+from booty.test_generation.detector import detect_conventions
+from booty.test_generation.validator import get_project_dependencies, get_project_modules
+
+
+def _write(root: Path, rel: str, text: str = "") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _workspace(root: Path) -> Path:
+    _write(root, ".gitignore", "*.log\ngenerated/\n")
+    _write(
+        root,
+        "pyproject.toml",
+        '[project]\ndependencies = ["requests>=2", "PyYAML"]\n\n[tool.pytest.ini_options]\n',
+    )
+    _write(root, "requirements.txt", "httpx==0.27\n")
+    _write(root, "src/app/__init__.py")
+    _write(root, "src/app/core.py")
+    _write(root, "helpers.py")
+    _write(root, "tests/test_core.py", "import pytest\n")
+    _write(root, "debug.log")
+    _write(root, "generated/uv.lock", "x")
+    _write(root, "node_modules/pkg/package-lock.json", "{}")
+    _write(root, "web/.gitignore", "cache/\n")
+    _write(root, "web/cache/yarn.lock", "y")
+    _write(root, "web/package-lock.json", '{"packages": {}}')
+    return root
+
+
+def test_build_skips_excluded_and_gitignored(tmp_path):
+    index = RepoIndex.build(_workspace(tmp_path))
+
+    assert index.files == [
+        ".gitignore",
+        "helpers.py",
+        "pyproject.toml",
+        "requirements.txt",
+        "src/app/__init__.py",
+        "src/app/core.py",
+        "tests/test_core.py",
+        "web/.gitignore",
+        "web/package-lock.json",
+    ]
+    assert index.extension_counts[".py"] == 4
+    assert index.named("test_*.py") == ["tests/test_core.py"]
+    assert "web/package-lock.json" in index
+
+
+def test_manifest_is_parsed_once(tmp_path):
+    index = RepoIndex.build(_workspace(tmp_path))
+
+    with patch("booty.repo_index.parse_manifest", wraps=lambda p: {"parsed": str(p)}) as parse:
+        first = index.manifest("pyproject.toml")
+        second = index.manifest("pyproject.toml")
+    assert parse.call_count == 1
+    assert first is second
+    assert index.manifest("missing.toml") is None
+
+
+def test_consumers_share_one_walk(tmp_path):
+    ws = _workspace(tmp_path)
+    index = RepoIndex.build(ws)
+
+    with patch.object(Path, "rglob", side_effect=AssertionError("walked again")):
+        conventions = detect_conventions(ws, index)
+        lockfiles = discover_lockfiles(ws, index)
+        modules = get_project_modules(ws, index)
+        deps = get_project_dependencies(ws, index)
+
+    assert (conventions.language, conventions.test_framework) == ("python", "pytest")
+    assert conventions.existing_test_examples == ["tests/test_core.py"]
+    assert [p.relative_to(ws.resolve()).as_posix() for _, p in lockfiles] == [
+        "web/package-lock.json",
+        "requirements.txt",  # One Python target per directory
+    ]
+    assert modules == {"app", "helpers"}
+    assert modules == get_project_modules(ws)
+    assert deps == {"requests", "pyyaml", "yaml", "httpx"}
+    assert deps == get_project_dependencies(ws)
+
+
+def test_build_in_git_checkout_keeps_tracked_ignored_files(tmp_path):
+    ws = _workspace(tmp_path)
+    _write(ws, ".gitignore", "*.log\ngenerated/\nrequirements.txt\n")
+    _write(ws, "gone.py")
+    subprocess.run(["git", "init", "-q", str(ws)], check=True)
+    subprocess.run(["git", "add", "."], cwd=ws, check=True)
+    subprocess.run(["git", "add", "-f", "requirements.txt"], cwd=ws, check=True)
+    (ws / "gone.py").unlink()
+    _write(ws, "untracked.py")
+
+    index = RepoIndex.build(ws)
+
+    assert "requirements.txt" in index
+    assert "untracked.py" in index
+    assert "gone.py" not in index
+    assert "debug.log" not in index and "web/cache/yarn.lock" not in index
+    assert not any(f.startswith("node_modules/") for f in index.files)
+    assert [p.name for _, p in discover_lockfiles(ws, index)] == [
+        "package-lock.json",
+        "requirements.txt",
+    ]
@@ -78,3 +78,44 @@ def test_warn_approval_with_suggestions(mock_impl: MagicMock) -> None:
     mock_impl.return_value = type("_", (), {"categories": _make_categories(overengineering="WARN")})()
     result = run_review("diff", {"title": "", "body": "", "base_sha": "a", "head_sha": "b", "file_list": ""}, ["overengineering"])
     assert result.decision == "APPROVED_WITH_SUGGESTIONS"
+
+
+def test_merge_review_results_keeps_untouched_findings() -> None:
+    """Prior findings on unchanged files survive; findings on changed files are superseded."""
+    from booty.reviewer.engine import apply_block_on, merge_review_results
+
+    prior_cats = _make_categories(tests="FAIL", duplication="WARN")
+    prior_cats[2].findings = [Finding(summary="untested", detail="d", paths=["src/a.py"])]
+    prior_cats[3].findings = [Finding(summary="dup", detail="d", paths=["src/b.py"])]
+    prior = apply_block_on(prior_cats, ["poor_tests"])
+    incremental = apply_block_on(_make_categories(), ["poor_tests"])
+
+    merged = merge_review_results(prior, incremental, {"src/b.py"}, ["poor_tests"])
+
+    by_name = {c.category: c for c in merged.categories}
+    assert by_name["Tests"].grade == "FAIL"
+    assert [f.summary for f in by_name["Tests"].findings] == ["untested"]
+    assert by_name["Duplication"].grade == "PASS"
+    assert by_name["Duplication"].findings == []
+    assert merged.decision == "BLOCKED"
+    assert merged.blocking_categories == ["Tests"]
+
+
+def test_merge_review_results_never_lowers_unreviewed_grades() -> None:
+    """Pathless findings survive, and a FAIL stays unless its files were re-reviewed."""
+    from booty.reviewer.engine import apply_block_on, merge_review_results
+
+    prior_cats = _make_categories(tests="FAIL", duplication="WARN", architectural_drift="FAIL")
+    prior_cats[2].findings = [Finding(summary="no tests at all", detail="d", paths=[])]
+    prior_cats[3].findings = [Finding(summary="dup", detail="d", paths=["src/b.py"])]
+    prior = apply_block_on(prior_cats, ["poor_tests"])
+    docs_only = apply_block_on(_make_categories(), ["poor_tests"])
+
+    merged = merge_review_results(prior, docs_only, {"docs/guide.md"}, ["poor_tests"])
+
+    by_name = {c.category: c for c in merged.categories}
+    assert by_name["Tests"].grade == "FAIL"
+    assert [f.summary for f in by_name["Tests"].findings] == ["no tests at all"]
+    assert by_name["Duplication"].grade == "WARN"
+    assert by_name["Architectural drift"].grade == "FAIL"  # Graded without findings: never re-reviewed
+    assert merged.decision == "BLOCKED"
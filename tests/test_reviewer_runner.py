@@ -52,12 +52,13 @@ def test_format_reviewer_comment_blocked_includes_rationale() -> None:
 
 
 @pytest.mark.asyncio
-async def test_process_reviewer_job_approved_success() -> None:
+async def test_process_reviewer_job_approved_success(tmp_path, monkeypatch) -> None:
     """process_reviewer_job with APPROVED result → edit_check_run conclusion=success, title=Reviewer approved."""
     from booty.reviewer.config import ReviewerConfig
     from booty.reviewer.job import ReviewerJob
     from booty.reviewer.runner import process_reviewer_job
 
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
     job = ReviewerJob(
         job_id="r-1",
         owner="o",
@@ -110,12 +111,13 @@ async def test_process_reviewer_job_approved_success() -> None:
 
 
 @pytest.mark.asyncio
-async def test_process_reviewer_job_blocked_failure_and_comment() -> None:
+async def test_process_reviewer_job_blocked_failure_and_comment(tmp_path, monkeypatch) -> None:
     """process_reviewer_job with BLOCKED → conclusion=failure, title=Reviewer blocked; post_reviewer_comment called."""
     from booty.reviewer.config import ReviewerConfig
     from booty.reviewer.job import ReviewerJob
     from booty.reviewer.runner import process_reviewer_job
 
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
     job = ReviewerJob(
         job_id="r-2",
         owner="o",
@@ -169,3 +171,183 @@ async def test_process_reviewer_job_blocked_failure_and_comment() -> None:
     mock_post.assert_called_once()
     call_body = mock_post.call_args[0][3]
     assert "<!-- booty-reviewer -->" in call_body
+
+
+def _incremental_job(head_sha: str):
+    from booty.reviewer.job import ReviewerJob
+
+    return ReviewerJob(
+        job_id=f"r-{head_sha}",
+        owner="o",
+        repo_name="r",
+        pr_number=3,
+        head_sha=head_sha,
+        head_ref="feat",
+        repo_url="https://github.com/o/r",
+        installation_id=1,
+        payload={
+            "pull_request": {
+                "title": "PR",
+                "body": "",
+                "base": {"sha": "base789", "ref": "main"},
+                "head": {"sha": head_sha, "ref": "feat"},
+            }
+        },
+    )
+
+
+async def _run_incremental(job, mock_repo, run_review_mock):
+    from booty.reviewer.config import ReviewerConfig
+    from booty.reviewer.runner import process_reviewer_job
+
+    settings = MagicMock()
+    settings.GITHUB_TOKEN = "token"
+    reviewer_config = ReviewerConfig(enabled=True, block_on=["poor_tests"])
+    with (
+        patch("booty.reviewer.runner.get_verifier_repo", return_value=mock_repo),
+        patch("booty.reviewer.runner.get_reviewer_config", return_value=reviewer_config),
+        patch("booty.reviewer.runner.apply_reviewer_env_overrides", return_value=reviewer_config),
+        patch("booty.reviewer.runner.load_booty_config_from_content"),
+        patch("booty.reviewer.runner.create_reviewer_check_run", return_value=MagicMock()),
+        patch("booty.reviewer.runner.edit_check_run") as mock_edit,
+        patch("booty.reviewer.runner.post_reviewer_comment"),
+        patch("booty.reviewer.runner.run_review", run_review_mock),
+    ):
+        await process_reviewer_job(job, settings)
+    return [c for c in mock_edit.call_args_list if c[1].get("conclusion")][-1]
+
+
+def _file(name: str, patch_text: str = "diff") -> MagicMock:
+    f = MagicMock()
+    f.filename = name
+    f.patch = patch_text
+    return f
+
+
+@pytest.mark.asyncio
+async def test_process_reviewer_job_reviews_only_interdiff_and_merges(tmp_path, monkeypatch) -> None:
+    """Second push reviews only the interdiff; prior findings on untouched files are kept."""
+    from booty.reviewer.schema import Finding
+    from booty.reviewer.store import get_last_review, save_review
+
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    prior = _make_result("BLOCKED", ["Tests"])
+    prior.categories[2] = CategoryResult(
+        category="Tests",
+        grade="FAIL",
+        findings=[Finding(summary="no tests", detail="d", paths=["src/a.py"])],
+    )
+    save_review("o", "r", 3, "head1", "tree1", prior)
+
+    mock_repo = MagicMock()
+    mock_repo.get_commit.return_value.commit.tree.sha = "tree2"
+    interdiff = MagicMock(status="ahead", files=[_file("src/b.py", "b diff")])
+    mock_repo.compare.return_value = interdiff
+    run_review_mock = MagicMock(return_value=_make_result("APPROVED"))
+
+    final_edit = await _run_incremental(_incremental_job("head2"), mock_repo, run_review_mock)
+
+    mock_repo.compare.assert_called_once_with("head1", "head2")
+    assert run_review_mock.call_args[0][0] == "b diff"
+    assert final_edit[1]["conclusion"] == "failure"
+    last = get_last_review("o", "r", 3)
+    assert last.head_sha == "head2"
+    assert last.tree_sha == "tree2"
+    assert last.result.blocking_categories == ["Tests"]
+
+
+@pytest.mark.asyncio
+async def test_process_reviewer_job_skips_llm_for_identical_tree(tmp_path, monkeypatch) -> None:
+    """Rebase with no content change (same tree) reuses prior result without LLM."""
+    from booty.reviewer.store import save_review
+
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    save_review("o", "r", 3, "head1", "tree1", _make_result("APPROVED"))
+
+    mock_repo = MagicMock()
+    mock_repo.get_commit.return_value.commit.tree.sha = "tree1"
+    run_review_mock = MagicMock()
+
+    final_edit = await _run_incremental(_incremental_job("rebased"), mock_repo, run_review_mock)
+
+    run_review_mock.assert_not_called()
+    mock_repo.compare.assert_not_called()
+    assert final_edit[1]["conclusion"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_process_reviewer_job_full_review_after_force_push(tmp_path, monkeypatch) -> None:
+    """Diverged interdiff (force-push) falls back to full base..head review."""
+    from booty.reviewer.store import save_review
+
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    save_review("o", "r", 3, "head1", "tree1", _make_result("APPROVED"))
+
+    mock_repo = MagicMock()
+    mock_repo.get_commit.return_value.commit.tree.sha = "tree3"
+    diverged = MagicMock(status="diverged", files=[])
+    full = MagicMock(files=[_file("src/a.py", "full diff")])
+    mock_repo.compare.side_effect = [diverged, full]
+    run_review_mock = MagicMock(return_value=_make_result("APPROVED"))
+
+    await _run_incremental(_incremental_job("forced"), mock_repo, run_review_mock)
+
+    assert mock_repo.compare.call_args_list[1][0] == ("base789", "forced")
+    assert run_review_mock.call_args[0][0] == "full diff"
+
+
+@pytest.mark.asyncio
+async def test_process_reviewer_job_full_review_when_prior_head_unreachable(tmp_path, monkeypatch) -> None:
+    """compare() failing for an unreachable prior head falls back to full base..head review."""
+    from github import UnknownObjectException
+
+    from booty.reviewer.store import save_review
+
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    save_review("o", "r", 3, "head1", "tree1", _make_result("APPROVED"))
+
+    mock_repo = MagicMock()
+    mock_repo.get_commit.return_value.commit.tree.sha = "tree3"
+    full = MagicMock(files=[_file("src/a.py", "full diff")])
+    mock_repo.compare.side_effect = [UnknownObjectException(404, {"message": "Not Found"}, {}), full]
+    run_review_mock = MagicMock(return_value=_make_result("APPROVED"))
+
+    await _run_incremental(_incremental_job("forced"), mock_repo, run_review_mock)
+
+    assert mock_repo.compare.call_args_list[1][0] == ("base789", "forced")
+    assert run_review_mock.call_args[0][0] == "full diff"
+
+
+@pytest.mark.asyncio
+async def test_process_reviewer_job_docs_only_auto_approves_without_llm(tmp_path, monkeypatch) -> None:
+    """Docs-only PR is auto-approved by the pre-filter; run_review not called."""
+    from booty.reviewer.metrics import get_reviewer_24h_stats
+
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    mock_repo = MagicMock()
+    mock_repo.get_commit.return_value.commit.tree.sha = "tree-docs"
+    mock_repo.compare.return_value = MagicMock(files=[_file("docs/guide.md", "+new line")])
+    run_review_mock = MagicMock()
+
+    final_edit = await _run_incremental(_incremental_job("docs1"), mock_repo, run_review_mock)
+
+    run_review_mock.assert_not_called()
+    assert final_edit[1]["output"]["title"] == "Reviewer approved"
+    assert get_reviewer_24h_stats()["triage_auto_approve"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_reviewer_job_small_diff_uses_fast_model(tmp_path, monkeypatch) -> None:
+    """Small diff with tests is routed to the fast model."""
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("REVIEWER_FAST_MODEL", "fast-model")
+    mock_repo = MagicMock()
+    mock_repo.get_commit.return_value.commit.tree.sha = "tree-small"
+    mock_repo.compare.return_value = MagicMock(
+        files=[_file("src/a.py", "+x = 1"), _file("tests/test_a.py", "+assert x")]
+    )
+    run_review_mock = MagicMock(return_value=_make_result("APPROVED"))
+
+    await _run_incremental(_incremental_job("small1"), mock_repo, run_review_mock)
+
+    assert run_review_mock.call_args[0][3] == "fast-model"
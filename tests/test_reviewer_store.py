@@ -0,0 +1,49 @@
+"""Tests for Reviewer PR state store — last reviewed head/tree and result."""
+
+from booty.reviewer.schema import ReviewResult
+from booty.reviewer.store import (
+    REVIEW_HISTORY_MAX,
+    find_review_for_tree,
+    get_last_review,
+    load_review_history,
+    save_review,
+)
+
+
+def test_save_and_get_last_review_roundtrip(tmp_path) -> None:
+    """save_review persists head, tree and result; get_last_review returns it."""
+    result = ReviewResult(decision="APPROVED")
+    save_review("o", "r", 1, "h1", "t1", result, state_dir=tmp_path)
+    last = get_last_review("o", "r", 1, state_dir=tmp_path)
+    assert last is not None
+    assert last.head_sha == "h1"
+    assert last.tree_sha == "t1"
+    assert last.result == result
+    assert get_last_review("o", "r", 2, state_dir=tmp_path) is None
+
+
+def test_find_review_for_tree_matches_earlier_revision(tmp_path) -> None:
+    """Identical tree from an older revision is found."""
+    save_review("o", "r", 1, "h1", "t1", ReviewResult(decision="APPROVED"), state_dir=tmp_path)
+    save_review("o", "r", 1, "h2", "t2", ReviewResult(decision="BLOCKED"), state_dir=tmp_path)
+    rev = find_review_for_tree("o", "r", 1, "t1", state_dir=tmp_path)
+    assert rev is not None
+    assert rev.head_sha == "h1"
+    assert find_review_for_tree("o", "r", 1, "t9", state_dir=tmp_path) is None
+
+
+def test_history_is_bounded(tmp_path) -> None:
+    """History keeps at most REVIEW_HISTORY_MAX revisions."""
+    for i in range(REVIEW_HISTORY_MAX + 3):
+        save_review("o", "r", 1, f"h{i}", f"t{i}", ReviewResult(decision="APPROVED"), state_dir=tmp_path)
+    history = load_review_history("o", "r", 1, state_dir=tmp_path)
+    assert len(history) == REVIEW_HISTORY_MAX
+    assert history[-1].head_sha == f"h{REVIEW_HISTORY_MAX + 2}"
+
+
+def test_load_review_history_invalid_json(tmp_path) -> None:
+    """Corrupt state file yields empty history."""
+    path = tmp_path / "reviewer" / "prs" / "o" / "r" / "1.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json")
+    assert load_review_history("o", "r", 1, state_dir=tmp_path) == []
@@ -0,0 +1,88 @@
+"""Tests for Reviewer pre-filter — deterministic triage ahead of run_review."""
+
+from booty.reviewer.metrics import get_reviewer_24h_stats, record_triage_decision
+from booty.reviewer.triage import DiffFile, classify_diff, count_changed_lines, is_doc_path
+
+
+def _classify(files: list[DiffFile], block_on: list[str] | None = None):
+    return classify_diff(files, block_on or [], fast_max_changed_lines=40, fast_max_files=3)
+
+
+def test_count_changed_lines_ignores_headers_and_context() -> None:
+    """Only +/- body lines count; missing patch is None."""
+    patch = "@@ -1,2 +1,2 @@\n context\n-old\n+new\n+more"
+    assert count_changed_lines(patch) == 3
+    assert count_changed_lines(None) is None
+
+
+def test_docs_only_auto_approves() -> None:
+    """Docs-only diff → auto_approve."""
+    d = _classify([DiffFile("README.md", "modified", 10), DiffFile("docs/x.rst", "added", 200)])
+    assert (d.path, d.reason) == ("auto_approve", "docs_only")
+
+
+def test_manifests_are_not_docs() -> None:
+    """requirements*.txt / CMakeLists.txt are dependency or build changes, even under docs/."""
+    for path in ("requirements.txt", "requirements-dev.txt", "CMakeLists.txt", "docs/requirements.txt"):
+        assert not is_doc_path(path), path
+    assert is_doc_path("LICENSE.txt")
+    assert not is_doc_path("notes.txt")
+    d = _classify([DiffFile("README.md", "modified", 1), DiffFile("requirements.txt", "modified", 1)])
+    assert d.path != "auto_approve"
+
+
+def test_code_under_docs_is_not_docs() -> None:
+    """Only text and images under docs/ count as docs; code there gets reviewed."""
+    for path in ("docs/conf.py", "docs/hooks.py", "docs/_static/site.js", "doc/build.sh"):
+        assert not is_doc_path(path), path
+    assert is_doc_path("docs/guide.txt") and is_doc_path("docs/img/flow.svg")
+    d = _classify([DiffFile("docs/index.md", "modified", 1), DiffFile("docs/hooks.py", "added", 5)])
+    assert d.path != "auto_approve"
+
+
+def test_lockfile_only_auto_approves() -> None:
+    """Lockfile-only diff (even huge or without patch) → auto_approve."""
+    d = _classify([DiffFile("uv.lock", "modified", None), DiffFile("web/package-lock.json", "modified", 5000)])
+    assert (d.path, d.reason) == ("auto_approve", "lockfile_only")
+
+
+def test_small_code_diff_goes_fast() -> None:
+    """Small code change with no blocking categories → fast."""
+    d = _classify([DiffFile("src/a.py", "modified", 12), DiffFile("README.md", "modified", 300)])
+    assert d.path == "fast"
+
+
+def test_large_diff_goes_full() -> None:
+    """Exceeding line or file limits → full."""
+    assert _classify([DiffFile("src/a.py", "modified", 41)]).path == "full"
+    files = [DiffFile(f"src/m{i}.py", "modified", 1) for i in range(4)]
+    assert _classify(files).path == "full"
+
+
+def test_missing_patch_goes_full() -> None:
+    """Code file without a patch (too large/binary) → full."""
+    assert _classify([DiffFile("src/a.py", "modified", None)]).reason == "patch_unavailable"
+
+
+def test_block_on_poor_tests_requires_full_for_untested_source() -> None:
+    """poor_tests blocking + source-only change → full; with tests → fast."""
+    src = DiffFile("src/a.py", "modified", 5)
+    assert _classify([src], ["poor_tests"]).reason == "block_on_poor_tests"
+    assert _classify([src, DiffFile("tests/test_a.py", "modified", 5)], ["poor_tests"]).path == "fast"
+
+
+def test_block_on_architecture_requires_full_for_new_files() -> None:
+    """overengineering/architectural_regression + added source file → full."""
+    d = _classify([DiffFile("src/new.py", "added", 5)], ["architectural_regression"])
+    assert d.reason == "block_on_new_files"
+
+
+def test_record_triage_decision_counts_in_24h_stats(tmp_path) -> None:
+    """Triage events appear in 24h stats by path."""
+    record_triage_decision("auto_approve", "docs_only", state_dir=tmp_path)
+    record_triage_decision("fast", "small_diff", state_dir=tmp_path)
+    record_triage_decision("fast", "small_diff", state_dir=tmp_path)
+    stats = get_reviewer_24h_stats(state_dir=tmp_path)
+    assert stats["triage_auto_approve"] == 1
+    assert stats["triage_fast"] == 2
+    assert stats["triage_full"] == 0
@@ -134,3 +134,134 @@ class TestRunDependencyAudit:
                 assert findings[0].get("severity") == "high"
             finally:
                 path.unlink(missing_ok=True)
+
+
+class TestAuditCacheAndOfflineIndex:
+    """Lockfile-hash audit cache and OSV advisory index tests."""
+
+    @pytest.fixture(autouse=True)
+    def _state_dir(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setenv("RELEASE_GOVERNOR_STATE_DIR", str(tmp_path / "state"))
+
+    @staticmethod
+    def _osv_export(root: Path) -> Path:
+        (root / "PyPI").mkdir(parents=True)
+        advisory = {
+            "id": "GHSA-xxxx",
+            "aliases": ["CVE-2024-0001"],
+            "database_specific": {"severity": "CRITICAL"},
+            "affected": [
+                {
+                    "package": {"ecosystem": "PyPI", "name": "Requests"},
+                    "ranges": [
+                        {
+                            "type": "ECOSYSTEM",
+                            "events": [{"introduced": "0"}, {"fixed": "2.31.0"}],
+                        }
+                    ],
+                }
+            ],
+        }
+        (root / "PyPI" / "GHSA-xxxx.json").write_text(json.dumps(advisory))
+        return root
+
+    def test_offline_index_matches_pinned_versions(self, tmp_path) -> None:
+        """Pinned lockfile versions are matched against OSV ranges without tools."""
+        ws = tmp_path / "ws"
+        ws.mkdir()
+        (ws / "poetry.lock").write_text(
+            '[[package]]\nname = "requests"\nversion = "2.30.0"\n\n'
+            '[[package]]\nname = "idna"\nversion = "3.4"\n'
+        )
+        export = self._osv_export(tmp_path / "osv")
+        with patch("booty.security.audit.subprocess.run") as run:
+            r = run_dependency_audit(ws, None, osv_index_dir=export)
+        run.assert_not_called()
+        assert r.worst_severity == "critical"
+        assert [(f["package"], f["cve_id"]) for f in r.findings] == [
+            ("requests", "CVE-2024-0001")
+        ]
+
+        (ws / "poetry.lock").write_text('[[package]]\nname = "requests"\nversion = "2.31.0"\n')
+        assert run_dependency_audit(ws, None, osv_index_dir=export).ok
+
+    def test_cache_reuses_result_for_unchanged_lockfile(self, tmp_path) -> None:
+        """Same lockfile content in another workspace reuses the cached tool result."""
+        output = json.dumps([{"name": "pkg1", "version": "1.0", "vulns": [{"id": "PYSEC-1"}]}])
+        proc = type("R", (), {"returncode": 1, "stdout": output, "stderr": ""})()
+        paths = []
+        for name in ("ws1", "ws2"):
+            ws = tmp_path / name
+            ws.mkdir()
+            (ws / "requirements.txt").write_text("pkg1==1.0\n")
+            paths.append(ws / "requirements.txt")
+        with (
+            patch("booty.security.audit.shutil.which", return_value="/usr/bin/pip-audit"),
+            patch("booty.security.audit.subprocess.run", return_value=proc) as run,
+        ):
+            first = run_dependency_audit(tmp_path / "ws1", None, cache=True)
+            second = run_dependency_audit(tmp_path / "ws2", None, cache=True)
+        assert run.call_count == 1
+        assert [f["cve_id"] for f in second.findings] == ["PYSEC-1"]
+        assert second.findings[0]["path"] == str(paths[1].resolve())
+        assert first.findings[0]["path"] == str(paths[0].resolve())
+
+    def test_cache_key_follows_requirement_includes(self, tmp_path) -> None:
+        """Editing a file included with -r invalidates the cached audit."""
+        from booty.security.audit import lockfile_content_hash
+
+        (tmp_path / "requirements").mkdir()
+        req = tmp_path / "requirements.txt"
+        req.write_text("-r requirements/base.txt\n--constraint=constraints.txt\n")
+        (tmp_path / "requirements" / "base.txt").write_text("-r ../shared.txt\nrequests==2.31.0\n")
+        (tmp_path / "shared.txt").write_text("urllib3==2.0.0\n")
+        (tmp_path / "constraints.txt").write_text("idna==3.4\n")
+
+        before = lockfile_content_hash(req)
+        (tmp_path / "shared.txt").write_text("urllib3==1.26.0\n")
+        after = lockfile_content_hash(req)
+        (tmp_path / "constraints.txt").write_text("idna==3.6\n")
+
+        assert len({before, after, lockfile_content_hash(req)}) == 3
+        req.write_text("-r https://example.com/reqs.txt\n")
+        assert lockfile_content_hash(req) is None
+
+    def test_is_affected_semver_and_last_affected(self) -> None:
+        """OSV events: introduced/fixed/last_affected with SemVer pre-releases."""
+        from booty.security.advisories import Advisory, is_affected
+
+        adv = Advisory(
+            id="X",
+            cve_id="X",
+            severity="high",
+            versions=frozenset({"0.9.9"}),
+            ranges=(
+                (("introduced", "1.2.0"), ("fixed", "1.4.0")),
+                (("introduced", "2.0.0"), ("last_affected", "2.1.0")),
+            ),
+        )
+        assert is_affected("node", "0.9.9", adv)
+        assert not is_affected("node", "1.1.9", adv)
+        assert is_affected("node", "1.3.5", adv)
+        assert is_affected("node", "1.4.0-rc.1", adv)
+        assert not is_affected("node", "1.4.0", adv)
+        assert is_affected("node", "2.1.0", adv)
+        assert not is_affected("node", "2.1.1", adv)
+
+    def test_parse_node_lockfiles(self, tmp_path) -> None:
+        """package-lock.json (v2+) and yarn.lock are pinned in-process."""
+        from booty.security.advisories import parse_lockfile
+
+        lock = tmp_path / "package-lock.json"
+        lock.write_text(json.dumps({"packages": {
+            "": {"name": "app", "version": "1.0.0"},
+            "node_modules/@scope/lib": {"version": "2.0.1"},
+            "node_modules/a/node_modules/b": {"version": "0.1.0"},
+        }}))
+        yarn = tmp_path / "yarn.lock"
+        yarn.write_text(
+            '# yarn lockfile v1\n\n"@scope/lib@^2.0.0", "@scope/lib@^2.0.1":\n'
+            '  version "2.0.1"\n\nleft-pad@1.3.0:\n  version "1.3.0"\n'
+        )
+        assert parse_lockfile("node", lock) == [("@scope/lib", "2.0.1"), ("b", "0.1.0")]
+        assert parse_lockfile("node", yarn) == [("@scope/lib", "2.0.1"), ("left-pad", "1.3.0")]
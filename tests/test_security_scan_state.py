@@ -0,0 +1,121 @@
+"""Tests for incremental secret scan state."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from booty.security.job import SecurityJob
+from booty.security.runner import _scan_secrets_incrementally
+from booty.security.scanner import run_secret_scan
+from booty.security.scan_state import (
+    SecretScanState,
+    load_scan_state,
+    merge_findings,
+    plan_secret_scan,
+    save_scan_state,
+)
+from booty.test_runner.config import SecurityConfig
+
+GITHUB_PAT = "ghp_" + "aB3dE5fG7hJ9kL1mN3pQ5rS7tU9vW1xY3z5A"
+
+
+@pytest.fixture(autouse=True)
+def _state_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("RELEASE_GOVERNOR_STATE_DIR", str(tmp_path / "state"))
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=root, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _commit(root: Path, name: str, text: str) -> str:
+    (root / name).write_text(text)
+    _git(root, "add", name)
+    _git(root, "commit", "-q", "-m", name)
+    return _git(root, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path) -> Path:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "t@example.com")
+    _git(root, "config", "user.name", "t")
+    _commit(root, "README.md", "readme\n")
+    return root
+
+
+def _job(head_sha: str) -> SecurityJob:
+    return SecurityJob(
+        job_id="s1",
+        owner="o",
+        repo_name="r",
+        pr_number=3,
+        head_sha=head_sha,
+        head_ref="feature",
+        base_sha="",
+        base_ref="main",
+        repo_url="https://github.com/o/r",
+        installation_id=1,
+        payload={},
+    )
+
+
+def test_state_round_trip():
+    state = SecretScanState("h1", "b1", "fp", [{"path": "a", "start_line": 1}])
+    save_scan_state("o", "r", 3, state)
+
+    loaded = load_scan_state("o", "r", 3)
+    assert loaded == state
+    assert loaded.scanned_at
+    assert load_scan_state("o", "r", 4) is None
+
+
+def test_plan_incremental_and_fallbacks(repo):
+    base = _git(repo, "rev-parse", "HEAD")
+    first = _commit(repo, "a.py", "a = 1\n")
+    second = _commit(repo, "b.py", "b = 2\n")
+    previous = SecretScanState(first, base, "fp")
+
+    plan = plan_secret_scan(repo, previous, base, second, "fp")
+    assert (plan.scan_base, plan.incremental, plan.reuse) == (first, True, False)
+
+    assert plan_secret_scan(repo, previous, base, first, "fp").reuse
+    assert plan_secret_scan(repo, previous, "other-base", second, "fp").scan_base == "other-base"
+    assert plan_secret_scan(repo, previous, base, second, "changed").scan_base == base
+
+    # Force-push: the old head is no longer in history
+    _git(repo, "reset", "-q", "--hard", base)
+    rewritten = _commit(repo, "c.py", "c = 3\n")
+    plan = plan_secret_scan(repo, previous, base, rewritten, "fp")
+    assert (plan.scan_base, plan.incremental) == (base, False)
+
+
+def test_merge_findings_dedups():
+    old = [{"path": "a", "start_line": 1, "rule_id": "r", "secret": "s"}]
+    new = [dict(old[0]), {"path": "b", "start_line": 2, "rule_id": "r", "secret": "t"}]
+
+    assert merge_findings(old, new) == [old[0], new[1]]
+
+
+@pytest.mark.asyncio
+async def test_scans_only_new_commits_and_merges(repo):
+    config = SecurityConfig(secret_scanner="native")
+    base = _git(repo, "rev-parse", "HEAD")
+    first = _commit(repo, "leak.py", f'TOKEN = "{GITHUB_PAT}"\n')
+
+    result = await _scan_secrets_incrementally(_job(first), str(repo), base, config)
+    assert [f["path"] for f in result.findings] == ["leak.py"]
+
+    second = _commit(repo, "clean.py", "x = 1\n")
+    with patch("booty.security.runner.run_secret_scan", wraps=run_secret_scan) as scan:
+        result = await _scan_secrets_incrementally(_job(second), str(repo), base, config)
+
+    assert scan.call_args.args[1:3] == (first, second)
+    assert [f["path"] for f in result.findings] == ["leak.py"]
+    assert load_scan_state("o", "r", 3).head_sha == second
@@ -0,0 +1,111 @@
+"""Tests for streaming test execution, failure extraction and structured results."""
+
+import sys
+
+import pytest
+
+from booty.test_runner import executor
+from booty.test_runner.executor import execute_tests
+from booty.test_runner.parser import (
+    FailureLineExtractor,
+    format_structured_failures,
+    parse_junit_xml,
+    with_junit_xml,
+)
+
+
+@pytest.mark.asyncio
+async def test_execute_tests_captures_output(tmp_path):
+    result = await execute_tests("echo out; echo err >&2; exit 3", 30, tmp_path)
+    assert result.exit_code == 3
+    assert result.stdout == "out\n"
+    assert result.stderr == "err\n"
+    assert not result.timed_out
+    assert not result.output_truncated
+
+
+@pytest.mark.asyncio
+async def test_execute_tests_keeps_partial_output_on_timeout(tmp_path):
+    result = await execute_tests("echo 'FAILED tests/test_a.py::test_x'; sleep 30", 1, tmp_path)
+    assert result.timed_out
+    assert result.exit_code == -1
+    assert "FAILED tests/test_a.py::test_x" in result.stdout
+    assert "exceeded timeout of 1 seconds" in result.stderr
+
+
+@pytest.mark.asyncio
+async def test_execute_tests_truncates_to_head_and_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(executor, "MAX_RESULT_BYTES", 200)
+    command = "for i in $(seq 1 500); do echo line$i; done; echo 'FAILED tests/t.py::x'"
+    result = await execute_tests(command, 30, tmp_path)
+    assert result.output_truncated
+    assert result.stdout.startswith("line1\n")
+    assert result.stdout.rstrip().endswith("FAILED tests/t.py::x")
+    assert "bytes omitted" in result.stdout
+    assert "FAILED tests/t.py::x" in result.error_summary
+
+
+@pytest.mark.asyncio
+async def test_execute_tests_reports_progress(tmp_path, monkeypatch):
+    monkeypatch.setattr(executor, "PROGRESS_INTERVAL_SECONDS", 0)
+    seen = []
+    await execute_tests(
+        "echo 'tests/test_a.py ..F.  [ 50%]'; echo 'tests/test_b.py .E   [100%]'",
+        30,
+        tmp_path,
+        on_progress=lambda run, failed: seen.append((run, failed)),
+    )
+    assert seen[-1] == (6, 2)
+
+
+def test_extractor_counts_verbose_lines():
+    extractor = FailureLineExtractor()
+    for line in [
+        "tests/test_a.py::test_one PASSED                [ 33%]",
+        "tests/test_a.py::test_two FAILED                [ 66%]",
+        "tests/test_a.py::test_three SKIPPED (reason)    [100%]",
+        "FAILED tests/test_a.py::test_two - assert 1 == 2",
+    ]:
+        extractor.feed(line)
+    assert (extractor.tests_run, extractor.failures) == (3, 1)
+    assert "FAILED tests/test_a.py::test_two - assert 1 == 2" in extractor.summary()
+
+
+@pytest.mark.asyncio
+async def test_execute_tests_structured_results(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "calc.py").write_text("def add(a, b):\n    return a - b\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_calc.py").write_text(
+        "import sys\nsys.path.insert(0, 'src')\nfrom calc import add\n\n"
+        "def test_ok():\n    assert True\n\n"
+        "def test_add():\n    assert add(1, 2) == 3\n"
+    )
+    result = await execute_tests(
+        f"{sys.executable} -m pytest -q -p no:cacheprovider tests", 60, tmp_path, structured=True
+    )
+    assert result.exit_code == 1
+    assert result.structured is not None
+    assert [c.nodeid for c in result.structured.failures] == ["tests/test_calc.py::test_add"]
+    assert set(result.structured.durations()) == {
+        "tests/test_calc.py::test_ok",
+        "tests/test_calc.py::test_add",
+    }
+    summary = format_structured_failures(result.structured)
+    assert "FAILED tests/test_calc.py::test_add" in summary
+    assert "E       assert -1 == 3" in summary
+    assert "at tests/test_calc.py:9" in summary
+
+
+def test_parse_junit_xml_missing_or_invalid(tmp_path):
+    assert parse_junit_xml(tmp_path / "missing.xml") is None
+    bad = tmp_path / "bad.xml"
+    bad.write_text("<testsuite><testcase")
+    assert parse_junit_xml(bad) is None
+
+
+def test_with_junit_xml_only_for_pytest(tmp_path):
+    xml = tmp_path / "r.xml"
+    assert with_junit_xml("pytest tests/", xml).startswith("pytest tests/ --junitxml=")
+    assert with_junit_xml("make test", xml) is None
+    assert with_junit_xml("pytest --junitxml=out.xml", xml) is None
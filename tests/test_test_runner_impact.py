@@ -0,0 +1,110 @@
+"""Tests for test impact selection (map, selection, command rewrite, refiner use)."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from booty.code_gen.refiner import refine_until_tests_pass
+from booty.llm.models import FileChange
+from booty.test_runner.config import BootyConfig
+from booty.test_runner import executor
+from booty.test_runner.impact import (
+    ImpactMap,
+    load_impact_map,
+    read_coverage_contexts,
+    save_impact_map,
+    select_tests,
+    subset_command,
+    supports_impact_selection,
+)
+
+
+def _write_coverage_db(path: Path, rows: list[tuple[str, str]]) -> None:
+    """Minimal coverage.py schema: file, context, line_bits."""
+    conn = sqlite3.connect(str(path))
+    conn.executescript(
+        "CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT);"
+        "CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT);"
+        "CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);"
+    )
+    for file_path, context in rows:
+        fid = conn.execute("INSERT INTO file (path) VALUES (?)", (file_path,)).lastrowid
+        cid = conn.execute("INSERT INTO context (context) VALUES (?)", (context,)).lastrowid
+        conn.execute("INSERT INTO line_bits VALUES (?, ?, x'01')", (fid, cid))
+    conn.commit()
+    conn.close()
+
+
+def test_supports_impact_selection():
+    assert supports_impact_selection("pytest tests/")
+    assert supports_impact_selection("python -m pytest -q")
+    assert not supports_impact_selection("make test")
+    assert not supports_impact_selection("pip install -e . && pytest")
+
+
+def test_read_coverage_contexts(tmp_path):
+    db = tmp_path / ".coverage"
+    src = tmp_path / "src" / "app.py"
+    _write_coverage_db(
+        db,
+        [
+            (str(src), "tests/test_app.py::test_one|run"),
+            (str(src), "tests/test_other.py::test_two|run"),
+            (str(src), ""),  # import-time coverage
+            ("/usr/lib/python3/site.py", "tests/test_app.py::test_one|run"),
+        ],
+    )
+    mapping = read_coverage_contexts(db, tmp_path)
+    assert mapping == {"src/app.py": ["tests/test_app.py", "tests/test_other.py"]}
+
+
+def test_select_tests():
+    impact = ImpactMap(
+        base_sha="abc",
+        file_to_tests={"src/a.py": ["tests/test_a.py"], "src/b.py": ["tests/test_b.py"]},
+    )
+    assert select_tests(impact, {"src/a.py"}) == ["tests/test_a.py"]
+    assert select_tests(impact, {"src/a.py", "tests/test_new.py"}) == [
+        "tests/test_a.py",
+        "tests/test_new.py",
+    ]
+    # Unmapped module, non-Python file, conftest → full suite
+    assert select_tests(impact, {"src/a.py", "src/c.py"}) is None
+    assert select_tests(impact, {"pyproject.toml"}) is None
+    assert select_tests(impact, {"tests/conftest.py"}) is None
+
+
+def test_subset_command_drops_path_args(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("")
+    cmd = subset_command("pytest tests/ -q -k tests", ["tests/test_a.py"], tmp_path)
+    assert cmd == "pytest -q -k tests tests/test_a.py"
+
+
+def test_impact_map_cache_roundtrip(tmp_path):
+    impact = ImpactMap(base_sha="abc123", file_to_tests={"src/a.py": ["tests/test_a.py"]})
+    save_impact_map(impact, "pytest", state_dir=tmp_path)
+    loaded = load_impact_map("abc123", "pytest", state_dir=tmp_path)
+    assert loaded == impact
+    assert load_impact_map("abc123", "pytest -x", state_dir=tmp_path) is None
+
+
+@pytest.mark.asyncio
+async def test_refiner_confirms_subset_with_full_suite(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("")
+    config = BootyConfig(test_command="pytest tests/", max_retries=2)
+    impact = ImpactMap(base_sha="abc", file_to_tests={"src/a.py": ["tests/test_a.py"]})
+    changes = [FileChange(path="src/a.py", content="X = 1\n", operation="modify", explanation="")]
+    execute = AsyncMock(return_value=executor.TestResult(exit_code=0, stdout="", stderr=""))
+
+    with patch("booty.code_gen.refiner.execute_tests", execute):
+        passed, _, error = await refine_until_tests_pass(
+            tmp_path, config, changes, "task", "title", "body", impact=impact
+        )
+
+    assert passed and error is None
+    commands = [c.args[0] for c in execute.call_args_list]
+    assert commands == ["pytest tests/test_a.py", "pytest tests/"]
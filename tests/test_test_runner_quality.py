@@ -0,0 +1,136 @@
+"""Tests for the ruff quality gate (targets, concurrency, auto-fix)."""
+
+import stat
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from booty.test_runner.quality import quality_targets, run_quality_checks
+
+# Fake ruff: logs its args; `format` without --check strips trailing spaces;
+# `format --check` / `check` fail while any target has trailing spaces.
+FAKE_RUFF = """#!{python}
+import sys
+from pathlib import Path
+
+args = sys.argv[1:]
+with open({log!r}, "a") as f:
+    f.write(" ".join(args) + "\\n")
+targets = [a for a in args[1:] if not a.startswith("-")]
+files = [Path(t) for t in targets if Path(t).is_file()]
+if args[0] == "format" and "--check" not in args:
+    for p in files:
+        p.write_text("\\n".join(l.rstrip() for l in p.read_text().splitlines()) + "\\n")
+    sys.exit(0)
+if "--fix" in args:
+    sys.exit(0)
+dirty = [str(p) for p in files if any(l != l.rstrip() for l in p.read_text().splitlines())]
+print("\\n".join(dirty))
+sys.exit(1 if dirty else 0)
+"""
+
+
+@pytest.fixture
+def fake_ruff(tmp_path):
+    log = tmp_path / "ruff.log"
+    script = tmp_path / "ruff"
+    script.write_text(FAKE_RUFF.format(python=sys.executable, log=str(log)))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    with patch("booty.test_runner.quality.find_ruff", return_value=str(script)):
+        yield log
+
+
+def _workspace(tmp_path: Path) -> Path:
+    ws = tmp_path / "ws"
+    (ws / "pkg").mkdir(parents=True)
+    (ws / "pkg" / "clean.py").write_text("x = 1\n")
+    (ws / "pkg" / "dirty.py").write_text("y = 2   \n")
+    (ws / "README.md").write_text("docs\n")
+    return ws
+
+
+def test_quality_targets(tmp_path):
+    ws = _workspace(tmp_path)
+    changed = ["pkg/dirty.py", "README.md", "pkg/deleted.py", "pkg/clean.py"]
+
+    assert quality_targets(ws, changed) == ["pkg/clean.py", "pkg/dirty.py"]
+    assert quality_targets(ws, changed, whole_repo=True) == ["."]
+    assert quality_targets(ws, None) == ["."]
+    assert quality_targets(ws, ["README.md"]) == []
+
+
+@pytest.mark.asyncio
+async def test_checks_only_changed_files(tmp_path, fake_ruff):
+    ws = _workspace(tmp_path)
+
+    result = await run_quality_checks(ws, changed_paths=["pkg/clean.py"])
+
+    assert result.passed
+    calls = sorted(fake_ruff.read_text().splitlines())
+    assert calls == ["check pkg/clean.py", "format --check pkg/clean.py"]
+
+
+@pytest.mark.asyncio
+async def test_failures_reported_without_fix(tmp_path, fake_ruff):
+    ws = _workspace(tmp_path)
+
+    result = await run_quality_checks(ws, changed_paths=["pkg/dirty.py"])
+
+    assert not result.passed
+    assert not result.formatting_ok and not result.linting_ok
+    assert result.errors[0].startswith("Formatting check failed:")
+    assert result.errors[1].startswith("Linting check failed:")
+    assert result.fixed_paths == []
+
+
+@pytest.mark.asyncio
+async def test_auto_fix_rewrites_and_passes(tmp_path, fake_ruff):
+    ws = _workspace(tmp_path)
+
+    result = await run_quality_checks(
+        ws, changed_paths=["pkg/dirty.py", "pkg/clean.py"], fix=True
+    )
+
+    assert result.passed
+    assert result.fixed_paths == ["pkg/dirty.py"]
+    assert (ws / "pkg" / "dirty.py").read_text() == "y = 2\n"
+    calls = fake_ruff.read_text().splitlines()
+    assert calls[:2] == [
+        "check --fix --exit-zero pkg/clean.py pkg/dirty.py",
+        "format pkg/clean.py pkg/dirty.py",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_whole_repo_check_fixes_only_changed_files(tmp_path, fake_ruff):
+    ws = _workspace(tmp_path)
+
+    result = await run_quality_checks(
+        ws, changed_paths=["pkg/clean.py"], fix=True, whole_repo=True
+    )
+
+    assert result.fixed_paths == []
+    assert (ws / "pkg" / "dirty.py").read_text() != "y = 2\n"
+    calls = fake_ruff.read_text().splitlines()
+    assert calls[:2] == ["check --fix --exit-zero pkg/clean.py", "format pkg/clean.py"]
+    assert sorted(calls[2:]) == ["check .", "format --check ."]
+
+
+@pytest.mark.asyncio
+async def test_no_python_changes_skips_ruff(tmp_path, fake_ruff):
+    ws = _workspace(tmp_path)
+
+    result = await run_quality_checks(ws, changed_paths=["README.md"])
+
+    assert result.passed
+    assert not fake_ruff.exists()
+
+
+@pytest.mark.asyncio
+async def test_missing_ruff_passes(tmp_path):
+    with patch("booty.test_runner.quality.find_ruff", return_value=None):
+        result = await run_quality_checks(tmp_path, whole_repo=True)
+
+    assert result.passed and result.errors == []
@@ -0,0 +1,64 @@
+"""Tests for the tree-hash keyed test result cache."""
+
+from types import SimpleNamespace
+
+from booty.test_runner.result_cache import (
+    CachedTestResult,
+    find_reusable_pass,
+    install_fingerprint,
+    lookup_test_result,
+    record_test_result,
+)
+
+
+def _result(passed: bool = True, **kw) -> CachedTestResult:
+    fields = dict(
+        tree_sha="t1",
+        test_command="pytest",
+        install_fingerprint="fp",
+        passed=passed,
+        exit_code=0 if passed else 1,
+        source="verifier",
+        head_sha="abc1234def",
+        run_url="https://github.com/o/r/runs/1",
+    )
+    fields.update(kw)
+    return CachedTestResult(**fields)
+
+
+def test_record_and_find_reusable_pass(tmp_path):
+    record_test_result(_result(), state_dir=tmp_path)
+    found = find_reusable_pass("t1", "pytest", "fp", state_dir=tmp_path)
+    assert found is not None
+    assert found.source == "verifier"
+    assert found.recorded_at
+    assert "https://github.com/o/r/runs/1" in found.describe()
+
+
+def test_key_includes_command_and_fingerprint(tmp_path):
+    record_test_result(_result(), state_dir=tmp_path)
+    assert find_reusable_pass("t2", "pytest", "fp", state_dir=tmp_path) is None
+    assert find_reusable_pass("t1", "pytest -x", "fp", state_dir=tmp_path) is None
+    assert find_reusable_pass("t1", "pytest", "other", state_dir=tmp_path) is None
+
+
+def test_failures_recorded_but_not_reused(tmp_path):
+    record_test_result(_result(passed=False), state_dir=tmp_path)
+    assert lookup_test_result("t1", "pytest", "fp", state_dir=tmp_path).passed is False
+    assert find_reusable_pass("t1", "pytest", "fp", state_dir=tmp_path) is None
+
+
+def test_install_fingerprint_tracks_commands():
+    a = SimpleNamespace(setup_command=None, install_command="pip install -e .")
+    b = SimpleNamespace(setup_command=None, install_command="pip install -e '.[dev]'")
+    assert install_fingerprint(a) == install_fingerprint(a)
+    assert install_fingerprint(a) != install_fingerprint(b)
+
+
+def test_passes_from_other_sources_are_not_reused(tmp_path):
+    """Only runs that executed setup/install themselves are reusable."""
+    record_test_result(_result(source="manual"), state_dir=tmp_path)
+    assert lookup_test_result("t1", "pytest", "fp", state_dir=tmp_path).passed is True
+    assert find_reusable_pass("t1", "pytest", "fp", state_dir=tmp_path) is None
+    record_test_result(_result(source="main_verify"), state_dir=tmp_path)
+    assert find_reusable_pass("t1", "pytest", "fp", state_dir=tmp_path).source == "main_verify"
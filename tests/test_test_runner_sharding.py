@@ -0,0 +1,87 @@
+"""Tests for parallel test sharding."""
+
+import sys
+
+import pytest
+
+from booty.test_runner.sharding import (
+    _verbosity_flag,
+    load_durations,
+    plan_file_shards,
+    plan_shards,
+    run_sharded,
+    save_durations,
+)
+
+
+def test_plan_shards_balances_by_duration():
+    durations = {"t::a": 10.0, "t::b": 6.0, "t::c": 4.0, "t::d": 1.0}
+    shards = plan_shards(list(durations), durations, 2)
+    totals = sorted(sum(durations[t] for t in s) for s in shards)
+    assert totals == [10.0, 11.0]
+    assert sorted(t for s in shards for t in s) == sorted(durations)
+
+
+def test_plan_shards_unknown_tests_use_median_and_drop_empty():
+    shards = plan_shards(["t::a"], {}, 4)
+    assert shards == [["t::a"]]
+
+
+def test_plan_file_shards_keeps_files_whole():
+    durations = {"a.py::x": 5.0, "a.py::y": 5.0, "b.py::x": 4.0, "c.py::x": 3.0}
+    shards = plan_file_shards(list(durations) + ["c.py::new"], durations, 2)
+    assert sorted(shards) == [["a.py"], ["b.py", "c.py"]]
+
+
+def test_durations_roundtrip_merges(tmp_path):
+    save_durations("o/r", {"t::a": 1.5}, state_dir=tmp_path)
+    save_durations("o/r", {"t::b": 0.5}, state_dir=tmp_path)
+    assert load_durations("o/r", state_dir=tmp_path) == {"t::a": 1.5, "t::b": 0.5}
+    assert load_durations("o/other", state_dir=tmp_path) == {}
+
+
+def test_verbosity_flag():
+    assert _verbosity_flag("pytest tests") == "-q"
+    assert _verbosity_flag("pytest -q tests") == ""
+    assert _verbosity_flag("pytest -qq tests") == "-v"
+    assert _verbosity_flag("pytest -v tests") == "-qq"
+
+
+@pytest.mark.asyncio
+async def test_run_sharded_merges_results(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path / "state"))
+    ws = tmp_path / "ws"
+    (ws / "tests").mkdir(parents=True)
+    (ws / "tests" / "test_a.py").write_text(
+        "def test_one():\n    pass\n\ndef test_two():\n    pass\n"
+    )
+    (ws / "tests" / "test_b.py").write_text(
+        "def test_three():\n    pass\n\ndef test_four():\n    assert False\n"
+    )
+    command = f"{sys.executable} -m pytest tests"
+
+    result = await run_sharded(command, 60, ws, 2, "o/r")
+
+    assert result is not None
+    assert result.exit_code == 1
+    assert "=== shard 1/2 ===" in result.stdout and "=== shard 2/2 ===" in result.stdout
+    assert [c.nodeid for c in result.structured.failures] == ["tests/test_b.py::test_four"]
+    assert len(load_durations("o/r")) == 4
+
+
+@pytest.mark.asyncio
+async def test_run_sharded_skips_non_pytest(tmp_path):
+    assert await run_sharded("make test", 60, tmp_path, 4, "o/r") is None
+
+
+@pytest.mark.asyncio
+async def test_run_sharded_falls_back_when_command_too_long(tmp_path, monkeypatch):
+    monkeypatch.setattr("booty.test_runner.sharding.MAX_SHARD_COMMAND_BYTES", 10)
+    ws = tmp_path / "ws"
+    (ws / "tests").mkdir(parents=True)
+    for name in ("a", "b"):
+        (ws / "tests" / f"test_{name}.py").write_text(
+            "def test_one():\n    pass\n\ndef test_two():\n    pass\n"
+        )
+
+    assert await run_sharded(f"{sys.executable} -m pytest tests", 60, ws, 2, "o/r") is None
@@ -0,0 +1,130 @@
+"""Tests for the warm forking pytest runner."""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from booty.code_gen.refiner import _run_tests
+from booty.test_runner import executor
+from booty.test_runner.dependencies import dependency_fingerprint
+from booty.test_runner.warm import (
+    WarmTestRunner,
+    resolve_interpreter,
+    third_party_modules,
+    warm_supported,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="warm runner needs fork()")
+
+
+def _write_project(root: Path, value: int) -> None:
+    (root / "calc.py").write_text(f"def value():\n    return {value}\n")
+    tests = root / "tests"
+    tests.mkdir(exist_ok=True)
+    (tests / "test_calc.py").write_text(
+        "import calc\n\n\ndef test_value():\n    assert calc.value() == 1\n"
+    )
+
+
+def test_warm_supported():
+    assert warm_supported("pytest -q")
+    assert warm_supported("python -m pytest tests/")
+    assert not warm_supported("npm test")
+    assert not warm_supported("pytest && ruff check .")
+
+
+def test_third_party_modules_excludes_stdlib_and_local(tmp_path):
+    (tmp_path / "src" / "mypkg").mkdir(parents=True)
+    (tmp_path / "src" / "mypkg" / "core.py").write_text(
+        "import os\nimport json\nimport requests\nfrom yaml import safe_load\n"
+        "from mypkg import other\nfrom . import sibling\nimport helper\n"
+    )
+    (tmp_path / "helper.py").write_text("import numpy.linalg\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "junk.py").write_text("import should_not_appear\n")
+
+    assert third_party_modules(tmp_path) == ["numpy", "requests", "yaml"]
+
+
+def test_dependency_fingerprint_tracks_manifests(tmp_path):
+    empty = dependency_fingerprint(tmp_path)
+    (tmp_path / "requirements-dev.txt").write_text("pytest\n")
+    with_reqs = dependency_fingerprint(tmp_path)
+    (tmp_path / "calc.py").write_text("x = 1\n")
+
+    assert with_reqs != empty
+    assert dependency_fingerprint(tmp_path) == with_reqs
+
+
+def test_resolve_interpreter_from_module_invocation():
+    assert resolve_interpreter(f"{sys.executable} -m pytest -q") == sys.executable
+
+
+@pytest.mark.asyncio
+async def test_warm_runner_reimports_project_code_per_run(tmp_path):
+    _write_project(tmp_path, 1)
+    runner = WarmTestRunner(tmp_path, f"{sys.executable} -m pytest -q")
+    try:
+        first = await runner.run(f"{sys.executable} -m pytest -q", 60, structured=True)
+        assert first is not None
+        assert first.exit_code == 0
+        assert first.structured is not None and len(first.structured.cases) == 1
+
+        _write_project(tmp_path, 2)
+        second = await runner.run(f"{sys.executable} -m pytest -q", 60, structured=True)
+        assert second is not None
+        assert second.exit_code == 1
+        assert second.structured.failures[0].nodeid == "tests/test_calc.py::test_value"
+    finally:
+        await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_runner_restarts_on_dependency_change(tmp_path):
+    _write_project(tmp_path, 1)
+    runner = WarmTestRunner(tmp_path, f"{sys.executable} -m pytest -q")
+    try:
+        await runner.run(f"{sys.executable} -m pytest -q", 60)
+        pid = runner._proc.pid
+        (tmp_path / "requirements.txt").write_text("attrs\n")
+        result = await runner.run(f"{sys.executable} -m pytest -q", 60)
+        assert result is not None and result.exit_code == 0
+        assert runner._proc.pid != pid
+    finally:
+        await runner.close()
+    assert runner._proc is None
+
+
+@pytest.mark.asyncio
+async def test_warm_runner_timeout_keeps_partial_output(tmp_path):
+    (tmp_path / "test_slow.py").write_text(
+        "import time\n\n\ndef test_slow():\n    print('started', flush=True)\n"
+        "    time.sleep(30)\n"
+    )
+    runner = WarmTestRunner(tmp_path, f"{sys.executable} -m pytest -s")
+    try:
+        result = await runner.run(f"{sys.executable} -m pytest -s", 2)
+        assert result is not None
+        assert result.timed_out
+        assert result.exit_code == -1
+        assert "started" in result.stdout
+        assert "exceeded timeout of 2 seconds" in result.stderr
+    finally:
+        await runner.close()
+
+
+@pytest.mark.asyncio
+async def test_refiner_falls_back_to_cold_run_when_warm_fails(tmp_path):
+    cold = executor.TestResult(exit_code=0, stdout="1 passed", stderr="")
+    warm = MagicMock()
+    warm.run = AsyncMock(return_value=None)
+    with patch(
+        "booty.code_gen.refiner.execute_tests", AsyncMock(return_value=cold)
+    ) as mock_exec:
+        result = await _run_tests("pytest -q", 30, tmp_path, warm)
+
+    assert result is cold
+    warm.run.assert_awaited_once_with("pytest -q", 30, structured=True)
+    mock_exec.assert_awaited_once_with("pytest -q", 30, tmp_path, structured=True)
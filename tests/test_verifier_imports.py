@@ -0,0 +1,177 @@
+"""Tests for the Verifier compile sweep and import validation."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from booty.verifier import imports
+from booty.verifier.imports import (
+    compile_sweep,
+    environment_fingerprint,
+    git_blob_sha,
+    load_import_resolutions,
+    validate_imports,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_compile_cache():
+    imports._compile_cache.clear()
+    yield
+    imports._compile_cache.clear()
+
+
+def _write(root, name, text):
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_git_blob_sha_matches_git(tmp_path):
+    path = _write(tmp_path, "a.py", "x = 1\n")
+    expected = subprocess.run(
+        ["git", "hash-object", str(path)], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert git_blob_sha(path.read_bytes()) == expected
+
+
+@pytest.mark.asyncio
+async def test_compile_sweep_annotations(tmp_path):
+    _write(tmp_path, "pkg/ok.py", "x = 1\n")
+    _write(tmp_path, "pkg/bad.py", "x = 1\nif True:\npass\n")
+    _write(tmp_path, "notes.txt", "not python (\n")
+
+    annotations = await compile_sweep(
+        ["pkg/ok.py", "pkg/bad.py", "notes.txt", "pkg/missing.py"], tmp_path
+    )
+
+    assert annotations == [
+        {
+            "path": "pkg/bad.py",
+            "start_line": 3,
+            "end_line": 3,
+            "annotation_level": "failure",
+            "title": "Syntax error",
+            "message": "expected an indented block after 'if' statement on line 2",
+        }
+    ]
+    assert not (tmp_path / "pkg" / "__pycache__").exists()
+
+
+@pytest.mark.asyncio
+async def test_compile_sweep_memoizes_by_blob_sha(tmp_path):
+    _write(tmp_path, "a.py", "def f(:\n")
+    _write(tmp_path, "b.py", "y = 2\n")
+    first = await compile_sweep(["a.py", "b.py"], tmp_path)
+
+    # Same contents in a fresh workspace (next push): nothing is re-checked
+    other = tmp_path / "next"
+    _write(other, "a.py", "def f(:\n")
+    _write(other, "b.py", "y = 2\n")
+    with patch.object(imports, "_check_sources") as check:
+        second = await compile_sweep(["a.py", "b.py"], other)
+
+    check.assert_not_called()
+    assert second == first
+
+    _write(other, "b.py", "y = (\n")
+    third = await compile_sweep(["a.py", "b.py"], other)
+    assert [a["path"] for a in third] == ["a.py", "b.py"]
+
+
+@pytest.mark.asyncio
+async def test_compile_sweep_process_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(imports, "PARALLEL_COMPILE_MIN_FILES", 2)
+    names = [f"m{i}.py" for i in range(4)]
+    for i, name in enumerate(names):
+        _write(tmp_path, name, "x = (\n" if i % 2 else f"x = {i}\n")
+
+    annotations = await compile_sweep(names, tmp_path)
+
+    assert [a["path"] for a in annotations] == ["m1.py", "m3.py"]
+    assert {a["message"] for a in annotations} == {"'(' was never closed"}
+
+
+@pytest.mark.asyncio
+async def test_validate_imports_reports_missing_modules(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path / "state"))
+    ws = tmp_path / "ws"
+    _write(ws, "mypkg/__init__.py", "")
+    _write(
+        ws,
+        "mypkg/core.py",
+        "import os\nimport pytest\nfrom mypkg import other\nfrom . import sibling\n"
+        "from .helpers import x\nimport definitely_missing_mod.sub\n",
+    )
+    _write(ws, "broken.py", "def f(:\n")
+
+    annotations = await validate_imports(["mypkg/core.py", "broken.py"], ws)
+
+    assert [(a["path"], a["start_line"], a["message"]) for a in annotations] == [
+        ("broken.py", 1, annotations[0]["message"]),
+        ("mypkg/core.py", 6, "No module named 'definitely_missing_mod'"),
+    ]
+    assert annotations[0]["title"] == annotations[1]["title"] == "Unresolved import"
+
+
+@pytest.mark.asyncio
+async def test_validate_imports_uses_resolution_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path / "state"))
+    ws = tmp_path / "ws"
+    _write(ws, "requirements.txt", "pytest\n")
+    _write(ws, "app.py", "import pytest\nimport definitely_missing_mod\nimport app_helpers\n")
+    _write(ws, "app_helpers.py", "")
+
+    first = await validate_imports(["app.py"], ws)
+    fingerprint = environment_fingerprint(ws, sys.executable)
+    cached = load_import_resolutions(fingerprint)
+    assert cached == {"pytest": True}  # Unresolved names are never cached
+    assert [a["message"] for a in first] == ["No module named 'definitely_missing_mod'"]
+
+    _write(ws, "app.py", "import pytest\nimport app_helpers\n")
+    with patch("asyncio.create_subprocess_exec") as spawn:
+        second = await validate_imports(["app.py"], ws)
+    spawn.assert_not_called()
+    assert second == []
+
+
+def test_environment_fingerprint_tracks_dependency_files(tmp_path):
+    before = environment_fingerprint(tmp_path, sys.executable)
+    (tmp_path / "poetry.lock").write_text("[[package]]\n")
+
+    assert environment_fingerprint(tmp_path, sys.executable) != before
+
+
+def test_environment_fingerprint_tracks_repo_and_install_command(tmp_path):
+    base = environment_fingerprint(tmp_path, sys.executable, "o/a", "pip install -e .")
+
+    assert environment_fingerprint(tmp_path, sys.executable, "o/b", "pip install -e .") != base
+    assert environment_fingerprint(tmp_path, sys.executable, "o/a", "pip install .[dev]") != base
+    assert environment_fingerprint(tmp_path, sys.executable, "o/a", "pip install -e .") == base
+
+
+@pytest.mark.asyncio
+async def test_validate_imports_stdlib_names_come_from_workspace_python(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path / "state"))
+    ws = tmp_path / "ws"
+    _write(ws, "app.py", "import os\nimport __future__\n")
+
+    assert await validate_imports(["app.py"], ws) == []
+    cached = load_import_resolutions(environment_fingerprint(ws, sys.executable))
+    assert cached == {"os": True, "__future__": True}
+
+
+@pytest.mark.asyncio
+async def test_validate_imports_reports_undecodable_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLANNER_STATE_DIR", str(tmp_path / "state"))
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    (ws / "latin.py").write_bytes(b"import os\nname = '\xe9'\n")
+
+    annotations = await validate_imports(["latin.py"], ws)
+
+    assert [(a["path"], a["title"]) for a in annotations] == [("latin.py", "Unresolved import")]
@@ -0,0 +1,171 @@
+"""Tests for the Verifier stage DAG and its use in process_verifier_job."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from booty.test_runner.config import BootyConfigV1
+from booty.verifier.job import VerifierJob
+from booty.verifier.limits import DiffStats, FileDiff
+from booty.verifier.pipeline import Stage, StageOutcome, run_stages
+from booty.verifier.runner import process_verifier_job
+
+
+def _stage(name, seconds=0.0, ok=True, log=None, **kwargs):
+    async def run(done):
+        if log is not None:
+            log.append(("start", name, sorted(done)))
+        await asyncio.sleep(seconds)
+        if log is not None:
+            log.append(("end", name))
+        return StageOutcome(ok, name)
+
+    return Stage(name, run, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently():
+    start = time.monotonic()
+    result = await run_stages([_stage("a", 0.2), _stage("b", 0.2), _stage("c", 0.2)])
+
+    assert time.monotonic() - start < 0.5
+    assert result.statuses == {"a": "ok", "b": "ok", "c": "ok"}
+    assert all(t >= 0.2 for t in result.timings.values())
+
+
+@pytest.mark.asyncio
+async def test_dependencies_wait_and_absent_deps_are_satisfied():
+    log = []
+    result = await run_stages(
+        [
+            _stage("diff", 0.05, log=log),
+            _stage("compile", log=log, after=("diff",)),
+            _stage("tests", log=log, after=("setup", "install")),
+        ]
+    )
+
+    compile_start = next(i for i, e in enumerate(log) if e[:2] == ("start", "compile"))
+    assert "diff" in log[compile_start][2]
+    assert log.index(("end", "diff")) < compile_start
+    assert result.outcomes["tests"].value == "tests"
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_cancels_running_and_skips_dependents():
+    result = await run_stages(
+        [
+            _stage("compile", 0.05, ok=False),
+            _stage("install", 5.0),
+            _stage("tests", after=("install",)),
+        ]
+    )
+
+    assert result.failed("compile")
+    assert result.statuses == {"compile": "failed", "install": "cancelled", "tests": "skipped"}
+    assert result.total_seconds < 1.0
+
+
+@pytest.mark.asyncio
+async def test_non_fail_fast_failure_lets_siblings_finish():
+    result = await run_stages(
+        [_stage("tests", ok=False, fail_fast=False), _stage("imports", 0.1)]
+    )
+
+    assert result.statuses == {"tests": "failed", "imports": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_cancel_event_stops_pipeline():
+    event = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, event.set)
+
+    result = await run_stages([_stage("tests", 5.0)], cancel_event=event)
+
+    assert result.cancelled
+    assert result.statuses["tests"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_stage_exception_propagates_and_cancels_others():
+    async def boom(done):
+        raise RuntimeError("api down")
+
+    sibling = _stage("install", 5.0)
+    with pytest.raises(RuntimeError, match="api down"):
+        await run_stages([Stage("diff", boom), sibling])
+
+
+def test_format_timings():
+    from booty.verifier.pipeline import PipelineResult
+
+    result = PipelineResult(
+        statuses={"diff": "ok", "tests": "cancelled"},
+        timings={"diff": 0.25, "tests": 1.04},
+        order=["diff", "setup", "tests"],
+        total_seconds=1.3,
+    )
+
+    assert result.format_timings().splitlines()[-4:] == [
+        "| diff | ok | 0.2s |",
+        "| setup | skipped | — |",
+        "| tests | cancelled | 1.0s |",
+        "| **total** | | 1.3s |",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_compile_failure_cancels_tests_and_reports_timings(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_bad.py").write_text("def f(:\n")
+    config = BootyConfigV1(test_command="sleep 30")
+    job = VerifierJob(
+        job_id="v1",
+        owner="o",
+        repo_name="r",
+        pr_number=7,
+        head_sha="abc",
+        head_ref="feature",
+        repo_url="https://github.com/o/r",
+        installation_id=1,
+        payload={},
+    )
+    settings = MagicMock(
+        TEST_RESULT_CACHE_ENABLED=False, TEST_SHARDS=0, CHECK_RUN_UPDATE_INTERVAL_SECONDS=0.0
+    )
+    stats = DiffStats(1, 1, 0, [FileDiff("tests/test_bad.py", 1, 0)])
+    check_run = MagicMock()
+
+    @asynccontextmanager
+    async def fake_workspace(*args, **kwargs):
+        yield SimpleNamespace(path=str(tmp_path), repo=MagicMock())
+
+    start = time.monotonic()
+    with (
+        patch("booty.verifier.runner.verifier_enabled", return_value=True),
+        patch("booty.verifier.runner.create_check_run", return_value=check_run),
+        patch("booty.verifier.runner.edit_check_run"),
+        patch("booty.github.checks.edit_check_run") as edit,
+        patch("booty.verifier.runner.get_verifier_repo", return_value=MagicMock()),
+        patch("booty.verifier.runner.get_pr_diff_stats", return_value=stats),
+        patch("booty.verifier.runner.prepare_verification_workspace", fake_workspace),
+        patch("booty.verifier.runner.load_booty_config", return_value=config),
+        patch("booty.verifier.runner._ingest_verifier_record"),
+    ):
+        await process_verifier_job(job, settings)
+
+    assert time.monotonic() - start < 10
+    final = edit.call_args.kwargs
+    assert final["conclusion"] == "failure"
+    assert final["output"]["title"] == "Verifier failed — Compile errors"
+    streamed = [
+        a for c in edit.call_args_list for a in c.kwargs.get("output", {}).get("annotations", [])
+    ]
+    assert [a["path"] for a in streamed] == ["tests/test_bad.py"]
+    text = final["output"]["text"]
+    assert "### Phase timings" in text
+    assert "| compile | failed |" in text
+    assert "| tests | cancelled |" in text